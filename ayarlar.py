@@ -0,0 +1,99 @@
+# Bu dosya, uygulama ayarlarının varsayılan değerlerini tutar ve ayarlar.json dosyasındaki değişiklikleri bunlarla birleştirir.
+
+import copy  # Varsayılan ayarların değiştirilmemesi için kopyalamada kullanılır
+import json  # Ayar dosyasını okumak için kullanılır
+import os  # Dosya ve dizin işlemleri için kullanılır
+
+AYAR_DOSYASI = 'ayarlar.json'  # Varsayılan ayar dosyası
+VERI_YAML = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'plaka.yaml')  # Yolları kendi klasörüne göreli veri seti
+
+# Varsayılan ayarlar; ayarlar.json içinde yalnızca değiştirilmek istenen anahtarlar yazılır
+VARSAYILAN_AYARLAR = {
+    'tespit': {
+        'arkayuz': 'pytorch',  # Çıkarım arka yüzü: pytorch, onnx, onnx_int8, openvino, openvino_fp16, openvino_int8
+        'guven_esigi': 0.25,  # YOLO güven eşiği
+        'imgsz': 640,  # YOLO giriş boyutu (dışa aktarılan modellerde dışa aktarma boyutuyla aynı olmalı)
+    },
+    'ocr': {
+        'motor': 'paddle',  # OCR motoru: paddle (PaddleOCR) veya karakter (train.py ile eğitilen Random Forest)
+        'karakter_modeli': '2random_forest_model.pkl',  # karakter motorunun model dosyası
+        'en_fazla_duzeltme': 2.5,  # Plaka biçimine uydurmak için kabul edilen en yüksek düzeltme maliyeti
+        'yalnizca_tanima': False,  # paddle motorunda satır tespiti ve açı sınıflandırmayı atla, YOLO kutusunu doğrudan tanı
+        'yeniden_deneme_esigi': 0.8,  # Yalnızca tanımada bu güvenin altındaki bölgeler tam modda yeniden okunur (0: kapalı)
+    },
+    'izin': {
+        'bulanik_esik': 0,  # Okuma ile izinli plaka arasında kabul edilen en yüksek ağırlıklı uzaklık (0: yalnızca tam eşleşme, 0.5: tek sık karışıklık)
+        'tekrar_penceresi': 30,  # Aynı plakanın yeniden kontrol edilip kaydedilmeyeceği süre (saniye, 0: kapalı)
+        'tekrar_en_fazla': 10000,  # Tekrar önbelleğindeki en fazla plaka sayısı
+        'izinli_bekleme': 0,  # Eski davranış: izinli bir plakadan sonra hiçbir plakanın kaydedilmediği süre (saniye, 0: kapalı)
+    },
+    'hareket': {
+        'etkin': True,  # Kamera akışında sahne boşken tespiti atla
+        'yontem': 'fark',  # Hareket ölçümü: fark (kare farkı) veya mog2 (arka plan çıkarıcı)
+        'alan_orani': 0.002,  # Hareket sayılması için değişen piksellerin en düşük oranı
+        'en_fazla_adim': 16,  # Sahne boşken iki tespit arasındaki en fazla kare sayısı
+        'etkin_sure': 2.0,  # Son hareketten / plakadan sonra her karenin tespit edileceği süre (saniye)
+    },
+    'metrikler': {
+        'etkin': False,  # Canlı tespitte aşama süreleri, FPS ve sayaçları topla
+        'adres': '127.0.0.1',  # Prometheus uç noktasının dinleyeceği adres
+        'port': 9108,  # /metrics uç noktasının portu (0 ise uç nokta açılmaz)
+        'gunluk_araligi': 30,  # Özet satırının yazdırılma aralığı (saniye, 0 ise yazılmaz)
+        'profil': False,  # /profil?sure=10 ile örneklenmiş çağrı yığını alınabilsin mi
+        'profil_araligi': 0.005,  # Profil örnekleme aralığı (saniye)
+    },
+    'servis': {
+        'adres': '127.0.0.1',  # Çıkarım servisinin dinleyeceği adres (varsayılan yalnızca yerel makine)
+        'port': 8765,  # Çıkarım servisinin portu
+        'en_fazla_toplu': 8,  # Tek bir tespit çağrısında işlenecek en fazla istek sayısı
+        'en_uzun_bekleme': 0.01,  # İlk istekten sonra toplu doldurmak için beklenecek en uzun süre (saniye)
+        'en_fazla_eszamanli': 32,  # Aynı anda işlenen en fazla istek; fazlası 503 ile reddedilir
+        'en_buyuk_istek': 10 * 1024 * 1024,  # Kabul edilen en büyük görüntü boyutu (bayt)
+    },
+    # Kaynağa özel ayarlar; anahtar kamera numarası ("0") veya video dosyasının adıdır. Örnek:
+    # "0": {"ilgi_bolgesi": {"dikdortgen": [0.1, 0.4, 0.9, 1.0]}, "imgsz": 480}
+    # Koordinatlar piksel veya 0-1 aralığında oransal olabilir; "cokgen": [[x, y], ...] de kullanılabilir.
+    'kameralar': {},
+    # coklu_kaynak.py komut satırında kaynak verilmezse işlenecek kameralar, video dosyaları veya RTSP adresleri
+    'kaynaklar': [],
+}
+
+
+def _birlestir(temel, degisiklikler):
+    """
+    İç içe sözlükleri birleştirir, değişiklikler temel ayarların üzerine yazılır.
+
+    Parametreler:
+        temel (dict): Varsayılan ayarlar (yerinde değiştirilir)
+        degisiklikler (dict): Dosyadan okunan ayarlar
+
+    Dönüş:
+        dict: Birleştirilmiş ayarlar
+    """
+    for anahtar, deger in degisiklikler.items():
+        if isinstance(deger, dict) and isinstance(temel.get(anahtar), dict):
+            _birlestir(temel[anahtar], deger)
+        else:
+            temel[anahtar] = deger
+    return temel
+
+
+def ayarlari_yukle(yol=AYAR_DOSYASI):
+    """
+    Varsayılan ayarları, varsa ayar dosyasındaki değerlerle birleştirerek döndürür.
+
+    Parametreler:
+        yol (str): JSON ayar dosyasının yolu
+
+    Dönüş:
+        dict: Uygulama ayarları
+    """
+    ayarlar = copy.deepcopy(VARSAYILAN_AYARLAR)
+    if os.path.exists(yol):
+        try:
+            with open(yol, encoding='utf-8') as dosya:
+                _birlestir(ayarlar, json.load(dosya))
+        except Exception as e:
+            print(f"Ayar dosyası okunamadı, varsayılan ayarlar kullanılıyor: {e}")
+    return ayarlar
+
@@ -0,0 +1,290 @@
+# Bu dosya, izinli plakalar üzerinde OCR karışıklıklarına dayanıklı bulanık arama yapan dizini içerir.
+# Okunan plakaya karışıklık ağırlıklı düzenleme uzaklığıyla en yakın izinli plaka bulunur; böylece tek bir
+# 0/O veya 8/B hatası izinli bir aracın reddedilmesine yol açmaz.
+
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import itertools  # Silme varyantlarını üretmek için kullanılır
+import random  # Ölçüm için rastgele plaka üretmekte kullanılır
+import sys  # Yakın komşu kabul edildiğinde çıkış kodu için kullanılır
+import time  # Zaman ölçümleri için kullanılır
+from plaka_dogrulama import HARF_KARISIKLIKLARI, HARFLER, RAKAM_KARISIKLIKLARI, gecerli_mi  # OCR karışıklık tabloları ve plaka dilbilgisi
+
+EKLEME_SILME_MALIYETI = 1.0  # Fazladan veya eksik okunan bir karakterin maliyeti
+DEGISTIRME_MALIYETI = 1.0  # Birbirine benzemeyen iki karakterin karıştırılmasının maliyeti
+
+
+def _karisiklik_maliyetleri():
+    """
+    Doğrulayıcının karışıklık tablolarından simetrik karakter çifti → değiştirme maliyeti sözlüğü oluşturur.
+    Sık karıştırılan çiftler (maliyeti 1.0 olanlar) 0.5, diğerleri en fazla 1.0 tutar.
+    """
+    maliyetler = {}
+    for tablo in (RAKAM_KARISIKLIKLARI, HARF_KARISIKLIKLARI):
+        for kaynak, (hedef, maliyet) in tablo.items():
+            cift = frozenset((kaynak, hedef))
+            maliyetler[cift] = min(maliyetler.get(cift, DEGISTIRME_MALIYETI), maliyet / 2.0, DEGISTIRME_MALIYETI)
+    return maliyetler
+
+
+KARISIKLIK_MALIYETLERI = _karisiklik_maliyetleri()
+
+
+def _kanonik_tablo():
+    """
+    Sık karıştırılan karakterleri (değiştirme maliyeti 1'den küçük) aynı temsilciye çeviren tablo.
+    Aynı kanonik anahtara sahip plakalar yalnızca bu karışıklıklarla birbirinden ayrılır.
+    """
+    temsilci = {}
+
+    def bul(k):
+        while temsilci.get(k, k) != k:
+            k = temsilci[k]
+        return k
+
+    for cift, maliyet in KARISIKLIK_MALIYETLERI.items():
+        if maliyet < DEGISTIRME_MALIYETI:
+            a, b = sorted(cift)  # Rakam varsa temsilci rakam olur
+            temsilci[bul(b)] = bul(a)
+    return str.maketrans({k: bul(k) for k in temsilci})
+
+
+KANONIK_TABLO = _kanonik_tablo()
+
+
+def agirlikli_mesafe(a, b):
+    """
+    Karışıklık ağırlıklı düzenleme (Levenshtein) uzaklığını hesaplar.
+
+    Parametreler:
+        a, b (str): Karşılaştırılacak plakalar
+
+    Dönüş:
+        float: Sık karıştırılan karakter değişimi 0.5, diğer değişim / ekleme / silme 1.0 sayılır
+    """
+    onceki = [j * EKLEME_SILME_MALIYETI for j in range(len(b) + 1)]
+    for i, ca in enumerate(a, 1):
+        simdiki = [i * EKLEME_SILME_MALIYETI]
+        for j, cb in enumerate(b, 1):
+            if ca == cb:
+                degistirme = onceki[j - 1]
+            else:
+                degistirme = onceki[j - 1] + KARISIKLIK_MALIYETLERI.get(frozenset((ca, cb)), DEGISTIRME_MALIYETI)
+            simdiki.append(min(degistirme,
+                               onceki[j] + EKLEME_SILME_MALIYETI,
+                               simdiki[j - 1] + EKLEME_SILME_MALIYETI))
+        onceki = simdiki
+    return onceki[-1]
+
+
+def _silme_varyantlari(anahtar, derinlik):
+    """Anahtardan en fazla derinlik kadar karakter silinerek elde edilen bütün varyantları döndürür."""
+    varyantlar = {anahtar}
+    for n in range(1, min(derinlik, len(anahtar) - 1) + 1):
+        for konumlar in itertools.combinations(range(len(anahtar)), n):
+            varyantlar.add(''.join(c for i, c in enumerate(anahtar) if i not in konumlar))
+    return varyantlar
+
+
+class BulanikIzinDizini:
+    """
+    İzinli plakalar için bulanık arama dizini.
+
+    Her plaka, sık karıştırılan karakterleri aynı temsilciye çevrilmiş kanonik anahtarı ve bu anahtarın
+    derinlik kadar karakter silinmiş varyantlarıyla dizine eklenir. Sorguda okumanın varyantları dizinde
+    aranır, bulunan az sayıdaki aday karışıklık ağırlıklı uzaklıkla doğrulanır. Böylece herhangi sayıda
+    sık karışıklık ile derinlik kadar ekleme, silme veya başka değişiklik, izin sayısından bağımsız
+    sürede bulunur.
+    """
+
+    def __init__(self, plakalar, esik=0.5, derinlik=1):
+        """
+        Parametreler:
+            plakalar (iterable): İzinli plakalar
+            esik (float): Kabul edilecek en yüksek ağırlıklı uzaklık. 1 ve üzeri değerler, sık karışıklık
+                olmayan tek bir değişiklik, ekleme veya silmeyle farklı plakaları da kabul eder
+            derinlik (int): Dizinde tutulacak silme derinliği (esik 1'den büyükse 2 gerekebilir)
+        """
+        self.esik = esik
+        self.derinlik = derinlik
+        self.plakalar = set(plakalar)
+        self._dizin = {}  # Silme varyantı → kanonik anahtarlar
+        self._kanonikler = {}  # Kanonik anahtar → plakalar
+        for plaka in self.plakalar:
+            kanonik = plaka.translate(KANONIK_TABLO)
+            if kanonik not in self._kanonikler:
+                for varyant in _silme_varyantlari(kanonik, derinlik):
+                    self._dizin.setdefault(varyant, []).append(kanonik)
+            self._kanonikler.setdefault(kanonik, []).append(plaka)
+
+    def __len__(self):
+        return len(self.plakalar)
+
+    def _mesafeler(self, plaka):
+        """Dizinde okumaya aday çıkan izinli plakaları uzaklıklarıyla birlikte, yakından uzağa döndürür."""
+        kanonik = plaka.translate(KANONIK_TABLO)
+        adaylar = set()
+        for varyant in _silme_varyantlari(kanonik, self.derinlik):
+            adaylar.update(self._dizin.get(varyant, ()))
+        return sorted((agirlikli_mesafe(plaka, aday), aday)
+                      for aday_kanonik in adaylar for aday in self._kanonikler[aday_kanonik])
+
+    def esik_icindekiler(self, plaka):
+        """
+        Okunan plakaya eşik içinde kalan bütün izinli plakaları bulur. Kendisi geçerli bir plaka olan
+        okumalar başka bir araca ait olabileceği için bulanık eşleştirilmez, yalnızca tam eşleşmeye bakılır.
+
+        Parametreler:
+            plaka (str): Okunan plaka
+
+        Dönüş:
+            list: Yakından uzağa (izinli plaka, uzaklık) çiftleri
+        """
+        if plaka in self.plakalar:
+            return [(plaka, 0.0)]
+        if gecerli_mi(plaka):
+            return []
+        return [(aday, mesafe) for mesafe, aday in self._mesafeler(plaka) if mesafe <= self.esik]
+
+    def en_yakin(self, plaka):
+        """
+        Okunan plakaya en yakın izinli plakayı bulur.
+
+        Parametreler:
+            plaka (str): Okunan plaka
+
+        Dönüş:
+            tuple: (izinli plaka, uzaklık); eşik içinde plaka yoksa, okuma kendisi geçerli bir plakaysa
+                veya en yakın iki farklı plaka eşit uzaklıktaysa (belirsiz okuma) (None, en küçük uzaklık veya None)
+        """
+        if plaka in self.plakalar:
+            return plaka, 0.0
+        if gecerli_mi(plaka):
+            return None, None
+        mesafeler = self._mesafeler(plaka)
+        if not mesafeler:
+            return None, None
+        en_iyi_mesafe, en_iyi = mesafeler[0]
+        belirsiz = len(mesafeler) > 1 and mesafeler[1][0] == en_iyi_mesafe
+        if en_iyi_mesafe > self.esik or belirsiz:
+            return None, en_iyi_mesafe
+        return en_iyi, en_iyi_mesafe
+
+
+def _rastgele_plaka(rastgele):
+    """Ölçüm için geçerli biçimde rastgele bir plaka üretir."""
+    il = f"{rastgele.randint(1, 81):02d}"
+    harf_sayisi, rakam_sayisi = rastgele.choice(((1, 4), (2, 3), (2, 4), (3, 2), (3, 3)))
+    return (il + ''.join(rastgele.choice(HARFLER) for _ in range(harf_sayisi))
+            + ''.join(rastgele.choice('0123456789') for _ in range(rakam_sayisi)))
+
+
+def _komsu(plaka, rastgele):
+    """Plakada sık karışıklık olmayan tek bir değişiklik, ekleme veya silme yapar (farklı bir araç)."""
+    tur = rastgele.choice(('degistir', 'fazla', 'eksik'))
+    i = rastgele.randrange(len(plaka))
+    if tur == 'degistir':
+        secenekler = [k for k in HARFLER + '0123456789' if k != plaka[i] and
+                      KARISIKLIK_MALIYETLERI.get(frozenset((k, plaka[i])), DEGISTIRME_MALIYETI) >= DEGISTIRME_MALIYETI]
+        return plaka[:i] + rastgele.choice(secenekler) + plaka[i + 1:]
+    if tur == 'fazla':
+        return plaka[:i] + rastgele.choice(HARFLER + '0123456789') + plaka[i:]
+    return plaka[:i] + plaka[i + 1:]
+
+
+def _boz(plaka, rastgele):
+    """Plakaya tek bir OCR hatası (sık karışıklık, fazladan veya eksik karakter) ekler."""
+    tur = rastgele.choice(('karisiklik', 'karisiklik', 'fazla', 'eksik'))
+    i = rastgele.randrange(len(plaka))
+    if tur == 'karisiklik':
+        for j in list(range(i, len(plaka))) + list(range(i)):
+            for cift, maliyet in KARISIKLIK_MALIYETLERI.items():
+                if plaka[j] in cift and maliyet < DEGISTIRME_MALIYETI:
+                    return plaka[:j] + next(iter(cift - {plaka[j]})) + plaka[j + 1:]
+        return plaka
+    if tur == 'fazla':
+        return plaka[:i] + rastgele.choice(HARFLER + '0123456789') + plaka[i:]
+    return plaka[:i] + plaka[i + 1:]
+
+
+if __name__ == "__main__":
+    # Bulanık dizini, her okumada veritabanına giden tam eşleşme sorgusuyla karşılaştırır
+    parser = argparse.ArgumentParser(description="Bulanık izin dizini ölçümü")
+    parser.add_argument('--izin-sayisi', type=int, default=20000, help="Üretilecek izinli plaka sayısı")
+    parser.add_argument('--sorgu-sayisi', type=int, default=5000, help="Yapılacak sorgu sayısı")
+    parser.add_argument('--esik', type=float, default=0.5, help="Kabul edilecek en yüksek ağırlıklı uzaklık")
+    parser.add_argument('--veritabani', action='store_true',
+                        help="Temel olarak geçici bir tabloda okuma başına SQL sorgusunu da ölç")
+    args = parser.parse_args()
+
+    rastgele = random.Random(42)
+    izinliler = set()
+    while len(izinliler) < args.izin_sayisi:
+        izinliler.add(_rastgele_plaka(rastgele))
+    izinliler = sorted(izinliler)
+
+    baslangic = time.perf_counter()
+    dizin = BulanikIzinDizini(izinliler, esik=args.esik)
+    print(f"{len(dizin)} izinli plaka {(time.perf_counter() - baslangic) * 1000:.0f} ms'de dizine eklendi.")
+
+    # Yarısı izinli plakaların tek hatalı okumaları, yarısı izinsiz rastgele plakalar
+    bozuk = [(_boz(p, rastgele), p) for p in rastgele.sample(izinliler, args.sorgu_sayisi // 2)]
+    yabanci = [(p, None) for p in (_rastgele_plaka(rastgele) for _ in range(args.sorgu_sayisi // 2))
+               if p not in dizin.plakalar]
+    sorgular = bozuk + yabanci
+
+    sureler = []
+    dogru_kabul = yanlis_kabul = 0
+    for okuma, gercek in sorgular:
+        baslangic = time.perf_counter()
+        eslesen, _ = dizin.en_yakin(okuma)
+        sureler.append(time.perf_counter() - baslangic)
+        if gercek is not None and eslesen == gercek:
+            dogru_kabul += 1
+        elif gercek is None and eslesen is not None:
+            yanlis_kabul += 1
+    sureler.sort()
+    print(f"Bulanık dizin: ortalama {sum(sureler) / len(sureler) * 1e6:.1f} µs, "
+          f"p99 {sureler[int(len(sureler) * 0.99)] * 1e6:.1f} µs/sorgu")
+    print(f"  Hatalı okunan izinli plakaların kabul oranı: %{dogru_kabul / len(bozuk) * 100:.1f} "
+          f"(tam eşleşmede %{sum(o == g for o, g in bozuk) / len(bozuk) * 100:.1f})")
+    print(f"  İzinsiz plakaların yanlışlıkla kabul oranı: %{yanlis_kabul / max(len(yabanci), 1) * 100:.2f}")
+
+    # İzinli plakalardan karışıklık olmayan tek bir karakterle ayrılan plakalar başka araçlardır ve reddedilmelidir
+    komsular = [(k, p) for k, p in ((_komsu(p, rastgele), p) for p in rastgele.sample(izinliler, args.sorgu_sayisi // 2))
+                if k not in dizin.plakalar]
+    komsu_kabul = [(k, p) for k, p in komsular if dizin.en_yakin(k)[0] == p]
+    print(f"  Yakın komşu (karışıklık olmayan tek düzenleme) plakaların kabul oranı: "
+          f"%{len(komsu_kabul) / max(len(komsular), 1) * 100:.2f}")
+    for okuma, izinli in komsu_kabul[:5]:
+        print(f"    {okuma} → {izinli} kabul edildi")
+
+    if args.veritabani:
+        import psycopg2  # PostgreSQL bağlantısı için kullanılır
+        from db_operations import BAGLANTI_AYARLARI
+
+        conn = psycopg2.connect(**BAGLANTI_AYARLARI)
+        try:
+            with conn.cursor() as cursor:
+                # Gerçek tabloya dokunmamak için aynı yapıda geçici bir tablo kullanılır
+                cursor.execute("CREATE TEMP TABLE izinli_olcum (LIKE izinli_plakalar INCLUDING ALL)")
+                cursor.executemany("INSERT INTO izinli_olcum VALUES (%s, TRUE, '2020-01-01', '2100-01-01')",
+                                   [(p,) for p in izinliler])
+                cursor.execute("ANALYZE izinli_olcum")
+                baslangic = time.perf_counter()
+                for okuma, _ in sorgular:
+                    cursor.execute("""
+                        SELECT * FROM izinli_olcum
+                        WHERE plaka = %s AND aktif = TRUE
+                        AND CURRENT_DATE BETWEEN baslangic_tarih AND bitis_tarih
+                    """, (okuma,))
+                    cursor.fetchone()
+                sure = (time.perf_counter() - baslangic) / len(sorgular)
+            print(f"Okuma başına SQL sorgusu: ortalama {sure * 1e6:.1f} µs/sorgu "
+                  f"({sure / (sum(sureler) / len(sureler)):.0f}x), yalnızca tam eşleşme")
+        finally:
+            conn.rollback()
+            conn.close()
+
+    if komsu_kabul:
+        print("HATA: izinli plakalardan karışıklık olmayan tek bir karakterle ayrılan plakalar kabul edildi.")
+        sys.exit(1)
@@ -0,0 +1,250 @@
+# Bu dosya, plaka tespit modelini ONNX Runtime / OpenVINO biçimlerine dışa aktarır, yükler ve arka yüzleri karşılaştırır.
+
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import os  # Dosya ve dizin işlemleri için kullanılır
+import shutil  # Dışa aktarılan modelleri taşımak için kullanılır
+import time  # Zaman ölçümleri için kullanılır
+from pathlib import Path  # Dosya yollarını yönetmek için kullanılır
+import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
+import numpy as np  # Numpy kütüphanesini matematiksel işlemler için kullanır
+from ayarlar import VERI_YAML  # Kalibrasyon için kullanılan veri seti YAML dosyası (plaka.yaml)
+
+AGIRLIK_KLASORU = 'plaka_tespit/plaka_model/weights'  # Eğitilmiş modelin bulunduğu klasör
+PYTORCH_MODELI = os.path.join(AGIRLIK_KLASORU, 'best.pt')  # Eğitilmiş PyTorch modeli
+
+# Her arka yüz için model dosyası veya klasörü
+MODEL_YOLLARI = {
+    'pytorch': PYTORCH_MODELI,
+    'onnx': os.path.join(AGIRLIK_KLASORU, 'best.onnx'),
+    'onnx_int8': os.path.join(AGIRLIK_KLASORU, 'best_int8.onnx'),
+    'openvino': os.path.join(AGIRLIK_KLASORU, 'best_openvino_model'),
+    'openvino_fp16': os.path.join(AGIRLIK_KLASORU, 'best_fp16_openvino_model'),
+    'openvino_int8': os.path.join(AGIRLIK_KLASORU, 'best_int8_openvino_model'),
+}
+
+
+def _on_isle(goruntu, imgsz):
+    """
+    Görüntüyü YOLO girişine hazırlar: oranı koruyarak boyutlandırır, 114 gri ile doldurur,
+    RGB'ye çevirir ve 0-1 aralığında NCHW float32 dizisi yapar.
+
+    Parametreler:
+        goruntu: BGR görüntü
+        imgsz (int): Model giriş boyutu
+
+    Dönüş:
+        numpy.ndarray: (1, 3, imgsz, imgsz) boyutunda giriş dizisi
+    """
+    h, w = goruntu.shape[:2]
+    oran = min(imgsz / h, imgsz / w)
+    yeni_w, yeni_h = int(round(w * oran)), int(round(h * oran))
+    boyutlu = cv2.resize(goruntu, (yeni_w, yeni_h), interpolation=cv2.INTER_LINEAR)
+    tuval = np.full((imgsz, imgsz, 3), 114, dtype=np.uint8)
+    ust, sol = (imgsz - yeni_h) // 2, (imgsz - yeni_w) // 2
+    tuval[ust:ust + yeni_h, sol:sol + yeni_w] = boyutlu
+    giris = tuval[:, :, ::-1].transpose(2, 0, 1)[None].astype(np.float32) / 255.0
+    return np.ascontiguousarray(giris)
+
+
+class _KalibrasyonOkuyucu:
+    """ONNX Runtime statik nicemleme için doğrulama görüntülerini sırayla veren okuyucu."""
+
+    def __init__(self, giris_adi, goruntu_yollari, imgsz):
+        self.giris_adi = giris_adi
+        self.yollar = iter(goruntu_yollari)
+        self.imgsz = imgsz
+
+    def get_next(self):
+        for yol in self.yollar:
+            goruntu = cv2.imread(str(yol))
+            if goruntu is not None:
+                return {self.giris_adi: _on_isle(goruntu, self.imgsz)}
+        return None
+
+
+def disa_aktar(arkayuz, imgsz=640, kalibrasyon_klasoru='yolov8_dataset/valid/images', kalibrasyon_sayisi=100):
+    """
+    PyTorch modelini istenen arka yüz biçimine dışa aktarır.
+    INT8 modeller doğrulama görüntüleriyle kalibre edilir.
+
+    Parametreler:
+        arkayuz (str): MODEL_YOLLARI içindeki arka yüz adı
+        imgsz (int): Sabit giriş boyutu
+        kalibrasyon_klasoru (str): INT8 kalibrasyonunda kullanılacak görüntüler
+        kalibrasyon_sayisi (int): Kalibrasyonda kullanılacak en fazla görüntü sayısı
+
+    Dönüş:
+        str: Dışa aktarılan modelin yolu
+    """
+    from ultralytics import YOLO  # YOLO modelini kullanmak için gerekli kütüphane
+
+    hedef = MODEL_YOLLARI[arkayuz]
+    model = YOLO(PYTORCH_MODELI)
+
+    if arkayuz == 'pytorch':
+        return hedef
+
+    if arkayuz in ('onnx', 'onnx_int8'):
+        onnx_yolu = model.export(format='onnx', imgsz=imgsz, simplify=True, dynamic=False)
+        if arkayuz == 'onnx':
+            return onnx_yolu
+
+        # ONNX Runtime statik INT8 nicemleme (QDQ biçimi, kanal başına ağırlık ölçekleri)
+        import onnxruntime as ort  # ONNX modelini çalıştırmak için kullanılır
+        from onnxruntime.quantization import QuantFormat, QuantType, quantize_static
+
+        giris_adi = ort.InferenceSession(onnx_yolu, providers=['CPUExecutionProvider']).get_inputs()[0].name
+        yollar = sorted(Path(kalibrasyon_klasoru).glob('*.jpg'))[:kalibrasyon_sayisi]
+        quantize_static(onnx_yolu, hedef, _KalibrasyonOkuyucu(giris_adi, yollar, imgsz),
+                        quant_format=QuantFormat.QDQ, per_channel=True,
+                        activation_type=QuantType.QUInt8, weight_type=QuantType.QInt8)
+        return hedef
+
+    if arkayuz == 'openvino_int8':
+        # Ultralytics, INT8 kalibrasyonunu veri setinin doğrulama bölümüyle (NNCF) yapar
+        return model.export(format='openvino', imgsz=imgsz, int8=True,
+                            data=VERI_YAML, fraction=1.0)
+
+    # FP32 ve FP16 OpenVINO modelleri aynı klasör adıyla üretildiği için yerine taşınır
+    cikti = model.export(format='openvino', imgsz=imgsz, half=(arkayuz == 'openvino_fp16'))
+    if os.path.abspath(cikti) != os.path.abspath(hedef):
+        shutil.rmtree(hedef, ignore_errors=True)
+        shutil.move(cikti, hedef)
+    return hedef
+
+
+def model_yukle(arkayuz):
+    """
+    Seçilen arka yüzün modelini yükler. Dışa aktarılmış model yoksa PyTorch modeline döner.
+
+    Parametreler:
+        arkayuz (str): MODEL_YOLLARI içindeki arka yüz adı
+
+    Dönüş:
+        YOLO: Yüklenmiş model (predict arayüzü bütün arka yüzlerde aynıdır)
+    """
+    from ultralytics import YOLO  # YOLO modelini kullanmak için gerekli kütüphane
+
+    if arkayuz not in MODEL_YOLLARI:
+        raise ValueError(f"Bilinmeyen çıkarım arka yüzü: {arkayuz}")
+    yol = MODEL_YOLLARI[arkayuz]
+    if not os.path.exists(yol):
+        print(f"{yol} bulunamadı, PyTorch modeli kullanılıyor. "
+              f"Dışa aktarmak için: python cikarim_arkayuzleri.py disa-aktar {arkayuz}")
+        yol = PYTORCH_MODELI
+    return YOLO(yol, task='detect')
+
+
+def _kutulari_al(model, goruntu, imgsz, conf):
+    """Modelin tahmin ettiği kutuları (N, 4) ve güvenleri (N,) dizileri olarak döndürür."""
+    sonuc = model.predict(goruntu, imgsz=imgsz, conf=conf, verbose=False)[0]
+    return sonuc.boxes.xyxy.cpu().numpy(), sonuc.boxes.conf.cpu().numpy(), sonuc.speed
+
+
+def _kutu_iou(a, b):
+    """İki kutu kümesi arasındaki IoU matrisini hesaplar."""
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros((len(a), len(b)))
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    kesisim = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    alan_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    alan_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    return kesisim / (alan_a[:, None] + alan_b[None, :] - kesisim + 1e-9)
+
+
+def karsilastir(arkayuzler, klasor='yolov8_dataset/test/images', imgsz=640, conf=0.25,
+                iou_toleransi=0.9, guven_toleransi=0.05):
+    """
+    Arka yüzleri PyTorch modeline göre kutu uyumu ve gecikme açısından karşılaştırır.
+
+    Parametreler:
+        arkayuzler (list): Karşılaştırılacak arka yüz adları
+        klasor (str): Test görüntülerinin bulunduğu klasör
+        imgsz (int): Giriş boyutu
+        conf (float): Güven eşiği
+        iou_toleransi (float): Kutunun aynı sayılması için referansla en düşük IoU
+        guven_toleransi (float): Kutunun aynı sayılması için en büyük güven farkı
+
+    Dönüş:
+        dict: Arka yüz adı → uyum ve gecikme ölçümleri
+    """
+    goruntuler = [cv2.imread(str(p)) for p in sorted(Path(klasor).glob('*.jpg'))]
+    goruntuler = [g for g in goruntuler if g is not None]
+    if not goruntuler:
+        raise FileNotFoundError(f"{klasor} içinde görüntü bulunamadı")
+
+    # Referans kutular PyTorch modelinden alınır
+    referans_model = model_yukle('pytorch')
+    referans = [_kutulari_al(referans_model, g, imgsz, conf)[:2] for g in goruntuler]
+
+    rapor = {}
+    for arkayuz in arkayuzler:
+        model = model_yukle(arkayuz)
+        _kutulari_al(model, goruntuler[0], imgsz, conf)  # Isınma çağrısı
+
+        sureler, cikarim_sureleri = [], []
+        ref_sayisi = eslesen = fazla = 0
+        iou_toplami = 0.0
+        for goruntu, (ref_kutular, ref_guvenler) in zip(goruntuler, referans):
+            baslangic = time.perf_counter()
+            kutular, guvenler, hiz = _kutulari_al(model, goruntu, imgsz, conf)
+            sureler.append((time.perf_counter() - baslangic) * 1000)
+            cikarim_sureleri.append(hiz['inference'])
+
+            # Referans kutuları en yüksek IoU'ya göre açgözlü eşleştir
+            ious = _kutu_iou(ref_kutular, kutular)
+            kullanilan = set()
+            for r in np.argsort(-ref_guvenler):
+                adaylar = [j for j in np.argsort(-ious[r]) if j not in kullanilan]
+                if not adaylar:
+                    break
+                aday = int(adaylar[0])
+                if (ious[r, aday] >= iou_toleransi and
+                        abs(ref_guvenler[r] - guvenler[aday]) <= guven_toleransi):
+                    kullanilan.add(aday)
+                    eslesen += 1
+                    iou_toplami += ious[r, aday]
+            ref_sayisi += len(ref_kutular)
+            fazla += len(kutular) - len(kullanilan)
+
+        rapor[arkayuz] = {
+            'uyum': eslesen / ref_sayisi if ref_sayisi else 1.0,
+            'eksik_kutu': ref_sayisi - eslesen,
+            'fazla_kutu': fazla,
+            'ortalama_iou': iou_toplami / eslesen if eslesen else 0.0,
+            'gecikme_ms_p50': float(np.percentile(sureler, 50)),
+            'gecikme_ms_p95': float(np.percentile(sureler, 95)),
+            'cikarim_ms_p50': float(np.percentile(cikarim_sureleri, 50)),
+        }
+    return rapor
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plaka tespit modeli için CPU çıkarım arka yüzleri")
+    alt = parser.add_subparsers(dest='komut', required=True)
+
+    p_disa = alt.add_parser('disa-aktar', help="Modeli verilen arka yüzlere dışa aktar")
+    p_disa.add_argument('arkayuzler', nargs='+', choices=list(MODEL_YOLLARI))
+    p_disa.add_argument('--imgsz', type=int, default=640)
+
+    p_kars = alt.add_parser('karsilastir', help="Arka yüzleri PyTorch modeliyle karşılaştır")
+    p_kars.add_argument('arkayuzler', nargs='+', choices=list(MODEL_YOLLARI))
+    p_kars.add_argument('--klasor', default='yolov8_dataset/test/images')
+    p_kars.add_argument('--imgsz', type=int, default=640)
+    p_kars.add_argument('--iou-toleransi', type=float, default=0.9)
+    args = parser.parse_args()
+
+    if args.komut == 'disa-aktar':
+        for arkayuz in args.arkayuzler:
+            print(f"{arkayuz}: {disa_aktar(arkayuz, imgsz=args.imgsz)}")
+    else:
+        rapor = karsilastir(args.arkayuzler, klasor=args.klasor, imgsz=args.imgsz,
+                            iou_toleransi=args.iou_toleransi)
+        print(f"{'arka yüz':<15}{'uyum':>8}{'eksik':>7}{'fazla':>7}{'IoU':>7}{'p50 ms':>9}{'p95 ms':>9}{'çıkarım':>9}")
+        for arkayuz, r in rapor.items():
+            print(f"{arkayuz:<15}{r['uyum']:>8.1%}{r['eksik_kutu']:>7}{r['fazla_kutu']:>7}"
+                  f"{r['ortalama_iou']:>7.3f}{r['gecikme_ms_p50']:>9.1f}{r['gecikme_ms_p95']:>9.1f}"
+                  f"{r['cikarim_ms_p50']:>9.1f}")
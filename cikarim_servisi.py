@@ -0,0 +1,541 @@
+# Bu dosya, tespit ve OCR modellerini bir kez yükleyip yerel ağdaki diğer sistemlere (bariyer denetleyicisi,
+# otopark ücret kutusu gibi) HTTP üzerinden plaka okuma sunan asyncio tabanlı çıkarım servisini içerir.
+# Aynı anda gelen istekler küçük toplular halinde tek bir tespit ve tek bir OCR çağrısında işlenir.
+# Servisi yerel makinede yük altında denemek için bir yük testi istemcisi de içerir.
+
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import asyncio  # HTTP sunucusu, istemcisi ve istek toplayıcı için kullanılır
+import json  # İstek yanıtları ve yük testi raporu için kullanılır
+import sys  # Hata mesajlarını standart hataya yazmak için kullanılır
+import time  # Gecikme ölçümleri için kullanılır
+from collections import deque  # Son isteklerin gecikmelerini tutmak için kullanılır
+from concurrent.futures import ThreadPoolExecutor  # Modelleri olay döngüsünün dışında çalıştırmak için kullanılır
+from http import HTTPStatus  # Yanıt durum metinleri için kullanılır
+from pathlib import Path  # Yük testi görüntülerini bulmak için kullanılır
+from urllib.parse import parse_qs, urlparse  # İstek adresindeki parametreleri okumak için kullanılır
+import cv2  # JPEG görüntüleri çözmek için kullanılır
+import numpy as np  # Yüzdelik hesapları ve görüntü çözme için kullanılır
+from coklu_kaynak import Akis  # Kaynak başına ilgi bölgesi, takipçi ve tekrar önbelleği
+from metrikler import Metrikler  # Aşama süre histogramları ve Prometheus metni
+
+GECIKME_PENCERESI = 10000  # Yüzdelikleri hesaplanan son istek sayısı
+EN_FAZLA_KAYNAK = 64  # İsteklerde kullanılabilecek en fazla farklı kaynak adı
+
+
+def _goruntu_coz(veri):
+    """JPEG / PNG baytlarını BGR kareye çevirir; çözülemezse None döndürür."""
+    return cv2.imdecode(np.frombuffer(veri, np.uint8), cv2.IMREAD_COLOR)
+
+
+def _yuzdelikler(sureler):
+    """Süre listesinin (saniye) p50, p95 ve p99 değerlerini milisaniye olarak döndürür."""
+    if not sureler:
+        return 0.0, 0.0, 0.0
+    p50, p95, p99 = np.percentile(np.asarray(sureler) * 1000.0, [50, 95, 99])
+    return float(p50), float(p95), float(p99)
+
+
+class _Istek:
+    """Toplayıcı kuyruğunda bekleyen tek bir tespit isteği."""
+
+    __slots__ = ('kare', 'akis', 'gelis', 'sonuc')
+
+    def __init__(self, kare, akis, sonuc):
+        self.kare = kare
+        self.akis = akis
+        self.gelis = time.perf_counter()  # Kuyruğa giriş zamanı
+        self.sonuc = sonuc  # Yanıtı bekleyen asyncio.Future
+
+
+class CikarimServisi:
+    """
+    PlakaTespitTest modellerini HTTP üzerinden sunan servis.
+
+    Uç noktalar:
+        POST /tespit?kaynak=ad: Gövdedeki JPEG görüntüde kutuları, plakaları ve izin durumlarını döndürür
+        GET /istatistik: İstek sayaçları, toplu boyutları ve gecikme yüzdelikleri (JSON)
+        GET /metrics: Prometheus metin biçiminde aşama süreleri
+        GET /saglik: Servisin çalıştığını bildirir
+
+    Olay döngüsü yalnızca bağlantıları ve isteklerin toplanmasını yürütür. İlk istekten sonra en_uzun_bekleme
+    kadar (veya en_fazla_toplu dolana kadar) gelen istekler tek bir toplu halinde tek iş parçacıklı yürütücüde
+    işlenir; bir toplu işlenirken gelen istekler bir sonraki toplu için birikir. Aynı anda işlenen istek sayısı
+    en_fazla_eszamanli değerini aşarsa yeni istekler beklemeden 503 ile reddedilir.
+
+    Her kaynak adı coklu_kaynak.Akis nesnesiyle kendi ilgi bölgesini, giriş boyutunu ve tekrar önbelleğini
+    kullanır; aynı kapıdan art arda gönderilen karelerdeki plaka pencere süresince yeniden kaydedilmez.
+    """
+
+    def __init__(self, uygulama, adres='127.0.0.1', port=8765, en_fazla_toplu=8, en_uzun_bekleme=0.01,
+                 en_fazla_eszamanli=32, en_buyuk_istek=10 * 1024 * 1024):
+        """
+        Parametreler:
+            uygulama (PlakaTespitTest): Modelleri yüklenmiş tespit nesnesi
+            adres (str): Dinlenecek adres
+            port (int): Dinlenecek port (0 ise boş bir port seçilir)
+            en_fazla_toplu (int): Tek toplu içindeki en fazla istek sayısı
+            en_uzun_bekleme (float): İlk istekten sonra toplu doldurmak için beklenecek süre (saniye)
+            en_fazla_eszamanli (int): Aynı anda işlenen en fazla istek sayısı
+            en_buyuk_istek (int): Kabul edilen en büyük istek gövdesi (bayt)
+        """
+        self.uygulama = uygulama
+        self.adres = adres
+        self.port = port
+        self.en_fazla_toplu = en_fazla_toplu
+        self.en_uzun_bekleme = en_uzun_bekleme
+        self.en_fazla_eszamanli = en_fazla_eszamanli
+        self.en_buyuk_istek = en_buyuk_istek
+
+        # Modeller iş parçacığı güvenli olmadığı için bütün toplular tek bir iş parçacığında işlenir
+        self._yurutucu = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cikarim')
+        self._kuyruk = None  # Olay döngüsünde oluşturulur
+        self._sunucu = None
+        self._akislar = {}  # Kaynak adı → Akis
+
+        # Aşama süreleri servisin /metrics uç noktasında sunulur
+        if uygulama.metrikler is None:
+            uygulama.metrikler = Metrikler()
+        self.metrikler = uygulama.metrikler
+        if uygulama.olcer is None:
+            uygulama.olcer = self.metrikler
+        self.metrikler.kaynak_ekle('servis', self.istatistikler)
+
+        # Sayaçlar
+        self.istek = 0  # Gelen tespit isteği sayısı
+        self.basarili = 0  # Yanıtlanan tespit isteği sayısı
+        self.reddedilen = 0  # Servis meşgul olduğu için reddedilen istek sayısı
+        self.hatali = 0  # Geçersiz veya işlenemeyen istek sayısı
+        self.eszamanli = 0  # Şu anda işlenen istek sayısı
+        self.toplu_sayisi = 0  # İşlenen toplu sayısı
+        self.toplu_istek = 0  # Toplularda işlenen toplam istek sayısı
+        self.en_buyuk_toplu = 0  # Görülen en büyük toplu boyutu
+        self._toplam_sureler = deque(maxlen=GECIKME_PENCERESI)  # İstek başına uçtan uca süre
+        self._bekleme_sureleri = deque(maxlen=GECIKME_PENCERESI)  # Toplu oluşana kadar kuyrukta bekleme
+        self._cikarim_sureleri = deque(maxlen=GECIKME_PENCERESI)  # Toplu başına tespit + OCR süresi
+
+    def _akis(self, kaynak):
+        """Kaynak adına ait durumu döndürür (gerekirse oluşturur); sınır aşılırsa None döndürür."""
+        akis = self._akislar.get(kaynak)
+        if akis is None:
+            if len(self._akislar) >= EN_FAZLA_KAYNAK:
+                return None
+            akis = self._akislar[kaynak] = Akis(kaynak, self.uygulama.ayarlar)
+        return akis
+
+    def _toplu_isle(self, toplu):
+        """
+        Bir topludaki istekleri tek tespit (giriş boyutu başına) ve tek OCR çağrısıyla işler.
+        Yürütücü iş parçacığında çalışır.
+
+        Parametreler:
+            toplu (list): _Istek nesneleri
+
+        Dönüş:
+            tuple: (isteklerle aynı sırada sonuç sözlükleri, toplu işlenme süresi)
+        """
+        uygulama = self.uygulama
+        baslangic = time.perf_counter()
+
+        # Kareleri giriş boyutuna göre grupla ve her grubu tek çağrıda tespit et
+        sonuclar = [None] * len(toplu)
+        ofsetler = [None] * len(toplu)
+        gruplar = {}
+        for j, istek in enumerate(toplu):
+            if istek.akis.ilgi_bolgesi is not None:
+                giris, ofsetler[j] = istek.akis.ilgi_bolgesi.kes(istek.kare)
+            else:
+                giris, ofsetler[j] = istek.kare, (0, 0)
+            gruplar.setdefault(istek.akis.imgsz, []).append((j, giris))
+        with uygulama._asama_olc('yolo'):
+            for imgsz, grup in gruplar.items():
+                for (j, _), sonuc in zip(grup, uygulama.toplu_tahmin([g for _, g in grup], imgsz)):
+                    sonuclar[j] = sonuc
+
+        # İstekler birbirinden bağımsız karelerdir; her kutu tek okumada karar verilen geçici bir izdir
+        kareler = []  # (istek, kutular, izler, okunacaklar)
+        bolge_listesi = []
+        for istek, sonuc, ofset in zip(toplu, sonuclar, ofsetler):
+            kutular, bolgeler = uygulama.kutulari_topla(istek.kare, sonuc, ofset, istek.akis.ilgi_bolgesi)
+            izler = istek.akis.takipci.gecici_izler(kutular)
+            okunacaklar = [i for i, iz in enumerate(izler) if istek.akis.takipci.okunacak_mi(iz)]
+            bolge_listesi.extend(bolgeler[i] for i in okunacaklar)
+            kareler.append((istek, kutular, izler, okunacaklar))
+
+        # Topludaki bütün plakalar tek bir toplu OCR çağrısıyla okunur
+        if bolge_listesi:
+            with uygulama._asama_olc('ocr'):
+                ocr_sonuclari = uygulama.toplu_ocr.oku(bolge_listesi)
+        else:
+            ocr_sonuclari = []
+        cikarim_suresi = time.perf_counter() - baslangic
+
+        # Okumalar sırasıyla isteklere dağıtılır; izin kontrolü ve kayıt kaynağın kendi durumuyla yapılır
+        yanitlar = []
+        sira = 0
+        for istek, kutular, izler, okunacaklar in kareler:
+            istek_ocr = ocr_sonuclari[sira:sira + len(okunacaklar)]
+            sira += len(okunacaklar)
+            okumalar, _ = uygulama.okumalari_isle(istek.akis, izler, okunacaklar, istek_ocr,
+                                                   takip=False, tekrar=True)
+            tespitler = uygulama.tespitleri_ciz(istek.kare, kutular, izler, ciz=False)
+            istek.akis.islenen += 1
+            istek.akis.plaka_sayisi += len(kutular)
+            self.metrikler.kare_islendi(cikarim_suresi, okumalar)
+            yanitlar.append({
+                'kaynak': istek.akis.ad,
+                'plaka_sayisi': len(kutular),
+                'tespitler': [{'kutu': t['kutu'], 'plaka': t['plaka'], 'izinli': t['izinli']} for t in tespitler],
+                'toplu_boyutu': len(toplu),
+                'bekleme_ms': round((baslangic - istek.gelis) * 1000, 2),
+                'cikarim_ms': round(cikarim_suresi * 1000, 2),
+            })
+        return yanitlar, cikarim_suresi
+
+    async def _toplayici(self):
+        """Kuyruktaki istekleri toplular halinde toplayıp yürütücüye gönderir."""
+        dongu = asyncio.get_running_loop()
+        while True:
+            toplu = [await self._kuyruk.get()]
+            son_zaman = dongu.time() + self.en_uzun_bekleme
+            while len(toplu) < self.en_fazla_toplu:
+                kalan = son_zaman - dongu.time()
+                try:
+                    if kalan > 0:
+                        toplu.append(await asyncio.wait_for(self._kuyruk.get(), kalan))
+                    else:
+                        toplu.append(self._kuyruk.get_nowait())  # Süre dolduysa yalnızca bekleyenleri al
+                except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                    break
+
+            try:
+                yanitlar, cikarim_suresi = await dongu.run_in_executor(self._yurutucu, self._toplu_isle, toplu)
+            except Exception as e:
+                print(f"Toplu tespitte hata: {e}")
+                for istek in toplu:
+                    if not istek.sonuc.done():
+                        istek.sonuc.set_exception(e)
+                continue
+
+            self.toplu_sayisi += 1
+            self.toplu_istek += len(toplu)
+            self.en_buyuk_toplu = max(self.en_buyuk_toplu, len(toplu))
+            self._cikarim_sureleri.append(cikarim_suresi)
+            self.metrikler.kaydet('servis_toplu', cikarim_suresi)
+            for istek, yanit in zip(toplu, yanitlar):
+                self._bekleme_sureleri.append(yanit['bekleme_ms'] / 1000)
+                self.metrikler.kaydet('servis_bekleme', yanit['bekleme_ms'] / 1000)
+                if not istek.sonuc.done():  # İstemci bağlantıyı kapattıysa yanıt atlanır
+                    istek.sonuc.set_result(yanit)
+
+    async def _tespit_istegi(self, sorgu, govde):
+        """
+        POST /tespit isteğini işler.
+
+        Dönüş:
+            tuple: (HTTP durum kodu, yanıt sözlüğü)
+        """
+        self.istek += 1
+        if self.eszamanli >= self.en_fazla_eszamanli:
+            self.reddedilen += 1
+            return 503, {'hata': "Servis meşgul, daha sonra yeniden deneyin"}
+        if not govde:
+            self.hatali += 1
+            return 400, {'hata': "İstek gövdesinde görüntü yok"}
+
+        self.eszamanli += 1
+        baslangic = time.perf_counter()
+        try:
+            akis = self._akis(sorgu.get('kaynak', ['servis'])[0])
+            if akis is None:
+                self.hatali += 1
+                return 400, {'hata': f"En fazla {EN_FAZLA_KAYNAK} farklı kaynak adı kullanılabilir"}
+
+            dongu = asyncio.get_running_loop()
+            kare = await dongu.run_in_executor(None, _goruntu_coz, govde)  # Çözme olay döngüsünü bekletmez
+            if kare is None:
+                self.hatali += 1
+                return 400, {'hata': "Görüntü çözülemedi (JPEG veya PNG bekleniyor)"}
+
+            sonuc = dongu.create_future()
+            await self._kuyruk.put(_Istek(kare, akis, sonuc))
+            try:
+                yanit = await sonuc
+            except Exception as e:
+                self.hatali += 1
+                return 500, {'hata': f"Tespit yapılamadı: {e}"}
+
+            toplam = time.perf_counter() - baslangic
+            self._toplam_sureler.append(toplam)
+            self.metrikler.kaydet('servis_istek', toplam)
+            self.basarili += 1
+            yanit['toplam_ms'] = round(toplam * 1000, 2)
+            return 200, yanit
+        finally:
+            self.eszamanli -= 1
+
+    async def _yonlendir(self, yontem, yol, govde):
+        """
+        İsteği uç noktasına yönlendirir.
+
+        Dönüş:
+            tuple: (HTTP durum kodu, yanıt gövdesi (bayt), içerik türü)
+        """
+        adres = urlparse(yol)
+        if adres.path == '/tespit' and yontem == 'POST':
+            kod, yanit = await self._tespit_istegi(parse_qs(adres.query), govde)
+        elif adres.path == '/istatistik' and yontem == 'GET':
+            kod, yanit = 200, self.istatistikler()
+        elif adres.path == '/metrics' and yontem == 'GET':
+            return 200, self.metrikler.prometheus_metni().encode('utf-8'), 'text/plain; version=0.0.4; charset=utf-8'
+        elif adres.path == '/saglik' and yontem == 'GET':
+            kod, yanit = 200, {'hazir': True, 'toplu_cikarim': self.uygulama.toplu_cikarim}
+        else:
+            kod, yanit = 404, {'hata': "Bulunamadı"}
+        return kod, json.dumps(yanit, ensure_ascii=False).encode('utf-8'), 'application/json; charset=utf-8'
+
+    @staticmethod
+    def _yanit_yaz(writer, kod, veri, tur, kapat=False):
+        """HTTP/1.1 yanıtını yazar."""
+        basliklar = [
+            f"HTTP/1.1 {kod} {HTTPStatus(kod).phrase}",
+            f"Content-Type: {tur}",
+            f"Content-Length: {len(veri)}",
+            f"Connection: {'close' if kapat else 'keep-alive'}",
+        ]
+        if kod == 503:
+            basliklar.append("Retry-After: 1")
+        writer.write(("\r\n".join(basliklar) + "\r\n\r\n").encode('latin-1') + veri)
+
+    async def _baglanti(self, reader, writer):
+        """Tek bir istemci bağlantısındaki istekleri sırayla (keep-alive) karşılar."""
+        try:
+            while True:
+                istek_satiri = await reader.readline()
+                if not istek_satiri:
+                    break
+                try:
+                    yontem, yol, surum = istek_satiri.decode('latin-1').split()
+                except ValueError:
+                    self._yanit_yaz(writer, 400, b'', 'text/plain', kapat=True)
+                    break
+
+                basliklar = {}
+                while True:
+                    satir = await reader.readline()
+                    if satir in (b'\r\n', b'\n', b''):
+                        break
+                    ad, _, deger = satir.decode('latin-1').partition(':')
+                    basliklar[ad.strip().lower()] = deger.strip()
+
+                uzunluk = int(basliklar.get('content-length') or 0)
+                if uzunluk > self.en_buyuk_istek:
+                    self.hatali += 1
+                    self._yanit_yaz(writer, 413, b'', 'text/plain', kapat=True)
+                    break
+                govde = await reader.readexactly(uzunluk) if uzunluk else b''
+
+                kapat = basliklar.get('connection', '').lower() == 'close' or surum == 'HTTP/1.0'
+                kod, veri, tur = await self._yonlendir(yontem, yol, govde)
+                self._yanit_yaz(writer, kod, veri, tur, kapat)
+                await writer.drain()
+                if kapat:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass  # İstemci bağlantıyı kesti veya bozuk istek gönderdi
+        finally:
+            writer.close()
+
+    def istatistikler(self):
+        """
+        Dönüş:
+            dict: İstek sayaçları, ortalama toplu boyutu ve gecikme yüzdelikleri (milisaniye)
+        """
+        t50, t95, t99 = _yuzdelikler(list(self._toplam_sureler))
+        b50, b95, _ = _yuzdelikler(list(self._bekleme_sureleri))
+        c50, c95, _ = _yuzdelikler(list(self._cikarim_sureleri))
+        return {
+            'istek': self.istek,
+            'basarili': self.basarili,
+            'reddedilen': self.reddedilen,
+            'hatali': self.hatali,
+            'eszamanli': self.eszamanli,
+            'kuyrukta': self._kuyruk.qsize() if self._kuyruk is not None else 0,
+            'toplu_sayisi': self.toplu_sayisi,
+            'ortalama_toplu': self.toplu_istek / self.toplu_sayisi if self.toplu_sayisi else 0.0,
+            'en_buyuk_toplu': self.en_buyuk_toplu,
+            'toplam_ms_p50': t50,
+            'toplam_ms_p95': t95,
+            'toplam_ms_p99': t99,
+            'bekleme_ms_p50': b50,
+            'bekleme_ms_p95': b95,
+            'cikarim_ms_p50': c50,
+            'cikarim_ms_p95': c95,
+        }
+
+    async def calistir(self):
+        """Sunucuyu başlatır ve iptal edilene kadar istekleri karşılar."""
+        self._kuyruk = asyncio.Queue()
+        self._sunucu = await asyncio.start_server(self._baglanti, self.adres, self.port)
+        self.port = self._sunucu.sockets[0].getsockname()[1]
+        toplayici = asyncio.create_task(self._toplayici())
+        print(f"Çıkarım servisi http://{self.adres}:{self.port} adresinde dinliyor "
+              f"(en fazla toplu {self.en_fazla_toplu}, bekleme {self.en_uzun_bekleme * 1000:.0f} ms, "
+              f"en fazla eşzamanlı {self.en_fazla_eszamanli}).")
+        try:
+            async with self._sunucu:
+                await self._sunucu.serve_forever()
+        finally:
+            toplayici.cancel()
+            self._yurutucu.shutdown(wait=False)
+            self.metrikler.kaynak_cikar('servis')
+
+
+async def _http_istegi(reader, writer, yontem, yol, govde=b'', tur='image/jpeg'):
+    """Açık bağlantı üzerinden bir HTTP/1.1 isteği gönderir ve (durum kodu, gövde) döndürür."""
+    writer.write((f"{yontem} {yol} HTTP/1.1\r\nHost: yerel\r\nContent-Type: {tur}\r\n"
+                  f"Content-Length: {len(govde)}\r\n\r\n").encode('latin-1') + govde)
+    await writer.drain()
+    durum_satiri = await reader.readline()
+    if not durum_satiri:
+        raise ConnectionError("Sunucu bağlantıyı kapattı")
+    kod = int(durum_satiri.split()[1])
+    uzunluk = 0
+    while True:
+        satir = await reader.readline()
+        if satir in (b'\r\n', b'\n', b''):
+            break
+        ad, _, deger = satir.decode('latin-1').partition(':')
+        if ad.strip().lower() == 'content-length':
+            uzunluk = int(deger)
+    return kod, await reader.readexactly(uzunluk)
+
+
+async def yuk_testi(adres, port, goruntuler, istemci_sayisi=16, istek_sayisi=400, kaynak_sayisi=1):
+    """
+    Servise eşzamanlı istemcilerden istek göndererek gecikme ve verimi ölçer.
+
+    Parametreler:
+        adres (str): Servis adresi
+        port (int): Servis portu
+        goruntuler (list): Sırayla gönderilecek JPEG baytları
+        istemci_sayisi (int): Aynı anda istek gönderen istemci (bağlantı) sayısı
+        istek_sayisi (int): Toplam istek sayısı
+        kaynak_sayisi (int): İsteklerin dağıtılacağı kaynak adı sayısı (kapı1, kapı2, ...)
+
+    Dönüş:
+        dict: İstemci tarafı verim, gecikme yüzdelikleri, durum kodları ve servis istatistikleri
+    """
+    sayac = iter(range(istek_sayisi))
+    gecikmeler = []
+    kodlar = {}
+
+    async def _istemci(no):
+        reader, writer = await asyncio.open_connection(adres, port)
+        try:
+            for i in sayac:
+                yol = f"/tespit?kaynak=kapi{(no % kaynak_sayisi) + 1}"
+                baslangic = time.perf_counter()
+                kod, _ = await _http_istegi(reader, writer, 'POST', yol, goruntuler[i % len(goruntuler)])
+                gecikmeler.append(time.perf_counter() - baslangic)
+                kodlar[kod] = kodlar.get(kod, 0) + 1
+        finally:
+            writer.close()
+
+    baslangic = time.perf_counter()
+    await asyncio.gather(*(_istemci(no) for no in range(istemci_sayisi)))
+    sure = time.perf_counter() - baslangic
+
+    reader, writer = await asyncio.open_connection(adres, port)
+    try:
+        _, veri = await _http_istegi(reader, writer, 'GET', '/istatistik')
+    finally:
+        writer.close()
+
+    p50, p95, p99 = _yuzdelikler(gecikmeler)
+    return {
+        'istemci': istemci_sayisi,
+        'istek': len(gecikmeler),
+        'sure_sn': round(sure, 3),
+        'istek_sn': round(len(gecikmeler) / max(sure, 1e-9), 2),
+        'gecikme_ms_p50': round(p50, 2),
+        'gecikme_ms_p95': round(p95, 2),
+        'gecikme_ms_p99': round(p99, 2),
+        'durum_kodlari': {str(k): v for k, v in sorted(kodlar.items())},
+        'servis': json.loads(veri),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plaka tespit ve OCR modellerini yerel HTTP servisi olarak sun")
+    alt = parser.add_subparsers(dest='komut', required=True)
+
+    p_sun = alt.add_parser('sun', help="Servisi başlat")
+    p_sun.add_argument('--adres', help="Dinlenecek adres (varsayılan ayarlardaki servis.adres)")
+    p_sun.add_argument('--port', type=int, help="Dinlenecek port (varsayılan ayarlardaki servis.port)")
+    p_sun.add_argument('--en-fazla-toplu', type=int, help="Tek topludaki en fazla istek sayısı")
+    p_sun.add_argument('--bekleme-ms', type=float, help="Toplu doldurmak için beklenecek en uzun süre (ms)")
+    p_sun.add_argument('--en-fazla-eszamanli', type=int, help="Aynı anda işlenen en fazla istek sayısı")
+    p_sun.add_argument('--veritabani', action='store_true', help="İzin kontrolü ve kayıt için veritabanını kullan")
+
+    p_yuk = alt.add_parser('yuk', help="Çalışan servise yük testi uygula")
+    p_yuk.add_argument('klasor', help="Gönderilecek JPEG görüntülerin bulunduğu klasör")
+    p_yuk.add_argument('--adres', default='127.0.0.1')
+    p_yuk.add_argument('--port', type=int, default=8765)
+    p_yuk.add_argument('--istemci', type=int, nargs='+', default=[1, 4, 16],
+                       help="Denenecek eşzamanlı istemci sayıları")
+    p_yuk.add_argument('--istek', type=int, default=200, help="Her denemedeki toplam istek sayısı")
+    p_yuk.add_argument('--kaynak-sayisi', type=int, default=1, help="İsteklerin dağıtılacağı kaynak adı sayısı")
+    p_yuk.add_argument('-o', '--cikti', help="Raporun yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    if args.komut == 'yuk':
+        dosyalar = sorted(p for p in Path(args.klasor).iterdir() if p.suffix.lower() in ('.jpg', '.jpeg'))
+        if not dosyalar:
+            parser.error(f"'{args.klasor}' içinde JPEG görüntü bulunamadı")
+        goruntuler = [p.read_bytes() for p in dosyalar]
+        raporlar = []
+        for istemci in args.istemci:
+            rapor = asyncio.run(yuk_testi(args.adres, args.port, goruntuler, istemci, args.istek,
+                                          args.kaynak_sayisi))
+            raporlar.append(rapor)
+            print(f"{istemci:>3} istemci: {rapor['istek_sn']:>7.2f} istek/sn, p50 {rapor['gecikme_ms_p50']:.1f} ms, "
+                  f"p95 {rapor['gecikme_ms_p95']:.1f} ms, p99 {rapor['gecikme_ms_p99']:.1f} ms, "
+                  f"ortalama toplu {rapor['servis']['ortalama_toplu']:.2f}, kodlar {rapor['durum_kodlari']}")
+        if args.cikti:
+            with open(args.cikti, 'w', encoding='utf-8') as f:
+                json.dump(raporlar, f, ensure_ascii=False, indent=2)
+        return
+
+    from plaka_tespit_test import PlakaTespitTest  # Tespit sınıfı
+    from db_operations import PlakaTespitDB, BosVeritabani  # Veritabanı sınıfları
+    from ayarlar import ayarlari_yukle  # Servis, izin ve tekrar ayarları için
+
+    ayarlar = ayarlari_yukle()
+    ayar = ayarlar['servis']
+    db = PlakaTespitDB.ayarlardan(ayarlar) if args.veritabani else BosVeritabani()
+    uygulama = PlakaTespitTest(arayuz=False, db=db)
+    if not uygulama.modeller_hazir.is_set():
+        print(f"Modeller yüklenemedi: {uygulama.yukleme_hatasi}", file=sys.stderr)
+        db.kapat()
+        sys.exit(1)
+
+    servis = CikarimServisi(
+        uygulama,
+        adres=args.adres or ayar['adres'],
+        port=args.port if args.port is not None else ayar['port'],
+        en_fazla_toplu=args.en_fazla_toplu or ayar['en_fazla_toplu'],
+        en_uzun_bekleme=args.bekleme_ms / 1000 if args.bekleme_ms is not None else ayar['en_uzun_bekleme'],
+        en_fazla_eszamanli=args.en_fazla_eszamanli or ayar['en_fazla_eszamanli'],
+        en_buyuk_istek=ayar['en_buyuk_istek'],
+    )
+    try:
+        asyncio.run(servis.calistir())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db.kapat()
+        print(f"Çıkarım servisi kapatıldı: {servis.istatistikler()}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,405 @@
+# Bu dosya, birden fazla kamerayı, video dosyasını veya RTSP akışını tek süreçte işleyen çoklu kaynak çalıştırıcısını içerir.
+# YOLO ve OCR modelleri bir kez yüklenir; bütün akışların kareleri tek bir toplu tespit çağrısında, plaka
+# bölgeleri de tek bir toplu OCR çağrısında işlenir. Takip, izin kararları ve istatistikler akış başına ayrı tutulur.
+
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import os  # Dosya ve dizin işlemleri için kullanılır
+import queue  # Yakalama iş parçacıkları ile tespit adımı arasındaki kuyruklar için kullanılır
+import sys  # Özet çıktısını standart hataya yazmak için kullanılır
+import threading  # Yakalama ve tespit adımlarını ayrı iş parçacıklarında çalıştırmak için kullanılır
+import time  # Zaman ölçümleri için kullanılır
+from collections import Counter  # Akış başına izin kararlarını saymak için kullanılır
+import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
+from ilgi_bolgesi import IlgiBolgesi  # Kaynağa özel ilgi bölgesi
+from plaka_takip import PlakaTakipci  # Akış başına plaka takipçisi
+from tekrar_onbellegi import TekrarOnbellegi  # Akış başına plaka tekrar önbelleği
+
+_BITTI = object()  # Akışın sona erdiğini tespit adımına bildiren işaret nesnesi
+
+
+def kaynak_adi(kaynak):
+    """
+    Kaynağın ayarlardaki 'kameralar' bölümünde aranacak adını döndürür (kaynak_ayarla ile aynı kural).
+
+    Parametreler:
+        kaynak (str): Kamera numarası, video dosyası veya RTSP/HTTP adresi
+
+    Dönüş:
+        str: Kamera numarası, video dosyasının adı veya adresin kendisi
+    """
+    kaynak = str(kaynak)
+    if kaynak.isdigit() or '://' in kaynak:
+        return kaynak
+    return os.path.basename(kaynak)
+
+
+class Akis:
+    """
+    Tek bir kaynağın yakalama iş parçacığını ve ona ait tespit durumunu tutar.
+
+    PlakaTespitTest.okumalari_isle bu nesneyi durum olarak kullanır; böylece her akışın
+    takipçisi ve son izinli tespit zamanı diğer akışlardan bağımsızdır.
+    """
+
+    def __init__(self, kaynak, ayarlar, canli=None, kuyruk_boyutu=2):
+        """
+        Parametreler:
+            kaynak (str): Kamera numarası, video dosyası veya RTSP/HTTP adresi
+            ayarlar (dict): Uygulama ayarları (kaynağa özel ilgi bölgesi ve imgsz için)
+            canli (bool): True ise kuyruk doluyken eski kareler atılır ve dosyalar kendi FPS'lerinde okunur;
+                None ise kameralar ve ağ akışları canlı, dosyalar canlı değil sayılır
+            kuyruk_boyutu (int): Tespit bekleyen en fazla kare sayısı
+        """
+        self.kaynak = str(kaynak)
+        self.ad = kaynak_adi(kaynak)
+        dosya = not (self.kaynak.isdigit() or '://' in self.kaynak)
+        self.canli = (not dosya) if canli is None else canli
+        self.dosya_hizinda = dosya and self.canli  # Dosya kamera yerine kullanılıyorsa gerçek zamanlı oku
+
+        kamera = ayarlar['kameralar'].get(self.ad, {})
+        self.ilgi_bolgesi = IlgiBolgesi.ayardan(kamera.get('ilgi_bolgesi'))
+        self.imgsz = kamera.get('imgsz') or ayarlar['tespit']['imgsz']
+
+        # Akışa özel tespit durumu
+        self.takipci = PlakaTakipci()
+        self.tekrar_onbellegi = TekrarOnbellegi.ayarlardan(ayarlar)  # Giriş ve çıkış kapıları ayrı kaydeder
+        self.son_izinli_tespit_zamani = 0
+        self.son_tespitler = []
+        self.son_kare = None  # Görüntüleme için son işlenen kare
+
+        self.kuyruk = queue.Queue(maxsize=kuyruk_boyutu)
+        self.cap = None
+        self.bitti = False
+
+        # Sayaçlar
+        self.yakalanan = 0  # Kaynaktan okunan kare sayısı
+        self.islenen = 0  # Tespitten geçen kare sayısı
+        self.dusurulen = 0  # Kuyruk dolu olduğu için atılan kare sayısı
+        self.plaka_sayisi = 0  # Tespit edilen kutu sayısı
+        self.kararlar = Counter()  # İzinli / izinsiz karar sayıları
+
+    def ac(self):
+        """Kaynağı açar; açılamazsa False döndürür."""
+        self.cap = cv2.VideoCapture(int(self.kaynak) if self.kaynak.isdigit() else self.kaynak)
+        if not self.cap.isOpened():
+            return False
+        if self.canli and not self.dosya_hizinda:
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Sürücü tamponunda eski karelerin birikmesini engeller
+        return True
+
+    def _kuyruga_koy(self, oge, durdur_olayi):
+        """Canlı akışta en eski kareyi atarak, dosyada yer açılmasını bekleyerek kuyruğa koyar."""
+        if self.canli:
+            while True:
+                try:
+                    self.kuyruk.put_nowait(oge)
+                    return
+                except queue.Full:
+                    try:
+                        if self.kuyruk.get_nowait() is not _BITTI:
+                            self.dusurulen += 1
+                    except queue.Empty:
+                        pass
+        while not durdur_olayi.is_set():
+            try:
+                self.kuyruk.put(oge, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def yakalama_dongusu(self, durdur_olayi):
+        """Kaynaktan kare okur ve kuyruğa koyar."""
+        aralik = 1.0 / (self.cap.get(cv2.CAP_PROP_FPS) or 25.0) if self.dosya_hizinda else 0.0
+        sonraki = time.monotonic()
+        while not durdur_olayi.is_set():
+            ret, frame = self.cap.read()  # Kaynaktan görüntü alır
+            if not ret:
+                break
+            self.yakalanan += 1
+            self._kuyruga_koy(frame, durdur_olayi)
+            if aralik:
+                sonraki += aralik
+                time.sleep(max(sonraki - time.monotonic(), 0))
+        self.cap.release()
+        self._kuyruga_koy(_BITTI, durdur_olayi)  # Akışın bittiğini bildir
+
+    def istatistikler(self):
+        """
+        Dönüş:
+            dict: Akışın kuyruk doluluğu, kare ve karar sayaçları
+        """
+        tekrar = self.tekrar_onbellegi.istatistikler() if self.tekrar_onbellegi is not None else {}
+        return {
+            'kuyruk': self.kuyruk.qsize(),
+            'yakalanan': self.yakalanan,
+            'islenen': self.islenen,
+            'dusurulen': self.dusurulen,
+            'plaka_sayisi': self.plaka_sayisi,
+            'izinli': self.kararlar[True],
+            'izinsiz': self.kararlar[False],
+            'tekrar_isabet': tekrar.get('isabet', 0),
+            'tekrar_iska': tekrar.get('iska', 0),
+        }
+
+
+class CokluKaynakCalistirici:
+    """
+    Birden fazla akışı tek bir PlakaTespitTest nesnesinin modelleriyle işler.
+
+    Her akışın yakalama adımı kendi iş parçacığında çalışır. Tespit adımı her turda kuyruğunda kare
+    bulunan bütün akışlardan birer kare alır; aynı giriş boyutundaki kareler tek bir YOLO çağrısında,
+    bütün akışlardaki okunacak plakalar da tek bir toplu OCR çağrısında işlenir.
+    """
+
+    def __init__(self, uygulama, kaynaklar, canli=None, goster=False, sonuc_fonksiyonu=None,
+                 en_fazla_toplu=16):
+        """
+        Parametreler:
+            uygulama (PlakaTespitTest): Modelleri yüklenmiş tespit nesnesi
+            kaynaklar (list): Kamera numaraları, video dosyaları veya RTSP/HTTP adresleri
+            canli (bool): Akış tipini zorlamak için (bkz. Akis); None ise kaynağa göre belirlenir
+            goster (bool): İşlenen kareler akış başına bir pencerede gösterilsin mi
+            sonuc_fonksiyonu: Karar verilen her kare için sonuç kaydıyla çağrılan fonksiyon
+            en_fazla_toplu (int): Tek bir tespit çağrısındaki en fazla kare sayısı
+        """
+        self.uygulama = uygulama
+        self.akislar = [Akis(k, uygulama.ayarlar, canli) for k in kaynaklar]
+        self.goster = goster
+        self.sonuc_fonksiyonu = sonuc_fonksiyonu
+        self.en_fazla_toplu = en_fazla_toplu
+        self.durdur_olayi = threading.Event()
+        self.iplikler = []
+        self._baslangic_sirasi = 0  # Turda akışların taranmaya başlanacağı sıra (her turda kaydırılır)
+
+        # Sayaçlar
+        self.tur_sayisi = 0  # Yapılan tespit turu sayısı
+        self.toplu_kare = 0  # Turlarda işlenen toplam kare sayısı
+
+    def _turu_isle(self, toplu):
+        """
+        Bir turda toplanan kareleri işler.
+
+        Parametreler:
+            toplu (list): (akış, kare) çiftleri
+        """
+        uygulama = self.uygulama
+        baslangic = time.perf_counter()
+
+        # Kareleri giriş boyutuna göre grupla ve her grubu tek çağrıda tespit et
+        sonuclar = [None] * len(toplu)
+        ofsetler = [None] * len(toplu)
+        gruplar = {}
+        for j, (akis, frame) in enumerate(toplu):
+            if akis.ilgi_bolgesi is not None:
+                giris, ofsetler[j] = akis.ilgi_bolgesi.kes(frame)
+            else:
+                giris, ofsetler[j] = frame, (0, 0)
+            gruplar.setdefault(akis.imgsz, []).append((j, giris))
+        with uygulama._asama_olc('yolo'):
+            for imgsz, grup in gruplar.items():
+                for (j, _), sonuc in zip(grup, uygulama.toplu_tahmin([g for _, g in grup], imgsz)):
+                    sonuclar[j] = sonuc
+
+        # Akış başına takip; okunacak bölgeler bütün akışlardan toplanır
+        kareler = []  # (akış, kare, kutular, izler, okunacaklar)
+        bolge_listesi = []
+        for (akis, frame), sonuc, ofset in zip(toplu, sonuclar, ofsetler):
+            kutular, bolgeler = uygulama.kutulari_topla(frame, sonuc, ofset, akis.ilgi_bolgesi)
+            with uygulama._asama_olc('takip'):
+                izler = akis.takipci.guncelle(kutular)
+            okunacaklar = [i for i, iz in enumerate(izler) if akis.takipci.okunacak_mi(iz)]
+            bolge_listesi.extend(bolgeler[i] for i in okunacaklar)
+            kareler.append((akis, frame, kutular, izler, okunacaklar))
+
+        # Bütün akışların plakaları tek bir toplu OCR çağrısıyla okunur
+        if bolge_listesi:
+            with uygulama._asama_olc('ocr'):
+                ocr_sonuclari = uygulama.toplu_ocr.oku(bolge_listesi)
+        else:
+            ocr_sonuclari = []
+        tespit_suresi = time.perf_counter() - baslangic
+
+        # OCR sonuçları sırasıyla akışlara dağıtılır; izin kararları akışın kendi durumuyla verilir
+        sira = 0
+        for akis, frame, kutular, izler, okunacaklar in kareler:
+            akis_ocr = ocr_sonuclari[sira:sira + len(okunacaklar)]
+            sira += len(okunacaklar)
+            okumalar, kararlar = uygulama.okumalari_isle(akis, izler, okunacaklar, akis_ocr)
+            akis.son_tespitler = uygulama.tespitleri_ciz(frame, kutular, izler, akis.ilgi_bolgesi,
+                                                         ciz=self.goster)
+            akis.islenen += 1
+            akis.plaka_sayisi += len(kutular)
+            if uygulama.metrikler is not None:
+                uygulama.metrikler.kare_islendi(tespit_suresi, okumalar)
+            for _, izinli in kararlar:
+                akis.kararlar[bool(izinli)] += 1
+            if self.goster:
+                akis.son_kare = frame
+            if kararlar and self.sonuc_fonksiyonu is not None:
+                self.sonuc_fonksiyonu({
+                    'kaynak': akis.ad,
+                    'kare': akis.islenen - 1,
+                    'plaka_sayisi': len(kutular),
+                    'plakalar': [p for p, _ in kararlar],
+                    'izinler': [i for _, i in kararlar],
+                    'tespit_ms': round(tespit_suresi * 1000, 2),
+                    'toplu': len(toplu),
+                })
+
+        self.tur_sayisi += 1
+        self.toplu_kare += len(toplu)
+
+    def _tespit_dongusu(self):
+        """Akışların kuyruklarındaki kareleri turlar halinde toplayıp işler."""
+        while not self.durdur_olayi.is_set():
+            # Tarama her turda bir sonraki akıştan başlar; böylece en_fazla_toplu'dan fazla akış
+            # olduğunda sondaki akışlar hiç işlenmeden beklemez
+            toplu = []
+            adet = len(self.akislar)
+            baslangic = self._baslangic_sirasi
+            self._baslangic_sirasi = (baslangic + 1) % adet
+            for k in range(adet):
+                akis = self.akislar[(baslangic + k) % adet]
+                if akis.bitti or len(toplu) >= self.en_fazla_toplu:
+                    continue
+                try:
+                    frame = akis.kuyruk.get_nowait()
+                except queue.Empty:
+                    continue
+                if frame is _BITTI:
+                    akis.bitti = True
+                    continue
+                toplu.append((akis, frame))
+
+            if not toplu:
+                if all(akis.bitti for akis in self.akislar):
+                    break
+                time.sleep(0.002)  # Yeni kare gelmesini bekle
+                continue
+            try:
+                self._turu_isle(toplu)
+            except Exception as e:
+                print(f"Tespit adımında hata: {e}")
+        self.durdur_olayi.set()
+
+    def istatistikler(self):
+        """
+        Dönüş:
+            dict: Ortalama toplu boyutu ve akış adına göre akış istatistikleri
+        """
+        return {
+            'tur_sayisi': self.tur_sayisi,
+            'ortalama_toplu': self.toplu_kare / self.tur_sayisi if self.tur_sayisi else 0.0,
+            'akislar': {akis.ad: akis.istatistikler() for akis in self.akislar},
+        }
+
+    def calistir(self):
+        """
+        Akışları açar ve hepsi bitene, 'q' tuşuna basılana veya durdurulana kadar işler.
+
+        Dönüş:
+            dict: Son durumdaki istatistikler
+        """
+        acik = []
+        for akis in self.akislar:
+            if akis.ac():
+                acik.append(akis)
+            else:
+                print(f"Kaynak açılamadı, atlanıyor: {akis.kaynak}")
+        self.akislar = acik
+        if not self.akislar:
+            return self.istatistikler()
+
+        metrikler = self.uygulama.metrikler
+        if metrikler is not None:
+            for i, akis in enumerate(self.akislar):
+                metrikler.kaynak_ekle(f"akis{i}", akis.istatistikler)
+
+        self.iplikler = [threading.Thread(target=akis.yakalama_dongusu, args=(self.durdur_olayi,),
+                                          name=f"yakalama_{i}", daemon=True)
+                         for i, akis in enumerate(self.akislar)]
+        for iplik in self.iplikler:
+            iplik.start()
+
+        try:
+            if self.goster:
+                # OpenCV pencereleri ana iş parçacığında çalışmak zorunda olduğu için tespit ayrı iş parçacığındadır
+                tespit = threading.Thread(target=self._tespit_dongusu, name='coklu_tespit', daemon=True)
+                tespit.start()
+                while tespit.is_alive():
+                    for akis in self.akislar:
+                        if akis.son_kare is not None:
+                            cv2.imshow(akis.ad, cv2.resize(akis.son_kare, (600, 600)))
+                    if cv2.waitKey(15) & 0xFF == ord('q'):
+                        break
+                cv2.destroyAllWindows()
+            else:
+                self._tespit_dongusu()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.durdur_olayi.set()
+            for iplik in self.iplikler:
+                iplik.join(timeout=2)
+            if metrikler is not None:
+                for i in range(len(self.akislar)):
+                    metrikler.kaynak_cikar(f"akis{i}")
+        return self.istatistikler()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Birden fazla kamera / video / RTSP akışında ortak modellerle plaka tespiti")
+    parser.add_argument('kaynaklar', nargs='*', help="Kamera numarası, video dosyası veya RTSP adresi "
+                                                     "(verilmezse ayarlardaki 'kaynaklar' listesi)")
+    parser.add_argument('-o', '--cikti', help="İzin kararlarının yazılacağı dosya (.jsonl veya .csv), '-' ise standart çıktı")
+    parser.add_argument('--canli', action='store_true',
+                        help="Video dosyalarını kamera gibi kendi FPS'lerinde oku ve geciken kareleri at")
+    parser.add_argument('--goster', action='store_true', help="Her akışı ayrı pencerede göster")
+    parser.add_argument('--veritabani', action='store_true', help="İzin kontrolü ve kayıt için veritabanını kullan")
+    parser.add_argument('--en-fazla-toplu', type=int, default=16, help="Tek tespit çağrısındaki en fazla kare sayısı")
+    args = parser.parse_args()
+
+    from plaka_tespit_test import PlakaTespitTest  # Tespit sınıfı
+    from db_operations import PlakaTespitDB, BosVeritabani  # Veritabanı sınıfları
+    from toplu_tespit import SonucYazici  # JSONL / CSV sonuç yazıcısı
+
+    from ayarlar import ayarlari_yukle  # İzin ve tekrar ayarları için
+
+    db = PlakaTespitDB.ayarlardan(ayarlari_yukle()) if args.veritabani else BosVeritabani()
+    uygulama = PlakaTespitTest(arayuz=False, db=db)
+    if not uygulama.modeller_hazir.is_set():
+        print(f"Modeller yüklenemedi: {uygulama.yukleme_hatasi}", file=sys.stderr)
+        db.kapat()
+        sys.exit(1)
+
+    kaynaklar = args.kaynaklar or uygulama.ayarlar['kaynaklar']
+    if not kaynaklar:
+        parser.error("En az bir kaynak verilmeli (komut satırında veya ayarlardaki 'kaynaklar' listesinde)")
+
+    yazici = None
+    if args.cikti:
+        yazici = SonucYazici(args.cikti, 'csv' if args.cikti.endswith('.csv') else 'jsonl')
+
+    calistirici = CokluKaynakCalistirici(uygulama, kaynaklar, canli=True if args.canli else None,
+                                         goster=args.goster, sonuc_fonksiyonu=yazici.yaz if yazici else None,
+                                         en_fazla_toplu=args.en_fazla_toplu)
+    baslangic = time.perf_counter()
+    try:
+        ist = calistirici.calistir()
+    finally:
+        if yazici is not None:
+            yazici.kapat()
+        if uygulama.metrik_sunucusu is not None:
+            uygulama.metrik_sunucusu.durdur()
+        db.kapat()
+    sure = time.perf_counter() - baslangic
+
+    toplam = sum(a['islenen'] for a in ist['akislar'].values())
+    print(f"{len(ist['akislar'])} akış, {toplam} kare {sure:.1f} sn'de işlendi ({toplam / max(sure, 1e-9):.2f} kare/sn), "
+          f"ortalama toplu boyutu {ist['ortalama_toplu']:.2f}.", file=sys.stderr)
+    for ad, akis_ist in ist['akislar'].items():
+        print(f"  {ad}: {akis_ist}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,621 @@
+# Bu dosya, plakalar olay tablosunu büyüdükçe yavaşlamayacak hale getiren veritabanı göçlerini içerir:
+# tespit_zamani üzerinde aylık bölümleme, kapsayan indeksler, artımlı güncellenen saatlik / günlük özetler
+# ve bu yapıları kullanan rapor sorguları. Göçler sürüm tablosuyla izlenir ve her biri bir kez uygulanır.
+
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import datetime  # Aylık bölüm sınırlarını hesaplamak için kullanılır
+import statistics  # Ölçümlerde ortanca süre için kullanılır
+import time  # Göç ve sorgu sürelerini ölçmek için kullanılır
+import psycopg2  # PostgreSQL bağlantısı için kullanılır
+from psycopg2.extras import execute_values  # Ölçümde çok satırlı INSERT için kullanılır
+
+GOC_KILIDI = 4613_0023  # Aynı anda iki sürecin göç veya bölüm oluşturmasını engelleyen danışma kilidi
+
+# Göç 0: Projenin ilk tablo yapısı (README'de anlatılan); tablolar varsa dokunulmaz
+TEMEL_TABLOLAR_SQL = """
+CREATE TABLE IF NOT EXISTS izinli_plakalar (
+    plaka VARCHAR PRIMARY KEY,
+    aktif BOOLEAN DEFAULT TRUE,
+    baslangic_tarih DATE,
+    bitis_tarih DATE
+);
+CREATE TABLE IF NOT EXISTS plakalar (
+    id SERIAL PRIMARY KEY,
+    plaka VARCHAR,
+    durum BOOLEAN,
+    tespit_zamani TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Göç 2: Rapor ve izin sorgularının tabloya gitmeden indeksten cevaplanması için kapsayan indeksler
+INDEKSLER_SQL = """
+CREATE INDEX IF NOT EXISTS plakalar_plaka_zaman ON plakalar (plaka, tespit_zamani DESC) INCLUDE (durum);
+CREATE INDEX IF NOT EXISTS plakalar_zaman_brin ON plakalar USING brin (tespit_zamani);
+CREATE INDEX IF NOT EXISTS izinli_plakalar_aktif ON izinli_plakalar (plaka)
+    INCLUDE (baslangic_tarih, bitis_tarih) WHERE aktif;
+"""
+
+# Göç 3: Özet tabloları ve her INSERT ifadesinde eklenen satırlarla özetleri güncelleyen tetikleyici.
+# Tetikleyici ifade başına çalışır; KayitYazici'nin toplu INSERT'lerinde özet güncellemesi toplu başına bir kez yapılır.
+OZETLER_SQL = """
+CREATE TABLE plakalar_saatlik (
+    saat TIMESTAMP NOT NULL,
+    durum BOOLEAN NOT NULL,
+    adet BIGINT NOT NULL,
+    PRIMARY KEY (saat, durum)
+);
+CREATE TABLE plakalar_gunluk (
+    gun DATE NOT NULL,
+    durum BOOLEAN NOT NULL,
+    adet BIGINT NOT NULL,
+    PRIMARY KEY (gun, durum)
+);
+CREATE TABLE plaka_son_gorulme (
+    plaka VARCHAR PRIMARY KEY,
+    son_gorulme TIMESTAMP NOT NULL,
+    son_durum BOOLEAN,
+    gorulme_sayisi BIGINT NOT NULL
+);
+
+CREATE OR REPLACE FUNCTION plakalar_ozet_guncelle() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO plakalar_saatlik (saat, durum, adet)
+        SELECT date_trunc('hour', tespit_zamani), COALESCE(durum, FALSE), count(*)
+        FROM yeni_satirlar GROUP BY 1, 2 ORDER BY 1, 2
+    ON CONFLICT (saat, durum) DO UPDATE SET adet = plakalar_saatlik.adet + EXCLUDED.adet;
+
+    INSERT INTO plakalar_gunluk (gun, durum, adet)
+        SELECT tespit_zamani::date, COALESCE(durum, FALSE), count(*)
+        FROM yeni_satirlar GROUP BY 1, 2 ORDER BY 1, 2
+    ON CONFLICT (gun, durum) DO UPDATE SET adet = plakalar_gunluk.adet + EXCLUDED.adet;
+
+    INSERT INTO plaka_son_gorulme (plaka, son_gorulme, son_durum, gorulme_sayisi)
+        SELECT DISTINCT ON (plaka) plaka, tespit_zamani, durum, count(*) OVER (PARTITION BY plaka)
+        FROM yeni_satirlar WHERE plaka IS NOT NULL
+        ORDER BY plaka, tespit_zamani DESC
+    ON CONFLICT (plaka) DO UPDATE SET
+        son_durum = CASE WHEN EXCLUDED.son_gorulme >= plaka_son_gorulme.son_gorulme
+                         THEN EXCLUDED.son_durum ELSE plaka_son_gorulme.son_durum END,
+        son_gorulme = GREATEST(plaka_son_gorulme.son_gorulme, EXCLUDED.son_gorulme),
+        gorulme_sayisi = plaka_son_gorulme.gorulme_sayisi + EXCLUDED.gorulme_sayisi;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER plakalar_ozet
+    AFTER INSERT ON plakalar REFERENCING NEW TABLE AS yeni_satirlar
+    FOR EACH STATEMENT EXECUTE FUNCTION plakalar_ozet_guncelle();
+"""
+
+
+def _ay_basi(tarih):
+    """Tarihin içinde bulunduğu ayın ilk gününü döndürür."""
+    return datetime.date(tarih.year, tarih.month, 1)
+
+
+def _sonraki_ay(ay):
+    """Ayın ilk gününden bir sonraki ayın ilk gününü döndürür."""
+    return datetime.date(ay.year + ay.month // 12, ay.month % 12 + 1, 1)
+
+
+def _bolum_adi(ay):
+    """Aylık bölüm tablosunun adını döndürür (örn. plakalar_2026_10)."""
+    return f"plakalar_{ay.year:04d}_{ay.month:02d}"
+
+
+def bolumlu_mu(cursor):
+    """plakalar tablosu bölümlenmişse True döndürür."""
+    cursor.execute("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass('plakalar')")
+    satir = cursor.fetchone()
+    return bool(satir and satir[0])
+
+
+def _ay_bolumu_olustur(cursor, ay):
+    """
+    Ay için bölüm oluşturur. Varsayılan bölüme o aya ait satırlar düşmüşse önce ayrı bir tabloya
+    taşınır, sonra tablo bölüm olarak eklenir (aksi halde PostgreSQL bölümü oluşturmaz).
+
+    Dönüş:
+        bool: Bölüm oluşturulduysa True, zaten varsa False
+    """
+    ad = _bolum_adi(ay)
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (ad,))
+    if cursor.fetchone()[0]:
+        return False
+    bitis = _sonraki_ay(ay)
+
+    cursor.execute("SELECT to_regclass('plakalar_varsayilan') IS NOT NULL")
+    varsayilan_var = cursor.fetchone()[0]
+    tasinacak = 0
+    if varsayilan_var:
+        cursor.execute("SELECT count(*) FROM plakalar_varsayilan WHERE tespit_zamani >= %s AND tespit_zamani < %s",
+                       (ay, bitis))
+        tasinacak = cursor.fetchone()[0]
+
+    if not tasinacak:
+        cursor.execute(f"CREATE TABLE {ad} PARTITION OF plakalar FOR VALUES FROM (%s) TO (%s)", (ay, bitis))
+        return True
+
+    # Satırlar doğrudan bölümler arasında taşındığı için özet tetikleyicisi çalışmaz, sayılar değişmez
+    cursor.execute(f"CREATE TABLE {ad} (LIKE plakalar INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+    cursor.execute(f"""
+        WITH tasinan AS (
+            DELETE FROM plakalar_varsayilan WHERE tespit_zamani >= %s AND tespit_zamani < %s RETURNING *
+        )
+        INSERT INTO {ad} SELECT * FROM tasinan
+    """, (ay, bitis))
+    cursor.execute(f"ALTER TABLE plakalar ATTACH PARTITION {ad} FOR VALUES FROM (%s) TO (%s)", (ay, bitis))
+    print(f"{ad} bölümü oluşturuldu, varsayılan bölümden {tasinacak} satır taşındı.")
+    return True
+
+
+def bolumleri_hazirla(conn, ileri_ay=3):
+    """
+    Bu ay ve önümüzdeki ileri_ay ay için bölümleri oluşturur. Tablo bölümlü değilse bir şey yapmaz.
+    Uygulama her açılışta çağırır; bölümü olmayan aylar varsayılan bölüme düşer ve burada taşınır.
+
+    Parametreler:
+        conn: psycopg2 bağlantısı
+        ileri_ay (int): Önceden oluşturulacak ay sayısı
+
+    Dönüş:
+        list: Oluşturulan bölümlerin adları
+    """
+    olusturulan = []
+    with conn.cursor() as cursor:
+        if not bolumlu_mu(cursor):
+            conn.rollback()
+            return olusturulan
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (GOC_KILIDI,))
+        ay = _ay_basi(datetime.date.today())
+        for _ in range(ileri_ay + 1):
+            if _ay_bolumu_olustur(cursor, ay):
+                olusturulan.append(_bolum_adi(ay))
+            ay = _sonraki_ay(ay)
+    conn.commit()
+    return olusturulan
+
+
+def eski_bolumleri_sil(conn, tutulacak_ay):
+    """
+    Son tutulacak_ay aydan eski bölümleri siler. Özet tabloları silinen ayların sayılarını korur.
+
+    Parametreler:
+        conn: psycopg2 bağlantısı
+        tutulacak_ay (int): İçinde bulunulan ay dahil saklanacak ay sayısı
+
+    Dönüş:
+        list: Silinen bölümlerin adları
+    """
+    sinir = _ay_basi(datetime.date.today())
+    for _ in range(tutulacak_ay - 1):
+        sinir = _ay_basi(sinir - datetime.timedelta(days=1))
+    silinen = []
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (GOC_KILIDI,))
+        cursor.execute("""
+            SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'plakalar'::regclass AND c.relname ~ '^plakalar_[0-9]{4}_[0-9]{2}$'
+            ORDER BY c.relname
+        """)
+        for (ad,) in cursor.fetchall():
+            yil, ay = int(ad[9:13]), int(ad[14:16])
+            if datetime.date(yil, ay, 1) < sinir:
+                cursor.execute(f"DROP TABLE {ad}")
+                silinen.append(ad)
+    conn.commit()
+    return silinen
+
+
+def _plakalari_bolumle(cursor, ileri_ay=3):
+    """Göç 1: plakalar tablosunu tespit_zamani üzerinde aylık bölümlenmiş yeni tabloya taşır."""
+    if bolumlu_mu(cursor):
+        return
+    # Taşıma sırasında yeni kayıt gelmesin (KayitYazici bağlantı kesilirse yeniden dener)
+    cursor.execute("LOCK TABLE plakalar IN ACCESS EXCLUSIVE MODE")
+    cursor.execute("""
+        CREATE TABLE plakalar_bolumlu (
+            id INTEGER NOT NULL DEFAULT nextval('plakalar_id_seq'),
+            plaka VARCHAR,
+            durum BOOLEAN,
+            tespit_zamani TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (id, tespit_zamani)
+        ) PARTITION BY RANGE (tespit_zamani)
+    """)
+    cursor.execute("CREATE TABLE plakalar_varsayilan PARTITION OF plakalar_bolumlu DEFAULT")
+
+    # Mevcut kayıtların ilk ayından önümüzdeki aylara kadar bölümler
+    cursor.execute("SELECT min(tespit_zamani)::date, max(tespit_zamani)::date FROM plakalar")
+    ilk, son = cursor.fetchone()
+    bugun = datetime.date.today()
+    ay = _ay_basi(ilk or bugun)
+    son_ay = _ay_basi(max(son or bugun, bugun))
+    for _ in range(ileri_ay):
+        son_ay = _sonraki_ay(son_ay)
+    while ay <= son_ay:
+        cursor.execute(f"CREATE TABLE {_bolum_adi(ay)} PARTITION OF plakalar_bolumlu FOR VALUES FROM (%s) TO (%s)",
+                       (ay, _sonraki_ay(ay)))
+        ay = _sonraki_ay(ay)
+
+    cursor.execute("""
+        INSERT INTO plakalar_bolumlu (id, plaka, durum, tespit_zamani)
+        SELECT id, plaka, durum, COALESCE(tespit_zamani, CURRENT_TIMESTAMP) FROM plakalar
+    """)
+    cursor.execute("ALTER SEQUENCE plakalar_id_seq OWNED BY plakalar_bolumlu.id")
+    cursor.execute("DROP TABLE plakalar")
+    cursor.execute("ALTER TABLE plakalar_bolumlu RENAME TO plakalar")
+    cursor.execute("ALTER INDEX plakalar_bolumlu_pkey RENAME TO plakalar_pkey")
+
+
+def _ozetleri_olustur(cursor):
+    """Göç 3: Özet tablolarını ve tetikleyiciyi oluşturur, mevcut kayıtlardan özetleri doldurur."""
+    # Tetikleyici aynı işlemde kurulduğu için işlem bitene kadar yeni INSERT'ler bekler; kayıtlar iki kez sayılmaz
+    cursor.execute(OZETLER_SQL)
+    _ozetleri_hesapla(cursor)
+
+
+def _ozetleri_hesapla(cursor, baslangic=None, bitis=None):
+    """Verilen aralıktaki (verilmezse bütün) saatlik ve günlük özetleri ham kayıtlardan yeniden yazar."""
+    kosul, parametreler = "TRUE", ()
+    if baslangic is not None and bitis is not None:
+        kosul, parametreler = "tespit_zamani >= %s AND tespit_zamani < %s", (baslangic, bitis)
+        cursor.execute("DELETE FROM plakalar_saatlik WHERE saat >= %s AND saat < %s", parametreler)
+        cursor.execute("DELETE FROM plakalar_gunluk WHERE gun >= %s AND gun < %s", parametreler)
+    else:
+        cursor.execute("TRUNCATE plakalar_saatlik, plakalar_gunluk, plaka_son_gorulme")
+        cursor.execute("""
+            INSERT INTO plaka_son_gorulme (plaka, son_gorulme, son_durum, gorulme_sayisi)
+            SELECT DISTINCT ON (plaka) plaka, tespit_zamani, durum, count(*) OVER (PARTITION BY plaka)
+            FROM plakalar WHERE plaka IS NOT NULL
+            ORDER BY plaka, tespit_zamani DESC
+        """)
+    cursor.execute(f"""
+        INSERT INTO plakalar_saatlik (saat, durum, adet)
+        SELECT date_trunc('hour', tespit_zamani), COALESCE(durum, FALSE), count(*)
+        FROM plakalar WHERE {kosul} GROUP BY 1, 2
+    """, parametreler)
+    cursor.execute(f"""
+        INSERT INTO plakalar_gunluk (gun, durum, adet)
+        SELECT tespit_zamani::date, COALESCE(durum, FALSE), count(*)
+        FROM plakalar WHERE {kosul} GROUP BY 1, 2
+    """, parametreler)
+
+
+def ozetleri_yeniden_hesapla(conn, baslangic=None, bitis=None):
+    """
+    Saatlik ve günlük özetleri ham kayıtlardan yeniden hesaplar. Tetikleyici yalnızca INSERT'leri
+    izlediği için, plakalar tablosunda elle silme veya güncelleme yapıldıktan sonra kullanılır.
+
+    Parametreler:
+        conn: psycopg2 bağlantısı
+        baslangic (date): Aralığın ilk günü; verilmezse bütün özetler ve son görülmeler yeniden yazılır
+        bitis (date): Aralığın son gününden sonraki gün (hariç)
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("LOCK TABLE plakalar IN SHARE MODE")  # Hesaplama sırasında yeni kayıt gelmesin
+        _ozetleri_hesapla(cursor, baslangic, bitis)
+    conn.commit()
+
+
+# Sıralı göç listesi: (sürüm, ad, uygulayan fonksiyon veya SQL)
+GOCLER = [
+    (0, 'temel_tablolar', TEMEL_TABLOLAR_SQL),
+    (1, 'plakalar_aylik_bolumleme', _plakalari_bolumle),
+    (2, 'kapsayan_indeksler', INDEKSLER_SQL),
+    (3, 'saatlik_gunluk_ozetler', _ozetleri_olustur),
+]
+
+
+def uygulanan_surumler(conn):
+    """Uygulanmış göçlerin sürümlerini döndürür (sürüm tablosunu gerekirse oluşturur)."""
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sema_surumu (
+                surum INTEGER PRIMARY KEY,
+                ad VARCHAR NOT NULL,
+                uygulama_zamani TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                sure_sn DOUBLE PRECISION
+            )
+        """)
+        cursor.execute("SELECT surum FROM sema_surumu")
+        surumler = {surum for (surum,) in cursor.fetchall()}
+    conn.commit()
+    return surumler
+
+
+def gocleri_uygula(conn, hedef=None):
+    """
+    Uygulanmamış göçleri sırayla, her birini ayrı bir işlemde uygular. Bir göç hata verirse
+    işlemi geri alınır ve sonraki göçlere geçilmez.
+
+    Parametreler:
+        conn: psycopg2 bağlantısı
+        hedef (int): Bu sürüme kadar uygula (verilmezse hepsi)
+
+    Dönüş:
+        list: Uygulanan (sürüm, ad, süre) üçlüleri
+    """
+    uygulanan = []
+    for surum, ad, goc in GOCLER:
+        if hedef is not None and surum > hedef:
+            break
+        if surum in uygulanan_surumler(conn):
+            continue
+        baslangic = time.perf_counter()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_xact_lock(%s)", (GOC_KILIDI,))
+                cursor.execute("SELECT 1 FROM sema_surumu WHERE surum = %s", (surum,))
+                if cursor.fetchone():
+                    conn.rollback()  # Başka bir süreç bu arada uyguladı
+                    continue
+                if callable(goc):
+                    goc(cursor)
+                else:
+                    cursor.execute(goc)
+                sure = time.perf_counter() - baslangic
+                cursor.execute("INSERT INTO sema_surumu (surum, ad, sure_sn) VALUES (%s, %s, %s)", (surum, ad, sure))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        print(f"Göç {surum} ({ad}) uygulandı: {sure:.2f} sn")
+        uygulanan.append((surum, ad, sure))
+    return uygulanan
+
+
+def saatlik_gecisler(conn, baslangic, bitis):
+    """
+    Saat başına izinli ve izinsiz geçiş sayıları (özet tablosundan).
+
+    Parametreler:
+        conn: psycopg2 bağlantısı
+        baslangic (datetime): Aralığın başı
+        bitis (datetime): Aralığın sonu (hariç)
+
+    Dönüş:
+        list: (saat, izinli, izinsiz) üçlüleri; geçiş olmayan saatler yer almaz
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT saat, COALESCE(sum(adet) FILTER (WHERE durum), 0)::bigint,
+                   COALESCE(sum(adet) FILTER (WHERE NOT durum), 0)::bigint
+            FROM plakalar_saatlik WHERE saat >= %s AND saat < %s
+            GROUP BY saat ORDER BY saat
+        """, (baslangic, bitis))
+        return cursor.fetchall()
+
+
+def gunluk_gecisler(conn, baslangic, bitis):
+    """
+    Gün başına izinli ve izinsiz geçiş sayıları (özet tablosundan).
+
+    Parametreler:
+        conn: psycopg2 bağlantısı
+        baslangic (date): İlk gün
+        bitis (date): Son günden sonraki gün (hariç)
+
+    Dönüş:
+        list: (gün, izinli, izinsiz) üçlüleri
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT gun, COALESCE(sum(adet) FILTER (WHERE durum), 0)::bigint,
+                   COALESCE(sum(adet) FILTER (WHERE NOT durum), 0)::bigint
+            FROM plakalar_gunluk WHERE gun >= %s AND gun < %s
+            GROUP BY gun ORDER BY gun
+        """, (baslangic, bitis))
+        return cursor.fetchall()
+
+
+def son_gorulme(conn, plaka):
+    """
+    Plakanın en son görüldüğü zaman.
+
+    Parametreler:
+        conn: psycopg2 bağlantısı
+        plaka (str): Plaka
+
+    Dönüş:
+        tuple: (son görülme zamanı, son izin durumu, toplam görülme sayısı), hiç görülmediyse None
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT son_gorulme, son_durum, gorulme_sayisi FROM plaka_son_gorulme WHERE plaka = %s",
+                       (plaka,))
+        return cursor.fetchone()
+
+
+def plaka_gecmisi(conn, plaka, baslangic=None, bitis=None, limit=100):
+    """
+    Plakanın geçişleri, en yeni önce (plaka, tespit_zamani indeksinden).
+
+    Parametreler:
+        conn: psycopg2 bağlantısı
+        plaka (str): Plaka
+        baslangic (datetime): Verilirse bu zamandan sonraki geçişler (bölüm budaması için önerilir)
+        bitis (datetime): Verilirse bu zamandan önceki geçişler
+        limit (int): En fazla geçiş sayısı
+
+    Dönüş:
+        list: (tespit_zamani, durum) çiftleri
+    """
+    kosullar, parametreler = ["plaka = %s"], [plaka]
+    if baslangic is not None:
+        kosullar.append("tespit_zamani >= %s")
+        parametreler.append(baslangic)
+    if bitis is not None:
+        kosullar.append("tespit_zamani < %s")
+        parametreler.append(bitis)
+    with conn.cursor() as cursor:
+        cursor.execute(f"""
+            SELECT tespit_zamani, durum FROM plakalar WHERE {' AND '.join(kosullar)}
+            ORDER BY tespit_zamani DESC LIMIT %s
+        """, (*parametreler, limit))
+        return cursor.fetchall()
+
+
+def _sure_olc(conn, sorgu, parametreler=(), tekrar=5):
+    """Sorgunun ortanca süresini (milisaniye) döndürür."""
+    sureler = []
+    with conn.cursor() as cursor:
+        for _ in range(tekrar):
+            baslangic = time.perf_counter()
+            cursor.execute(sorgu, parametreler)
+            cursor.fetchall()
+            sureler.append((time.perf_counter() - baslangic) * 1000)
+    conn.rollback()
+    return statistics.median(sureler)
+
+
+def _fonksiyon_olc(fonksiyon, *args, tekrar=5):
+    """Rapor fonksiyonunun ortanca süresini (milisaniye) döndürür."""
+    sureler = []
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        fonksiyon(*args)
+        sureler.append((time.perf_counter() - baslangic) * 1000)
+    return statistics.median(sureler)
+
+
+def _yazma_olc(conn, toplu_boyut=100, toplu_sayisi=50):
+    """KayitYazici gibi çok satırlı INSERT'lerle saniyede yazılan kayıt sayısını ölçer."""
+    simdi = datetime.datetime.now()
+    baslangic = time.perf_counter()
+    with conn.cursor() as cursor:
+        for t in range(toplu_sayisi):
+            kayitlar = [(f"34OLC{(t * toplu_boyut + i) % 997:03d}", i % 3 == 0, simdi) for i in range(toplu_boyut)]
+            execute_values(cursor, "INSERT INTO plakalar (plaka, durum, tespit_zamani) VALUES %s", kayitlar,
+                           page_size=toplu_boyut)
+            conn.commit()
+    return toplu_boyut * toplu_sayisi / (time.perf_counter() - baslangic)
+
+
+def olcum(baglanti_ayarlari, satir_sayisi, veritabani='plaka_tanima_olcum'):
+    """
+    Ayrı bir ölçüm veritabanında eski tablo yapısını sentetik kayıtlarla doldurur, rapor sorgularını ölçer,
+    göçleri uygular ve aynı soruları yeni yapı ve özet tablolarıyla yeniden ölçer.
+
+    Parametreler:
+        baglanti_ayarlari (dict): Sunucuya bağlanmak için bilgiler (veritabanı adı değiştirilir)
+        satir_sayisi (int): Üretilecek sentetik kayıt sayısı (son bir yıla dağıtılır)
+        veritabani (str): Silinip yeniden oluşturulacak ölçüm veritabanı
+
+    Dönüş:
+        dict: Sorgu süreleri (ms), göç süreleri (sn) ve yazma hızları (kayıt/sn)
+    """
+    yonetim = psycopg2.connect(**baglanti_ayarlari)
+    yonetim.autocommit = True
+    with yonetim.cursor() as cursor:
+        cursor.execute(f"DROP DATABASE IF EXISTS {veritabani}")
+        cursor.execute(f"CREATE DATABASE {veritabani}")
+    yonetim.close()
+
+    conn = psycopg2.connect(**{**baglanti_ayarlari, 'dbname': veritabani})
+    gocleri_uygula(conn, hedef=0)  # Eski tablo yapısı
+
+    baslangic = time.perf_counter()
+    with conn.cursor() as cursor:
+        # Yaklaşık 80 bin farklı plaka, son bir yıla dağılmış geçişler
+        cursor.execute("""
+            INSERT INTO plakalar (plaka, durum, tespit_zamani)
+            SELECT lpad((1 + p %% 81)::text, 2, '0') || chr(65 + p %% 23) || chr(65 + (p / 23) %% 23)
+                   || lpad((p %% 1000)::text, 3, '0'),
+                   random() < 0.3,
+                   now()::timestamp - random() * interval '365 days'
+            FROM (SELECT (random() * 80000)::int AS p FROM generate_series(1, %s)) s
+        """, (satir_sayisi,))
+        cursor.execute("SELECT plaka FROM plakalar GROUP BY plaka ORDER BY count(*) DESC LIMIT 1")
+        ornek_plaka = cursor.fetchone()[0]
+    conn.commit()
+    with conn.cursor() as cursor:
+        conn.autocommit = True
+        cursor.execute("VACUUM ANALYZE plakalar")
+        conn.autocommit = False
+    print(f"{satir_sayisi} sentetik kayıt {time.perf_counter() - baslangic:.1f} sn'de eklendi.")
+
+    gun = datetime.datetime.combine(datetime.date.today() - datetime.timedelta(days=10), datetime.time())
+    ay_basi = datetime.date.today() - datetime.timedelta(days=30)
+    ham_sorgular = {
+        'saatlik_1_gun': ("""SELECT date_trunc('hour', tespit_zamani), count(*) FILTER (WHERE durum),
+                                    count(*) FILTER (WHERE NOT durum)
+                             FROM plakalar WHERE tespit_zamani >= %s AND tespit_zamani < %s GROUP BY 1 ORDER BY 1""",
+                          (gun, gun + datetime.timedelta(days=1))),
+        'gunluk_30_gun': ("""SELECT tespit_zamani::date, count(*) FILTER (WHERE durum), count(*) FILTER (WHERE NOT durum)
+                             FROM plakalar WHERE tespit_zamani >= %s GROUP BY 1 ORDER BY 1""", (ay_basi,)),
+        'son_gorulme': ("SELECT max(tespit_zamani) FROM plakalar WHERE plaka = %s", (ornek_plaka,)),
+        'plaka_gecmisi': ("SELECT tespit_zamani, durum FROM plakalar WHERE plaka = %s "
+                          "ORDER BY tespit_zamani DESC LIMIT 20", (ornek_plaka,)),
+    }
+    sonuc = {'satir_sayisi': satir_sayisi, 'once_ms': {}, 'sonra_ham_ms': {}, 'sonra_ozet_ms': {}}
+    for ad, (sorgu, parametreler) in ham_sorgular.items():
+        sonuc['once_ms'][ad] = _sure_olc(conn, sorgu, parametreler)
+    sonuc['once_yazma_kayit_sn'] = _yazma_olc(conn)
+
+    sonuc['goc_sn'] = {ad: sure for _, ad, sure in gocleri_uygula(conn)}
+    with conn.cursor() as cursor:
+        conn.autocommit = True
+        cursor.execute("ANALYZE")
+        conn.autocommit = False
+
+    for ad, (sorgu, parametreler) in ham_sorgular.items():
+        sonuc['sonra_ham_ms'][ad] = _sure_olc(conn, sorgu, parametreler)
+    sonuc['sonra_ozet_ms'] = {
+        'saatlik_1_gun': _fonksiyon_olc(saatlik_gecisler, conn, gun, gun + datetime.timedelta(days=1)),
+        'gunluk_30_gun': _fonksiyon_olc(gunluk_gecisler, conn, ay_basi, datetime.date.today() + datetime.timedelta(days=1)),
+        'son_gorulme': _fonksiyon_olc(son_gorulme, conn, ornek_plaka),
+        'plaka_gecmisi': _fonksiyon_olc(plaka_gecmisi, conn, ornek_plaka, None, None, 20),
+    }
+    sonuc['sonra_yazma_kayit_sn'] = _yazma_olc(conn)
+
+    # Özetlerin ham kayıtlarla tutarlılığı (yazma ölçümünde tetikleyiciyle eklenenler dahil)
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT (SELECT count(*) FROM plakalar), (SELECT sum(adet) FROM plakalar_saatlik), "
+                       "(SELECT sum(adet) FROM plakalar_gunluk), (SELECT sum(gorulme_sayisi) FROM plaka_son_gorulme)")
+        sonuc['tutarlilik'] = dict(zip(('ham', 'saatlik', 'gunluk', 'son_gorulme'), cursor.fetchone()))
+    conn.close()
+    return sonuc
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="plakalar tablosu için bölümleme, indeks ve özet göçleri")
+    parser.add_argument('--durum', action='store_true', help="Uygulanmış ve bekleyen göçleri listele")
+    parser.add_argument('--eski-bolumleri-sil', type=int, metavar='AY',
+                        help="Son AY aydan eski bölümleri sil (özetler korunur)")
+    parser.add_argument('--ozetleri-yeniden-hesapla', action='store_true',
+                        help="Özetleri ham kayıtlardan baştan hesapla")
+    parser.add_argument('--olcum', type=int, metavar='SATIR',
+                        help="Ayrı bir veritabanında SATIR sentetik kayıtla göç öncesi / sonrası sorguları ölç")
+    parser.add_argument('--olcum-veritabani', default='plaka_tanima_olcum',
+                        help="Ölçüm için silinip yeniden oluşturulacak veritabanı")
+    args = parser.parse_args()
+
+    from db_operations import BAGLANTI_AYARLARI  # Veritabanı bağlantı bilgileri
+
+    if args.olcum:
+        sonuc = olcum(BAGLANTI_AYARLARI, args.olcum, args.olcum_veritabani)
+        print(f"\n{sonuc['satir_sayisi']} kayıt, sorgu süreleri (ms, 5 tekrarın ortancası):")
+        print(f"{'sorgu':<16}{'önce':>10}{'sonra ham':>12}{'sonra özet':>12}")
+        for ad in sonuc['once_ms']:
+            print(f"{ad:<16}{sonuc['once_ms'][ad]:>10.2f}{sonuc['sonra_ham_ms'][ad]:>12.2f}"
+                  f"{sonuc['sonra_ozet_ms'][ad]:>12.2f}")
+        print(f"Yazma (100'lük toplular): önce {sonuc['once_yazma_kayit_sn']:.0f} kayıt/sn, "
+              f"sonra {sonuc['sonra_yazma_kayit_sn']:.0f} kayıt/sn")
+        print(f"Göç süreleri (sn): {', '.join(f'{ad} {sure:.1f}' for ad, sure in sonuc['goc_sn'].items())}")
+        print(f"Tutarlılık: {sonuc['tutarlilik']}")
+    else:
+        conn = psycopg2.connect(**BAGLANTI_AYARLARI)
+        try:
+            if args.durum:
+                uygulanan = uygulanan_surumler(conn)
+                for surum, ad, _ in GOCLER:
+                    print(f"{surum}: {ad:<28} {'uygulandı' if surum in uygulanan else 'bekliyor'}")
+            elif args.eski_bolumleri_sil:
+                print(f"Silinen bölümler: {eski_bolumleri_sil(conn, args.eski_bolumleri_sil) or 'yok'}")
+            elif args.ozetleri_yeniden_hesapla:
+                ozetleri_yeniden_hesapla(conn)
+                print("Özetler yeniden hesaplandı.")
+            else:
+                gocleri_uygula(conn)
+                print(f"Hazırlanan bölümler: {bolumleri_hazirla(conn) or 'yok'}")
+        finally:
+            conn.close()
@@ -1,5 +1,17 @@
 import psycopg2
 import time
+from izin_onbellegi import IzinOnbellegi
+from kayit_yazici import KayitYazici
+from db_gocler import bolumleri_hazirla
+
+# Veritabanı bağlantı bilgileri
+BAGLANTI_AYARLARI = {
+    'dbname': "plaka_tanima_db",  # Veritabanı adı
+    'user': "postgres",           # Kullanıcı adı
+    'password': "4613",           # Şifre
+    'host': "localhost",          # Sunucu adresi
+    'port': "5432",               # Port numarası
+}
 
 class PlakaTespitDB:
     """
@@ -7,20 +19,24 @@ class PlakaTespitDB:
     Plaka kaydetme ve izin kontrolü gibi işlemleri gerçekleştirir.
     """
     
-    def __init__(self):
+    def __init__(self, izin_onbellegi_kullan=True, arka_plan_kayit=True, bulanik_esik=None, izinli_bekleme=0):
         """
         Veritabanı bağlantısını başlatır.
-        Bağlantı bilgileri burada ayarlanır.
+        Bağlantı bilgileri BAGLANTI_AYARLARI içinde ayarlanır.
+
+        Parametreler:
+            izin_onbellegi_kullan (bool): True ise izin kontrolleri bellekteki izin
+                listesinden yapılır, liste arka planda yenilenir
+            arka_plan_kayit (bool): True ise kayıtlar kuyruğa alınır ve arka planda
+                toplu olarak yazılır, tespit iş parçacığı veritabanını beklemez
+            bulanik_esik (float): İzin önbelleğinde tam eşleşmeyen okumaların en yakın izinli plakayla
+                eşleştirileceği en yüksek ağırlıklı uzaklık; None ise yalnızca tam eşleşme
+            izinli_bekleme (float): İzinli bir plakadan sonra hiçbir plakanın kaydedilmeyeceği süre (saniye);
+                0 ise kapalıdır (tekrarlar plaka başına TekrarOnbellegi ile engellenir)
         """
         try:
             # Veritabanına bağlanma
-            self.conn = psycopg2.connect(
-                dbname="plaka_tanima_db",  # Veritabanı adı
-                user="postgres",           # Kullanıcı adı
-                password="4613",           # Şifre
-                host="localhost",          # Sunucu adresi
-                port="5432"               # Port numarası
-            )
+            self.conn = psycopg2.connect(**BAGLANTI_AYARLARI)
             # Veritabanı üzerinde işlem yapmak için cursor oluşturma
             self.cursor = self.conn.cursor()
             print("Veritabanı bağlantısı başarılı.")
@@ -29,6 +45,41 @@ class PlakaTespitDB:
             self.conn = None
             self.cursor = None
 
+        # plakalar tablosu db_gocler.py ile bölümlendiyse önümüzdeki ayların bölümlerini hazırla
+        if self.conn:
+            try:
+                olusturulan = bolumleri_hazirla(self.conn)
+                if olusturulan:
+                    print(f"plakalar bölümleri oluşturuldu: {', '.join(olusturulan)}")
+            except Exception as e:
+                self.conn.rollback()
+                print(f"plakalar bölümleri hazırlanamadı: {e}")
+
+        self.izinli_bekleme = izinli_bekleme
+
+        # İzinli plakaları bellekte tut, değişiklikleri arka planda takip et
+        self.izin_onbellegi = None
+        if izin_onbellegi_kullan:
+            self.izin_onbellegi = IzinOnbellegi(BAGLANTI_AYARLARI, bulanik_esik=bulanik_esik)
+            self.izin_onbellegi.baslat()
+
+        # Kayıtları arka planda toplu olarak yaz
+        self.kayit_yazici = KayitYazici(BAGLANTI_AYARLARI) if arka_plan_kayit else None
+
+    @classmethod
+    def ayarlardan(cls, ayarlar):
+        """
+        Uygulama ayarlarındaki 'izin' bölümüne göre veritabanı nesnesi oluşturur.
+
+        Parametreler:
+            ayarlar (dict): ayarlari_yukle ile okunan ayarlar
+
+        Dönüş:
+            PlakaTespitDB: Bağlanmış veritabanı nesnesi
+        """
+        izin = ayarlar['izin']
+        return cls(bulanik_esik=izin['bulanik_esik'], izinli_bekleme=izin['izinli_bekleme'])
+
     def plaka_izin_kontrol(self, plaka):
         """
         Verilen plakanın izinli olup olmadığını kontrol eder.
@@ -40,6 +91,13 @@ class PlakaTespitDB:
             bool: Plaka izinli ise True, değilse False
         """
         try:
+            # İzin listesi bellekteyse veritabanına gitmeden cevap ver
+            if self.izin_onbellegi and self.izin_onbellegi.yuklendi:
+                izinli, eslesen, mesafe = self.izin_onbellegi.izin_bul(plaka)
+                if izinli and eslesen != plaka:
+                    print(f"{plaka} okuması izinli {eslesen} plakasıyla eşleştirildi (uzaklık {mesafe:g}).")
+                return izinli
+
             # Eğer veritabanı bağlantısı yoksa False dön
             if not self.cursor:
                 return False
@@ -73,19 +131,31 @@ class PlakaTespitDB:
             
         Dönüş:
             tuple: (plaka_id, yeni_son_tespit_zamani) veya (None, son_izinli_tespit_zamani)
+                Arka plan kaydında plaka_id henüz bilinmediği için None döner
         """
         try:
-            # Veritabanı bağlantısı yoksa işlem yapma
-            if not self.cursor:
+            # Veritabanı bağlantısı da arka plan yazıcısı da yoksa işlem yapma
+            if not self.cursor and not self.kayit_yazici:
                 return None, son_izinli_tespit_zamani
             
             # Şu anki zamanı al
             simdiki_zaman = time.time()
             
-            # Son izinli tespitten bu yana 15 saniye geçmediyse kayıt yapma
-            if simdiki_zaman - son_izinli_tespit_zamani < 15:
-                print("Son izinli tespitten 15 saniye geçmedi, kayıt yapılmıyor.")
+            # Son izinli tespitten bu yana bekleme süresi geçmediyse kayıt yapma
+            if self.izinli_bekleme and simdiki_zaman - son_izinli_tespit_zamani < self.izinli_bekleme:
+                print(f"Son izinli tespitten {self.izinli_bekleme:g} saniye geçmedi, kayıt yapılmıyor.")
                 return None, son_izinli_tespit_zamani
+
+            # Eğer izinli plaka ise son tespit zamanını güncelle
+            yeni_son_tespit_zamani = simdiki_zaman if durum else son_izinli_tespit_zamani
+
+            # Arka plan yazıcısı varsa kaydı kuyruğa al ve beklemeden dön
+            if self.kayit_yazici:
+                if self.kayit_yazici.ekle(plaka, durum):
+                    print("Plaka kayıt kuyruğuna eklendi.")
+                else:
+                    print("Kayıt kuyruğu dolu, plaka kaydedilemedi.")
+                return None, yeni_son_tespit_zamani
             
             # Plakayı veritabanına kaydet
             sorgu = "INSERT INTO plakalar (plaka, durum) VALUES (%s, %s) RETURNING id;"
@@ -93,9 +163,6 @@ class PlakaTespitDB:
             plaka_id = self.cursor.fetchone()[0]
             self.conn.commit()
             
-            # Eğer izinli plaka ise son tespit zamanını güncelle
-            yeni_son_tespit_zamani = simdiki_zaman if durum else son_izinli_tespit_zamani
-            
             # if durum:
             #     print(f"İzinli plaka tespit edildi. Sonraki 15 saniye kayıt yapılmayacak.")
             
@@ -109,12 +176,40 @@ class PlakaTespitDB:
             print(f"Plaka kaydedilirken hata oluştu: {e}")
             return None, son_izinli_tespit_zamani
 
+    def kapat(self):
+        """
+        Arka plan işlerini durdurur: kuyrukta kalan kayıtları yazar ve izin yenilemesini kapatır.
+        """
+        if getattr(self, 'kayit_yazici', None):
+            self.kayit_yazici.kapat()
+        if getattr(self, 'izin_onbellegi', None):
+            self.izin_onbellegi.durdur()
+
     def __del__(self):
         """
         Sınıf silindiğinde veritabanı bağlantısını düzgün bir şekilde kapatır.
         """
+        self.kapat()
         if hasattr(self, 'cursor') and self.cursor:
             self.cursor.close()
         if hasattr(self, 'conn') and self.conn:
             self.conn.close()
-            print("Veritabanı bağlantısı kapatıldı.") 
\ No newline at end of file
+            print("Veritabanı bağlantısı kapatıldı.") 
+
+
+class BosVeritabani:
+    """
+    Veritabanı bağlantısı olmadan çalışmak için PlakaTespitDB ile aynı arayüze sahip boş sınıf.
+    Hiçbir plakayı izinli saymaz ve kayıt yapmaz (komut satırından toplu işlem için).
+    """
+
+    def plaka_izin_kontrol(self, plaka):
+        """Her zaman False döner."""
+        return False
+
+    def plaka_kaydet(self, plaka, durum, son_izinli_tespit_zamani):
+        """Kayıt yapmaz, (None, son_izinli_tespit_zamani) döner."""
+        return None, son_izinli_tespit_zamani
+
+    def kapat(self):
+        """Kapatılacak bir şey yoktur."""
@@ -0,0 +1,145 @@
+# Bu dosya, sahnede değişiklik yokken plaka tespitini atlayan ve tespit aralığını uyarlayan hareket filtresini içerir.
+
+import time  # Zaman ölçümleri için kullanılır
+import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
+
+
+class HareketFiltresi:
+    """
+    Küçültülmüş kareler üzerinde ucuz bir hareket ölçümü yaparak tespitin gerekip gerekmediğine karar verir.
+
+    Hareket varken veya son tespitte plaka bulunduysa her kare tespit edilir. Sahne boşken
+    tespit aralığı (adım) her örneklemede ikiye katlanarak en_fazla_adim değerine kadar büyür;
+    böylece hareket algılanmasa bile sahne ara ara kontrol edilir.
+
+    Yöntemler:
+        'fark': Kayan ortalama arka plana göre kare farkı
+        'mog2': OpenCV MOG2 arka plan çıkarıcı
+    """
+
+    YONTEMLER = ('fark', 'mog2')
+
+    def __init__(self, yontem='fark', genislik=160, fark_esigi=25, alan_orani=0.002,
+                 en_fazla_adim=16, etkin_sure=2.0, ogrenme_orani=0.05):
+        """
+        Parametreler:
+            yontem (str): 'fark' veya 'mog2'
+            genislik (int): Hareket ölçümünün yapılacağı küçültülmüş kare genişliği
+            fark_esigi (int): Bir pikselin değişmiş sayılması için gereken gri seviye farkı
+            alan_orani (float): Hareket sayılması için değişen piksellerin en düşük oranı
+            en_fazla_adim (int): Sahne boşken iki tespit arasındaki en fazla kare sayısı
+            etkin_sure (float): Son hareketten / plakadan sonra her karenin tespit edileceği süre (saniye)
+            ogrenme_orani (float): 'fark' yönteminde arka plan ortalamasının güncellenme hızı
+        """
+        if yontem not in self.YONTEMLER:
+            raise ValueError(f"Geçersiz hareket yöntemi: {yontem}")
+        self.yontem = yontem
+        self.genislik = genislik
+        self.fark_esigi = fark_esigi
+        self.alan_orani = alan_orani
+        self.en_fazla_adim = max(en_fazla_adim, 1)
+        self.etkin_sure = etkin_sure
+        self.ogrenme_orani = ogrenme_orani
+
+        self._arka_plan = None  # 'fark' yöntemi için kayan ortalama arka plan
+        self._mog2 = cv2.createBackgroundSubtractorMOG2(history=200, detectShadows=False) if yontem == 'mog2' else None
+        self._son_etkinlik = float('-inf')  # Son hareket veya plaka zamanı
+        self._adim = 1  # Mevcut tespit aralığı
+        self._son_tespitten_beri = 0  # Son tespitten bu yana geçen kare sayısı
+
+        # Sayaçlar
+        self.toplam_kare = 0  # Filtreye gelen kare sayısı
+        self.tespit_edilen = 0  # Tespite gönderilen kare sayısı
+        self.atlanan = 0  # Tespiti atlanan kare sayısı
+        self.filtre_suresi = 0.0  # Filtrenin kendi harcadığı toplam süre (saniye)
+        self.ortalama_tespit_suresi = None  # Tespit süresinin üssel ortalaması (saniye)
+        self.son_hareket_orani = 0.0  # Son karede değişen piksellerin oranı
+
+    def _hareket_orani(self, frame):
+        """Küçültülmüş karede değişen piksellerin oranını döndürür."""
+        h, w = frame.shape[:2]
+        kucuk = cv2.resize(frame, (self.genislik, max(int(h * self.genislik / w), 1)),
+                           interpolation=cv2.INTER_AREA)
+        gri = cv2.cvtColor(kucuk, cv2.COLOR_BGR2GRAY) if kucuk.ndim == 3 else kucuk
+        gri = cv2.GaussianBlur(gri, (5, 5), 0)  # Sensör gürültüsünü bastırır
+
+        if self._mog2 is not None:
+            maske = self._mog2.apply(gri)
+            return cv2.countNonZero(maske) / float(maske.size)
+
+        if self._arka_plan is None or self._arka_plan.shape != gri.shape:
+            self._arka_plan = gri.astype('float32')
+            return 0.0
+        fark = cv2.absdiff(gri, cv2.convertScaleAbs(self._arka_plan))
+        cv2.accumulateWeighted(gri, self._arka_plan, self.ogrenme_orani)  # Arka planı yavaşça güncelle
+        _, maske = cv2.threshold(fark, self.fark_esigi, 255, cv2.THRESH_BINARY)
+        return cv2.countNonZero(maske) / float(maske.size)
+
+    def tespit_gerekli_mi(self, frame):
+        """
+        Karenin tespite gönderilip gönderilmeyeceğine karar verir.
+
+        Parametreler:
+            frame: Yakalanan kare
+
+        Dönüş:
+            bool: Tespit yapılacaksa True
+        """
+        baslangic = time.perf_counter()
+        self.toplam_kare += 1
+        self.son_hareket_orani = self._hareket_orani(frame)
+        simdi = time.monotonic()
+        if self.son_hareket_orani >= self.alan_orani:
+            self._son_etkinlik = simdi
+
+        if simdi - self._son_etkinlik < self.etkin_sure:
+            # Sahnede hareket veya araç var: her kareyi işle
+            self._adim = 1
+            gerekli = True
+        elif self._son_tespitten_beri + 1 >= self._adim:
+            # Sahne boş: seyrek örnekle ve aralığı büyüt
+            gerekli = True
+            self._adim = min(self._adim * 2, self.en_fazla_adim)
+        else:
+            gerekli = False
+
+        if gerekli:
+            self.tespit_edilen += 1
+            self._son_tespitten_beri = 0
+        else:
+            self.atlanan += 1
+            self._son_tespitten_beri += 1
+        self.filtre_suresi += time.perf_counter() - baslangic
+        return gerekli
+
+    def bildir(self, plaka_sayisi, tespit_suresi):
+        """
+        Tespit sonucunu filtreye bildirir: plaka varsa sahne etkin sayılır.
+
+        Parametreler:
+            plaka_sayisi (int): Karede bulunan plaka sayısı
+            tespit_suresi (float): Tespitin sürdüğü süre (saniye)
+        """
+        if plaka_sayisi:
+            self._son_etkinlik = time.monotonic()
+        if self.ortalama_tespit_suresi is None:
+            self.ortalama_tespit_suresi = tespit_suresi
+        else:
+            self.ortalama_tespit_suresi = 0.9 * self.ortalama_tespit_suresi + 0.1 * tespit_suresi
+
+    def istatistikler(self):
+        """
+        Dönüş:
+            dict: Atlama oranı, mevcut adım ve tahmini kazanılan işlemci süresi
+        """
+        ortalama = self.ortalama_tespit_suresi or 0.0
+        return {
+            'toplam_kare': self.toplam_kare,
+            'tespit_edilen': self.tespit_edilen,
+            'atlanan': self.atlanan,
+            'atlama_orani': self.atlanan / self.toplam_kare if self.toplam_kare else 0.0,
+            'adim': self._adim,
+            'hareket_orani': self.son_hareket_orani,
+            'filtre_suresi_sn': self.filtre_suresi,
+            'tahmini_kazanilan_cpu_sn': max(self.atlanan * ortalama - self.filtre_suresi, 0.0),
+        }
@@ -0,0 +1,115 @@
+# Bu dosya, sabit kameralarda plakaların görüldüğü şerit alanını (ilgi bölgesi) tanımlar; tespit yalnızca bu bölgede yapılır.
+
+import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
+import numpy as np  # Numpy kütüphanesini matematiksel işlemler için kullanır
+
+
+class IlgiBolgesi:
+    """
+    Dikdörtgen veya çokgen ilgi bölgesi.
+
+    Koordinatlar piksel olarak veya 0-1 aralığında kare boyutuna oranla verilebilir.
+    Tespit modeline bölgeyi çevreleyen dikdörtgen gönderilir; çokgen bölgelerde dışarıda
+    kalan pikseller siyaha boyanır ve merkezi bölge dışında kalan kutular atılır.
+    """
+
+    def __init__(self, dikdortgen=None, cokgen=None):
+        """
+        Parametreler:
+            dikdortgen (list): [x1, y1, x2, y2]
+            cokgen (list): [[x, y], [x, y], ...] köşe noktaları
+        """
+        if (dikdortgen is None) == (cokgen is None):
+            raise ValueError("İlgi bölgesi için dikdortgen veya cokgen değerlerinden yalnızca biri verilmelidir")
+        if dikdortgen is not None:
+            x1, y1, x2, y2 = dikdortgen
+            cokgen = [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
+            self.dikdortgen_mi = True
+        else:
+            self.dikdortgen_mi = False
+        self.noktalar = np.asarray(cokgen, dtype=np.float64)
+        if self.noktalar.ndim != 2 or self.noktalar.shape[0] < 3 or self.noktalar.shape[1] != 2:
+            raise ValueError(f"Geçersiz ilgi bölgesi: {cokgen}")
+        self.oransal = bool(self.noktalar.max() <= 1.0)  # Tüm değerler 0-1 aralığındaysa oransal kabul edilir
+
+        self._kare_boyutu = None  # Önbelleğe alınmış hesapların ait olduğu kare boyutu
+        self._piksel_noktalar = None  # Kare boyutuna göre piksel koordinatları
+        self._kesim = None  # Bölgeyi çevreleyen dikdörtgen (x1, y1, x2, y2)
+        self._maske = None  # Çokgen bölgeler için kesim boyutunda maske
+
+    @classmethod
+    def ayardan(cls, ayar):
+        """
+        Ayar sözlüğünden ilgi bölgesi oluşturur.
+
+        Parametreler:
+            ayar (dict): {'dikdortgen': [...]} veya {'cokgen': [...]}, ya da None
+
+        Dönüş:
+            IlgiBolgesi: Bölge nesnesi, ayar boşsa None
+        """
+        if not ayar:
+            return None
+        return cls(dikdortgen=ayar.get('dikdortgen'), cokgen=ayar.get('cokgen'))
+
+    def _hazirla(self, h, w):
+        """Kare boyutu değiştiğinde piksel koordinatlarını, kesim dikdörtgenini ve maskeyi hesaplar."""
+        if self._kare_boyutu == (h, w):
+            return
+        noktalar = self.noktalar * [w, h] if self.oransal else self.noktalar
+        noktalar = np.round(noktalar).astype(np.int32)
+        noktalar[:, 0] = np.clip(noktalar[:, 0], 0, w)
+        noktalar[:, 1] = np.clip(noktalar[:, 1], 0, h)
+        x1, y1 = noktalar.min(axis=0)
+        x2, y2 = noktalar.max(axis=0)
+        if x2 <= x1 or y2 <= y1:
+            raise ValueError("İlgi bölgesi kare dışında kalıyor")
+
+        self._piksel_noktalar = noktalar
+        self._kesim = (int(x1), int(y1), int(x2), int(y2))
+        if self.dikdortgen_mi:
+            self._maske = None
+        else:
+            self._maske = np.zeros((y2 - y1, x2 - x1), dtype=np.uint8)
+            cv2.fillPoly(self._maske, [noktalar - [x1, y1]], 255)
+        self._kare_boyutu = (h, w)
+
+    def kes(self, frame):
+        """
+        Karenin tespite gönderilecek kısmını keser.
+
+        Parametreler:
+            frame: Tam kare
+
+        Dönüş:
+            tuple: (Kesilmiş görüntü, (x, y) kesim başlangıcı)
+        """
+        self._hazirla(*frame.shape[:2])
+        x1, y1, x2, y2 = self._kesim
+        kesit = frame[y1:y2, x1:x2]
+        if self._maske is not None:
+            kesit = cv2.bitwise_and(kesit, kesit, mask=self._maske)  # Çokgen dışını siyaha boya
+        return kesit, (x1, y1)
+
+    def icinde_mi(self, kutu):
+        """
+        Tam kare koordinatlarındaki kutunun merkezinin bölge içinde olup olmadığını döndürür.
+
+        Parametreler:
+            kutu (tuple): (x1, y1, x2, y2)
+        """
+        if self.dikdortgen_mi:
+            return True  # Kesim dikdörtgeni bölgenin kendisidir
+        merkez = ((kutu[0] + kutu[2]) / 2.0, (kutu[1] + kutu[3]) / 2.0)
+        return cv2.pointPolygonTest(self._piksel_noktalar.reshape(-1, 1, 2), merkez, False) >= 0
+
+    def piksel_orani(self, frame):
+        """Tespite gönderilen piksel sayısının tam kareye oranını döndürür."""
+        self._hazirla(*frame.shape[:2])
+        x1, y1, x2, y2 = self._kesim
+        return (x2 - x1) * (y2 - y1) / float(frame.shape[0] * frame.shape[1])
+
+    def ciz(self, frame, renk=(255, 200, 0)):
+        """Bölge sınırını kare üzerine çizer."""
+        self._hazirla(*frame.shape[:2])
+        cv2.polylines(frame, [self._piksel_noktalar.reshape(-1, 1, 2)], True, renk, 2)
@@ -0,0 +1,207 @@
+# Bu dosya, kamera ve video akışlarını yakalama → tespit → görüntüleme adımlarına ayıran iş parçacıklı işlem hattını içerir.
+
+import queue  # İş parçacıkları arasında sınırlı kuyruklar için kullanılır
+import threading  # Yakalama ve tespit adımlarını ayrı iş parçacıklarında çalıştırmak için kullanılır
+import time  # Zaman ölçümleri için kullanılır
+import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
+
+_BITTI = object()  # Akışın sona erdiğini sonraki adıma bildiren işaret nesnesi
+
+
+class IslemHatti:
+    """
+    Yakalama, tespit ve görüntüleme adımlarını sınırlı kuyruklarla birbirine bağlar.
+
+    Yakalama ve tespit ayrı iş parçacıklarında çalışır, görüntüleme ise
+    (OpenCV pencereleri ana iş parçacığında çalışmak zorunda olduğu için)
+    çağıran iş parçacığında yapılır.
+
+    Düşürme politikaları:
+        'en_yeni': Kuyruk doluysa en eski kare atılır, her zaman en yeni kare işlenir (canlı kamera)
+        'hepsi': Kuyruk doluysa üretici bekler, hiçbir kare atılmaz (video dosyası)
+    """
+
+    POLITIKALAR = ('en_yeni', 'hepsi')
+
+    def __init__(self, cap, isle, politika='en_yeni', kuyruk_boyutu=2):
+        """
+        İşlem hattını hazırlar.
+
+        Parametreler:
+            cap: Açılmış cv2.VideoCapture nesnesi
+            isle: Kareyi alıp (işlenmiş kare, plaka sayısı) döndüren fonksiyon
+            politika (str): Kuyruk dolduğunda uygulanacak düşürme politikası
+            kuyruk_boyutu (int): Her kuyruğun alabileceği en fazla kare sayısı
+        """
+        if politika not in self.POLITIKALAR:
+            raise ValueError(f"Geçersiz düşürme politikası: {politika}")
+
+        self.cap = cap  # Görüntü kaynağı
+        self.isle = isle  # Tespit fonksiyonu
+        self.politika = politika  # Düşürme politikası
+
+        # Adımlar arasındaki sınırlı kuyruklar
+        self.yakalama_kuyrugu = queue.Queue(maxsize=kuyruk_boyutu)  # Yakalama → tespit
+        self.goruntu_kuyrugu = queue.Queue(maxsize=kuyruk_boyutu)  # Tespit → görüntüleme
+
+        self.durdur_olayi = threading.Event()  # Tüm adımları durdurmak için kullanılır
+        self.iplikler = []  # Başlatılan iş parçacıkları
+
+        # Sayaçlar
+        self.yakalanan = 0  # Kaynaktan okunan kare sayısı
+        self.islenen = 0  # Tespitten geçen kare sayısı
+        self.hatali = 0  # Tespit adımı hata verdiği için atılan kare sayısı
+        self.gosterilen = 0  # Ekrana basılan kare sayısı
+        self.dusurulen = {'yakalama': 0, 'goruntuleme': 0}  # Kuyruk bazında atılan kare sayıları
+        self.tespit_suresi = 0.0  # Son karenin tespit süresi (saniye)
+
+    def _kuyruga_koy(self, kuyruk, oge, asama):
+        """
+        Öğeyi politikaya göre kuyruğa koyar.
+
+        Parametreler:
+            kuyruk (queue.Queue): Hedef kuyruk
+            oge: Kuyruğa konacak öğe
+            asama (str): Düşürme sayacında kullanılacak kuyruk adı
+        """
+        if self.politika == 'en_yeni':
+            # Yer açılana kadar en eski öğeleri at
+            while True:
+                try:
+                    kuyruk.put_nowait(oge)
+                    return
+                except queue.Full:
+                    try:
+                        atilan = kuyruk.get_nowait()
+                        if atilan is not _BITTI:
+                            self.dusurulen[asama] += 1
+                    except queue.Empty:
+                        pass
+        else:
+            # Yer açılana kadar bekle, durdurulursa vazgeç
+            while not self.durdur_olayi.is_set():
+                try:
+                    kuyruk.put(oge, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+    def _yakalama_dongusu(self):
+        """Kaynaktan kare okur ve yakalama kuyruğuna koyar."""
+        while not self.durdur_olayi.is_set():
+            ret, frame = self.cap.read()  # Kaynaktan görüntü alır
+            if not ret:
+                break
+            self.yakalanan += 1
+            self._kuyruga_koy(self.yakalama_kuyrugu, frame, 'yakalama')
+        self._kuyruga_koy(self.yakalama_kuyrugu, _BITTI, 'yakalama')  # Akışın bittiğini bildir
+
+    def _tespit_dongusu(self):
+        """Yakalama kuyruğundaki kareleri işler ve görüntüleme kuyruğuna koyar."""
+        while not self.durdur_olayi.is_set():
+            try:
+                frame = self.yakalama_kuyrugu.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if frame is _BITTI:
+                break
+
+            baslangic = time.perf_counter()
+            try:
+                frame, plaka_sayisi = self.isle(frame)  # Görüntüde plaka tespiti yapar
+            except Exception as e:
+                print(f"Tespit adımında hata: {e}")
+                self.hatali += 1
+                continue
+            self.tespit_suresi = time.perf_counter() - baslangic
+            self.islenen += 1
+
+            self._kuyruga_koy(self.goruntu_kuyrugu, frame, 'goruntuleme')
+        self._kuyruga_koy(self.goruntu_kuyrugu, _BITTI, 'goruntuleme')  # Akışın bittiğini bildir
+
+    def istatistikler(self):
+        """
+        Adım bazında kuyruk doluluklarını ve sayaçları döndürür.
+
+        Dönüş:
+            dict: Kuyruk derinlikleri, düşürülen, hatalı ve işlenen kare sayıları
+        """
+        return {
+            'politika': self.politika,
+            'yakalama_kuyrugu': self.yakalama_kuyrugu.qsize(),
+            'goruntu_kuyrugu': self.goruntu_kuyrugu.qsize(),
+            'yakalanan': self.yakalanan,
+            'islenen': self.islenen,
+            'hatali': self.hatali,
+            'gosterilen': self.gosterilen,
+            'dusurulen_yakalama': self.dusurulen['yakalama'],
+            'dusurulen_goruntuleme': self.dusurulen['goruntuleme'],
+            'tespit_suresi_ms': self.tespit_suresi * 1000,
+        }
+
+    def baslat(self):
+        """Yakalama ve tespit iş parçacıklarını başlatır."""
+        self.iplikler = [
+            threading.Thread(target=self._yakalama_dongusu, name='yakalama', daemon=True),
+            threading.Thread(target=self._tespit_dongusu, name='tespit', daemon=True),
+        ]
+        for iplik in self.iplikler:
+            iplik.start()
+
+    def durdur(self):
+        """Tüm adımları durdurur ve iş parçacıklarının bitmesini bekler."""
+        self.durdur_olayi.set()
+        for iplik in self.iplikler:
+            iplik.join(timeout=2)
+
+    def calistir(self, pencere_adi):
+        """
+        İşlem hattını başlatır ve görüntüleme adımını bu iş parçacığında yürütür.
+        'q' tuşuna basılınca veya akış bitince döner.
+
+        Parametreler:
+            pencere_adi (str): Görüntünün gösterileceği pencerenin adı
+
+        Dönüş:
+            dict: Son durumdaki istatistikler
+        """
+        self.baslat()
+
+        prev_time = time.time()  # Önceki zaman
+        try:
+            while True:
+                try:
+                    frame = self.goruntu_kuyrugu.get(timeout=0.05)
+                except queue.Empty:
+                    # Pencerenin donmaması için olayları işlemeye devam et
+                    if cv2.waitKey(1) & 0xFF == ord('q'):
+                        break
+                    continue
+                if frame is _BITTI:
+                    break
+
+                # FPS hesaplama
+                current_time = time.time()  # Şu anki zamanı alır
+                fps = 1 / max(current_time - prev_time, 1e-6)  # FPS hesaplar
+                prev_time = current_time  # Önceki zamanı günceller
+                self.gosterilen += 1
+
+                # FPS ve kuyruk durumunu gösterme
+                ist = self.istatistikler()
+                cv2.putText(frame, f'FPS: {fps:.2f}', (10, 30),
+                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)  # FPS değerini görüntüye yazar
+                cv2.putText(frame, f"Kuyruk: {ist['yakalama_kuyrugu']}/{ist['goruntu_kuyrugu']}  "
+                                   f"Dusen: {ist['dusurulen_yakalama'] + ist['dusurulen_goruntuleme']}",
+                            (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)  # Kuyruk durumunu yazar
+
+                # Görüntüyü göster
+                cv2.imshow(pencere_adi, frame)  # İşlenmiş görüntüyü gösterir
+
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break  # 'q' tuşuna basılırsa döngüden çık
+        finally:
+            self.durdur()
+
+        ist = self.istatistikler()
+        print(f"İşlem hattı istatistikleri: {ist}")
+        return ist
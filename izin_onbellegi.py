@@ -0,0 +1,244 @@
+# Bu dosya, izinli plakaları bellekte tutan ve veritabanındaki değişiklikleri arka planda takip eden izin önbelleğini içerir.
+
+import datetime  # İzin tarih aralıklarının kontrolü için kullanılır
+import select  # LISTEN bağlantısında bildirim beklemek için kullanılır
+import threading  # Arka planda yenileme için kullanılır
+import time  # Yenileme zamanlaması için kullanılır
+import psycopg2  # PostgreSQL bağlantısı için kullanılır
+from bulanik_izin import BulanikIzinDizini  # OCR hatalarına dayanıklı izin araması
+
+# İzin tablosu değiştiğinde bildirim gönderen tetikleyici
+TETIKLEYICI_SQL = """
+CREATE OR REPLACE FUNCTION izinli_plakalar_bildir() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('{kanal}', TG_OP);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS izinli_plakalar_degisti ON izinli_plakalar;
+CREATE TRIGGER izinli_plakalar_degisti
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON izinli_plakalar
+    FOR EACH STATEMENT EXECUTE PROCEDURE izinli_plakalar_bildir();
+"""
+
+
+class IzinOnbellegi:
+    """
+    izinli_plakalar tablosunun bellekteki kopyası.
+
+    Başlangıçta tablo bir kez yüklenir, ardından arka plandaki iş parçacığı tabloyu
+    belirli aralıklarla (TTL) veya PostgreSQL LISTEN/NOTIFY bildirimi geldiğinde yeniden yükler.
+    Veritabanına ulaşılamazsa son başarılı kopya kullanılmaya devam eder.
+    """
+
+    def __init__(self, baglanti_ayarlari, yenileme_suresi=60, kanal='izinli_plakalar_degisti', dinle=True,
+                 bulanik_esik=None):
+        """
+        Parametreler:
+            baglanti_ayarlari (dict): psycopg2.connect için bağlantı bilgileri
+            yenileme_suresi (float): İki tam yükleme arasındaki en uzun süre (saniye)
+            kanal (str): Değişiklik bildirimlerinin dinleneceği NOTIFY kanalı
+            dinle (bool): LISTEN/NOTIFY ile anlık yenileme yapılsın mı
+            bulanik_esik (float): Verilirse tam eşleşmeyen okumalar bu ağırlıklı uzaklığa kadar
+                en yakın izinli plakayla eşleştirilir (bkz. bulanik_izin.py), None veya 0 ise yalnızca tam eşleşme
+        """
+        self.baglanti_ayarlari = baglanti_ayarlari
+        self.yenileme_suresi = yenileme_suresi
+        self.kanal = kanal
+        self.dinle = dinle
+        self.bulanik_esik = bulanik_esik
+
+        self._izinler = {}  # Plaka → [(başlangıç, bitiş), ...] (yalnızca aktif izinler)
+        self._bulanik_dizin = None  # İzinli plakaların bulanık arama dizini
+        self.bulanik_eslesme = 0  # Tam eşleşmeyip bulanık aramayla izin verilen okuma sayısı
+        self.yuklendi = False  # En az bir kez başarıyla yüklendi mi
+        self.son_yukleme = None  # Son başarılı yüklemenin zamanı
+        self.yukleme_sayisi = 0  # Başarılı yükleme sayısı
+        self.hata_sayisi = 0  # Başarısız yükleme sayısı
+
+        self._conn = None  # Yenileme ve dinleme bağlantısı
+        self._durdur_olayi = threading.Event()
+        self._iplik = None
+
+    def _baglan(self):
+        """Yenileme bağlantısını (gerekirse) açar ve kanalı dinlemeye başlar."""
+        if self._conn is not None and not self._conn.closed:
+            return
+        self._conn = psycopg2.connect(connect_timeout=5, **self.baglanti_ayarlari)
+        self._conn.autocommit = True  # Bildirimlerin işlem dışında gelmesi için gerekir
+        if self.dinle:
+            with self._conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.kanal};")
+
+    def _baglantiyi_kapat(self):
+        """Yenileme bağlantısını kapatır."""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+
+    def yukle(self):
+        """
+        İzin tablosunu veritabanından okuyup bellekteki kopyayı tek seferde değiştirir.
+
+        Dönüş:
+            bool: Yükleme başarılıysa True, hata olduysa False (eski kopya korunur)
+        """
+        try:
+            self._baglan()
+            with self._conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT plaka, baslangic_tarih, bitis_tarih FROM izinli_plakalar
+                    WHERE aktif = TRUE
+                """)
+                satirlar = cursor.fetchall()
+        except Exception as e:
+            self.hata_sayisi += 1
+            print(f"İzin listesi yüklenemedi, son kopya kullanılıyor: {e}")
+            self._baglantiyi_kapat()
+            return False
+
+        yeni_izinler = {}
+        for plaka, baslangic, bitis in satirlar:
+            if baslangic is None or bitis is None:
+                continue  # SQL'deki BETWEEN gibi, tarihi olmayan izinler geçersizdir
+            yeni_izinler.setdefault(plaka, []).append((baslangic, bitis))
+
+        # Dizin yeni kopyayla birlikte hazırlanır; okuyucular eski ya da yeni kopyayı bütün olarak görür
+        bulanik_dizin = BulanikIzinDizini(yeni_izinler, self.bulanik_esik) if self.bulanik_esik else None
+        self._izinler, self._bulanik_dizin = yeni_izinler, bulanik_dizin
+        self.yuklendi = True
+        self.son_yukleme = time.time()
+        self.yukleme_sayisi += 1
+        return True
+
+    def izinli_mi(self, plaka, tarih=None):
+        """
+        Plakanın verilen tarihte izinli olup olmadığını bellekten kontrol eder.
+
+        Parametreler:
+            plaka (str): Kontrol edilecek plaka numarası
+            tarih (datetime.date): Kontrol tarihi, verilmezse bugün
+
+        Dönüş:
+            bool: Plaka izinli ise True, değilse False
+        """
+        return self.izin_bul(plaka, tarih)[0]
+
+    def izin_bul(self, plaka, tarih=None):
+        """
+        Plakayı önce tam, bulanık arama etkinse ardından eşik içindeki izinli plakalarla eşleştirir.
+        Bulanık aramada tarihi geçerli izinler arasından tek bir aday kalmalıdır; süresi dolmuş en yakın
+        plaka geçerli bir ikinci adayı gizlemez, birden fazla geçerli aday ise belirsiz sayılıp reddedilir.
+
+        Parametreler:
+            plaka (str): Okunan plaka numarası
+            tarih (datetime.date): Kontrol tarihi, verilmezse bugün
+
+        Dönüş:
+            tuple: (izinli mi, eşleşen izinli plaka veya None, ağırlıklı uzaklık veya None)
+        """
+        izinler, dizin = self._izinler, self._bulanik_dizin
+        tarih = tarih or datetime.date.today()
+        if plaka in izinler:
+            izinli = any(baslangic <= tarih <= bitis for baslangic, bitis in izinler[plaka])
+            return izinli, plaka, 0.0
+        if dizin is None:
+            return False, None, None
+        adaylar = dizin.esik_icindekiler(plaka)
+        gecerliler = [(aday, mesafe) for aday, mesafe in adaylar
+                      if any(baslangic <= tarih <= bitis for baslangic, bitis in izinler[aday])]
+        if len(gecerliler) != 1:
+            return False, None, adaylar[0][1] if adaylar else None
+        eslesen, mesafe = gecerliler[0]
+        self.bulanik_eslesme += 1
+        return True, eslesen, mesafe
+
+    def _yenileme_dongusu(self):
+        """Bildirim geldiğinde veya süre dolduğunda izin listesini yeniden yükler."""
+        while not self._durdur_olayi.is_set():
+            kalan = self.yenileme_suresi - (time.time() - (self.son_yukleme or 0))
+            if kalan <= 0:
+                if not self.yukle():
+                    self._durdur_olayi.wait(5)  # Veritabanı yoksa hemen yeniden deneme
+                continue
+
+            try:
+                self._baglan()
+                if not self.dinle:
+                    self._durdur_olayi.wait(min(kalan, 1.0))
+                    continue
+                # Bildirim veya kısa bir zaman aşımı bekle (durdurma isteğini kaçırmamak için)
+                hazir, _, _ = select.select([self._conn], [], [], min(kalan, 1.0))
+                if not hazir:
+                    continue
+                self._conn.poll()
+                bildirim_var = bool(self._conn.notifies)
+                self._conn.notifies.clear()
+                if bildirim_var:
+                    self.yukle()
+            except Exception as e:
+                # Veritabanı gittiyse son kopyayla devam et, biraz bekleyip yeniden dene
+                print(f"İzin bildirim bağlantısı koptu: {e}")
+                self._baglantiyi_kapat()
+                self._durdur_olayi.wait(5)
+
+    def baslat(self):
+        """İzin listesini yükler ve arka plan yenilemesini başlatır."""
+        self.yukle()
+        self._iplik = threading.Thread(target=self._yenileme_dongusu, name='izin_yenileme', daemon=True)
+        self._iplik.start()
+
+    def durdur(self):
+        """Arka plan yenilemesini durdurur ve bağlantıyı kapatır."""
+        self._durdur_olayi.set()
+        if self._iplik is not None and self._iplik is not threading.current_thread():
+            self._iplik.join(timeout=2)
+        self._baglantiyi_kapat()
+
+    def tetikleyiciyi_kur(self):
+        """
+        izinli_plakalar tablosuna, her değişiklikte NOTIFY gönderen tetikleyiciyi kurar.
+        Bir kez çalıştırılması yeterlidir.
+        """
+        conn = psycopg2.connect(**self.baglanti_ayarlari)
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(TETIKLEYICI_SQL.replace('{kanal}', self.kanal))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def istatistikler(self):
+        """
+        Dönüş:
+            dict: İzinli plaka sayısı, yükleme sayaçları ve son yükleme zamanı
+        """
+        return {
+            'plaka_sayisi': len(self._izinler),
+            'yukleme_sayisi': self.yukleme_sayisi,
+            'hata_sayisi': self.hata_sayisi,
+            'son_yukleme': self.son_yukleme,
+            'bulanik_eslesme': self.bulanik_eslesme,
+        }
+
+
+if __name__ == "__main__":
+    # Tetikleyiciyi kurar ve izin listesinin yüklenme/sorgu sürelerini ölçer
+    from db_operations import BAGLANTI_AYARLARI
+
+    onbellek = IzinOnbellegi(BAGLANTI_AYARLARI, dinle=False)
+    onbellek.tetikleyiciyi_kur()
+    baslangic = time.perf_counter()
+    onbellek.yukle()
+    print(f"Yükleme: {(time.perf_counter() - baslangic) * 1000:.1f} ms, {onbellek.istatistikler()}")
+
+    plakalar = list(onbellek._izinler) or ['34ABC123']
+    baslangic = time.perf_counter()
+    for i in range(100000):
+        onbellek.izinli_mi(plakalar[i % len(plakalar)])
+    print(f"Sorgu: {(time.perf_counter() - baslangic) * 10:.3f} µs/sorgu")
+    onbellek.durdur()
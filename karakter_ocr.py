@@ -0,0 +1,188 @@
+# Bu dosya, plaka bölgesindeki karakterleri ayırıp train.py ile eğitilen Random Forest modeliyle toplu olarak sınıflandıran OCR motorunu içerir.
+
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import time  # Zaman ölçümleri için kullanılır
+import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
+import numpy as np  # Numpy kütüphanesini matematiksel işlemler için kullanır
+import joblib  # Eğitilmiş modeli yüklemek için kullanılır
+
+KARAKTER_BOYUTU = (20, 20)  # train.py'deki eğitim görüntü boyutu
+ARKAPLAN_ETIKETI = 'arkaplan'  # Karakter olmayan bölgelerin etiketi
+PLAKA_YUKSEKLIGI = 64  # Ayırma öncesinde plaka bölgesinin ölçekleneceği yükseklik
+
+
+def karakterleri_ayir(bolge):
+    """
+    Plaka bölgesindeki karakter adaylarını soldan sağa sıralı olarak keser.
+
+    Parametreler:
+        bolge: Plaka bölgesi görüntüsü (BGR veya gri)
+
+    Dönüş:
+        list: Her karakter için gri tonlamalı görüntü (koyu karakter, açık zemin)
+    """
+    if bolge is None or bolge.size == 0:
+        return []
+    gri = cv2.cvtColor(bolge, cv2.COLOR_BGR2GRAY) if bolge.ndim == 3 else bolge
+    olcek = PLAKA_YUKSEKLIGI / float(gri.shape[0])
+    gri = cv2.resize(gri, (max(int(gri.shape[1] * olcek), 1), PLAKA_YUKSEKLIGI),
+                     interpolation=cv2.INTER_CUBIC)
+    yumusak = cv2.medianBlur(gri, 3)  # Tuz-biber gürültüsünü azaltır
+
+    # Karakterler koyu, zemin açık: ters Otsu ile karakterleri beyaz yap
+    _, ikili = cv2.threshold(yumusak, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
+    ikili = cv2.morphologyEx(ikili, cv2.MORPH_OPEN, np.ones((2, 2), np.uint8))
+
+    sayi, _, istatistik, _ = cv2.connectedComponentsWithStats(ikili, connectivity=8)
+    H, W = ikili.shape
+    adaylar = []
+    for x, y, w, h, alan in istatistik[1:sayi]:
+        # Karakter boyutunda olmayan bileşenleri ele (çerçeve, TR şeridi, vida, gürültü)
+        if not (0.2 * H <= h <= 0.95 * H):
+            continue
+        if not (0.08 <= w / float(h) <= 1.2) or w > 0.25 * W:
+            continue
+        if alan < 0.15 * w * h:
+            continue
+        adaylar.append((x, y, w, h))
+    if not adaylar:
+        return []
+
+    # Benzer yükseklikte olmayan adayları at
+    orta_yukseklik = float(np.median([h for _, _, _, h in adaylar]))
+    adaylar = sorted(a for a in adaylar if abs(a[3] - orta_yukseklik) <= 0.3 * orta_yukseklik)
+
+    # Eğik plakalarda da çalışması için karakter merkezlerine bir doğru uydur, doğrudan uzak olanları at
+    merkez_x = np.array([x + w / 2.0 for x, _, w, _ in adaylar])
+    merkez_y = np.array([y + h / 2.0 for _, y, _, h in adaylar])
+    if len(adaylar) >= 3:
+        egim, kesisim = np.polyfit(merkez_x, merkez_y, 1)
+        # Aykırı karakterlerin doğruyu bozmaması için sapan uçlar atılıp bir kez daha uydurulur
+        sapma = np.abs(merkez_y - (egim * merkez_x + kesisim))
+        yakin = sapma <= np.median(sapma) + 0.25 * orta_yukseklik
+        if yakin.sum() >= 2:
+            egim, kesisim = np.polyfit(merkez_x[yakin], merkez_y[yakin], 1)
+        beklenen = egim * merkez_x + kesisim
+    else:
+        beklenen = np.full(len(adaylar), np.median(merkez_y))
+
+    karakterler = []
+    for (x, y, w, h), my, by in zip(adaylar, merkez_y, beklenen):
+        if abs(my - by) > 0.35 * orta_yukseklik:
+            continue
+        pay = max(int(0.05 * h), 1)  # Eğitim görüntülerindeki gibi karakter çevresinde az bir boşluk bırak
+        karakterler.append(gri[max(y - pay, 0):y + h + pay, max(x - pay, 0):x + w + pay])
+    return karakterler
+
+
+def _ozellikler(karakterler):
+    """Karakter görüntülerini train.py ile aynı biçimde 400 boyutlu özellik satırlarına çevirir."""
+    return np.stack([cv2.resize(k, KARAKTER_BOYUTU).flatten() for k in karakterler])
+
+
+class KarakterOCR:
+    """
+    PaddleOCR yerine kullanılabilen hafif OCR motoru.
+
+    Bütün plaka bölgelerindeki karakterler ayrılır ve tek bir vektörel predict_proba
+    çağrısıyla sınıflandırılır. TopluOCR ile aynı arayüzü sunar.
+    """
+
+    def __init__(self, model_yolu='2random_forest_model.pkl', en_dusuk_guven=0.1, n_jobs=1):
+        """
+        Parametreler:
+            model_yolu (str): train.py ile kaydedilen model dosyası
+            en_dusuk_guven (float): Bu olasılığın altındaki karakterler atlanır
+            n_jobs (int): Tahmin sırasında kullanılacak iş parçacığı sayısı
+        """
+        self.model = joblib.load(model_yolu)  # Eğitilmiş Random Forest modeli
+        self.model.n_jobs = n_jobs  # Küçük toplu çağrılarda iş parçacığı açma maliyetinden kaçın
+        self.siniflar = np.asarray(self.model.classes_)  # Etiketler
+        self.en_dusuk_guven = en_dusuk_guven
+
+    def isit(self):
+        """Modeli boş bir karakter ile bir kez çalıştırır."""
+        self.model.predict_proba(np.full((1, KARAKTER_BOYUTU[0] * KARAKTER_BOYUTU[1]), 255, dtype=np.uint8))
+
+    def oku(self, bolgeler, cls=True):
+        """
+        Plaka bölgelerini toplu olarak okur. Sonuçlar bölgelerle aynı sıradadır.
+
+        Parametreler:
+            bolgeler (list): Plaka bölgesi görüntüleri
+            cls (bool): TopluOCR ile uyumluluk için, kullanılmaz
+
+        Dönüş:
+            list: Her bölge için (metin, güven) çiftleri, okunamayanlar için ("", 0.0)
+        """
+        sahipler = []  # Her karakterin ait olduğu bölgenin indeksi
+        karakterler = []
+        for i, bolge in enumerate(bolgeler):
+            for karakter in karakterleri_ayir(bolge):
+                sahipler.append(i)
+                karakterler.append(karakter)
+
+        sonuclar = [("", 0.0)] * len(bolgeler)
+        if not karakterler:
+            return sonuclar
+
+        # Bütün karakterler tek çağrıda sınıflandırılır
+        olasiliklar = self.model.predict_proba(_ozellikler(karakterler))
+        en_iyi = olasiliklar.argmax(axis=1)
+        etiketler = self.siniflar[en_iyi]
+        guvenler = olasiliklar[np.arange(len(en_iyi)), en_iyi]
+
+        metinler = [[] for _ in bolgeler]
+        guven_listeleri = [[] for _ in bolgeler]
+        for sahip, etiket, guven in zip(sahipler, etiketler, guvenler):
+            if etiket == ARKAPLAN_ETIKETI or guven < self.en_dusuk_guven:
+                continue
+            metinler[sahip].append(str(etiket))
+            guven_listeleri[sahip].append(float(guven))
+
+        return [("".join(m), float(np.mean(g))) if m else ("", 0.0)
+                for m, g in zip(metinler, guven_listeleri)]
+
+
+if __name__ == "__main__":
+    # Random Forest ve PaddleOCR motorlarını aynı test bölgelerinde karşılaştırır
+    from ocr_toplu import TopluOCR, etiketli_bolgeler  # Test bölgeleri ve PaddleOCR adımı
+
+    parser = argparse.ArgumentParser(description="Karakter OCR ve PaddleOCR karşılaştırması")
+    parser.add_argument('--klasor', default='yolov8_dataset/test', help="images/ ve labels/ içeren klasör")
+    parser.add_argument('--model', default='2random_forest_model.pkl', help="train.py ile kaydedilen model")
+    parser.add_argument('--tekrar', type=int, default=3, help="Hız ölçümünün tekrar sayısı")
+    args = parser.parse_args()
+
+    bolgeler = [b for kare in etiketli_bolgeler(args.klasor) for b in kare]
+    print(f"{len(bolgeler)} plaka bölgesi kesildi.")
+
+    def _olc(motor):
+        motor.oku(bolgeler[:1])  # Isınma çağrısı
+        baslangic = time.perf_counter()
+        for _ in range(args.tekrar):
+            sonuclar = motor.oku(bolgeler)
+        return sonuclar, len(bolgeler) * args.tekrar / (time.perf_counter() - baslangic)
+
+    karakter_sonuclari, karakter_hizi = _olc(KarakterOCR(args.model))
+    print(f"Karakter OCR: {karakter_hizi:.1f} bölge/sn")
+
+    try:
+        from paddleocr import PaddleOCR  # OCR işlemleri için PaddleOCR kullanılıyor
+    except ImportError:
+        PaddleOCR = None
+        print("PaddleOCR kurulu değil, yalnızca karakter OCR ölçüldü.")
+
+    if PaddleOCR is not None:
+        paddle_sonuclari, paddle_hizi = _olc(TopluOCR(PaddleOCR(use_angle_cls=True, lang='en')))
+        print(f"PaddleOCR: {paddle_hizi:.1f} bölge/sn ({karakter_hizi / paddle_hizi:.1f}x)")
+
+        # PaddleOCR okumaları referans alınarak karşılaştırılır
+        duzelt = lambda metin: ''.join(c for c in metin.upper() if c.isalnum())
+        ayni = sum(duzelt(k[0]) == duzelt(p[0]) for k, p in zip(karakter_sonuclari, paddle_sonuclari))
+        print(f"PaddleOCR ile aynı okunan bölge: {ayni}/{len(bolgeler)}")
+        for (k, _), (p, _) in list(zip(karakter_sonuclari, paddle_sonuclari))[:10]:
+            print(f"  Karakter: {k:<12} PaddleOCR: {p}")
+    else:
+        for metin, guven in karakter_sonuclari[:10]:
+            print(f"  {metin:<12} {guven:.2f}")
@@ -0,0 +1,237 @@
+# Bu dosya, tespit edilen plakaları kuyruğa alıp arka planda toplu olarak veritabanına yazan kayıt yazıcısını içerir.
+
+import datetime  # Tespit zamanını kuyruğa alınırken kaydetmek için kullanılır
+import queue  # Tespit iş parçacığı ile yazıcı arasındaki sınırlı kuyruk için kullanılır
+import threading  # Arka planda yazma için kullanılır
+import time  # Zaman ölçümleri için kullanılır
+import psycopg2  # Bağlantı hatalarını diğer hatalardan ayırmak için kullanılır
+from psycopg2 import pool  # Bağlantı havuzu için kullanılır
+from psycopg2.extras import execute_values  # Çok satırlı INSERT için kullanılır
+
+
+class KayitYazici:
+    """
+    plakalar tablosuna yazılacak kayıtları arka planda toplu olarak yazar.
+
+    Tespit iş parçacığı yalnızca kuyruğa ekleme yapar; yazıcı iş parçacığı kayıtları
+    toplu_boyut kadar birikince veya en_uzun_bekleme dolunca tek bir çok satırlı INSERT ile yazar.
+    Kuyruk doluysa ekleme en fazla ekleme_bekleme kadar bekler, sonra kayıt reddedilir.
+    Veritabanına ulaşılamazsa toplu yazma artan aralıklarla yazılana kadar yeniden denenir; bu sırada
+    gelen kayıtlar kuyrukta birikir. Böylece kesinti sırasında kayıp yalnızca kuyruk taşınca (reddedilen)
+    veya kapanışta hâlâ yazılamayan kayıtlar (basarisiz) için olur.
+    """
+
+    def __init__(self, baglanti_ayarlari, toplu_boyut=100, en_uzun_bekleme=1.0,
+                 en_fazla_kuyruk=10000, ekleme_bekleme=0.0, deneme_sayisi=3, havuz_boyutu=2, olcer=None,
+                 en_uzun_deneme_bekleme=30.0):
+        """
+        Parametreler:
+            baglanti_ayarlari (dict): psycopg2.connect için bağlantı bilgileri
+            toplu_boyut (int): Tek seferde yazılacak en fazla kayıt sayısı
+            en_uzun_bekleme (float): Bir kaydın yazılmadan önce kuyrukta bekleyebileceği süre (saniye)
+            en_fazla_kuyruk (int): Kuyrukta bekleyebilecek en fazla kayıt sayısı
+            ekleme_bekleme (float): Kuyruk doluyken eklemenin bekleyeceği süre (saniye)
+            deneme_sayisi (int): Kapanış sırasında başarısız bir toplu yazmanın kaç kez deneneceği
+                (çalışırken yazılana kadar denenir)
+            havuz_boyutu (int): Bağlantı havuzundaki en fazla bağlantı sayısı
+            olcer: kaydet(asama, sure) metodu olan bir nesne verilirse toplu yazma süreleri
+                'db_toplu_yazma' aşaması olarak bildirilir (sonradan da atanabilir)
+            en_uzun_deneme_bekleme (float): Yeniden denemeler arasında beklenecek en uzun süre (saniye)
+        """
+        self.baglanti_ayarlari = baglanti_ayarlari
+        self.toplu_boyut = toplu_boyut
+        self.en_uzun_bekleme = en_uzun_bekleme
+        self.ekleme_bekleme = ekleme_bekleme
+        self.deneme_sayisi = deneme_sayisi
+        self.havuz_boyutu = havuz_boyutu
+        self.olcer = olcer
+        self.en_uzun_deneme_bekleme = en_uzun_deneme_bekleme
+
+        self.kuyruk = queue.Queue(maxsize=en_fazla_kuyruk)  # Yazılmayı bekleyen kayıtlar
+        self._havuz = None  # Bağlantı havuzu (ilk yazmada açılır)
+        self._durdur_olayi = threading.Event()
+        self._baglanti_kesik = False  # Son başarısız yazma bağlantı hatasıyla mı bitti
+        self._iplik = threading.Thread(target=self._yazma_dongusu, name='kayit_yazici', daemon=True)
+
+        # Sayaçlar
+        self.kuyruga_alinan = 0  # Kuyruğa eklenen kayıt sayısı
+        self.yazilan = 0  # Veritabanına yazılan kayıt sayısı
+        self.basarisiz = 0  # Veri hatası nedeniyle veya kapanışta yazılamayıp atılan kayıt sayısı
+        self.yeniden_deneme = 0  # Başarısız toplu yazmadan sonra yapılan yeniden deneme sayısı
+        self.reddedilen = 0  # Kuyruk dolu olduğu için alınmayan kayıt sayısı
+        self.toplu_yazma_sayisi = 0  # Yapılan toplu yazma sayısı
+
+        self._iplik.start()
+
+    def ekle(self, plaka, durum):
+        """
+        Kaydı yazılmak üzere kuyruğa ekler.
+
+        Parametreler:
+            plaka (str): Kaydedilecek plaka numarası
+            durum (bool): Plakanın izinli olup olmadığı
+
+        Dönüş:
+            bool: Kayıt kuyruğa alındıysa True, kuyruk dolu olduğu için reddedildiyse False
+        """
+        kayit = (plaka, durum, datetime.datetime.now())  # Tespit zamanı kuyruğa alınırken belirlenir
+        try:
+            if self.ekleme_bekleme > 0:
+                self.kuyruk.put(kayit, timeout=self.ekleme_bekleme)
+            else:
+                self.kuyruk.put_nowait(kayit)
+        except queue.Full:
+            self.reddedilen += 1
+            return False
+        self.kuyruga_alinan += 1
+        return True
+
+    def _havuzu_al(self):
+        """Bağlantı havuzunu (gerekirse) oluşturur ve döndürür."""
+        if self._havuz is None:
+            self._havuz = pool.ThreadedConnectionPool(1, self.havuz_boyutu, **self.baglanti_ayarlari)
+        return self._havuz
+
+    def _toplu_yaz(self, kayitlar):
+        """
+        Kayıtları tek bir çok satırlı INSERT ile yazar. Bağlantı hatalarında artan aralıklarla yazılana
+        kadar yeniden dener, yazıcı durdurulduktan sonra en fazla deneme_sayisi kez dener. Veri hataları
+        (örn. tabloya uymayan bir kayıt) yeniden denenmez.
+
+        Parametreler:
+            kayitlar (list): (plaka, durum, tespit_zamani) demetleri
+
+        Dönüş:
+            bool: Kayıtlar yazıldıysa True, yazılamadıysa False
+        """
+        baslangic = time.perf_counter()
+        deneme = sinirli_deneme = 0
+        while True:
+            havuz = conn = None
+            try:
+                havuz = self._havuzu_al()
+                conn = havuz.getconn()
+                with conn.cursor() as cursor:
+                    execute_values(
+                        cursor,
+                        "INSERT INTO plakalar (plaka, durum, tespit_zamani) VALUES %s",
+                        kayitlar,
+                        page_size=len(kayitlar),
+                    )
+                conn.commit()
+                havuz.putconn(conn)
+                self.yazilan += len(kayitlar)
+                self.toplu_yazma_sayisi += 1
+                if self.olcer is not None:
+                    self.olcer.kaydet('db_toplu_yazma', time.perf_counter() - baslangic)
+                return True
+            except Exception as e:
+                baglanti_hatasi = isinstance(e, (psycopg2.OperationalError, psycopg2.InterfaceError))
+                print(f"Plakalar kaydedilirken hata oluştu ({deneme + 1}. deneme): {e}")
+                if conn is not None:
+                    # Bozuk bağlantıyı havuza geri koymadan kapat
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        pass
+                    havuz.putconn(conn, close=True)
+            self._baglanti_kesik = baglanti_hatasi
+            if not baglanti_hatasi:
+                return False
+            if self._durdur_olayi.is_set():
+                sinirli_deneme += 1
+                if sinirli_deneme >= self.deneme_sayisi:
+                    return False
+            if not self._durdur_olayi.is_set():
+                # Yeniden denemeden önce bekle; kapatılırsa bekleme hemen biter
+                self._durdur_olayi.wait(min(2 ** min(deneme, 10), self.en_uzun_deneme_bekleme))
+            deneme += 1
+            self.yeniden_deneme += 1
+
+    def _yazma_dongusu(self):
+        """Yazıcı iş parçacığının döngüsü; kuyruk bitince bağlantı havuzunu kapatır."""
+        try:
+            self._kuyrugu_isle()
+        finally:
+            # Havuzu yalnızca onu kullanan bu iş parçacığı kapatır; kapat() zaman aşımına uğrasa da
+            # süren bir yazmanın altından havuz çekilmez
+            havuz, self._havuz = self._havuz, None
+            if havuz is not None:
+                havuz.closeall()
+
+    def _kuyrugu_isle(self):
+        """Kuyruktaki kayıtları toplayıp toplu olarak yazar."""
+        while True:
+            durduruldu = self._durdur_olayi.is_set()
+            try:
+                ilk = self.kuyruk.get(timeout=0.1)
+            except queue.Empty:
+                if durduruldu:
+                    break
+                continue
+
+            # İlk kayıttan sonra toplu_boyut dolana veya süre bitene kadar topla
+            kayitlar = [ilk]
+            son_zaman = time.monotonic() + (0 if durduruldu else self.en_uzun_bekleme)
+            while len(kayitlar) < self.toplu_boyut:
+                kalan = son_zaman - time.monotonic()
+                try:
+                    if kalan > 0 and not self._durdur_olayi.is_set():
+                        kayitlar.append(self.kuyruk.get(timeout=kalan))
+                    else:
+                        kayitlar.append(self.kuyruk.get_nowait())
+                except queue.Empty:
+                    break
+
+            if self._toplu_yaz(kayitlar):
+                continue
+            if not self._baglanti_kesik:
+                # Veri hatası: toplunun geri kalanı kaybolmasın diye kayıtlar tek tek yazılır
+                if len(kayitlar) == 1:
+                    self.basarisiz += 1
+                    continue
+                for kayit in kayitlar:
+                    if not self._toplu_yaz([kayit]):
+                        self.basarisiz += 1
+                continue
+            # Kapanışta veritabanına ulaşılamıyor: bu toplu ile kuyrukta kalanlar atılıp sayılır
+            atilan = len(kayitlar)
+            while True:
+                try:
+                    self.kuyruk.get_nowait()
+                except queue.Empty:
+                    break
+                atilan += 1
+            self.basarisiz += atilan
+            print(f"Veritabanına ulaşılamadığı için {atilan} kayıt yazılamadan atıldı.")
+            break
+
+    def istatistikler(self):
+        """
+        Dönüş:
+            dict: Kuyruktaki, yazılan, başarısız ve reddedilen kayıt sayıları
+        """
+        return {
+            'kuyrukta': self.kuyruk.qsize(),
+            'kuyruga_alinan': self.kuyruga_alinan,
+            'yazilan': self.yazilan,
+            'basarisiz': self.basarisiz,
+            'yeniden_deneme': self.yeniden_deneme,
+            'reddedilen': self.reddedilen,
+            'toplu_yazma_sayisi': self.toplu_yazma_sayisi,
+        }
+
+    def kapat(self, zaman_asimi=10):
+        """
+        Kuyrukta kalan kayıtları yazar; bağlantı havuzu yazıcı iş parçacığı bitince kapanır.
+
+        Parametreler:
+            zaman_asimi (float): Kalan kayıtların yazılması için beklenecek en uzun süre (saniye)
+        """
+        if self._durdur_olayi.is_set():
+            return
+        self._durdur_olayi.set()
+        self._iplik.join(timeout=zaman_asimi)
+        if self._iplik.is_alive():
+            print(f"Kayıt yazıcısı {zaman_asimi:g} saniyede bitmedi; havuz yazma bitince kapatılacak.")
+        print(f"Kayıt yazıcısı kapatıldı: {self.istatistikler()}")
@@ -0,0 +1,338 @@
+# Bu dosya, canlı tespit sisteminin aşama süreleri, FPS ve sayaçlarını toplayan; bunları yerel bir
+# Prometheus uç noktasında ve periyodik günlük satırında sunan metrik modülünü ve örnekleyen profil çıkarıcıyı içerir.
+
+import collections  # Kayan FPS penceresi ve profil sayaçları için kullanılır
+import sys  # İş parçacıklarının çağrı yığınlarını örneklemek için kullanılır
+import threading  # Arka plan sunucusu, günlük ve profil iş parçacıkları için kullanılır
+import time  # Zaman ölçümleri için kullanılır
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # Yerel metrik uç noktası
+from urllib.parse import parse_qs, urlparse  # Profil isteğindeki parametreleri okumak için kullanılır
+
+# Histogram sınırları (saniye); 1 ms ile 5 sn arası
+VARSAYILAN_SINIRLAR = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    """Prometheus biçiminde kümülatif sınırlı süre histogramı."""
+
+    def __init__(self, sinirlar=VARSAYILAN_SINIRLAR):
+        self.sinirlar = tuple(sinirlar)
+        self.kovalar = [0] * (len(self.sinirlar) + 1)  # Son kova +Inf
+        self.toplam = 0.0
+        self.adet = 0
+
+    def ekle(self, deger):
+        """Bir ölçüm ekler."""
+        for i, sinir in enumerate(self.sinirlar):
+            if deger <= sinir:
+                self.kovalar[i] += 1
+                break
+        else:
+            self.kovalar[-1] += 1
+        self.toplam += deger
+        self.adet += 1
+
+    def yuzdelik(self, oran):
+        """Kova sınırlarından yaklaşık yüzdelik değeri (saniye) döndürür."""
+        if not self.adet:
+            return 0.0
+        hedef = oran * self.adet
+        birikimli = 0
+        for i, sayi in enumerate(self.kovalar):
+            birikimli += sayi
+            if birikimli >= hedef:
+                return self.sinirlar[i] if i < len(self.sinirlar) else float('inf')
+        return float('inf')
+
+
+class Metrikler:
+    """
+    Canlı tespit metriklerinin kayıt defteri.
+
+    Aşama süreleri PlakaTespitTest.olcer arayüzüyle (kaydet(asama, sure)) toplanır, böylece
+    tespit_et içindeki yolo, ocr, izin_kontrol, kayit gibi aşamalar ayrıca değiştirilmeden ölçülür.
+    İşlem hattı, veritabanı önbelleği gibi bileşenlerin istatistikleri kaynak olarak eklenir ve
+    her okumada güncel değerleriyle sunulur.
+    """
+
+    def __init__(self, fps_penceresi=5.0, onek='plaka'):
+        """
+        Parametreler:
+            fps_penceresi (float): Kayan FPS hesabındaki pencere süresi (saniye)
+            onek (str): Prometheus metrik adlarının öneki
+        """
+        self.fps_penceresi = fps_penceresi
+        self.onek = onek
+        self._kilit = threading.Lock()
+        self.histogramlar = collections.OrderedDict()  # Aşama adı → Histogram
+        self.sayaclar = collections.Counter()  # Kare, OCR okuma ve boş okuma sayıları
+        self._kare_zamanlari = collections.deque()  # Kayan FPS için kare bitiş zamanları
+        self._kaynaklar = {}  # Ad → istatistik döndüren fonksiyon
+        self.baslangic = time.time()
+
+    def kaydet(self, asama, sure):
+        """
+        Bir aşamanın süresini histograma ekler.
+
+        Parametreler:
+            asama (str): Aşama adı
+            sure (float): Süre (saniye)
+        """
+        with self._kilit:
+            histogram = self.histogramlar.get(asama)
+            if histogram is None:
+                histogram = self.histogramlar[asama] = Histogram()
+            histogram.ekle(sure)
+
+    def kare_islendi(self, sure, ocr_okumalari=()):
+        """
+        İşlenen bir kareyi FPS ve OCR sayaçlarına ekler.
+
+        Parametreler:
+            sure (float): Karenin toplam işlenme süresi (saniye)
+            ocr_okumalari (list): Karede OCR ile okunan metinler (boş okumalar dahil)
+        """
+        simdi = time.monotonic()
+        self.kaydet('kare', sure)
+        with self._kilit:
+            self.sayaclar['kare'] += 1
+            self.sayaclar['ocr_okuma'] += len(ocr_okumalari)
+            self.sayaclar['ocr_bos'] += sum(1 for metin in ocr_okumalari if not metin)
+            self._kare_zamanlari.append(simdi)
+            while self._kare_zamanlari and simdi - self._kare_zamanlari[0] > self.fps_penceresi:
+                self._kare_zamanlari.popleft()
+
+    def kaynak_ekle(self, ad, istatistik_fonksiyonu):
+        """
+        Her okumada çağrılacak bir istatistik kaynağı ekler (örn. IslemHatti.istatistikler).
+
+        Parametreler:
+            ad (str): Kaynak adı (metrik adında kullanılır)
+            istatistik_fonksiyonu: Sözlük döndüren fonksiyon; yalnızca sayısal değerler sunulur
+        """
+        self._kaynaklar[ad] = istatistik_fonksiyonu
+
+    def kaynak_cikar(self, ad):
+        """Kaynağı kaldırır (örn. akış bittiğinde işlem hattı)."""
+        self._kaynaklar.pop(ad, None)
+
+    def fps(self):
+        """Son fps_penceresi saniyedeki ortalama FPS değerini döndürür."""
+        with self._kilit:
+            if len(self._kare_zamanlari) < 2:
+                return 0.0
+            aralik = self._kare_zamanlari[-1] - self._kare_zamanlari[0]
+            return (len(self._kare_zamanlari) - 1) / aralik if aralik > 0 else 0.0
+
+    def ocr_bos_orani(self):
+        """OCR okumalarının boş çıkma oranını döndürür."""
+        return self.sayaclar['ocr_bos'] / self.sayaclar['ocr_okuma'] if self.sayaclar['ocr_okuma'] else 0.0
+
+    def _kaynak_degerleri(self):
+        """Kaynaklardaki sayısal değerleri (kaynak, anahtar, değer) olarak döndürür."""
+        degerler = []
+        for ad, fonksiyon in list(self._kaynaklar.items()):
+            try:
+                istatistik = fonksiyon()
+            except Exception as e:
+                print(f"Metrik kaynağı okunamadı ({ad}): {e}")
+                continue
+            for anahtar, deger in istatistik.items():
+                if isinstance(deger, bool):
+                    deger = int(deger)
+                if isinstance(deger, (int, float)):
+                    degerler.append((ad, anahtar, deger))
+        return degerler
+
+    def prometheus_metni(self):
+        """
+        Metrikleri Prometheus metin biçiminde döndürür.
+
+        Dönüş:
+            str: /metrics yanıtı
+        """
+        o = self.onek
+        satirlar = [
+            f"# TYPE {o}_asama_sure_saniye histogram",
+        ]
+        with self._kilit:
+            for asama, h in self.histogramlar.items():
+                birikimli = 0
+                for sinir, sayi in zip(h.sinirlar, h.kovalar):
+                    birikimli += sayi
+                    satirlar.append(f'{o}_asama_sure_saniye_bucket{{asama="{asama}",le="{sinir}"}} {birikimli}')
+                satirlar.append(f'{o}_asama_sure_saniye_bucket{{asama="{asama}",le="+Inf"}} {h.adet}')
+                satirlar.append(f'{o}_asama_sure_saniye_sum{{asama="{asama}"}} {h.toplam:.6f}')
+                satirlar.append(f'{o}_asama_sure_saniye_count{{asama="{asama}"}} {h.adet}')
+            sayaclar = dict(self.sayaclar)
+
+        satirlar.append(f"# TYPE {o}_kare_toplam counter")
+        satirlar.append(f"{o}_kare_toplam {sayaclar.get('kare', 0)}")
+        satirlar.append(f"# TYPE {o}_ocr_okuma_toplam counter")
+        satirlar.append(f"{o}_ocr_okuma_toplam {sayaclar.get('ocr_okuma', 0)}")
+        satirlar.append(f"# TYPE {o}_ocr_bos_toplam counter")
+        satirlar.append(f"{o}_ocr_bos_toplam {sayaclar.get('ocr_bos', 0)}")
+        satirlar.append(f"# TYPE {o}_fps gauge")
+        satirlar.append(f"{o}_fps {self.fps():.3f}")
+        satirlar.append(f"# TYPE {o}_calisma_suresi_saniye gauge")
+        satirlar.append(f"{o}_calisma_suresi_saniye {time.time() - self.baslangic:.0f}")
+        for kaynak, anahtar, deger in self._kaynak_degerleri():
+            satirlar.append(f'{o}_{kaynak}{{anahtar="{anahtar}"}} {deger}')
+        return "\n".join(satirlar) + "\n"
+
+    def gunluk_satiri(self):
+        """
+        Periyodik günlük için tek satırlık özet döndürür.
+
+        Dönüş:
+            str: FPS, aşama p95 süreleri, düşürülen kareler ve boş OCR oranı
+        """
+        parcalar = [f"FPS {self.fps():.1f}"]
+        with self._kilit:
+            for asama, h in self.histogramlar.items():
+                if h.adet:
+                    parcalar.append(f"{asama} p95<={h.yuzdelik(0.95) * 1000:.0f}ms")
+        for kaynak, anahtar, deger in self._kaynak_degerleri():
+            if anahtar.startswith('dusurulen'):
+                parcalar.append(f"{kaynak}.{anahtar}={deger}")
+        parcalar.append(f"boş OCR %{self.ocr_bos_orani() * 100:.0f}")
+        return "[metrik] " + " | ".join(parcalar)
+
+
+class OrneklemeProfilcisi:
+    """
+    Çalışan sistemde belirli aralıklarla iş parçacıklarının çağrı yığınlarını örnekleyen profil çıkarıcı.
+    Sonuç, flame graph araçlarının okuyabildiği 'yığın;yığın;fonksiyon adet' biçimindedir.
+    """
+
+    def __init__(self, aralik=0.005, derinlik=40):
+        """
+        Parametreler:
+            aralik (float): Örnekleme aralığı (saniye)
+            derinlik (int): Bir yığından alınacak en fazla çerçeve sayısı
+        """
+        self.aralik = aralik
+        self.derinlik = derinlik
+        self._kilit = threading.Lock()  # Aynı anda tek profil alınır
+
+    def _cerceve_adi(self, cerceve):
+        kod = cerceve.f_code
+        return f"{kod.co_filename.replace(chr(92), '/').rsplit('/', 1)[-1]}:{kod.co_name}"
+
+    def profil_al(self, sure=10.0):
+        """
+        Verilen süre boyunca bütün iş parçacıklarını örnekler.
+
+        Parametreler:
+            sure (float): Profil süresi (saniye)
+
+        Dönüş:
+            str: Katlanmış yığın satırları (en sık görülen önce), başka profil sürüyorsa None
+        """
+        if not self._kilit.acquire(blocking=False):
+            return None
+        try:
+            yiginlar = collections.Counter()
+            kendi = threading.get_ident()
+            adlar = {t.ident: t.name for t in threading.enumerate()}
+            bitis = time.monotonic() + sure
+            while time.monotonic() < bitis:
+                for kimlik, cerceve in sys._current_frames().items():
+                    if kimlik == kendi:
+                        continue
+                    yigin = []
+                    while cerceve is not None and len(yigin) < self.derinlik:
+                        yigin.append(self._cerceve_adi(cerceve))
+                        cerceve = cerceve.f_back
+                    yigin.append(adlar.get(kimlik, str(kimlik)))
+                    yiginlar[";".join(reversed(yigin))] += 1
+                time.sleep(self.aralik)
+            return "\n".join(f"{yigin} {adet}" for yigin, adet in yiginlar.most_common()) + "\n"
+        finally:
+            self._kilit.release()
+
+
+class MetrikSunucusu:
+    """
+    Metrikleri yerel bir HTTP uç noktasında sunar ve periyodik günlük satırı yazar.
+
+    Uç noktalar:
+        /metrics: Prometheus metin biçimi
+        /profil?sure=10: Profil çıkarıcı etkinse örneklenmiş çağrı yığınları
+    """
+
+    def __init__(self, metrikler, adres='127.0.0.1', port=9108, gunluk_araligi=30.0, profilci=None):
+        """
+        Parametreler:
+            metrikler (Metrikler): Sunulacak metrikler
+            adres (str): Dinlenecek adres (varsayılan yalnızca yerel makine)
+            port (int): Dinlenecek port, 0 ise uç nokta açılmaz
+            gunluk_araligi (float): Günlük satırı aralığı (saniye), 0 ise yazılmaz
+            profilci (OrneklemeProfilcisi): Verilirse /profil uç noktası etkinleşir
+        """
+        self.metrikler = metrikler
+        self.adres = adres
+        self.port = port
+        self.gunluk_araligi = gunluk_araligi
+        self.profilci = profilci
+        self._sunucu = None
+        self._durdur_olayi = threading.Event()
+
+    def _istek_sinifi(self):
+        """HTTP isteklerini karşılayan sınıfı oluşturur."""
+        sunucu = self
+
+        class _Istek(BaseHTTPRequestHandler):
+            def do_GET(self):
+                adres = urlparse(self.path)
+                if adres.path == '/metrics':
+                    self._yanitla(200, sunucu.metrikler.prometheus_metni(), 'text/plain; version=0.0.4')
+                elif adres.path == '/profil' and sunucu.profilci is not None:
+                    sure = float(parse_qs(adres.query).get('sure', ['10'])[0])
+                    sonuc = sunucu.profilci.profil_al(min(sure, 120.0))
+                    if sonuc is None:
+                        self._yanitla(409, "Başka bir profil alınıyor\n", 'text/plain')
+                    else:
+                        self._yanitla(200, sonuc, 'text/plain')
+                else:
+                    self._yanitla(404, "Bulunamadı\n", 'text/plain')
+
+            def _yanitla(self, kod, metin, tur):
+                veri = metin.encode('utf-8')
+                self.send_response(kod)
+                self.send_header('Content-Type', f"{tur}; charset=utf-8" if 'charset' not in tur else tur)
+                self.send_header('Content-Length', str(len(veri)))
+                self.end_headers()
+                self.wfile.write(veri)
+
+            def log_message(self, *args):
+                pass  # Her isteği konsola yazma
+
+        return _Istek
+
+    def _gunluk_dongusu(self):
+        """Belirli aralıklarla özet satırını yazdırır."""
+        while not self._durdur_olayi.wait(self.gunluk_araligi):
+            print(self.metrikler.gunluk_satiri())
+
+    def baslat(self):
+        """HTTP sunucusunu ve günlük iş parçacığını başlatır."""
+        if self.port:
+            try:
+                self._sunucu = ThreadingHTTPServer((self.adres, self.port), self._istek_sinifi())
+                self._sunucu.daemon_threads = True
+                threading.Thread(target=self._sunucu.serve_forever, name='metrik_sunucusu', daemon=True).start()
+                print(f"Metrikler http://{self.adres}:{self._sunucu.server_address[1]}/metrics adresinde sunuluyor.")
+            except OSError as e:
+                print(f"Metrik sunucusu başlatılamadı: {e}")
+                self._sunucu = None
+        if self.gunluk_araligi:
+            threading.Thread(target=self._gunluk_dongusu, name='metrik_gunlugu', daemon=True).start()
+
+    def durdur(self):
+        """Sunucuyu ve günlük iş parçacığını durdurur."""
+        self._durdur_olayi.set()
+        if self._sunucu is not None:
+            self._sunucu.shutdown()
+            self._sunucu.server_close()
+            self._sunucu = None
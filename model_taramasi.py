@@ -0,0 +1,257 @@
+# Bu dosya, plaka tespit modelini farklı model boyutları (n/s) ve giriş boyutlarıyla (imgsz) eğitir veya ince ayar yapar,
+# her adayın mAP / duyarlılık değerlerini ve CPU gecikmesini ölçer ve hız-doğruluk Pareto sınırını raporlar.
+
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import datetime  # Sonuç dosyasının adı ve zaman bilgisi için kullanılır
+import json  # Sonuçları kaydetmek için kullanılır
+import os  # Dosya ve dizin işlemleri için kullanılır
+import platform  # Ölçümün yapıldığı makine bilgisi için kullanılır
+import time  # Gecikme ölçümleri için kullanılır
+from pathlib import Path  # Dosya yollarını yönetmek için kullanılır
+import cv2  # Test görüntülerini okumak için kullanılır
+import numpy as np  # Yüzdelik hesapları için kullanılır
+from ayarlar import VERI_YAML  # Yolları kendi klasörüne göreli veri seti (plaka.yaml)
+from performans_olcumu import SONUC_KLASORU  # Ölçüm sonuçlarının kaydedildiği dizin
+
+TARAMA_KLASORU = 'plaka_tespit/tarama'  # Aday modellerin eğitim klasörleri
+METRIKLER = ('map50', 'map50_95', 'duyarlilik', 'kesinlik')  # Pareto sınırında kullanılabilecek doğruluk ölçüleri
+
+
+def aday_adi(model, imgsz):
+    """Adayın eğitim klasörü adını döndürür (örn. 'yolov8n_416')."""
+    return f"{Path(model).stem}_{imgsz}"
+
+
+def veri_klasorleri(veri_yaml):
+    """
+    Veri seti YAML dosyasındaki set klasörlerini ultralytics'in çözdüğü biçimde döndürür.
+
+    Dönüş:
+        dict: 'train' / 'val' / 'test' → görüntü klasörü
+    """
+    from ultralytics.data.utils import check_det_dataset  # YAML'daki göreli yolları çözmek için kullanılır
+
+    veri = check_det_dataset(veri_yaml)
+    return {bolum: veri[bolum] for bolum in ('train', 'val', 'test') if veri.get(bolum)}
+
+
+def egit(model, imgsz, veri_yaml, epok, onbellek=None, **egitim_ayarlari):
+    """
+    Bir adayı eğitir; aynı aday daha önce eğitildiyse ağırlıkları yeniden kullanır.
+
+    Parametreler:
+        model (str): Başlangıç ağırlıkları ('yolov8n.pt', 'yolov8s.pt' veya ince ayar için best.pt) ya da model YAML'ı
+        imgsz (int): Eğitim giriş boyutu
+        veri_yaml (str): Veri seti YAML dosyası
+        epok (int): Epok sayısı; 0 ise eğitim yapılmaz, model olduğu gibi ölçülür
+        onbellek (str): veri_seti_araci.py önbellek klasörü; verilirse görüntüler JPEG çözülmeden okunur
+        egitim_ayarlari: YOLO.train'e geçirilecek diğer ayarlar (batch, patience, ...)
+
+    Dönüş:
+        str: Ölçülecek ağırlık dosyası
+    """
+    if epok == 0:
+        return model
+    agirlik = Path(TARAMA_KLASORU, aday_adi(model, imgsz), 'weights', 'best.pt')
+    if agirlik.exists():
+        print(f"{agirlik} zaten var, eğitim atlanıyor.")
+        return str(agirlik)
+
+    from ultralytics import YOLO  # YOLO modelini kullanmak için gerekli kütüphane
+
+    ek = {}
+    if onbellek:
+        from veri_seti_araci import onbellek_olustur, onbellekli_egitici, SETLER  # Önceden çözülmüş görüntüler
+        onbellek = os.path.join(onbellek, str(imgsz))  # Her giriş boyutunun ayrı önbelleği olur
+        for bolum, klasor in veri_klasorleri(veri_yaml).items():
+            set_adi = SETLER[('train', 'val', 'test').index(bolum)]
+            onbellek_olustur(os.path.dirname(klasor), os.path.join(onbellek, set_adi), imgsz)
+        ek['trainer'] = onbellekli_egitici(onbellek)
+
+    YOLO(model).train(data=veri_yaml, imgsz=imgsz, epochs=epok, device='cpu', project=os.path.abspath(TARAMA_KLASORU),
+                      name=aday_adi(model, imgsz), exist_ok=True, plots=False, **egitim_ayarlari, **ek)
+    return str(agirlik)
+
+
+def dogruluk_olc(agirlik, imgsz, veri_yaml, bolum='test'):
+    """
+    Modelin seçilen veri bölümündeki tespit doğruluğunu ölçer.
+
+    Dönüş:
+        dict: map50, map50_95, duyarlilik, kesinlik
+    """
+    from ultralytics import YOLO  # YOLO modelini kullanmak için gerekli kütüphane
+
+    sonuc = YOLO(agirlik).val(data=veri_yaml, imgsz=imgsz, split=bolum, device='cpu', plots=False, verbose=False)
+    return {
+        'map50': float(sonuc.box.map50),
+        'map50_95': float(sonuc.box.map),
+        'duyarlilik': float(sonuc.box.mr),
+        'kesinlik': float(sonuc.box.mp),
+    }
+
+
+def gecikme_olc(agirlik, imgsz, goruntuler, isinma=3):
+    """
+    Modelin CPU'da görüntü başına tespit gecikmesini ölçer (ön işleme ve NMS dahil).
+
+    Parametreler:
+        agirlik (str): Ağırlık dosyası
+        imgsz (int): Giriş boyutu
+        goruntuler (list): Bellekteki BGR test görüntüleri
+        isinma (int): Ölçüme katılmayan ilk çağrı sayısı
+
+    Dönüş:
+        dict: p50 / p95 toplam gecikme ve p50 çıkarım süresi (milisaniye)
+    """
+    from ultralytics import YOLO  # YOLO modelini kullanmak için gerekli kütüphane
+
+    model = YOLO(agirlik)
+    for goruntu in goruntuler[:isinma]:
+        model.predict(goruntu, imgsz=imgsz, device='cpu', verbose=False)
+    sureler, cikarim_sureleri = [], []
+    for goruntu in goruntuler:
+        baslangic = time.perf_counter()
+        sonuc = model.predict(goruntu, imgsz=imgsz, device='cpu', verbose=False)[0]
+        sureler.append((time.perf_counter() - baslangic) * 1000)
+        cikarim_sureleri.append(sonuc.speed['inference'])
+    p50, p95 = np.percentile(sureler, [50, 95])
+    return {
+        'gecikme_ms_p50': float(p50),
+        'gecikme_ms_p95': float(p95),
+        'cikarim_ms_p50': float(np.percentile(cikarim_sureleri, 50)),
+    }
+
+
+def pareto_siniri(adaylar, metrik='map50_95'):
+    """
+    Başka hiçbir adayın hem daha hızlı hem daha doğru olmadığı adayları seçer.
+
+    Parametreler:
+        adaylar (list): 'gecikme_ms_p50' ve metrik anahtarlarını içeren aday sonuçları
+        metrik (str): Doğruluk ölçüsü
+
+    Dönüş:
+        list: Gecikmeye göre sıralı Pareto sınırı
+    """
+    sinir = []
+    for aday in sorted(adaylar, key=lambda a: (a['gecikme_ms_p50'], -a[metrik])):
+        # Sıralama gereği öncekiler daha hızlıdır; aday ancak hepsinden daha doğruysa sınırdadır
+        if not sinir or aday[metrik] > sinir[-1][metrik]:
+            sinir.append(aday)
+    return sinir
+
+
+def oneri(adaylar, hedef_duyarlilik):
+    """
+    Duyarlılık hedefini karşılayan en hızlı adayı döndürür; hiçbiri karşılamıyorsa None.
+    """
+    uygunlar = [a for a in adaylar if a['duyarlilik'] >= hedef_duyarlilik]
+    return min(uygunlar, key=lambda a: a['gecikme_ms_p50']) if uygunlar else None
+
+
+def tara(modeller, boyutlar, veri_yaml=None, epok=50, bolum='test', onbellek=None, is_parcacigi=None,
+         **egitim_ayarlari):
+    """
+    Bütün model ve imgsz çiftlerini eğitip ölçer.
+
+    Parametreler:
+        modeller (list): Başlangıç ağırlıkları
+        boyutlar (list): imgsz değerleri
+        veri_yaml (str): Veri seti YAML dosyası (varsayılan: depodaki plaka.yaml)
+        epok (int): Aday başına epok sayısı
+        bolum (str): Doğruluğun ölçüleceği bölüm ('val' veya 'test')
+        onbellek (str): Eğitimde kullanılacak görüntü önbelleği klasörü
+        is_parcacigi (int): Gecikme ölçümünde kullanılacak PyTorch iş parçacığı sayısı
+
+    Dönüş:
+        list: Aday sonuçları
+    """
+    import torch  # Ölçümde iş parçacığı sayısını sabitlemek için kullanılır
+
+    veri_yaml = veri_yaml or VERI_YAML
+    olcum_klasoru = Path(veri_klasorleri(veri_yaml)[bolum])
+    goruntuler = [cv2.imread(str(p)) for p in sorted(olcum_klasoru.glob('*.jpg'))]
+    goruntuler = [g for g in goruntuler if g is not None]
+    if not goruntuler:
+        raise FileNotFoundError(f"{olcum_klasoru} içinde görüntü bulunamadı")
+
+    adaylar = []
+    for model in modeller:
+        for imgsz in boyutlar:
+            print(f"\n=== {aday_adi(model, imgsz)} ===")
+            baslangic = time.perf_counter()
+            agirlik = egit(model, imgsz, veri_yaml, epok, onbellek, **egitim_ayarlari)
+            egitim_suresi = time.perf_counter() - baslangic
+
+            aday = {'aday': aday_adi(model, imgsz), 'model': model, 'imgsz': imgsz, 'agirlik': agirlik,
+                    'egitim_sn': egitim_suresi}
+            aday.update(dogruluk_olc(agirlik, imgsz, veri_yaml, bolum))
+            onceki_is_parcacigi = torch.get_num_threads()
+            if is_parcacigi:
+                torch.set_num_threads(is_parcacigi)
+            try:
+                aday.update(gecikme_olc(agirlik, imgsz, goruntuler))
+            finally:
+                torch.set_num_threads(onceki_is_parcacigi)
+            adaylar.append(aday)
+    return adaylar
+
+
+def _rapor_yazdir(adaylar, sinir, secilen, metrik):
+    """Aday tablosunu yazdırır; Pareto sınırındakiler '*', önerilen aday '>' ile işaretlenir."""
+    sinirdakiler = {a['aday'] for a in sinir}
+    print(f"\n  {'aday':<22}{'mAP50':>8}{'mAP50-95':>10}{'duyar.':>8}{'kesin.':>8}{'p50 ms':>9}{'p95 ms':>9}")
+    for a in sorted(adaylar, key=lambda a: a['gecikme_ms_p50']):
+        isaret = '>' if secilen is a else '*' if a['aday'] in sinirdakiler else ' '
+        print(f"{isaret} {a['aday']:<22}{a['map50']:>8.3f}{a['map50_95']:>10.3f}{a['duyarlilik']:>8.3f}"
+              f"{a['kesinlik']:>8.3f}{a['gecikme_ms_p50']:>9.1f}{a['gecikme_ms_p95']:>9.1f}")
+    print(f"\n* {metrik} ve p50 gecikmeye göre Pareto sınırı")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model boyutu ve imgsz için hız / doğruluk taraması (CPU)")
+    parser.add_argument('--modeller', nargs='+', default=['yolov8n.pt', 'yolov8s.pt'],
+                        help="Başlangıç ağırlıkları; ince ayar için plaka_tespit/plaka_model/weights/best.pt verilebilir")
+    parser.add_argument('--imgsz', nargs='+', type=int, default=[320, 416, 512, 640], help="Denenecek giriş boyutları")
+    parser.add_argument('--veri', help="Veri seti YAML dosyası (varsayılan: depodaki plaka.yaml)")
+    parser.add_argument('--epok', type=int, default=50, help="Aday başına epok sayısı (0: eğitmeden ölç)")
+    parser.add_argument('--batch', type=int, default=16, help="Eğitim toplu boyutu")
+    parser.add_argument('--sabir', type=int, default=50, help="İyileşme olmazsa eğitimi durdurmadan önceki epok sayısı")
+    parser.add_argument('--bolum', choices=['val', 'test'], default='test', help="Doğruluğun ölçüleceği bölüm")
+    parser.add_argument('--onbellek', nargs='?', const='.goruntu_onbellegi',
+                        help="Eğitimde veri_seti_araci.py görüntü önbelleğini kullan")
+    parser.add_argument('--is-parcacigi', type=int, default=None, help="Gecikme ölçümündeki PyTorch iş parçacığı sayısı")
+    parser.add_argument('--metrik', choices=METRIKLER, default='map50_95', help="Pareto sınırındaki doğruluk ölçüsü")
+    parser.add_argument('--hedef-duyarlilik', type=float, default=0.95, help="Önerilecek modelin en düşük duyarlılığı")
+    parser.add_argument('-o', '--cikti', help="Sonuç JSON dosyası (varsayılan: performans_sonuclari/tarama_<zaman>.json)")
+    args = parser.parse_args()
+
+    adaylar = tara(args.modeller, args.imgsz, args.veri, args.epok, args.bolum, args.onbellek, args.is_parcacigi,
+                   batch=args.batch, patience=args.sabir)
+    sinir = pareto_siniri(adaylar, args.metrik)
+    secilen = oneri(adaylar, args.hedef_duyarlilik)
+    _rapor_yazdir(adaylar, sinir, secilen, args.metrik)
+    if secilen:
+        print(f"> Duyarlılığı {args.hedef_duyarlilik:.2f} ve üzeri olan en hızlı aday: {secilen['aday']} "
+              f"({secilen['agirlik']})")
+    else:
+        print(f"Duyarlılığı {args.hedef_duyarlilik:.2f} ve üzeri olan aday yok.")
+
+    sonuc = {
+        'zaman': datetime.datetime.now().isoformat(timespec='seconds'),
+        'makine': {'platform': platform.platform(), 'islemci': platform.processor(), 'cekirdek': os.cpu_count()},
+        'ayarlar': vars(args),
+        'adaylar': adaylar,
+        'pareto_siniri': [a['aday'] for a in sinir],
+        'oneri': secilen['aday'] if secilen else None,
+    }
+    cikti = args.cikti or os.path.join(SONUC_KLASORU, f"tarama_{datetime.datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(cikti) or '.', exist_ok=True)
+    with open(cikti, 'w', encoding='utf-8') as dosya:
+        json.dump(sonuc, dosya, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar kaydedildi: {cikti}")
+
+
+if __name__ == '__main__':
+    main()
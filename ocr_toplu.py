@@ -0,0 +1,362 @@
+# Bu dosya, plaka bölgelerini PaddleOCR tanıyıcısına tek tek değil toplu olarak gönderen OCR adımını içerir.
+
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import sys  # Hata durumunda programdan çıkmak için kullanılır
+import time  # Zaman ölçümleri için kullanılır
+from pathlib import Path  # Dosya yollarını yönetmek için kullanılır
+import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
+import numpy as np  # Numpy kütüphanesini matematiksel işlemler için kullanır
+
+
+def _satiri_kes(bolge, kutu):
+    """
+    Metin satırını dört köşe noktasından perspektif dönüşümü ile düz bir görüntü olarak keser.
+
+    Parametreler:
+        bolge: Plaka görüntüsü
+        kutu: Metin satırının 4x2 köşe koordinatları
+
+    Dönüş:
+        numpy.ndarray: Düzleştirilmiş satır görüntüsü
+    """
+    kutu = np.asarray(kutu, dtype=np.float32)
+    genislik = int(max(np.linalg.norm(kutu[0] - kutu[1]), np.linalg.norm(kutu[2] - kutu[3])))
+    yukseklik = int(max(np.linalg.norm(kutu[0] - kutu[3]), np.linalg.norm(kutu[1] - kutu[2])))
+    hedef = np.float32([[0, 0], [genislik, 0], [genislik, yukseklik], [0, yukseklik]])
+    matris = cv2.getPerspectiveTransform(kutu, hedef)  # Dönüşüm matrisini oluşturur
+    satir = cv2.warpPerspective(bolge, matris, (genislik, yukseklik),
+                                borderMode=cv2.BORDER_REPLICATE, flags=cv2.INTER_CUBIC)
+    # Dikey duran satırları yatay hale getir
+    if satir.shape[0] * 1.0 / max(satir.shape[1], 1) >= 1.5:
+        satir = np.rot90(satir)
+    return satir
+
+
+def egim_acisi(bolge, en_fazla_aci=20.0):
+    """
+    Plaka bölgesinin yataydan sapmasını kenarlardaki düz çizgilerden tahmin eder.
+
+    Plakanın üst / alt çerçevesi ve karakterlerin taban çizgisi yataya yakın uzun çizgiler verir;
+    Hough dönüşümü yalnızca yataya yakın açılarda aranır ve en güçlü çizgilerin açılarının ortancası
+    eğim kabul edilir.
+
+    Parametreler:
+        bolge: Plaka görüntüsü
+        en_fazla_aci (float): Bu açıdan daha dik çizgiler (karakter kenarları) aranmaz
+
+    Dönüş:
+        float: Derece cinsinden eğim (saat yönünde eğik plakalar için pozitif), çizgi yoksa 0
+    """
+    gri = cv2.cvtColor(bolge, cv2.COLOR_BGR2GRAY) if bolge.ndim == 3 else bolge
+    if gri.shape[1] > 128:
+        # Açı ölçekten bağımsız olduğu için büyük bölgeler küçültülerek ölçülür
+        olcek = 128 / gri.shape[1]
+        gri = cv2.resize(gri, (128, max(int(gri.shape[0] * olcek), 1)), interpolation=cv2.INTER_AREA)
+    kenarlar = cv2.Canny(gri, 50, 150)
+    cizgiler = cv2.HoughLines(kenarlar, 1, np.pi / 360, threshold=max(gri.shape[1] // 3, 10),
+                              min_theta=np.radians(90 - en_fazla_aci), max_theta=np.radians(90 + en_fazla_aci))
+    if cizgiler is None:
+        return 0.0
+    # Çizgiler oy sayısına göre sıralıdır; yatay bir çizginin normali 90 derecededir
+    return float(np.median(np.degrees(cizgiler[:5, 0, 1]) - 90))
+
+
+def plaka_normallestir(bolge, yukseklik=48, genislik=320, kenar_orani=0.05, en_kucuk_aci=1.0):
+    """
+    YOLO kutusundan kesilen plaka bölgesini tanıyıcının beklediği sabit boyutlu satıra çevirir.
+
+    Bölgenin etrafına kenardaki karakterler kesilmesin diye pay eklenir, eğimi düzeltilir,
+    en-boy oranı korunarak tanıyıcı yüksekliğine ölçeklenir ve sağdan gri ile genişliğe tamamlanır
+    (PaddleOCR tanıyıcısı da eksik genişliği normalleştirilmiş sıfır, yani gri ile doldurur).
+
+    Parametreler:
+        bolge: Plaka görüntüsü
+        yukseklik (int): Tanıyıcı giriş yüksekliği
+        genislik (int): Tanıyıcı giriş genişliği
+        kenar_orani (float): Her kenara eklenecek payın bölge yüksekliğine oranı
+        en_kucuk_aci (float): Bundan küçük eğimler (derece) düzeltilmez
+
+    Dönüş:
+        numpy.ndarray: yukseklik x genislik boyutunda BGR satır görüntüsü
+    """
+    if bolge.ndim == 2:
+        bolge = cv2.cvtColor(bolge, cv2.COLOR_GRAY2BGR)
+    kenar = max(int(round(bolge.shape[0] * kenar_orani)), 1)
+    bolge = cv2.copyMakeBorder(bolge, kenar, kenar, kenar, kenar, cv2.BORDER_REPLICATE)
+
+    # Eğimi düzelt
+    aci = egim_acisi(bolge)
+    if abs(aci) >= en_kucuk_aci:
+        h, w = bolge.shape[:2]
+        matris = cv2.getRotationMatrix2D((w / 2, h / 2), aci, 1.0)
+        bolge = cv2.warpAffine(bolge, matris, (w, h), flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+
+    # Yüksekliğe ölçekle, uzun plakaları genişliğe sığdır, kısaları gri ile tamamla
+    h, w = bolge.shape[:2]
+    yeni_genislik = min(genislik, max(int(round(w * yukseklik / h)), 1))
+    satir = cv2.resize(bolge, (yeni_genislik, yukseklik),
+                       interpolation=cv2.INTER_AREA if h > yukseklik else cv2.INTER_LINEAR)
+    if yeni_genislik < genislik:
+        satir = cv2.copyMakeBorder(satir, 0, 0, 0, genislik - yeni_genislik, cv2.BORDER_CONSTANT,
+                                   value=(128, 128, 128))
+    return satir
+
+
+class TopluOCR:
+    """
+    Bir karedeki (veya birkaç karedeki) tüm plaka bölgelerini tek seferde okur.
+
+    Tam modda metin satırı tespiti her bölge için ayrı yapılır, fakat açı sınıflandırma ve
+    tanıma adımları bütün satırlar için tek bir toplu çağrıyla çalıştırılır.
+
+    Yalnızca tanıma modunda plakanın yeri YOLO tarafından zaten bulunduğu için satır tespiti ve
+    açı sınıflandırma atlanır: bölgeler plaka_normallestir ile düzeltilip aynı boyuta getirilir ve
+    doğrudan tanıyıcıya verilir. Güveni yeniden_deneme_esigi altında kalan bölgeler (örn. iki satırlı
+    plakalar) tam modda yeniden okunur ve güveni yüksek olan sonuç kullanılır.
+    """
+
+    def __init__(self, ocr, yalnizca_tanima=False, yeniden_deneme_esigi=0.0):
+        """
+        Parametreler:
+            ocr: Yüklenmiş PaddleOCR nesnesi
+            yalnizca_tanima (bool): Satır tespiti ve açı sınıflandırmayı atla
+            yeniden_deneme_esigi (float): Yalnızca tanıma modunda bu güvenin altındaki bölgeler
+                tam modda yeniden okunur (0 ise yeniden denenmez)
+        """
+        self.ocr = ocr  # PaddleOCR nesnesi
+        self.yalnizca_tanima = yalnizca_tanima
+        self.yeniden_deneme_esigi = yeniden_deneme_esigi
+
+        # Tanıyıcının giriş boyutu (PP-OCR modellerinde "3, 48, 320")
+        rec_image_shape = getattr(getattr(ocr, 'args', None), 'rec_image_shape', '3, 48, 320')
+        _, self.tanima_yuksekligi, self.tanima_genisligi = (int(v) for v in rec_image_shape.split(','))
+
+        # Sayaçlar
+        self.tanima_sayisi = 0  # Yalnızca tanıma ile okunan bölge sayısı
+        self.yeniden_denenen = 0  # Düşük güven yüzünden tam modda yeniden okunan bölge sayısı
+
+    def isit(self):
+        """
+        Satır tespiti, açı sınıflandırma ve tanıma modellerini boş görüntülerle bir kez çalıştırır.
+        İlk gerçek okumanın yavaş olmasını önler.
+        """
+        bos_plaka = np.full((64, 256, 3), 255, dtype=np.uint8)  # Boş plaka bölgesi
+        bos_satir = np.full((48, 320, 3), 255, dtype=np.uint8)  # Boş metin satırı
+        self.ocr.text_detector(bos_plaka)
+        if self.ocr.use_angle_cls:
+            self.ocr.text_classifier([bos_satir])
+        self.ocr.text_recognizer([bos_satir])
+
+    def tek_tek_oku(self, bolgeler, cls=True):
+        """
+        Eski yöntem: Her bölge için ayrı bir PaddleOCR çağrısı yapar (karşılaştırma için).
+
+        Parametreler:
+            bolgeler (list): Plaka bölgesi görüntüleri
+            cls (bool): Açı sınıflandırma yapılsın mı
+
+        Dönüş:
+            list: Her bölge için (metin, güven) çiftleri
+        """
+        sonuclar = []
+        for bolge in bolgeler:
+            try:
+                ocr_result = self.ocr.ocr(bolge, cls=cls)
+                if ocr_result and len(ocr_result) > 0 and ocr_result[0]:
+                    metin, guven = ocr_result[0][0][1]  # İlk satırın metni ve güveni
+                    sonuclar.append((metin, float(guven)))
+                else:
+                    sonuclar.append(("", 0.0))
+            except Exception as e:
+                print(f"OCR işlemi sırasında hata: {e}")
+                sonuclar.append(("", 0.0))
+        return sonuclar
+
+    def oku(self, bolgeler, cls=True):
+        """
+        Plaka bölgelerini toplu olarak okur. Sonuçlar bölgelerle aynı sıradadır.
+
+        Parametreler:
+            bolgeler (list): Plaka bölgesi görüntüleri
+            cls (bool): Açı sınıflandırma yapılsın mı (tam modda)
+
+        Dönüş:
+            list: Her bölge için (metin, güven) çiftleri; okunamayanlar için ("", 0.0), yalnızca tanıma
+                modunda eşiğin altında kalanlar için ("", güven)
+        """
+        if self.yalnizca_tanima:
+            return self._yalnizca_tanima_oku(bolgeler, cls)
+        return self._tam_oku(bolgeler, cls)
+
+    def _yalnizca_tanima_oku(self, bolgeler, cls=True):
+        """Bölgeleri normalleştirip tek bir tanıma çağrısıyla okur, düşük güvenlileri tam modda yeniden dener."""
+        sonuclar = [("", 0.0)] * len(bolgeler)
+        indeksler = [i for i, bolge in enumerate(bolgeler) if bolge is not None and bolge.size > 0]
+        if not indeksler:
+            return sonuclar
+
+        satirlar = [plaka_normallestir(bolgeler[i], self.tanima_yuksekligi, self.tanima_genisligi)
+                    for i in indeksler]
+        try:
+            tanimalar, _ = self.ocr.text_recognizer(satirlar)
+        except Exception as e:
+            print(f"OCR işlemi sırasında hata: {e}")
+            return sonuclar
+        self.tanima_sayisi += len(indeksler)
+
+        sonuclar = list(sonuclar)
+        for i, (metin, guven) in zip(indeksler, tanimalar):
+            sonuclar[i] = (metin, float(guven))
+
+        # Düşük güvenli okumalar satır tespiti ve açı sınıflandırmayla yeniden okunur
+        tekrar = [i for i in indeksler if sonuclar[i][1] < self.yeniden_deneme_esigi]
+        if tekrar:
+            self.yeniden_denenen += len(tekrar)
+            for i, sonuc in zip(tekrar, self._tam_oku([bolgeler[i] for i in tekrar], cls)):
+                if sonuc[1] > sonuclar[i][1]:
+                    sonuclar[i] = sonuc
+
+        # Eşiğin altındaki okumaların metni atılır, güveni bırakılır
+        return [(metin, guven) if guven >= self.ocr.drop_score else ("", guven) for metin, guven in sonuclar]
+
+    def istatistikler(self):
+        """
+        Dönüş:
+            dict: Yalnızca tanıma ile okunan ve tam modda yeniden okunan bölge sayıları
+        """
+        return {
+            'tanima_sayisi': self.tanima_sayisi,
+            'yeniden_denenen': self.yeniden_denenen,
+            'yeniden_deneme_orani': self.yeniden_denenen / self.tanima_sayisi if self.tanima_sayisi else 0.0,
+        }
+
+    def _tam_oku(self, bolgeler, cls=True):
+        """Her bölgede satır tespiti yapar; açı sınıflandırma ve tanımayı bütün satırlar için toplu çalıştırır."""
+        sonuclar = [("", 0.0)] * len(bolgeler)
+        if not bolgeler:
+            return sonuclar
+
+        # Her bölgedeki metin satırlarını bul ve kes
+        satir_sahipleri = []  # Her satırın ait olduğu bölgenin indeksi
+        satirlar = []  # Kesilmiş satır görüntüleri
+        for i, bolge in enumerate(bolgeler):
+            if bolge is None or bolge.size == 0:
+                continue
+            try:
+                dt_boxes, _ = self.ocr.text_detector(bolge)
+            except Exception as e:
+                print(f"OCR satır tespiti sırasında hata: {e}")
+                continue
+            if dt_boxes is None or len(dt_boxes) == 0:
+                continue
+            # Satırları yukarıdan aşağıya, soldan sağa sırala
+            for kutu in sorted(dt_boxes, key=lambda k: (k[0][1], k[0][0])):
+                satir_sahipleri.append(i)
+                satirlar.append(_satiri_kes(bolge, kutu))
+
+        if not satirlar:
+            return sonuclar
+
+        try:
+            # Açı sınıflandırma ve tanıma tüm satırlar için tek çağrıda yapılır
+            if cls and self.ocr.use_angle_cls:
+                satirlar, _, _ = self.ocr.text_classifier(satirlar)
+            tanimalar, _ = self.ocr.text_recognizer(satirlar)
+        except Exception as e:
+            print(f"OCR işlemi sırasında hata: {e}")
+            return sonuclar
+
+        # Her bölge için eşik değerini geçen ilk satırı al
+        sonuclar = list(sonuclar)
+        dolu = set()
+        for sahip, (metin, guven) in zip(satir_sahipleri, tanimalar):
+            if sahip in dolu or guven < self.ocr.drop_score:
+                continue
+            sonuclar[sahip] = (metin, float(guven))
+            dolu.add(sahip)
+        return sonuclar
+
+
+def etiketli_bolgeler(klasor):
+    """
+    YOLO etiketlerini kullanarak test görüntülerinden plaka bölgelerini keser.
+
+    Parametreler:
+        klasor (str): images/ ve labels/ alt klasörlerini içeren veri seti klasörü
+
+    Dönüş:
+        list: Her görüntü için o görüntüdeki plaka bölgelerinin listesi
+    """
+    kareler = []
+    for goruntu_yolu in sorted(Path(klasor, 'images').glob('*.jpg')):
+        etiket_yolu = Path(klasor, 'labels', f"{goruntu_yolu.stem}.txt")
+        goruntu = cv2.imread(str(goruntu_yolu))
+        if goruntu is None or not etiket_yolu.exists():
+            continue
+        h, w = goruntu.shape[:2]
+        bolgeler = []
+        for satir in etiket_yolu.read_text().splitlines():
+            parcalar = satir.split()
+            if len(parcalar) != 5:
+                continue
+            xc, yc, bw, bh = (float(p) for p in parcalar[1:])
+            x1, y1 = max(int((xc - bw / 2) * w), 0), max(int((yc - bh / 2) * h), 0)
+            x2, y2 = min(int((xc + bw / 2) * w), w), min(int((yc + bh / 2) * h), h)
+            if x2 > x1 and y2 > y1:
+                bolgeler.append(goruntu[y1:y2, x1:x2])
+        kareler.append(bolgeler)
+    return kareler
+
+
+if __name__ == "__main__":
+    # Tek tek ve toplu OCR yöntemlerinin hızını aynı plaka bölgeleri üzerinde karşılaştırır
+    parser = argparse.ArgumentParser(description="Toplu OCR hız karşılaştırması")
+    parser.add_argument('--klasor', default='yolov8_dataset/test', help="images/ ve labels/ içeren klasör")
+    parser.add_argument('--pencere', type=int, default=1, help="Tek toplu çağrıda birleştirilecek kare sayısı")
+    parser.add_argument('--yeniden-deneme-esigi', type=float, default=0.8,
+                        help="Yalnızca tanıma modunda tam modda yeniden okunacak en düşük güven")
+    args = parser.parse_args()
+
+    kareler = etiketli_bolgeler(args.klasor)
+    bolge_sayisi = sum(len(b) for b in kareler)
+    print(f"{len(kareler)} görüntüden {bolge_sayisi} plaka bölgesi kesildi.")
+    if not bolge_sayisi:
+        print(f"Hata: {args.klasor} altında etiketli plaka bölgesi bulunamadı (images/ ve labels/ gerekli).")
+        sys.exit(1)
+    isinma = next(bolgeler for bolgeler in kareler if bolgeler)  # Isınma için ilk dolu kare
+
+    from paddleocr import PaddleOCR  # OCR işlemleri için PaddleOCR kullanılıyor
+    toplu_ocr = TopluOCR(PaddleOCR(use_angle_cls=True, lang='en'))
+    toplu_ocr.oku(isinma)  # Isınma çağrısı
+
+    # Eski yöntem: her kutu için ayrı çağrı
+    baslangic = time.perf_counter()
+    tek_sonuclar = [s for bolgeler in kareler for s in toplu_ocr.tek_tek_oku(bolgeler)]
+    tek_sure = time.perf_counter() - baslangic
+
+    # Yeni yöntem: her pencere için tek toplu çağrı
+    baslangic = time.perf_counter()
+    toplu_sonuclar = []
+    for i in range(0, len(kareler), args.pencere):
+        pencere = [b for bolgeler in kareler[i:i + args.pencere] for b in bolgeler]
+        toplu_sonuclar.extend(toplu_ocr.oku(pencere))
+    toplu_sure = time.perf_counter() - baslangic
+
+    # Yalnızca tanıma: satır tespiti ve açı sınıflandırma atlanır, düşük güvenliler tam modda yeniden okunur
+    tanima_ocr = TopluOCR(toplu_ocr.ocr, yalnizca_tanima=True, yeniden_deneme_esigi=args.yeniden_deneme_esigi)
+    tanima_ocr.oku(isinma)  # Isınma çağrısı
+    baslangic = time.perf_counter()
+    tanima_sonuclar = []
+    for i in range(0, len(kareler), args.pencere):
+        pencere = [b for bolgeler in kareler[i:i + args.pencere] for b in bolgeler]
+        tanima_sonuclar.extend(tanima_ocr.oku(pencere))
+    tanima_sure = time.perf_counter() - baslangic
+
+    ayni = sum(a[0] == b[0] for a, b in zip(tek_sonuclar, toplu_sonuclar))
+    tanima_ayni = sum(a[0] == b[0] for a, b in zip(tek_sonuclar, tanima_sonuclar))
+    print(f"Tek tek: {bolge_sayisi / tek_sure:.1f} bölge/sn ({tek_sure / bolge_sayisi * 1000:.1f} ms/bölge)")
+    print(f"Toplu (pencere={args.pencere}): {bolge_sayisi / toplu_sure:.1f} bölge/sn "
+          f"({toplu_sure / bolge_sayisi * 1000:.1f} ms/bölge)")
+    print(f"Yalnızca tanıma (pencere={args.pencere}): {bolge_sayisi / tanima_sure:.1f} bölge/sn "
+          f"({tanima_sure / bolge_sayisi * 1000:.1f} ms/bölge), yeniden denenen: {tanima_ocr.yeniden_denenen}")
+    print(f"Aynı okunan bölge: toplu {ayni}/{bolge_sayisi}, yalnızca tanıma {tanima_ayni}/{bolge_sayisi}")
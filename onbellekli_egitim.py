@@ -0,0 +1,51 @@
+# Bu dosya, YOLO eğitiminin görüntüleri veri_seti_araci.py ile yazılmış önceden çözülmüş önbellekten
+# okumasını sağlayan ultralytics veri seti ve eğitici sınıflarını içerir. Sınıflar modül düzeyinde
+# tanımlandığı için spawn ile başlatılan veri yükleyici işçilerine ve DDP süreçlerine gönderilebilir.
+
+import functools  # Veri setine önbellek klasörünü geçirmek için kullanılır
+import os  # Dosya yollarını karşılaştırmak için kullanılır
+from ultralytics.data import YOLODataset  # Önbellekten okuyan veri setinin temel sınıfı
+from ultralytics.data import build as yolo_build  # Eğitimde kurulan veri seti sınıfını değiştirmek için kullanılır
+from ultralytics.models.yolo.detect import DetectionTrainer  # Önbellekli eğiticinin temel sınıfı
+from veri_seti_araci import ONBELLEK_KLASORU, onbellekleri_yukle  # Önbellek klasörü ve set önbellekleri
+
+
+class OnbellekliYOLODataset(YOLODataset):
+    """Önbellekte bulunan görüntüleri JPEG çözmeden okuyan YOLO veri seti."""
+
+    def __init__(self, *args, onbellek_klasoru=ONBELLEK_KLASORU, **kwargs):
+        """
+        Parametreler:
+            onbellek_klasoru (str): onbellek komutuyla yazılmış klasör; diğer parametreler YOLODataset'e geçirilir
+        """
+        # cache='ram' görüntüleri kurulum sırasında okuduğu için önbellekler üst sınıftan önce yüklenir
+        self.onbellekler = list(onbellekleri_yukle(onbellek_klasoru).values())
+        super().__init__(*args, **kwargs)
+
+    def load_image(self, i, rect_mode=True, resize_short=False):
+        yol = os.path.realpath(self.im_files[i])
+        for onbellek in self.onbellekler:
+            satir = onbellek.sira.get(yol)
+            if satir is not None and onbellek.imgsz == self.imgsz and rect_mode and not resize_short:
+                break
+        else:
+            return super().load_image(i, rect_mode, resize_short)
+        if self.augment:  # Mozaik artırması rastgele görüntüleri bu tampondan seçer
+            self.buffer.append(i)
+            if len(self.buffer) > self.max_buffer_length:
+                self.buffer.pop(0)
+        return onbellek.goruntu(satir)
+
+
+class OnbellekliEgitici(DetectionTrainer):
+    """Veri setlerini OnbellekliYOLODataset ile kuran eğitici."""
+
+    onbellek_klasoru = ONBELLEK_KLASORU  # Veri setlerine geçirilecek önbellek klasörü
+
+    def build_dataset(self, img_path, mode='train', batch=None):
+        onceki = yolo_build.YOLODataset
+        yolo_build.YOLODataset = functools.partial(OnbellekliYOLODataset, onbellek_klasoru=self.onbellek_klasoru)
+        try:
+            return super().build_dataset(img_path, mode, batch)
+        finally:
+            yolo_build.YOLODataset = onceki
@@ -0,0 +1,349 @@
+# Bu dosya, test görüntülerini ve kayıtlı videoları tespit hattından geçirerek aşama bazında gecikme, verim,
+# bellek ve doğruluk ölçer; sonuçları JSON olarak kaydeder ve önceki bir ölçümle karşılaştırır.
+
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import datetime  # Sonuç dosyasının adı ve zaman bilgisi için kullanılır
+import json  # Sonuçları kaydetmek ve okumak için kullanılır
+import os  # Dosya ve dizin işlemleri için kullanılır
+import platform  # Ölçümün yapıldığı makine bilgisi için kullanılır
+import sys  # Gerileme durumunda çıkış kodu için kullanılır
+import time  # Zaman ölçümleri için kullanılır
+from collections import defaultdict  # Aşama sürelerini toplamak için kullanılır
+from difflib import SequenceMatcher  # Karakter düzeyinde OCR doğruluğu için kullanılır
+from pathlib import Path  # Dosya yollarını yönetmek için kullanılır
+import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
+import numpy as np  # Yüzdelik hesapları için kullanılır
+from plaka_takip import iou  # Tespit kutularını etiketlerle eşleştirmek için kullanılır
+
+SONUC_KLASORU = 'performans_sonuclari'  # Ölçüm sonuçlarının kaydedileceği dizin
+
+
+class AsamaOlcer:
+    """Tespit aşamalarının sürelerini toplar ve yüzdelik özetlerini çıkarır."""
+
+    def __init__(self):
+        self.sureler = defaultdict(list)  # Aşama adı → süreler (saniye)
+
+    def kaydet(self, asama, sure):
+        """
+        Parametreler:
+            asama (str): Aşama adı (yolo, ocr, izin_kontrol, ...)
+            sure (float): Süre (saniye)
+        """
+        self.sureler[asama].append(sure)
+
+    def ozet(self):
+        """
+        Dönüş:
+            dict: Her aşama için adet, ortalama, p50, p95, p99 (milisaniye) ve toplam süre (saniye)
+        """
+        sonuc = {}
+        for asama, sureler in self.sureler.items():
+            dizi = np.asarray(sureler) * 1000.0
+            p50, p95, p99 = np.percentile(dizi, [50, 95, 99])
+            sonuc[asama] = {
+                'adet': len(sureler),
+                'ortalama_ms': float(dizi.mean()),
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'p99_ms': float(p99),
+                'toplam_sn': float(dizi.sum() / 1000.0),
+            }
+        return sonuc
+
+
+def bellek_tepe_mb():
+    """
+    Sürecin ulaştığı en yüksek bellek kullanımını (MB) döndürür, ölçülemiyorsa None.
+    """
+    try:
+        import resource  # Yalnızca Unix sistemlerde bulunur
+        tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return tepe / (1024.0 * 1024.0) if sys.platform == 'darwin' else tepe / 1024.0  # macOS bayt, Linux KB döner
+    except ImportError:
+        pass
+    try:
+        import psutil  # Windows'ta isteğe bağlı
+        bilgi = psutil.Process().memory_info()
+        return getattr(bilgi, 'peak_wset', bilgi.rss) / (1024.0 * 1024.0)
+    except ImportError:
+        return None
+
+
+def etiket_kutulari(etiket_yolu, w, h):
+    """
+    YOLO etiket dosyasındaki kutuları piksel koordinatlarına çevirir.
+
+    Parametreler:
+        etiket_yolu (Path): Etiket dosyası
+        w, h (int): Görüntü boyutu
+
+    Dönüş:
+        list: (x1, y1, x2, y2) kutuları
+    """
+    kutular = []
+    if not etiket_yolu.exists():
+        return kutular
+    for satir in etiket_yolu.read_text().splitlines():
+        parcalar = satir.split()
+        if len(parcalar) != 5:
+            continue
+        xc, yc, bw, bh = (float(p) for p in parcalar[1:])
+        kutular.append(((xc - bw / 2) * w, (yc - bh / 2) * h, (xc + bw / 2) * w, (yc + bh / 2) * h))
+    return kutular
+
+
+def _eslestir(tespitler, gercekler, esik=0.5):
+    """
+    Tespitleri gerçek kutularla IoU'ya göre açgözlü eşleştirir.
+
+    Dönüş:
+        list: (tespit indeksi, gerçek indeksi) eşleşmeleri
+    """
+    adaylar = sorted(((iou(t, g), i, j) for i, t in enumerate(tespitler) for j, g in enumerate(gercekler)),
+                     reverse=True)
+    kullanilan_t, kullanilan_g, eslesmeler = set(), set(), []
+    for deger, i, j in adaylar:
+        if deger < esik:
+            break
+        if i in kullanilan_t or j in kullanilan_g:
+            continue
+        kullanilan_t.add(i)
+        kullanilan_g.add(j)
+        eslesmeler.append((i, j))
+    return eslesmeler
+
+
+def _plakalari_yukle(yol):
+    """
+    Görüntü adı → doğru plaka eşlemesini okur. JSON sözlüğü veya 'goruntu,plaka' satırları olan CSV kabul edilir.
+    Bir görüntüde birden fazla plaka varsa etiket dosyasındaki sırayla '|' ile ayrılır.
+    """
+    if not yol:
+        return {}
+    metin = Path(yol).read_text(encoding='utf-8')
+    if yol.endswith('.json'):
+        eslesme = json.loads(metin)
+    else:
+        eslesme = dict(satir.split(',', 1) for satir in metin.splitlines() if ',' in satir)
+    return {Path(ad.strip()).stem: [p.strip().upper().replace(' ', '') for p in plaka.split('|')]
+            for ad, plaka in eslesme.items()}
+
+
+def goruntuleri_olc(uygulama, olcer, klasor, plakalar, isinma=3):
+    """
+    Test görüntülerini tek tek tespit hattından geçirir ve sürelerle doğruluğu ölçer.
+
+    Parametreler:
+        uygulama (PlakaTespitTest): Modelleri yüklenmiş tespit nesnesi
+        olcer (AsamaOlcer): Aşama ölçer
+        klasor (str): images/ ve labels/ içeren klasör
+        plakalar (dict): Görüntü adı → doğru plakalar (boş olabilir)
+        isinma (int): Ölçüme katılmadan önce işlenecek görüntü sayısı
+
+    Dönüş:
+        dict: Aşama süreleri, verim ve doğruluk
+    """
+    goruntu_yollari = sorted(Path(klasor, 'images').glob('*.jpg')) + sorted(Path(klasor, 'images').glob('*.png'))
+    goruntuler = [(p, cv2.imread(str(p))) for p in goruntu_yollari]
+    goruntuler = [(p, g) for p, g in goruntuler if g is not None]  # Diskten okuma ölçüme katılmaz
+
+    # Isınma (ölçer kapalıyken)
+    uygulama.olcer = None
+    for _, goruntu in goruntuler[:isinma]:
+        uygulama.tespit_et(goruntu.copy(), takip=False)
+
+    dp = yp = yn = 0  # Doğru pozitif, yanlış pozitif, yanlış negatif
+    ocr_dogru = ocr_toplam = ocr_bos = 0
+    karakter_benzerligi = []
+    uygulama.olcer = olcer
+    baslangic = time.perf_counter()
+    for yol, goruntu in goruntuler:
+        h, w = goruntu.shape[:2]
+        kare_baslangic = time.perf_counter()
+        uygulama.tespit_et(goruntu.copy(), takip=False)
+        olcer.kaydet('toplam', time.perf_counter() - kare_baslangic)
+
+        # Tespit doğruluğu
+        tespitler = [t['kutu'] for t in uygulama.son_tespitler]
+        gercekler = etiket_kutulari(Path(klasor, 'labels', f"{yol.stem}.txt"), w, h)
+        eslesmeler = _eslestir(tespitler, gercekler)
+        dp += len(eslesmeler)
+        yp += len(tespitler) - len(eslesmeler)
+        yn += len(gercekler) - len(eslesmeler)
+
+        # OCR doğruluğu (eşleşen kutular üzerinde)
+        dogru_plakalar = plakalar.get(yol.stem, [])
+        for i, j in eslesmeler:
+            okunan = uygulama.son_tespitler[i]['plaka'] or ''
+            ocr_bos += not okunan
+            if j < len(dogru_plakalar):
+                ocr_toplam += 1
+                ocr_dogru += okunan == dogru_plakalar[j]
+                karakter_benzerligi.append(SequenceMatcher(None, okunan, dogru_plakalar[j]).ratio())
+    sure = time.perf_counter() - baslangic
+    uygulama.olcer = None
+
+    kesinlik = dp / (dp + yp) if dp + yp else 0.0
+    duyarlilik = dp / (dp + yn) if dp + yn else 0.0
+    return {
+        'kare_sayisi': len(goruntuler),
+        'verim_kare_sn': len(goruntuler) / sure if sure else 0.0,
+        'dogruluk': {
+            'kesinlik': kesinlik,
+            'duyarlilik': duyarlilik,
+            'f1': 2 * kesinlik * duyarlilik / (kesinlik + duyarlilik) if kesinlik + duyarlilik else 0.0,
+            'ocr_bos_orani': ocr_bos / dp if dp else 0.0,
+            'ocr_tam_dogruluk': ocr_dogru / ocr_toplam if ocr_toplam else None,
+            'ocr_karakter_dogrulugu': float(np.mean(karakter_benzerligi)) if karakter_benzerligi else None,
+        },
+    }
+
+
+def video_olc(uygulama, olcer, video_yolu, en_fazla_kare=None):
+    """
+    Videoyu baştan sona takip açıkken tespit hattından geçirir.
+
+    Dönüş:
+        dict: Kare sayısı, verim ve tespit sayıları
+    """
+    cap = cv2.VideoCapture(video_yolu)
+    if not cap.isOpened():
+        print(f"Video açılamadı: {video_yolu}")
+        return None
+    uygulama.takipci.sifirla()
+    uygulama.olcer = olcer
+    kare_sayisi = plakali_kare = 0
+    plakalar = set()
+    baslangic = time.perf_counter()
+    while en_fazla_kare is None or kare_sayisi < en_fazla_kare:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        kare_baslangic = time.perf_counter()
+        _, plaka_sayisi = uygulama.tespit_et(frame)
+        olcer.kaydet('toplam', time.perf_counter() - kare_baslangic)
+        kare_sayisi += 1
+        plakali_kare += plaka_sayisi > 0
+        plakalar.update(t['plaka'] for t in uygulama.son_tespitler if t['plaka'])
+    sure = time.perf_counter() - baslangic
+    uygulama.olcer = None
+    cap.release()
+    return {
+        'kare_sayisi': kare_sayisi,
+        'verim_kare_sn': kare_sayisi / sure if sure else 0.0,
+        'plakali_kare': plakali_kare,
+        'okunan_plakalar': sorted(plakalar),
+    }
+
+
+def karsilastir(onceki, simdiki, esik=0.10, dogruluk_esigi=0.01):
+    """
+    İki ölçümü karşılaştırır ve gerilemeleri listeler.
+
+    Parametreler:
+        onceki, simdiki (dict): Ölçüm sonuçları
+        esik (float): Gecikme artışı / verim düşüşü için izin verilen oran
+        dogruluk_esigi (float): Doğruluk ölçütleri için izin verilen mutlak düşüş
+
+    Dönüş:
+        list: Gerileme açıklamaları
+    """
+    gerilemeler = []
+    for bolum, yeni in simdiki['bolumler'].items():
+        eski = onceki.get('bolumler', {}).get(bolum)
+        if not eski:
+            continue
+        for asama, yeni_ozet in yeni['asamalar'].items():
+            eski_ozet = eski['asamalar'].get(asama)
+            if eski_ozet and yeni_ozet['p95_ms'] > eski_ozet['p95_ms'] * (1 + esik):
+                gerilemeler.append(f"{bolum}/{asama} p95: {eski_ozet['p95_ms']:.1f} → {yeni_ozet['p95_ms']:.1f} ms")
+        if yeni['verim_kare_sn'] < eski['verim_kare_sn'] * (1 - esik):
+            gerilemeler.append(f"{bolum} verim: {eski['verim_kare_sn']:.2f} → {yeni['verim_kare_sn']:.2f} kare/sn")
+        for olcut, yeni_deger in yeni.get('dogruluk', {}).items():
+            eski_deger = eski.get('dogruluk', {}).get(olcut)
+            if eski_deger is None or yeni_deger is None:
+                continue
+            # Boş okuma oranında artış, diğer ölçütlerde düşüş gerilemedir
+            fark = (yeni_deger - eski_deger) if olcut == 'ocr_bos_orani' else (eski_deger - yeni_deger)
+            if fark > dogruluk_esigi:
+                gerilemeler.append(f"{bolum}/{olcut}: {eski_deger:.3f} → {yeni_deger:.3f}")
+    return gerilemeler
+
+
+def _rapor_yazdir(sonuc):
+    """Ölçüm sonucunu okunabilir bir tablo olarak yazdırır."""
+    for bolum, veri in sonuc['bolumler'].items():
+        print(f"\n[{bolum}] {veri['kare_sayisi']} kare, {veri['verim_kare_sn']:.2f} kare/sn")
+        print(f"  {'aşama':<16}{'adet':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        for asama, ozet in veri['asamalar'].items():
+            print(f"  {asama:<16}{ozet['adet']:>7}{ozet['p50_ms']:>10.1f}{ozet['p95_ms']:>10.1f}{ozet['p99_ms']:>10.1f}")
+        for olcut, deger in veri.get('dogruluk', {}).items():
+            if deger is not None:
+                print(f"  {olcut}: {deger:.3f}")
+    if sonuc['bellek_tepe_mb'] is not None:
+        print(f"\nEn yüksek bellek: {sonuc['bellek_tepe_mb']:.0f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tespit hattı performans ve doğruluk ölçümü")
+    parser.add_argument('--klasor', default='yolov8_dataset/test', help="images/ ve labels/ içeren test klasörü")
+    parser.add_argument('--video', nargs='*', default=[], help="Takip açıkken oynatılacak video dosyaları")
+    parser.add_argument('--en-fazla-kare', type=int, default=None, help="Her videodan işlenecek en fazla kare")
+    parser.add_argument('--plakalar', help="Doğru plaka metinleri (JSON veya 'goruntu,plaka' CSV)")
+    parser.add_argument('--isinma', type=int, default=3, help="Ölçüm öncesi ısınma görüntüsü sayısı")
+    parser.add_argument('-o', '--cikti', help="Sonuç JSON dosyası (varsayılan: performans_sonuclari/olcum_<zaman>.json)")
+    parser.add_argument('--karsilastir', help="Gerileme kontrolü için önceki sonuç JSON dosyası")
+    parser.add_argument('--esik', type=float, default=0.10, help="Gecikme / verim için gerileme eşiği (oran)")
+    args = parser.parse_args()
+
+    from plaka_tespit_test import PlakaTespitTest  # Tespit sınıfı
+    from db_operations import BosVeritabani  # Veritabanı yerine kullanılan yerel sınıf
+
+    uygulama = PlakaTespitTest(arayuz=False, db=BosVeritabani())
+    if not uygulama.modeller_hazir.is_set():
+        print(f"Modeller yüklenemedi: {uygulama.yukleme_hatasi}")
+        sys.exit(2)
+
+    bolumler = {}
+    olcer = AsamaOlcer()
+    goruntu_sonucu = goruntuleri_olc(uygulama, olcer, args.klasor, _plakalari_yukle(args.plakalar), args.isinma)
+    goruntu_sonucu['asamalar'] = olcer.ozet()
+    bolumler['goruntuler'] = goruntu_sonucu
+
+    for video_yolu in args.video:
+        olcer = AsamaOlcer()
+        video_sonucu = video_olc(uygulama, olcer, video_yolu, args.en_fazla_kare)
+        if video_sonucu is not None:
+            video_sonucu['asamalar'] = olcer.ozet()
+            bolumler[f"video:{os.path.basename(video_yolu)}"] = video_sonucu
+
+    sonuc = {
+        'zaman': datetime.datetime.now().isoformat(timespec='seconds'),
+        'makine': {'platform': platform.platform(), 'islemci': platform.processor(), 'cekirdek': os.cpu_count()},
+        'ayarlar': {'tespit': uygulama.tespit_ayarlari, 'ocr': uygulama.ayarlar['ocr']},
+        'baslangic_sureleri': uygulama.baslangic_sureleri,
+        'bolumler': bolumler,
+        'bellek_tepe_mb': bellek_tepe_mb(),
+    }
+    _rapor_yazdir(sonuc)
+
+    cikti = args.cikti or os.path.join(SONUC_KLASORU, f"olcum_{datetime.datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(cikti) or '.', exist_ok=True)
+    with open(cikti, 'w', encoding='utf-8') as dosya:
+        json.dump(sonuc, dosya, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar kaydedildi: {cikti}")
+
+    if args.karsilastir:
+        with open(args.karsilastir, encoding='utf-8') as dosya:
+            gerilemeler = karsilastir(json.load(dosya), sonuc, args.esik)
+        if gerilemeler:
+            print("\nGERİLEME:")
+            for satir in gerilemeler:
+                print(f"  {satir}")
+            sys.exit(1)
+        print("\nÖnceki ölçüme göre gerileme yok.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+# Bu dosya, OCR ile okunan plaka metinlerini Türk plaka biçimlerine göre konuma duyarlı olarak düzelten
+# ve biçime uymayan okumaları veritabanına gitmeden eleyen plaka doğrulayıcısını içerir.
+
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import functools  # Tekrarlanan okumaların sonuçlarını önbelleğe almak için kullanılır
+import re  # Plaka dilbilgisinin derlenmiş düzenli ifadesi için kullanılır
+
+HARFLER = 'ABCDEFGHIJKLMNOPRSTUVYZ'  # Türk plakalarında kullanılan harfler (Q, W, X ve Türkçe karakterler yok)
+
+# (harf sayısı, rakam sayısı) biçimleri: 34 A 1234, 34 AB 123, 34 AB 1234, 34 ABC 12, 34 ABC 123
+BICIMLER = ((1, 4), (2, 3), (2, 4), (3, 2), (3, 3))
+
+# İl kodu 01-81, ardından biçimlerden birine uyan harf ve rakam grupları
+PLAKA_DESENI = re.compile(
+    rf'^(0[1-9]|[1-7][0-9]|8[01])([{HARFLER}]{{1,3}})([0-9]{{2,4}})$'
+)
+
+# Rakam olması gereken konumlarda karıştırılan harfler: harf → (rakam, maliyet)
+RAKAM_KARISIKLIKLARI = {
+    'O': ('0', 1.0), 'D': ('0', 1.5), 'Q': ('0', 1.5), 'U': ('0', 2.0),
+    'I': ('1', 1.0), 'L': ('1', 1.5), 'J': ('1', 2.0), 'T': ('7', 1.5),
+    'Z': ('2', 1.0), 'S': ('5', 1.0), 'B': ('8', 1.0), 'G': ('6', 1.0),
+    'A': ('4', 1.5), 'H': ('4', 2.0), 'E': ('3', 2.0),
+}
+
+# Harf olması gereken konumlarda karıştırılan rakamlar ve plakada bulunmayan harfler: karakter → (harf, maliyet)
+HARF_KARISIKLIKLARI = {
+    '0': ('O', 1.0), '1': ('I', 1.0), '2': ('Z', 1.0), '5': ('S', 1.0),
+    '8': ('B', 1.0), '6': ('G', 1.0), '4': ('A', 1.5), '7': ('T', 1.5), '3': ('B', 2.0),
+    'Q': ('O', 1.0), 'W': ('V', 1.5), 'X': ('K', 2.5),
+}
+
+# Karıştırılan karakterleri tek geçişte değiştiren çeviri tabloları
+RAKAM_TABLOSU = str.maketrans({k: v for k, (v, _) in RAKAM_KARISIKLIKLARI.items()})
+HARF_TABLOSU = str.maketrans({k: v for k, (v, _) in HARF_KARISIKLIKLARI.items()})
+
+_TEMIZLE = re.compile(r'[^0-9A-Z]+')  # Harf ve rakam dışındaki karakterler
+KIRPMA_MALIYETI = 2.0  # Baştan veya sondan fazladan okunan bir karakteri atmanın maliyeti
+
+
+def gecerli_mi(plaka):
+    """
+    Boşluksuz büyük harfli metnin geçerli bir Türk plakası olup olmadığını döndürür.
+
+    Parametreler:
+        plaka (str): Örn. '34ABC123'
+
+    Dönüş:
+        bool: İl kodu 01-81 ve harf / rakam grupları biçimlerden birine uyuyorsa True
+    """
+    eslesme = PLAKA_DESENI.match(plaka)
+    return bool(eslesme) and (len(eslesme.group(2)), len(eslesme.group(3))) in BICIMLER
+
+
+def _cevir(parca, gecerli, karisikliklar, tablo):
+    """
+    Parçadaki karakterleri hedef türe (harf veya rakam) çevirir.
+
+    Dönüş:
+        tuple: (çevrilmiş parça, toplam maliyet), çevrilemeyen karakter varsa (None, None)
+    """
+    maliyet = 0.0
+    for karakter in parca:
+        if karakter in gecerli:
+            continue
+        karisiklik = karisikliklar.get(karakter)
+        if karisiklik is None:
+            return None, None
+        maliyet += karisiklik[1]
+    return parca.translate(tablo), maliyet
+
+
+class PlakaDogrulayici:
+    """
+    OCR okumalarını Türk plaka dilbilgisine göre düzeltir ve puanlar.
+
+    Okuma önce harf ve rakam dışındaki karakterlerden temizlenir. Her biçim için il kodu ve rakam
+    konumlarındaki harfler rakama, harf konumlarındaki rakamlar harfe karışıklık tablolarıyla çevrilir;
+    her değişiklik karışıklığın olasılığına göre bir maliyet ekler. En düşük maliyetli aday seçilir,
+    hiçbir aday en_fazla_maliyet içinde kalmazsa okuma geçersiz sayılır.
+    """
+
+    def __init__(self, en_fazla_maliyet=2.5, onbellek_boyutu=4096):
+        """
+        Parametreler:
+            en_fazla_maliyet (float): Kabul edilecek en yüksek toplam düzeltme maliyeti
+            onbellek_boyutu (int): Sonuçları saklanacak farklı okuma sayısı
+        """
+        self.en_fazla_maliyet = en_fazla_maliyet
+        # Aynı araç ardışık karelerde aynı metinle okunduğu için sonuçlar önbelleğe alınır
+        self._duzelt = functools.lru_cache(maxsize=onbellek_boyutu)(self._en_iyi_aday)
+
+    def adaylar(self, metin):
+        """
+        Okumanın bütün geçerli düzeltmelerini maliyetine göre sıralı döndürür.
+
+        Parametreler:
+            metin (str): OCR okuması
+
+        Dönüş:
+            list: (plaka, maliyet) çiftleri, en düşük maliyetli önce
+        """
+        temiz = _TEMIZLE.sub('', metin.upper())
+        varyantlar = [(temiz, 0.0)]
+        if temiz.startswith('TR'):
+            varyantlar.append((temiz[2:], 0.0))  # Plakanın solundaki TR şeridi okunmuş
+        if len(temiz) > 7:
+            # Çerçeve veya vida gibi fazladan okunan bir karakter
+            varyantlar.append((temiz[1:], KIRPMA_MALIYETI))
+            varyantlar.append((temiz[:-1], KIRPMA_MALIYETI))
+
+        sonuclar = {}
+        for varyant, kirpma in varyantlar:
+            for harf_sayisi, rakam_sayisi in BICIMLER:
+                if len(varyant) != 2 + harf_sayisi + rakam_sayisi:
+                    continue
+                il, il_maliyeti = _cevir(varyant[:2], '0123456789', RAKAM_KARISIKLIKLARI, RAKAM_TABLOSU)
+                if il is None or not '01' <= il <= '81':
+                    continue
+                harfler, harf_maliyeti = _cevir(varyant[2:2 + harf_sayisi], HARFLER, HARF_KARISIKLIKLARI, HARF_TABLOSU)
+                if harfler is None:
+                    continue
+                rakamlar, rakam_maliyeti = _cevir(varyant[2 + harf_sayisi:], '0123456789',
+                                                  RAKAM_KARISIKLIKLARI, RAKAM_TABLOSU)
+                if rakamlar is None:
+                    continue
+                plaka = il + harfler + rakamlar
+                maliyet = kirpma + il_maliyeti + harf_maliyeti + rakam_maliyeti
+                if maliyet < sonuclar.get(plaka, float('inf')):
+                    sonuclar[plaka] = maliyet
+        return sorted(sonuclar.items(), key=lambda aday: aday[1])
+
+    def _en_iyi_aday(self, metin):
+        """Maliyeti sınır içinde kalan en iyi adayı, yoksa boş metni döndürür."""
+        adaylar = self.adaylar(metin)
+        if adaylar and adaylar[0][1] <= self.en_fazla_maliyet:
+            return adaylar[0][0]
+        return ""
+
+    def duzelt(self, metin):
+        """
+        Okumayı düzeltir.
+
+        Parametreler:
+            metin (str): OCR okuması
+
+        Dönüş:
+            str: Boşluksuz geçerli plaka (örn. '34ABC123'), geçersiz okumalar için boş metin
+        """
+        return self._duzelt(metin or "")
+
+    def duzelt_toplu(self, metinler):
+        """
+        Birden fazla okumayı düzeltir; aynı okumalar bir kez hesaplanır.
+
+        Parametreler:
+            metinler (list): OCR okumaları
+
+        Dönüş:
+            list: Okumalarla aynı sırada düzeltilmiş plakalar
+        """
+        return [self._duzelt(metin or "") for metin in metinler]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plaka okumalarını Türk plaka biçimine göre düzelt")
+    parser.add_argument('okumalar', nargs='+', help="Denenecek OCR okumaları")
+    parser.add_argument('--en-fazla-maliyet', type=float, default=2.5, help="Kabul edilen en yüksek düzeltme maliyeti")
+    args = parser.parse_args()
+
+    dogrulayici = PlakaDogrulayici(args.en_fazla_maliyet)
+    for okuma in args.okumalar:
+        adaylar = dogrulayici.adaylar(okuma)
+        sonuc = dogrulayici.duzelt(okuma) or "GEÇERSİZ"
+        print(f"{okuma!r:<16} → {sonuc:<10} adaylar: {', '.join(f'{p} ({m:g})' for p, m in adaylar[:3]) or '-'}")
@@ -0,0 +1,225 @@
+# Bu dosya, YOLO kutularını kareler arasında eşleştirerek her araca sabit bir iz numarası veren hafif plaka takipçisini içerir.
+
+from collections import Counter  # OCR okumalarının oylanması için kullanılır
+import time  # İzlerin görülme zamanları için kullanılır
+
+
+def iou(a, b):
+    """
+    İki kutunun kesişim/birleşim oranını hesaplar.
+
+    Parametreler:
+        a, b (tuple): (x1, y1, x2, y2) biçiminde kutular
+
+    Dönüş:
+        float: 0 ile 1 arasında IoU değeri
+    """
+    ix1, iy1 = max(a[0], b[0]), max(a[1], b[1])
+    ix2, iy2 = min(a[2], b[2]), min(a[3], b[3])
+    kesisim = max(0, ix2 - ix1) * max(0, iy2 - iy1)
+    if kesisim == 0:
+        return 0.0
+    alan_a = (a[2] - a[0]) * (a[3] - a[1])
+    alan_b = (b[2] - b[0]) * (b[3] - b[1])
+    return kesisim / float(alan_a + alan_b - kesisim)
+
+
+def _merkez_uzakligi(a, b):
+    """
+    İki kutunun merkezleri arasındaki uzaklığı, ilk kutunun genişliğine oranlayarak döndürür.
+    """
+    ax, ay = (a[0] + a[2]) / 2, (a[1] + a[3]) / 2
+    bx, by = (b[0] + b[2]) / 2, (b[1] + b[3]) / 2
+    genislik = max(a[2] - a[0], 1)
+    return ((ax - bx) ** 2 + (ay - by) ** 2) ** 0.5 / genislik
+
+
+class PlakaIzi:
+    """
+    Takip edilen tek bir plakanın durumunu tutar: konumu, OCR oyları ve verilen karar.
+    """
+
+    def __init__(self, iz_no, kutu):
+        """
+        Parametreler:
+            iz_no (int): İzin sabit numarası
+            kutu (tuple): İlk görüldüğü kutu (x1, y1, x2, y2)
+        """
+        self.iz_no = iz_no  # Sabit iz numarası
+        self.kutu = kutu  # Son görülen kutu
+        self.ilk_gorulme = time.time()  # İzin oluşturulma zamanı
+        self.kayip = 0  # Art arda görülmediği kare sayısı
+        self.oylar = Counter()  # Okunan plaka metinlerinin oy sayıları
+        self.okuma_sayisi = 0  # Boş olmayan OCR okuma sayısı
+        self.bos_okuma = 0  # Boş veya geçersiz okuma sayısı
+        self.ardisik_bos = 0  # Son boş olmayan okumadan bu yana art arda boş okuma sayısı
+        self.gorulen_kare = 0  # İzin eşleştiği kare sayısı
+        self.sonraki_okuma = 0  # Boş okumalardan sonra yeniden okunacağı kare (gorulen_kare cinsinden)
+        self.plaka = None  # Oylamayla belirlenen plaka metni
+        self.izin_durumu = None  # Veritabanından gelen izin durumu
+
+    def oy_ekle(self, metin, en_uzun_bekleme=8):
+        """
+        Bir OCR okumasını oylara ekler. Boş okumalar okuma sınırına sayılmaz; art arda her boş okumada
+        bir sonraki okumaya kadar beklenen kare sayısı iki katına çıkar (en fazla en_uzun_bekleme).
+        Böylece bulanık gelen bir araç görüş alanında kaldıkça seyrek de olsa yeniden okunur.
+
+        Parametreler:
+            metin (str): Düzenlenmiş plaka metni
+            en_uzun_bekleme (int): Boş okumalar arasında beklenecek en fazla kare sayısı
+        """
+        if metin:
+            self.okuma_sayisi += 1
+            self.oylar[metin] += 1
+            self.ardisik_bos = 0
+            self.sonraki_okuma = 0
+        else:
+            self.bos_okuma += 1
+            self.ardisik_bos += 1
+            self.sonraki_okuma = self.gorulen_kare + min(2 ** (self.ardisik_bos - 1), en_uzun_bekleme)
+
+    def uzlasi(self, gerekli_oy, en_fazla_okuma):
+        """
+        Oylamanın sonucunu döndürür.
+
+        Parametreler:
+            gerekli_oy (int): Bir metnin kabul edilmesi için gereken oy sayısı
+            en_fazla_okuma (int): Bu kadar okumadan sonra en çok oy alan metin kabul edilir
+
+        Dönüş:
+            str veya None: Üzerinde uzlaşılan plaka metni, henüz yoksa None
+        """
+        if not self.oylar:
+            return None
+        metin, oy = self.oylar.most_common(1)[0]
+        if oy >= gerekli_oy or self.okuma_sayisi >= en_fazla_okuma:
+            return metin
+        return None
+
+    @property
+    def karar_verildi(self):
+        """Plaka metni belirlenip izin kontrolü yapıldıysa True döner."""
+        return self.izin_durumu is not None
+
+
+class PlakaTakipci:
+    """
+    IoU ve merkez uzaklığına dayalı basit bir çoklu nesne takipçisi.
+
+    Her yeni kutu en çok örtüştüğü mevcut ize bağlanır, eşleşmeyen kutular için yeni iz açılır.
+    OCR yalnızca karar verilmemiş izler için çalıştırılır; yeterli oy toplanınca karar
+    bir kez verilir ve iz kaybolana kadar yeniden kullanılır.
+    """
+
+    def __init__(self, iou_esigi=0.3, merkez_esigi=0.5, en_fazla_kayip=15,
+                 gerekli_oy=2, en_fazla_okuma=5):
+        """
+        Parametreler:
+            iou_esigi (float): Kutu ile izin eşleşmesi için gereken en düşük IoU
+            merkez_esigi (float): IoU tutmazsa kabul edilen en büyük merkez uzaklığı (kutu genişliği oranı)
+            en_fazla_kayip (int): İz silinmeden önce görülmeden geçebilecek kare sayısı
+            gerekli_oy (int): Plaka metninin kabulü için gereken aynı okuma sayısı
+            en_fazla_okuma (int): Bir iz için toplanacak en fazla boş olmayan OCR okuması
+        """
+        self.iou_esigi = iou_esigi
+        self.merkez_esigi = merkez_esigi
+        self.en_fazla_kayip = en_fazla_kayip
+        self.gerekli_oy = gerekli_oy
+        self.en_fazla_okuma = en_fazla_okuma
+        self.izler = []  # Etkin izler
+        self.sonraki_no = 1  # Yeni izlere verilecek numara
+
+    def sifirla(self):
+        """Tüm izleri siler (yeni bir akış başlarken kullanılır)."""
+        self.izler = []
+        self.sonraki_no = 1
+
+    def _yeni_iz(self, kutu):
+        """Yeni bir iz oluşturur ve numarasını ilerletir."""
+        iz = PlakaIzi(self.sonraki_no, kutu)
+        self.sonraki_no += 1
+        return iz
+
+    def guncelle(self, kutular):
+        """
+        Yeni karedeki kutuları mevcut izlerle eşleştirir.
+
+        Parametreler:
+            kutular (list): (x1, y1, x2, y2) biçiminde kutular
+
+        Dönüş:
+            list: Her kutu için eşleştiği (veya yeni açılan) PlakaIzi, kutularla aynı sırada
+        """
+        # Bütün kutu-iz çiftleri için benzerlik puanlarını hesapla
+        adaylar = []
+        for k, kutu in enumerate(kutular):
+            for i, iz in enumerate(self.izler):
+                ortusme = iou(kutu, iz.kutu)
+                if ortusme >= self.iou_esigi:
+                    adaylar.append((1.0 + ortusme, k, i))
+                else:
+                    uzaklik = _merkez_uzakligi(iz.kutu, kutu)
+                    if uzaklik <= self.merkez_esigi:
+                        adaylar.append((1.0 - uzaklik, k, i))
+
+        # En iyi eşleşmelerden başlayarak açgözlü atama yap
+        eslesen = [None] * len(kutular)
+        kullanilan_izler = set()
+        for _, k, i in sorted(adaylar, reverse=True):
+            if eslesen[k] is not None or i in kullanilan_izler:
+                continue
+            eslesen[k] = self.izler[i]
+            kullanilan_izler.add(i)
+
+        # Eşleşen izleri güncelle, eşleşmeyenleri kayıp say
+        yeni_izler = []
+        for i, iz in enumerate(self.izler):
+            if i in kullanilan_izler:
+                iz.kayip = 0
+                iz.gorulen_kare += 1
+                yeni_izler.append(iz)
+            else:
+                iz.kayip += 1
+                if iz.kayip <= self.en_fazla_kayip:
+                    yeni_izler.append(iz)
+
+        # Eşleşmeyen kutular için yeni iz aç
+        for k, kutu in enumerate(kutular):
+            if eslesen[k] is None:
+                eslesen[k] = self._yeni_iz(kutu)
+                eslesen[k].gorulen_kare = 1
+                yeni_izler.append(eslesen[k])
+            eslesen[k].kutu = kutu
+
+        self.izler = yeni_izler
+        return eslesen
+
+    def gecici_izler(self, kutular):
+        """
+        Takip yapmadan her kutu için tek okumada karar verilen geçici izler döndürür
+        (tek fotoğraf gibi ardışık olmayan kareler için).
+        """
+        return [PlakaIzi(0, kutu) for kutu in kutular]
+
+    def okunacak_mi(self, iz):
+        """
+        İz için OCR çalıştırılması gerekiyorsa True döner. Karar verilmemiş bir iz, en_fazla_okuma kadar
+        boş olmayan okuma toplanana kadar okunur; boş okumalardan sonra geri çekilme süresi beklenir.
+        """
+        return (not iz.karar_verildi and iz.okuma_sayisi < self.en_fazla_okuma
+                and iz.gorulen_kare >= iz.sonraki_okuma)
+
+    def uzlasi(self, iz, tek_okuma=False):
+        """
+        İzin oylamasının sonucunu döndürür.
+
+        Parametreler:
+            iz (PlakaIzi): Sonucu istenen iz
+            tek_okuma (bool): True ise ilk geçerli okuma kabul edilir
+
+        Dönüş:
+            str veya None: Üzerinde uzlaşılan plaka metni
+        """
+        if tek_okuma:
+            return iz.uzlasi(1, 1)
+        return iz.uzlasi(self.gerekli_oy, self.en_fazla_okuma)
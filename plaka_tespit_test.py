@@ -1,13 +1,28 @@
-import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
-from ultralytics import YOLO  # YOLO modelini kullanmak için gerekli kütüphane
 import time  # Zaman işlemleri için kullanılır
+_ICE_AKTARMA_BASLANGICI = time.perf_counter()  # Modül içe aktarma süresini ölçmek için
+
+import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
+import numpy as np  # Isınma çıkarımı için boş kare oluşturmakta kullanılır
+import threading  # Modelleri arka planda yüklemek için kullanılır
+from contextlib import contextmanager  # Başlangıç süre ölçümü için kullanılır
 import tkinter as tk  # Tkinter kütüphanesini GUI oluşturmak için kullanır
 from tkinter import filedialog, messagebox  # Dosya diyalogları ve mesaj kutuları için kullanılır
 import os  # Dosya ve dizin işlemleri için kullanılır
-import joblib  # Modeli kaydetmek ve yüklemek için kullanılır
-from paddleocr import PaddleOCR  # OCR işlemleri için PaddleOCR kullanılıyor
-import re  # Regüler ifadeler için kullanılır
 from db_operations import PlakaTespitDB  # Yeni sınıfı içe aktar
+from ayarlar import ayarlari_yukle  # Uygulama ayarları
+from cikarim_arkayuzleri import model_yukle  # PyTorch / ONNX / OpenVINO tespit modeli yükleme
+from ocr_toplu import TopluOCR  # Plaka bölgelerini toplu okuyan OCR adımı
+from plaka_takip import PlakaTakipci  # Kareler arası plaka takipçisi
+from islem_hatti import IslemHatti  # Kamera ve video için iş parçacıklı işlem hattı
+from hareket_filtresi import HareketFiltresi  # Sahne boşken tespiti atlayan hareket filtresi
+from ilgi_bolgesi import IlgiBolgesi  # Kameranın plaka görülen şerit alanı
+from plaka_dogrulama import PlakaDogrulayici  # Türk plaka biçimine göre düzeltme ve doğrulama
+from tekrar_onbellegi import TekrarOnbellegi  # Aynı plakanın pencere içinde yeniden kaydedilmesini engeller
+from metrikler import Metrikler, MetrikSunucusu, OrneklemeProfilcisi  # Canlı metrikler ve profil çıkarıcı
+
+# ultralytics ve paddleocr çok ağır kütüphaneler olduğu için modeller yüklenirken içe aktarılır
+
+_ICE_AKTARMA_SURESI = time.perf_counter() - _ICE_AKTARMA_BASLANGICI
 
 # Bu dosya, plaka tespit modelinin test edilmesi için kullanılır. Test verileri ile modelin doğruluğunu kontrol eder.
 
@@ -17,46 +32,258 @@ class PlakaTespitTest:
     Kamera, video ve fotoğraf üzerinde plaka tespiti yapabilir.
     """
     
-    def __init__(self):
+    def __init__(self, arayuz=True, db=None):
         """
         Sınıfın başlangıç ayarlarını yapar.
         - Veritabanı bağlantısını kurar
         - YOLO modelini yükler
-        - PaddleOCR modelini yükler
+        - OCR modelini (PaddleOCR veya karakter sınıflandırıcı) yükler
         - Arayüzü oluşturur
+
+        Arayüz açılırken veritabanı ve modeller arka planda yüklenir, pencere beklemeden
+        görünür ve butonlar modeller hazır olunca etkinleşir.
+
+        Parametreler:
+            arayuz (bool): False ise Tkinter penceresi oluşturulmaz ve modeller hemen yüklenir
+                (komut satırından toplu işlem için)
+            db: Kullanılacak veritabanı nesnesi, verilmezse PlakaTespitDB ile bağlanılır
         """
-        # Veritabanı işlemleri için sınıfı başlat
-        self.db = PlakaTespitDB()
-        
-        # Model yükleme
-        try:
-            self.model = YOLO('plaka_tespit/plaka_model/weights/best.pt')  # YOLO modelini yükler
-            print("Model başarıyla yüklendi.")  # Modelin başarıyla yüklendiğini belirtir
-        except Exception as e:
-            print(f"Model yüklenirken hata oluştu: {e}")  # Hata durumunda mesaj gösterir
-            return
-            
-        # PaddleOCR modelini yükleme
-        try:
-            self.ocr = PaddleOCR(use_angle_cls=True, lang='en')  # PaddleOCR modelini yükler
-            print("PaddleOCR modeli başarıyla yüklendi.")  # Modelin başarıyla yüklendiğini belirtir
-        except Exception as e:
-            print(f"PaddleOCR modeli yüklenirken hata oluştu: {e}")  # Hata durumunda mesaj gösterir
-            return
+        # Veritabanı nesnesi verilmediyse modellerle birlikte arka planda bağlanılır
+        self.db = db
+
+        # Ayarlar (ayarlar.json varsa varsayılanların üzerine yazılır)
+        self.ayarlar = ayarlari_yukle()
+        self.tespit_ayarlari = self.ayarlar['tespit']  # Çıkarım arka yüzü, güven eşiği ve giriş boyutu
+
+        # Başlangıç durumu
+        self.modeller_hazir = threading.Event()  # Modeller yüklenip ısındığında işaretlenir
+        self.yukleme_hatasi = None  # Yükleme sırasında oluşan hata mesajı
+        self.baslangic_sureleri = {'ice_aktarma': _ICE_AKTARMA_SURESI}  # Bileşen bazında başlangıç süreleri
 
         # Son izinli plaka tespitinin zamanını tut
         self.son_izinli_tespit_zamani = 0
+
+        # Kamera ve video akışlarını iş parçacıklı işlem hattıyla işle
+        self.hatli_mod = True
+
+        # Plakaları kareler arasında takip eder, OCR ve veritabanı işlemleri araç başına bir kez yapılır
+        self.takipci = PlakaTakipci()
+
+        # Aynı plaka pencere süresince yeniden izin kontrolüne ve kayda gönderilmez
+        self.tekrar_onbellegi = TekrarOnbellegi.ayarlardan(self.ayarlar)
+
+        # Son işlenen karedeki plakalar (komut satırı ve raporlama için)
+        self.son_tespitler = []
+        self.son_ocr_okumalari = []  # Son karede OCR ile okunan düzenlenmiş metinler
+
+        # Plaka biçimine uymayan okumalar veritabanına gitmeden elenir
+        self.plaka_dogrulayici = PlakaDogrulayici(self.ayarlar['ocr']['en_fazla_duzeltme'])
+
+        # Kamera akışında sahne boşken tespiti atlayan filtre (akış başlarken oluşturulur)
+        self.hareket_filtresi = None
+
+        # Tespit aşamalarının sürelerini toplayan ölçer; kaydet(asama, sure) metodu olan bir nesne
+        # (performans ölçümü ve canlı metrikler için), None ise süre ölçülmez
+        self.olcer = None
+
+        # Canlı metrikler (ayarlarda etkinse modeller yüklendikten sonra başlatılır)
+        self.metrikler = None
+        self.metrik_sunucusu = None
+
+        # Model toplu girişi desteklemezse (örn. sabit toplu boyutla dışa aktarılmış ONNX) kare kare çalışılır
+        self.toplu_cikarim = True
+
+        # Etkin kaynağın ilgi bölgesi ve YOLO giriş boyutu (kaynak_ayarla ile değişir)
+        self.ilgi_bolgesi = None
+        self.imgsz = self.tespit_ayarlari['imgsz']
+
+        # Arayüz istenmiyorsa modelleri hemen yükle ve pencere açmadan dön
+        if not arayuz:
+            self.modelleri_yukle()
+            return
+
+        # Modelleri arka planda yükle
+        threading.Thread(target=self.modelleri_yukle, name='model_yukleme', daemon=True).start()
         
         # Tkinter penceresi oluştur
         self.root = tk.Tk()  # Tkinter penceresini başlatır
         self.root.title("Plaka Tespit ve Kontrol Sistemi")  # Pencere başlığını ayarlar
-        self.root.geometry("500x400")  # Pencere boyutunu ayarlar
+        self.root.geometry("500x450")  # Pencere boyutunu ayarlar
         
         # Butonları oluştur
         self.create_widgets()  # Arayüz elemanlarını oluşturur
+        self.root.after(100, self._hazirlik_kontrol)  # Modellerin hazır olup olmadığını izler
         
         # Pencereyi göster
         self.root.mainloop()  # Tkinter döngüsünü başlatır
+
+        # Pencere kapanınca kuyruktaki kayıtları yaz ve arka plan işlerini durdur
+        if self.metrik_sunucusu is not None:
+            self.metrik_sunucusu.durdur()
+        if self.db is not None:
+            self.db.kapat()
+
+    @contextmanager
+    def _sure_olc(self, bilesen):
+        """Bloğun çalışma süresini baslangic_sureleri içine bileşen adıyla yazar."""
+        baslangic = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.baslangic_sureleri[bilesen] = time.perf_counter() - baslangic
+
+    @contextmanager
+    def _asama_olc(self, asama):
+        """Bloğun süresini, ölçer tanımlıysa tespit aşaması adıyla ölçere bildirir."""
+        if self.olcer is None:
+            yield
+            return
+        baslangic = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.olcer.kaydet(asama, time.perf_counter() - baslangic)
+
+    def _veritabanina_baglan(self):
+        """Veritabanı bağlantısını kurar (modellerle paralel çalışır)."""
+        with self._sure_olc('veritabani'):
+            self.db = PlakaTespitDB.ayarlardan(self.ayarlar)
+
+    def modelleri_yukle(self):
+        """
+        Veritabanına bağlanır, YOLO ve OCR modellerini yükler ve boş bir kare ile
+        ısınma çıkarımı yapar. Bitince modeller_hazir işaretlenir ve başlangıç raporu yazdırılır.
+
+        Dönüş:
+            bool: Yükleme başarılıysa True
+        """
+        toplam_baslangic = time.perf_counter()
+
+        # Veritabanı bağlantısı model yüklemeyi beklemesin
+        db_ipligi = None
+        if self.db is None:
+            db_ipligi = threading.Thread(target=self._veritabanina_baglan, name='veritabani_baglanti', daemon=True)
+            db_ipligi.start()
+
+        # Model yükleme
+        try:
+            with self._sure_olc('yolo_ice_aktarma'):
+                import ultralytics  # YOLO modelini kullanmak için gerekli kütüphane
+            with self._sure_olc('yolo_yukleme'):
+                self.model = model_yukle(self.tespit_ayarlari['arkayuz'])  # Ayarlardaki arka yüzün modelini yükler
+            print(f"Model başarıyla yüklendi ({self.tespit_ayarlari['arkayuz']}).")  # Modelin başarıyla yüklendiğini belirtir
+        except Exception as e:
+            print(f"Model yüklenirken hata oluştu: {e}")  # Hata durumunda mesaj gösterir
+            self.yukleme_hatasi = f"Model yüklenirken hata oluştu: {e}"
+            return False
+            
+        # OCR motorunu yükleme (PaddleOCR veya Random Forest karakter sınıflandırıcı)
+        ocr_ayarlari = self.ayarlar['ocr']
+        try:
+            if ocr_ayarlari['motor'] == 'karakter':
+                with self._sure_olc('ocr_ice_aktarma'):
+                    from karakter_ocr import KarakterOCR  # Random Forest tabanlı hafif OCR motoru
+                with self._sure_olc('ocr_yukleme'):
+                    self.toplu_ocr = KarakterOCR(ocr_ayarlari['karakter_modeli'])  # Karakterleri tek çağrıda sınıflandırır
+                print("Karakter OCR modeli başarıyla yüklendi.")  # Modelin başarıyla yüklendiğini belirtir
+            else:
+                with self._sure_olc('ocr_ice_aktarma'):
+                    from paddleocr import PaddleOCR  # OCR işlemleri için PaddleOCR kullanılıyor
+                with self._sure_olc('ocr_yukleme'):
+                    self.ocr = PaddleOCR(use_angle_cls=True, lang='en')  # PaddleOCR modelini yükler
+                    # Bir karedeki tüm plakaları tek çağrıda okur; yalnızca tanıma modunda satır tespiti atlanır
+                    self.toplu_ocr = TopluOCR(self.ocr, ocr_ayarlari['yalnizca_tanima'],
+                                              ocr_ayarlari['yeniden_deneme_esigi'])
+                print("PaddleOCR modeli başarıyla yüklendi.")  # Modelin başarıyla yüklendiğini belirtir
+        except Exception as e:
+            print(f"OCR modeli yüklenirken hata oluştu: {e}")  # Hata durumunda mesaj gösterir
+            self.yukleme_hatasi = f"OCR modeli ({ocr_ayarlari['motor']}) yüklenirken hata oluştu: {e}"
+            return False
+
+        # İlk gerçek tespitin yavaş olmaması için modelleri boş bir kareyle ısıt
+        try:
+            with self._sure_olc('yolo_isinma'):
+                self.model.predict(np.zeros((640, 640, 3), dtype=np.uint8), verbose=False,
+                                   conf=self.tespit_ayarlari['guven_esigi'], imgsz=self.tespit_ayarlari['imgsz'])
+            with self._sure_olc('ocr_isinma'):
+                self.toplu_ocr.isit()
+        except Exception as e:
+            print(f"Isınma çıkarımı sırasında hata: {e}")  # Isınma başarısız olsa da devam edilir
+
+        if db_ipligi is not None:
+            db_ipligi.join()
+
+        self.baslangic_sureleri['toplam'] = time.perf_counter() - toplam_baslangic
+        print(self.baslangic_raporu())
+        if self.ayarlar['metrikler']['etkin']:
+            self.metrikleri_baslat()
+        self.modeller_hazir.set()
+        return True
+
+    def metrikleri_baslat(self):
+        """
+        Aşama sürelerini, FPS'i ve veritabanı sayaçlarını toplayan canlı metrikleri başlatır;
+        ayarlara göre /metrics uç noktasını, periyodik özet satırını ve profil çıkarıcıyı açar.
+        """
+        if self.metrikler is not None:
+            return
+        ayar = self.ayarlar['metrikler']
+        self.metrikler = Metrikler()
+        if self.olcer is None:
+            self.olcer = self.metrikler  # tespit_et aşamaları metriklere yazılır
+
+        # Veritabanı arka plan bileşenlerinin sayaçları
+        if self.db is not None:
+            if getattr(self.db, 'kayit_yazici', None) is not None:
+                self.db.kayit_yazici.olcer = self.metrikler
+                self.metrikler.kaynak_ekle('kayit_yazici', self.db.kayit_yazici.istatistikler)
+            if getattr(self.db, 'izin_onbellegi', None) is not None:
+                self.metrikler.kaynak_ekle('izin_onbellegi', self.db.izin_onbellegi.istatistikler)
+        if self.tekrar_onbellegi is not None:
+            self.metrikler.kaynak_ekle('tekrar_onbellegi', self.tekrar_onbellegi.istatistikler)
+        if hasattr(self.toplu_ocr, 'istatistikler'):
+            self.metrikler.kaynak_ekle('ocr', self.toplu_ocr.istatistikler)
+
+        profilci = OrneklemeProfilcisi(ayar['profil_araligi']) if ayar['profil'] else None
+        self.metrik_sunucusu = MetrikSunucusu(self.metrikler, ayar['adres'], ayar['port'],
+                                              ayar['gunluk_araligi'], profilci)
+        self.metrik_sunucusu.baslat()
+
+    def _olculen_isle(self, isle):
+        """Kare işleme fonksiyonunu, toplam süreyi ve OCR okumalarını metriklere bildirecek şekilde sarar."""
+        def _isle(frame):
+            self.son_ocr_okumalari = []  # Tespit atlanan karelerde önceki okumalar sayılmasın
+            baslangic = time.perf_counter()
+            sonuc = isle(frame)
+            self.metrikler.kare_islendi(time.perf_counter() - baslangic, self.son_ocr_okumalari)
+            return sonuc
+        return _isle
+
+    def baslangic_raporu(self):
+        """
+        Başlangıç sürelerini bileşen bazında okunabilir bir metin olarak döndürür.
+
+        Dönüş:
+            str: Başlangıç süre raporu
+        """
+        satirlar = ["Başlangıç süreleri:"]
+        for bilesen, sure in self.baslangic_sureleri.items():
+            satirlar.append(f"  {bilesen:<18} {sure:7.2f} sn")
+        return "\n".join(satirlar)
+
+    def _hazirlik_kontrol(self):
+        """Modeller hazır olunca butonları etkinleştirir, değilse kendini yeniden zamanlar."""
+        if self.yukleme_hatasi:
+            self.durum_etiketi.config(text="Modeller yüklenemedi!", fg="red")
+            messagebox.showerror("Hata", self.yukleme_hatasi)
+            return
+        if not self.modeller_hazir.is_set():
+            self.root.after(100, self._hazirlik_kontrol)
+            return
+        for buton in self.test_butonlari:
+            buton.config(state=tk.NORMAL)
+        self.durum_etiketi.config(
+            text=f"Hazır ({self.baslangic_sureleri['toplam']:.1f} sn)", fg="green")
     
     def create_widgets(self):
         """
@@ -65,24 +292,31 @@ class PlakaTespitTest:
         # Başlık
         title = tk.Label(self.root, text="Plaka Tespit ve Kontrol Sistemi", font=("Arial", 16))  # Başlık etiketi oluşturur
         title.pack(pady=20)  # Başlık etiketini yerleştirir
+
+        # Durum etiketi
+        self.durum_etiketi = tk.Label(self.root, text="Modeller yükleniyor...", fg="gray")  # Yükleme durumunu gösterir
+        self.durum_etiketi.pack()  # Durum etiketini yerleştirir
         
         # Kamera butonu
         camera_btn = tk.Button(self.root, text="Kamera ile Test Et", 
                              command=self.kamera_test,
-                             width=20, height=2)  # Kamera ile test butonu oluşturur
+                             width=20, height=2, state=tk.DISABLED)  # Kamera ile test butonu oluşturur
         camera_btn.pack(pady=10)  # Butonu yerleştirir
         
         # Video butonu
         video_btn = tk.Button(self.root, text="Video ile Test Et",
                             command=self.video_test,
-                            width=20, height=2)  # Video ile test butonu oluşturur
+                            width=20, height=2, state=tk.DISABLED)  # Video ile test butonu oluşturur
         video_btn.pack(pady=10)  # Butonu yerleştirir
         
         # Fotoğraf butonu
         photo_btn = tk.Button(self.root, text="Fotoğraf ile Test Et",
                             command=self.foto_test,
-                            width=20, height=2)  # Fotoğraf ile test butonu oluşturur
+                            width=20, height=2, state=tk.DISABLED)  # Fotoğraf ile test butonu oluşturur
         photo_btn.pack(pady=10)  # Butonu yerleştirir
+
+        # Modeller hazır olunca etkinleştirilecek butonlar
+        self.test_butonlari = [camera_btn, video_btn, photo_btn]
         
         # Çıkış butonu
         exit_btn = tk.Button(self.root, text="Çıkış",
@@ -92,117 +326,318 @@ class PlakaTespitTest:
     
     def plaka_metni_duzenle(self, metin):
         """
-        OCR ile okunan plaka metnini düzenler.
+        OCR ile okunan plaka metnini Türk plaka biçimine göre düzeltir.
         
         Parametreler:
             metin (str): Düzenlenecek plaka metni
             
         Dönüş:
-            str: Düzenlenmiş plaka metni
+            str: Boşluksuz düzeltilmiş plaka (örn. '34ABC123'), biçime uymayan okumalar için boş metin
         """
-        # Boşlukları temizle
-        metin = metin.strip()
-        
-        # Başında 3 sayı varsa, 2. ve 3. sayıları al
-        if re.match(r'^(\d{3})', metin):
-            metin = metin[1:3] + metin[3:]
-        
-        # Özel karakterleri temizle
-        metin = re.sub(r'[^A-Za-z0-9 ]+', '', metin)
-        
-        # 8 ile başlıyorsa 3 ile değiştir
-        # if metin.startswith('8'):
-        #     metin = '3' + metin[1:]
+        return self.plaka_dogrulayici.duzelt(metin)
+    
+    def kaynak_ayarla(self, kaynak=None):
+        """
+        Ayarlardaki 'kameralar' bölümünden kaynağa özel ilgi bölgesini ve giriş boyutunu seçer.
+
+        Parametreler:
+            kaynak (str): Kamera numarası veya video dosyasının adı; None ise tam kare ve varsayılan boyut kullanılır
+        """
+        kamera = self.ayarlar['kameralar'].get(str(kaynak), {}) if kaynak is not None else {}
+        self.ilgi_bolgesi = IlgiBolgesi.ayardan(kamera.get('ilgi_bolgesi'))
+        self.imgsz = kamera.get('imgsz') or self.tespit_ayarlari['imgsz']
+        if kamera:
+            print(f"'{kaynak}' kaynağı için ilgi bölgesi: {kamera.get('ilgi_bolgesi') or 'tam kare'}, imgsz: {self.imgsz}")
+
+    def toplu_tahmin(self, girisler, imgsz):
+        """
+        Aynı giriş boyutundaki kareleri tek bir YOLO çağrısında (desteklenmiyorsa tek tek) tespit eder.
+
+        Parametreler:
+            girisler (list): Kareler veya ilgi bölgeleri
+            imgsz (int): YOLO giriş boyutu
+
+        Dönüş:
+            list: Girişlerle aynı sırada sonuçlar
+        """
+        guven = self.tespit_ayarlari['guven_esigi']
+        if self.toplu_cikarim and len(girisler) > 1:
+            try:
+                return self.model.predict(girisler, conf=guven, imgsz=imgsz, batch=len(girisler), verbose=False)
+            except Exception as e:
+                # Sabit toplu boyutla dışa aktarılmış modeller (örn. ONNX) tek kare kabul eder
+                print(f"Toplu tespit desteklenmiyor, kareler tek tek işlenecek: {e}")
+                self.toplu_cikarim = False
+        return [self.model.predict(g, conf=guven, imgsz=imgsz, verbose=False)[0] for g in girisler]
+
+    def kutulari_topla(self, frame, sonuc, ofset=(0, 0), ilgi_bolgesi=None):
+        """
+        YOLO sonucundaki kutuları tam kare koordinatlarına taşır ve plaka bölgelerini keser.
+
+        Parametreler:
+            frame: Tam kare
+            sonuc: Modelin bu kare (veya ilgi bölgesi) için döndürdüğü sonuç
+            ofset (tuple): İlgi bölgesinin tam karedeki sol üst köşesi
+            ilgi_bolgesi (IlgiBolgesi): Çokgen bölgenin dışında kalan kutuları atmak için
+
+        Dönüş:
+            tuple: (kutular, bölgeler) listeleri
+        """
+        ox, oy = ofset
+        kutular = []  # Kutu koordinatları
+        bolgeler = []  # Plaka bölgeleri
+        for box in sonuc.boxes:
+            # Koordinatları alma (ilgi bölgesindeki koordinatlar tam kareye taşınır)
+            x1, y1, x2, y2 = box.xyxy[0]  # Kutunun koordinatlarını alır
+            x1, y1, x2, y2 = int(x1) + ox, int(y1) + oy, int(x2) + ox, int(y2) + oy  # Koordinatları tam sayıya çevirir
+            if ilgi_bolgesi is not None and not ilgi_bolgesi.icinde_mi((x1, y1, x2, y2)):
+                continue  # Çokgen bölgenin dışında kalan kutular atlanır
+            kutular.append((x1, y1, x2, y2))
+            bolgeler.append(frame[y1:y2, x1:x2])  # Plaka bölgesini keser
+        return kutular, bolgeler
+
+    def okumalari_isle(self, durum, izler, okunacaklar, ocr_sonuclari, takip=True, tekrar=None):
+        """
+        OCR okumalarını düzenleyip izlerin oylarına ekler; oylaması sonuçlanan izler için
+        izin kontrolü ve kayıt yapar.
+
+        Parametreler:
+            durum: takipci, tekrar_onbellegi ve son_izinli_tespit_zamani özellikleri olan akış durumu
+                (tek kaynakta uygulamanın kendisi, çoklu kaynakta her akışın kendi nesnesi)
+            izler (list): Karedeki izler
+            okunacaklar (list): OCR ile okunan izlerin indeksleri
+            ocr_sonuclari (list): Okunan izlerle aynı sırada (metin, güven) çiftleri
+            takip (bool): False ise tek okuma yeterli sayılır (tek fotoğraf)
+            tekrar (bool): Tekrar önbelleği kullanılsın mı; None ise takip değeri kullanılır
+                (çıkarım servisi tek karelerde de aynı plakayı pencere içinde yeniden kaydetmez)
+
+        Dönüş:
+            tuple: (düzenlenmiş okumalar, bu karede verilen (plaka, izinli) kararları)
+        """
+        # Plaka metinlerini toplu düzenleme; biçime uymayan okumalar boş döner ve oylamaya girmez
+        okumalar = []
+        if ocr_sonuclari:
+            with self._asama_olc('metin_duzenleme'):
+                okumalar = self.plaka_dogrulayici.duzelt_toplu([metin for metin, _ in ocr_sonuclari])
+
+        tekrar_onbellegi = durum.tekrar_onbellegi if (takip if tekrar is None else tekrar) else None
+        kararlar = []
+        for i, plaka_text in zip(okunacaklar, okumalar):
+            iz = izler[i]
+            iz.oy_ekle(plaka_text)
+
+            # Oylama sonuçlandıysa izin kontrolü ve kayıt iz başına bir kez yapılır
+            plaka_text = durum.takipci.uzlasi(iz, tek_okuma=not takip)
+            if plaka_text:
+                iz.plaka = plaka_text
+                # Aynı plaka pencere içinde karar verildiyse (örn. bariyerde bekleyen aracın izi koptuysa)
+                # önceki karar kullanılır, yeniden kontrol ve kayıt yapılmaz (tek fotoğraflarda varsayılan olarak uygulanmaz)
+                if tekrar_onbellegi is not None:
+                    onceki_karar = tekrar_onbellegi.bul(plaka_text)
+                    if onceki_karar is not None:
+                        iz.izin_durumu = onceki_karar
+                        continue
+                # İzin kontrolü
+                with self._asama_olc('izin_kontrol'):
+                    iz.izin_durumu = self.db.plaka_izin_kontrol(plaka_text)
+                # Veritabanına kaydet
+                with self._asama_olc('kayit'):
+                    plaka_id, durum.son_izinli_tespit_zamani = self.db.plaka_kaydet(
+                        plaka_text, 
+                        iz.izin_durumu, 
+                        durum.son_izinli_tespit_zamani
+                    )
+                if tekrar_onbellegi is not None:
+                    tekrar_onbellegi.ekle(plaka_text, iz.izin_durumu)
+                kararlar.append((plaka_text, iz.izin_durumu))
+        return okumalar, kararlar
+
+    def tespitleri_ciz(self, frame, kutular, izler, ilgi_bolgesi=None, ciz=True):
+        """
+        Karar verilen izlerin kutularını ve izin durumlarını kareye çizer.
+
+        Parametreler:
+            frame: Üzerine çizilecek tam kare
+            kutular (list): Karedeki kutular
+            izler (list): Kutularla aynı sıradaki izler
+            ilgi_bolgesi (IlgiBolgesi): Verilirse sınırı da çizilir
+            ciz (bool): False ise yalnızca tespit listesi oluşturulur
+
+        Dönüş:
+            list: Her kutu için kutu, iz numarası, plaka ve izin durumu sözlükleri
+        """
+        tespitler = []
+        for (x1, y1, x2, y2), iz in zip(kutular, izler):
+            tespitler.append({
+                'kutu': [x1, y1, x2, y2],
+                'iz_no': iz.iz_no,
+                'plaka': iz.plaka,
+                'izinli': iz.izin_durumu,
+            })
+            if not ciz or not iz.karar_verildi:
+                continue
+
+            # Görüntüye plaka ve durum bilgisini ekle
+            durum_renk = (0, 255, 0) if iz.izin_durumu else (0, 0, 255)  # Yeşil: İzinli, Kırmızı: İzinsiz
+            durum_text = "IZINLI ve GIREBILIR" if iz.izin_durumu else "IZINSIZ ve GIREMEZ"
         
-        # Plaka formatını düzelt
-        if len(metin.split()) == 3:
-            parcalar = metin.split()
-            # Sayıları ve harfleri düzelt
-            parcalar[0] = parcalar[0].replace('B', '8').replace('I', '1').replace('O', '0').replace('S', '5').replace('h', '4')
-            parcalar[1] = parcalar[1].replace('8', 'B').replace('1', 'I').replace('0', 'O').replace('5', 'S').replace('4', 'H')
-            parcalar[2] = parcalar[2].replace('B', '8').replace('I', '1').replace('O', '0').replace('S', '5').replace('h', '4')
-            metin = ' '.join(parcalar)
+            # Kutu çizme
+            cv2.rectangle(frame, (x1, y1), (x2, y2), durum_renk, 2)
         
-        # Uzunluğu kontrol et
-        if len(metin.replace(' ', '')) > 8:
-            metin = metin[:8]
-        else:
-            metin = metin[:10]
+            # Plaka ve durum bilgisini gösterme
+            text_position = (x1-5, y1-10)  # Plaka metninin konumunu ayarlar
+            if text_position[1] < 0:
+                text_position = (x1+15, y1 + 20)  # Eğer metin üstte kalıyorsa, aşağıya kaydır
         
-        return metin
-    
-    def tespit_et(self, frame):
+            cv2.putText(frame, f'{iz.plaka} - {durum_text}', text_position,
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, durum_renk, 2)
+
+        # İlgi bölgesinin sınırını göster
+        if ciz and ilgi_bolgesi is not None:
+            ilgi_bolgesi.ciz(frame)
+        return tespitler
+
+    def tespit_et(self, frame, takip=True):
         """
         Görüntü üzerinde plaka tespiti yapar.
         
         Parametreler:
             frame: İşlenecek görüntü
+            takip (bool): True ise kutular önceki karelerdeki izlerle eşleştirilir ve
+                OCR yalnızca yeni izlerde çalışır; tek fotoğraflar için False verilir
             
         Dönüş:
             tuple: (İşlenmiş görüntü, Tespit edilen plaka sayısı)
         """
-        # Tahmin yap
-        results = self.model.predict(frame, conf=0.25)  # Görüntüde plaka tespiti yapar
+        with self._asama_olc('yolo'):
+            # Tespit modeline yalnızca ilgi bölgesi gönderilir
+            if self.ilgi_bolgesi is not None:
+                giris, ofset = self.ilgi_bolgesi.kes(frame)
+            else:
+                giris, ofset = frame, (0, 0)
+
+            # Tahmin yap
+            results = self.model.predict(giris, conf=self.tespit_ayarlari['guven_esigi'],
+                                         imgsz=self.imgsz, verbose=False)  # Görüntüde plaka tespiti yapar
         
-        # Sonuçları görüntüleme
-        for result in results:
-            boxes = result.boxes  # Tespit edilen kutuları alır
-            for box in boxes:
-                # Koordinatları alma
-                x1, y1, x2, y2 = box.xyxy[0]  # Kutunun koordinatlarını alır
-                x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)  # Koordinatları tam sayıya çevirir
-                
-                # Plaka bölgesini kesme
-                plaka_region = frame[y1:y2, x1:x2]  # Plaka bölgesini keser
-
-                # PaddleOCR ile metni okuma
-                try:
-                    ocr_result = self.ocr.ocr(plaka_region, cls=True)
-                    
-                    # OCR sonuçlarını kontrol et
-                    if ocr_result and len(ocr_result) > 0 and len(ocr_result[0]) > 0:
-                        plaka_text = ocr_result[0][0][1][0]  # Tespit edilen metni al
-                    else:
-                        plaka_text = ""
-                except Exception as e:
-                    print(f"OCR işlemi sırasında hata: {e}")
-                    plaka_text = ""
-
-                # Plaka metnini düzenleme
-                plaka_text = self.plaka_metni_duzenle(plaka_text)
-                plaka_text = plaka_text.replace(' ', '')  # Plaka metnindeki boşlukları kaldır      
-                
-                # Plaka kontrolü ve kayıt
-                if plaka_text and len(plaka_text) >= 4:  # En az 4 karakter varsa işlem yap
-                    # İzin kontrolü
-                    izin_durumu = self.db.plaka_izin_kontrol(plaka_text)
-                    # Veritabanına kaydet
-                    plaka_id, self.son_izinli_tespit_zamani = self.db.plaka_kaydet(
-                        plaka_text, 
-                        izin_durumu, 
-                        self.son_izinli_tespit_zamani
-                    )
-                    
-                    # Görüntüye plaka ve durum bilgisini ekle
-                    durum_renk = (0, 255, 0) if izin_durumu else (0, 0, 255)  # Yeşil: İzinli, Kırmızı: İzinsiz
-                    durum_text = "IZINLI ve GIREBILIR" if izin_durumu else "IZINSIZ ve GIREMEZ"
-                    
-                    # Kutu çizme
-                    cv2.rectangle(frame, (x1, y1), (x2, y2), durum_renk, 2)
-                    
-                    # Plaka ve durum bilgisini gösterme
-                    text_position = (x1-5, y1-10)  # Plaka metninin konumunu ayarlar
-                    if text_position[1] < 0:
-                        text_position = (x1+15, y1 + 20)  # Eğer metin üstte kalıyorsa, aşağıya kaydır
-                    
-                    cv2.putText(frame, f'{plaka_text} - {durum_text}', text_position,
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, durum_renk, 2)
-
-        # Görüntüyü yeniden boyutlandırma
-        frame = cv2.resize(frame, (600, 600))  # Görüntüyü yeniden boyutlandırır
+        # Tespit edilen bütün kutuları ve plaka bölgelerini topla
+        kutular, bolgeler = self.kutulari_topla(frame, results[0], ofset, self.ilgi_bolgesi)
+
+        # Kutuları izlerle eşleştir (tek fotoğrafta her kutu ayrı değerlendirilir)
+        with self._asama_olc('takip'):
+            if takip:
+                izler = self.takipci.guncelle(kutular)
+            else:
+                izler = self.takipci.gecici_izler(kutular)
+
+        # Yalnızca karar verilmemiş izlerin plakalarını tek bir toplu OCR çağrısıyla oku
+        okunacaklar = [i for i, iz in enumerate(izler) if self.takipci.okunacak_mi(iz)]
+        if okunacaklar:
+            with self._asama_olc('ocr'):
+                ocr_sonuclari = self.toplu_ocr.oku([bolgeler[i] for i in okunacaklar])
+        else:
+            ocr_sonuclari = []
+
+        # Bu karede okunan (düzenlenmiş) metinler
+        self.son_ocr_okumalari, _ = self.okumalari_isle(self, izler, okunacaklar, ocr_sonuclari, takip)
+
+        with self._asama_olc('cizim'):
+            # Sonuçları görüntüleme
+            self.son_tespitler = self.tespitleri_ciz(frame, kutular, izler, self.ilgi_bolgesi)
+
+            # Görüntüyü yeniden boyutlandırma
+            frame = cv2.resize(frame, (600, 600))  # Görüntüyü yeniden boyutlandırır
         
-        return frame, len(boxes)  # İşlenmiş görüntüyü ve tespit edilen plaka sayısını döner
+        return frame, len(kutular)  # İşlenmiş görüntüyü ve tespit edilen plaka sayısını döner
     
+    def _hareket_filtreli_tespit(self, frame):
+        """
+        Hareket filtresi karede değişiklik görmezse tespiti atlar, aksi halde tespit_et çağırır.
+
+        Parametreler:
+            frame: İşlenecek görüntü
+
+        Dönüş:
+            tuple: İşlenmiş görüntü ve tespit edilen plaka sayısı
+        """
+        if not self.hareket_filtresi.tespit_gerekli_mi(frame):
+            return cv2.resize(frame, (600, 600)), 0  # Tespit yapılmadan yalnızca gösterilir
+        baslangic = time.perf_counter()
+        frame, plaka_sayisi = self.tespit_et(frame)
+        self.hareket_filtresi.bildir(plaka_sayisi, time.perf_counter() - baslangic)
+        return frame, plaka_sayisi
+
+    def _akisi_isle(self, cap, pencere_adi, politika, hareket_filtreli=False):
+        """
+        Kamera veya video akışındaki kareleri işler ve gösterir.
+
+        Parametreler:
+            cap: Açılmış cv2.VideoCapture nesnesi
+            pencere_adi (str): Görüntünün gösterileceği pencerenin adı
+            politika (str): İşlem hattı düşürme politikası ('en_yeni' veya 'hepsi')
+            hareket_filtreli (bool): Ayarlarda etkinse sahne boşken tespit atlansın mı
+        """
+        self.takipci.sifirla()  # Önceki akıştan kalan izleri temizle
+
+        isle = self.tespit_et
+        hareket_ayarlari = dict(self.ayarlar['hareket'])
+        if hareket_filtreli and hareket_ayarlari.pop('etkin'):
+            self.hareket_filtresi = HareketFiltresi(**hareket_ayarlari)
+            isle = self._hareket_filtreli_tespit
+        else:
+            self.hareket_filtresi = None
+
+        if self.metrikler is not None:
+            isle = self._olculen_isle(isle)
+            if self.hareket_filtresi is not None:
+                self.metrikler.kaynak_ekle('hareket_filtresi', self.hareket_filtresi.istatistikler)
+
+        if self.hatli_mod:
+            # Yakalama, tespit ve görüntüleme ayrı adımlarda çalışır
+            hat = IslemHatti(cap, isle, politika=politika)
+            if self.metrikler is not None:
+                self.metrikler.kaynak_ekle('islem_hatti', hat.istatistikler)  # Kuyruklar ve düşürülen kareler
+            hat.calistir(pencere_adi)
+        else:
+            prev_time = time.time()  # Önceki zaman
+            while True:
+                ret, frame = cap.read()  # Kaynaktan görüntü alır
+                if not ret:
+                    break
+
+                # FPS hesaplama
+                current_time = time.time()  # Şu anki zamanı alır
+                fps = 1 / (current_time - prev_time)  # FPS hesaplar
+                prev_time = current_time  # Önceki zamanı günceller
+
+                # Tespit
+                frame, plaka_sayisi = isle(frame)  # Görüntüde plaka tespiti yapar
+
+                # FPS gösterme
+                cv2.putText(frame, f'FPS: {fps:.2f}', (10, 30),
+                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)  # FPS değerini görüntüye yazar
+
+                # Görüntüyü göster
+                cv2.imshow(pencere_adi, frame)  # İşlenmiş görüntüyü gösterir
+
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break  # 'q' tuşuna basılırsa döngüden çık
+
+        cap.release()  # Kaynağı kapatır
+        cv2.destroyAllWindows()  # Tüm pencereleri kapatır
+
+        if self.metrikler is not None:
+            # Biten akışın bileşenleri sonraki akışta yenileri ile değişir
+            self.metrikler.kaynak_cikar('islem_hatti')
+            self.metrikler.kaynak_cikar('hareket_filtresi')
+            print(self.metrikler.gunluk_satiri())
+
+        if self.hareket_filtresi is not None:
+            ist = self.hareket_filtresi.istatistikler()
+            print(f"Hareket filtresi: {ist['atlanan']}/{ist['toplam_kare']} kare atlandı "
+                  f"(%{ist['atlama_orani'] * 100:.1f}), tahmini kazanılan işlemci süresi "
+                  f"{ist['tahmini_kazanilan_cpu_sn']:.1f} sn")
+
     def kamera_test(self):
         """Kamera ile test"""
         cap = cv2.VideoCapture(0)  # Varsayılan kamerayı açar
@@ -210,32 +645,12 @@ class PlakaTespitTest:
             messagebox.showerror("Hata", "Kamera açılamadı!")  # Kamera açılamazsa hata mesajı gösterir
             return
 
-        prev_time = time.time()  # Önceki zaman
-        while True:
-            ret, frame = cap.read()  # Kameradan görüntü alır
-            if not ret:
-                break
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Sürücü tamponunda eski karelerin birikmesini engeller
 
-            # FPS hesaplama
-            current_time = time.time()  # Şu anki zamanı alır
-            fps = 1 / (current_time - prev_time)  # FPS hesaplar
-            prev_time = current_time  # Önceki zamanı günceller
-            
-            # Tespit
-            frame, plaka_sayisi = self.tespit_et(frame)  # Görüntüde plaka tespiti yapar
-            
-            # FPS gösterme
-            cv2.putText(frame, f'FPS: {fps:.2f}', (10, 30),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)  # FPS değerini görüntüye yazar
-
-            # Görüntüyü göster
-            cv2.imshow('Kamera Testi', frame)  # İşlenmiş görüntüyü gösterir
-
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                break  # 'q' tuşuna basılırsa döngüden çık
+        self.kaynak_ayarla('0')  # Kameraya özel ilgi bölgesi ve giriş boyutu
 
-        cap.release()  # Kamerayı kapatır
-        cv2.destroyAllWindows()  # Tüm pencereleri kapatır
+        # Canlı kamerada her zaman en yeni kare işlenir
+        self._akisi_isle(cap, 'Kamera Testi', politika='en_yeni', hareket_filtreli=True)
     
     def video_test(self):
         """Video dosyası ile test"""
@@ -253,32 +668,10 @@ class PlakaTespitTest:
             messagebox.showerror("Hata", "Video dosyası açılamadı!")  # Video açılamazsa hata mesajı gösterir
             return
 
-        prev_time = time.time()  # Önceki zaman
-        while True:
-            ret, frame = cap.read()  # Videodan görüntü alır
-            if not ret:
-                break
-
-            # FPS hesaplama
-            current_time = time.time()  # Şu anki zamanı alır
-            fps = 1 / (current_time - prev_time)  # FPS hesaplar
-            prev_time = current_time  # Önceki zamanı günceller
-            
-            # Tespit
-            frame, plaka_sayisi = self.tespit_et(frame)  # Görüntüde plaka tespiti yapar
-            
-            # FPS gösterme
-            cv2.putText(frame, f'FPS: {fps:.2f}', (10, 30),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)  # FPS değerini görüntüye yazar
-
-            # Görüntüyü göster
-            cv2.imshow('Video Testi', frame)  # İşlenmiş görüntüyü gösterir
+        self.kaynak_ayarla(os.path.basename(video_path))  # Videoya özel ilgi bölgesi ve giriş boyutu
 
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                break  # 'q' tuşuna basılırsa döngüden çık
-
-        cap.release()  # Kamerayı kapatır
-        cv2.destroyAllWindows()  # Tüm pencereleri kapatır
+        # Video dosyasında hiçbir kare atlanmaz
+        self._akisi_isle(cap, 'Video Testi', politika='hepsi')
     
     def foto_test(self):
         """Fotoğraf ile test"""
@@ -298,7 +691,8 @@ class PlakaTespitTest:
             return
         
         # Tespit
-        image, plaka_sayisi = self.tespit_et(image)  # Görüntüde plaka tespiti yapar
+        self.kaynak_ayarla(None)  # Fotoğraflarda tam kare kullanılır
+        image, plaka_sayisi = self.tespit_et(image, takip=False)  # Görüntüde plaka tespiti yapar
         
         # Sonucu göster
         cv2.imshow('Fotoğraf Testi', image)  # İşlenmiş görüntüyü gösterir
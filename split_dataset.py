@@ -1,46 +1,170 @@
 # Veri setini eğitim, doğrulama ve test setlerine ayırmak için kullanılır.
+# Bölme, görüntü adının özetine göre yapıldığı için her çalıştırmada aynıdır ve yeni görüntüler eklendiğinde
+# eski görüntülerin seti değişmez. Artırılmış kopyalar (N_aug_k.jpg) kaynak görüntüleriyle aynı sete düşer.
 
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import hashlib  # Görüntü gruplarını setlere atamak için kullanılır
+import json  # Tekrar raporunu okumak için kullanılır
 import os  # Dosya ve dizin işlemleri için kullanılır
 import shutil  # Dosya kopyalama işlemleri için kullanılır
-import random  # Rastgele sayı üretimi için kullanılır
 from pathlib import Path  # Dosya yollarını yönetmek için kullanılır
 from tqdm import tqdm  # İlerleme çubuğu için kullanılır
 
-def split_dataset(images_dir, labels_dir, output_dir, train_ratio=0.7, valid_ratio=0.2, test_ratio=0.1):
-    """Veri setini eğitim, doğrulama ve test olarak böler"""
+SETLER = ('train', 'valid', 'test')  # Set adları
+MODLAR = ('kopya', 'hardlink', 'symlink', 'liste')  # Dosyaların sete yerleştirilme biçimleri
+
+def grup_anahtari(dosya_adi):
+    """Artırılmış kopyaların kaynak görüntüsünün adını döndürür (örn. '10_aug_3' → '10')."""
+    return Path(dosya_adi).stem.split('_aug_')[0]
+
+def kume_anahtarlari(rapor_yolu):
+    """
+    veri_seti_araci.py tara raporundaki neredeyse aynı görüntü kümelerini grup anahtarlarına çevirir.
+    Adları farklı olsa da birbirinin kopyası olan görüntüler böylece aynı sete düşer. Kümeler dosyalar
+    yerine grup anahtarları üzerinden birleştirilir (union-find); bir kümeye giren görüntünün artırılmış
+    kopyaları ve ortak grubu olan kümeler de aynı anahtarı alır.
+
+    Dönüş:
+        dict: Grup anahtarı → birleştirilmiş gruptaki en küçük grup anahtarı
+    """
+    with open(rapor_yolu, encoding='utf-8') as dosya:
+        rapor = json.load(dosya)
+    ebeveyn = {}
+
+    def kok(anahtar):
+        while ebeveyn[anahtar] != anahtar:
+            ebeveyn[anahtar] = ebeveyn[ebeveyn[anahtar]]  # Yolu kısaltır
+            anahtar = ebeveyn[anahtar]
+        return anahtar
+
+    for kume in rapor['benzer']:
+        gruplar = [grup_anahtari(Path(kayit['yol']).name) for kayit in kume]
+        for grup in gruplar:
+            ebeveyn.setdefault(grup, grup)
+        for grup in gruplar[1:]:
+            a, b = kok(gruplar[0]), kok(grup)
+            if a != b:
+                ebeveyn[max(a, b)] = min(a, b)  # Kök her zaman en küçük anahtar olur
+    return {grup: kok(grup) for grup in ebeveyn}
+
+def set_sec(grup, oranlar, tohum=42):
+    """
+    Grubu, tohum ve grup adının özetine göre bir sete atar.
+
+    Parametreler:
+        grup (str): Grup anahtarı
+        oranlar (tuple): (eğitim, doğrulama, test) oranları
+        tohum (int): Farklı bir bölme elde etmek için değiştirilebilen tohum
+
+    Dönüş:
+        str: 'train', 'valid' veya 'test'
+    """
+    ozet = hashlib.sha1(f"{tohum}:{grup}".encode('utf-8')).digest()
+    deger = int.from_bytes(ozet[:8], 'big') / 2.0 ** 64  # [0, 1) aralığında kararlı bir sayı
+    toplam = sum(oranlar)
+    sinir = 0.0
+    for set_adi, oran in zip(SETLER, oranlar):
+        sinir += oran / toplam
+        if deger < sinir:
+            return set_adi
+    return SETLER[-1]
+
+def _yerlestir(kaynak, hedef, mod):
+    """Dosyayı moda göre hedefe kopyalar veya bağlar; hedef zaten aynı dosyaysa dokunmaz."""
+    if os.path.lexists(hedef):
+        if mod == 'hardlink' and os.path.exists(hedef) and os.path.samefile(kaynak, hedef):
+            return
+        if mod == 'symlink' and os.path.islink(hedef) and os.path.realpath(hedef) == os.path.realpath(kaynak):
+            return
+        os.remove(hedef)
+    if mod == 'hardlink':
+        try:
+            os.link(kaynak, hedef)  # Aynı dosya sisteminde ek disk kullanmaz
+            return
+        except OSError as e:
+            print(f"Uyarı: {kaynak} için sabit bağlantı oluşturulamadı, kopyalanıyor ({e})")
+    elif mod == 'symlink':
+        os.symlink(os.path.relpath(kaynak, os.path.dirname(hedef)), hedef)
+        return
+    shutil.copy2(kaynak, hedef)  # Görüntü veya etiket dosyasını kopyalar
+
+def _liste_yaz(output_dir, images_dir, labels_dir, sets):
+    """
+    YOLO'nun doğrudan okuyabileceği liste dosyalarını ve veri seti YAML dosyasını yazar.
+    YOLO etiketleri görüntü yolundaki /images/ kısmını /labels/ yaparak aradığı için
+    görüntü klasörünün yanına etiket klasörünü gösteren bir bağlantı oluşturulur.
+    """
+    images_dir = Path(images_dir).resolve()
+    labels_dir = Path(labels_dir).resolve()
+    yolo_etiketleri = images_dir.parent / 'labels'
+    if not os.path.lexists(yolo_etiketleri):
+        os.symlink(os.path.relpath(labels_dir, images_dir.parent), yolo_etiketleri)
+    elif yolo_etiketleri.resolve() != labels_dir:
+        print(f"Uyarı: {yolo_etiketleri} klasörü {labels_dir} değil, YOLO etiketleri oradan okuyacak!")
+
+    output_dir = Path(output_dir).resolve()
+    os.makedirs(output_dir, exist_ok=True)
+    for set_name, files in sets.items():
+        (output_dir / f"{set_name}.txt").write_text(
+            "".join(f"{images_dir / f.name}\n" for f in files), encoding='utf-8')
+    yaml_yolu = output_dir / 'plaka_liste.yaml'
+    yaml_yolu.write_text(f"path: {output_dir}\n"
+                         "train: train.txt\n"
+                         "val: valid.txt\n"
+                         "test: test.txt\n"
+                         "names:\n"
+                         "  0: plaka\n", encoding='utf-8')
+    print(f"\nListe dosyaları ve {yaml_yolu} yazıldı.")
+
+def split_dataset(images_dir, labels_dir, output_dir, train_ratio=0.7, valid_ratio=0.2, test_ratio=0.1,
+                  mod='kopya', tohum=42, tekrar_raporu=None):
+    """
+    Veri setini eğitim, doğrulama ve test olarak böler.
+
+    Parametreler:
+        images_dir: Görüntülerin dizini
+        labels_dir: YOLO etiketlerinin dizini
+        output_dir: Setlerin oluşturulacağı dizin
+        train_ratio, valid_ratio, test_ratio (float): Set oranları
+        mod (str): 'kopya', 'hardlink', 'symlink' veya 'liste' (yalnızca liste dosyaları yazılır)
+        tohum (int): Bölmeyi belirleyen tohum
+        tekrar_raporu (str): veri_seti_araci.py tara raporu; verilirse neredeyse aynı görüntüler de aynı sete düşer
+
+    Dönüş:
+        dict: Set adı → görüntü dosyaları
+    """
+    if mod not in MODLAR:
+        raise ValueError(f"Geçersiz mod: {mod} (geçerli: {', '.join(MODLAR)})")
+
     # Görüntü dosyalarını listele
-    image_files = list(Path(images_dir).glob('*.jpg')) + list(Path(images_dir).glob('*.png'))  # JPG ve PNG dosyalarını alır
-    
+    image_files = sorted(list(Path(images_dir).glob('*.jpg')) + list(Path(images_dir).glob('*.png')))  # JPG ve PNG dosyalarını alır
+
     # Dosya sayısını kontrol et
     if not image_files:
         print("Hata: Görüntü dosyası bulunamadı!")  # Eğer görüntü yoksa hata mesajı gösterir
         return
-    
-    print(f"Toplam {len(image_files)} görüntü bulundu.")  # Toplam görüntü sayısını yazdırır
-    
-    # Dosyaları karıştır
-    random.shuffle(image_files)  # Görüntü dosyalarını karıştırır
-    
-    # Bölme noktalarını hesapla
-    train_end = int(len(image_files) * train_ratio)  # Eğitim setinin sonunu hesaplar
-    valid_end = int(len(image_files) * (train_ratio + valid_ratio))  # Doğrulama setinin sonunu hesaplar
-    
-    # Dosyaları böl
-    train_files = image_files[:train_end]  # Eğitim seti dosyaları
-    valid_files = image_files[train_end:valid_end]  # Doğrulama seti dosyaları
-    test_files = image_files[valid_end:]  # Test seti dosyaları
-    
-    print(f"Eğitim seti: {len(train_files)} görüntü")  # Eğitim seti sayısını yazdırır
-    print(f"Doğrulama seti: {len(valid_files)} görüntü")  # Doğrulama seti sayısını yazdırır
-    print(f"Test seti: {len(test_files)} görüntü")  # Test seti sayısını yazdırır
-    
-    # Her set için dosyaları kopyala
-    sets = {
-        'train': train_files,
-        'valid': valid_files,
-        'test': test_files
-    }  # Setleri bir sözlükte saklar
-    
+
+    # Aynı kaynaktan türeyen görüntüler aynı sete atanır
+    oranlar = (train_ratio, valid_ratio, test_ratio)
+    sets = {set_adi: [] for set_adi in SETLER}
+    gruplar = {}
+    kumeler = kume_anahtarlari(tekrar_raporu) if tekrar_raporu else {}
+    for img_file in image_files:
+        grup = grup_anahtari(img_file.name)
+        grup = kumeler.get(grup, grup)
+        if grup not in gruplar:
+            gruplar[grup] = set_sec(grup, oranlar, tohum)
+        sets[gruplar[grup]].append(img_file)
+
+    print(f"Toplam {len(image_files)} görüntü, {len(gruplar)} kaynak grubu bulundu.")  # Toplam görüntü sayısını yazdırır
+    print(f"Eğitim seti: {len(sets['train'])} görüntü")  # Eğitim seti sayısını yazdırır
+    print(f"Doğrulama seti: {len(sets['valid'])} görüntü")  # Doğrulama seti sayısını yazdırır
+    print(f"Test seti: {len(sets['test'])} görüntü")  # Test seti sayısını yazdırır
+
+    if mod == 'liste':
+        _liste_yaz(output_dir, images_dir, labels_dir, sets)
+        return sets
+
     for set_name, files in sets.items():
         # Hedef klasörler
         set_images_dir = os.path.join(output_dir, set_name, 'images')  # Görüntü dosyaları için hedef dizin
@@ -48,29 +172,43 @@ def split_dataset(images_dir, labels_dir, output_dir, train_ratio=0.7, valid_rat
         # Klasörleri oluştur
         os.makedirs(set_images_dir, exist_ok=True)  # Görüntü dizinini oluşturur
         os.makedirs(set_labels_dir, exist_ok=True)  # Etiket dizinini oluşturur
-        
-        print(f"\n{set_name} seti için dosyalar kopyalanıyor...")  # Hedef set için bilgi verir
+
+        # Önceki bölmeden kalıp artık bu sete ait olmayan dosyaları sil
+        gecerli = {f.name for f in files} | {f"{f.stem}.txt" for f in files}
+        for klasor in (set_images_dir, set_labels_dir):
+            for eski in os.listdir(klasor):
+                if eski not in gecerli:
+                    os.remove(os.path.join(klasor, eski))
+
+        print(f"\n{set_name} seti için dosyalar yerleştiriliyor ({mod})...")  # Hedef set için bilgi verir
         for img_file in tqdm(files, desc=f"{set_name} seti"):  # Her set için döngü
-            # Görüntü dosyasını kopyala
-            shutil.copy2(img_file, set_images_dir)  # Görüntü dosyasını kopyalar
-            
-            # Etiket dosyasını kopyala
+            # Görüntü dosyasını yerleştir
+            _yerlestir(img_file, os.path.join(set_images_dir, img_file.name), mod)
+
+            # Etiket dosyasını yerleştir
             label_file = Path(labels_dir) / f"{img_file.stem}.txt"  # Etiket dosyasının yolunu oluşturur
             if label_file.exists():
-                shutil.copy2(label_file, set_labels_dir)  # Etiket dosyasını kopyalar
+                _yerlestir(label_file, os.path.join(set_labels_dir, label_file.name), mod)
             else:
                 print(f"Uyarı: {label_file} bulunamadı!")  # Eğer etiket dosyası yoksa uyarı verir
+    return sets
 
 if __name__ == "__main__":
-    # Klasör yolları
-    images_dir = "dataset/images"  # Görüntü dosyalarının bulunduğu dizin
-    labels_dir = "dataset/labels_yolo"  # Etiket dosyalarının bulunduğu dizin
-    output_dir = "yolov8_dataset"  # Çıktı dizininin adı
-    
+    parser = argparse.ArgumentParser(description="Veri setini eğitim, doğrulama ve test setlerine böler")
+    parser.add_argument('--goruntuler', default="dataset/images", help="Görüntü dosyalarının bulunduğu dizin")
+    parser.add_argument('--etiketler', default="dataset/labels_yolo", help="Etiket dosyalarının bulunduğu dizin")
+    parser.add_argument('--cikti', default="yolov8_dataset", help="Çıktı dizininin adı")
+    parser.add_argument('--mod', choices=MODLAR, default='hardlink',
+                        help="kopya, hardlink, symlink veya liste (yalnızca YOLO liste dosyaları)")
+    parser.add_argument('--tohum', type=int, default=42, help="Bölmeyi belirleyen tohum")
+    parser.add_argument('--tekrar-raporu', help="veri_seti_araci.py tara raporu (kopyaları aynı sete toplar)")
+    args = parser.parse_args()
+
     # Veri setini böl
-    split_dataset(images_dir, labels_dir, output_dir)  # Veri setini böler
-    
+    split_dataset(args.goruntuler, args.etiketler, args.cikti, mod=args.mod, tohum=args.tohum,
+                  tekrar_raporu=args.tekrar_raporu)  # Veri setini böler
+
     # classes.txt dosyasını kopyala
-    shutil.copy2(os.path.join(labels_dir, "classes.txt"), output_dir)  # Sınıf dosyasını kopyalar
-    
-    print("\nVeri seti bölme işlemi tamamlandı!")  # İşlem tamamlandığında mesaj gösterir 
\ No newline at end of file
+    shutil.copy2(os.path.join(args.etiketler, "classes.txt"), args.cikti)  # Sınıf dosyasını kopyalar
+
+    print("\nVeri seti bölme işlemi tamamlandı!")  # İşlem tamamlandığında mesaj gösterir
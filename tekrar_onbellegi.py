@@ -0,0 +1,114 @@
+# Bu dosya, aynı plakanın belirli bir süre içinde yeniden izin kontrolüne ve kayda gönderilmesini engelleyen,
+# süre dolunca ve boyut sınırı aşılınca eski kayıtları atan plaka başına tekrar önbelleğini içerir.
+
+import threading  # Çoklu akışta aynı önbelleğe erişimi korumak için kullanılır
+import time  # Kayıtların süresini ölçmek için kullanılır
+from collections import OrderedDict  # Kayıtları eklenme sırasıyla tutmak için kullanılır
+
+
+class TekrarOnbellegi:
+    """
+    Son pencere saniyede karar verilen plakaları ve izin durumlarını tutar.
+
+    Bütün kayıtların süresi aynı olduğu için eklenme sırası aynı zamanda sona erme sırasıdır;
+    süresi dolan kayıtlar baştan atılır. Kayıt sayısı en_fazla değerini aşarsa en eski kayıt atılır.
+    Bir plaka pencere içinde yeniden görülünce süresi uzatılmaz, böylece kapıda bekleyen bir araç
+    her pencerede en fazla bir kez kaydedilir.
+    """
+
+    def __init__(self, pencere=30.0, en_fazla=10000):
+        """
+        Parametreler:
+            pencere (float): Aynı plakanın yeniden kontrol edilip kaydedilmeyeceği süre (saniye)
+            en_fazla (int): Önbellekteki en fazla plaka sayısı
+        """
+        self.pencere = pencere
+        self.en_fazla = en_fazla
+        self._kayitlar = OrderedDict()  # Plaka → (karar zamanı, izin durumu)
+        self._kilit = threading.Lock()
+
+        # Sayaçlar
+        self.isabet = 0  # Pencere içinde yeniden görülen (kontrol ve kayıt yapılmayan) plaka sayısı
+        self.iska = 0  # İlk kez veya pencere dolduktan sonra görülen plaka sayısı
+        self.sure_dolan = 0  # Süresi dolduğu için atılan kayıt sayısı
+        self.tasan = 0  # Boyut sınırı yüzünden atılan kayıt sayısı
+
+    @classmethod
+    def ayarlardan(cls, ayarlar):
+        """
+        Ayarlardaki 'izin' bölümüne göre önbellek oluşturur.
+
+        Dönüş:
+            TekrarOnbellegi: Önbellek, tekrar_penceresi 0 ise None
+        """
+        izin = ayarlar['izin']
+        if not izin['tekrar_penceresi']:
+            return None
+        return cls(izin['tekrar_penceresi'], izin['tekrar_en_fazla'])
+
+    def _temizle(self, simdi):
+        """Süresi dolan kayıtları baştan atar."""
+        while self._kayitlar:
+            plaka, (zaman, _) = next(iter(self._kayitlar.items()))
+            if simdi - zaman < self.pencere:
+                break
+            del self._kayitlar[plaka]
+            self.sure_dolan += 1
+
+    def bul(self, plaka, simdi=None):
+        """
+        Plaka pencere içinde karar verilmişse önceki izin durumunu döndürür.
+
+        Parametreler:
+            plaka (str): Plaka
+            simdi (float): Şimdiki zaman (varsayılan time.monotonic())
+
+        Dönüş:
+            bool veya None: Önceki izin durumu, plaka pencere içinde görülmediyse None
+        """
+        simdi = time.monotonic() if simdi is None else simdi
+        with self._kilit:
+            self._temizle(simdi)
+            kayit = self._kayitlar.get(plaka)
+            if kayit is None:
+                self.iska += 1
+                return None
+            self.isabet += 1
+            return kayit[1]
+
+    def ekle(self, plaka, izin_durumu, simdi=None):
+        """
+        Plakanın kararını pencere süresince saklar.
+
+        Parametreler:
+            plaka (str): Plaka
+            izin_durumu (bool): Verilen izin kararı
+            simdi (float): Şimdiki zaman (varsayılan time.monotonic())
+        """
+        simdi = time.monotonic() if simdi is None else simdi
+        with self._kilit:
+            self._kayitlar.pop(plaka, None)
+            self._kayitlar[plaka] = (simdi, izin_durumu)
+            while len(self._kayitlar) > self.en_fazla:
+                self._kayitlar.popitem(last=False)
+                self.tasan += 1
+
+    def sifirla(self):
+        """Bütün kayıtları siler (örn. izin listesi elle değiştirildiğinde)."""
+        with self._kilit:
+            self._kayitlar.clear()
+
+    def istatistikler(self):
+        """
+        Dönüş:
+            dict: Önbellekteki plaka sayısı, isabet / ıska sayıları ve isabet oranı
+        """
+        toplam = self.isabet + self.iska
+        return {
+            'plaka_sayisi': len(self._kayitlar),
+            'isabet': self.isabet,
+            'iska': self.iska,
+            'isabet_orani': self.isabet / toplam if toplam else 0.0,
+            'sure_dolan': self.sure_dolan,
+            'tasan': self.tasan,
+        }
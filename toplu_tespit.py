@@ -0,0 +1,320 @@
+# Bu dosya, görüntü klasörleri ve video dosyaları üzerinde arayüz açmadan, çok işlemli toplu plaka tespiti yapar.
+
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import csv  # Sonuçları CSV olarak yazmak için kullanılır
+import glob  # Joker karakterli yolları çözmek için kullanılır
+import hashlib  # Çıktı dosya adlarını kaynak klasöre göre ayırmak için kullanılır
+import json  # Sonuçları JSONL olarak yazmak için kullanılır
+import multiprocessing  # İşçi süreç havuzu için kullanılır
+import multiprocessing.util  # İşçi kapanırken temizlik yapmak için kullanılır
+import os  # Dosya ve dizin işlemleri için kullanılır
+import sys  # Standart çıktıya yazmak için kullanılır
+import time  # Zaman ölçümleri için kullanılır
+from pathlib import Path  # Dosya yollarını yönetmek için kullanılır
+import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
+
+GORUNTU_UZANTILARI = {'.jpg', '.jpeg', '.png'}  # İşlenecek görüntü uzantıları
+VIDEO_UZANTILARI = {'.mp4', '.avi', '.mov'}  # İşlenecek video uzantıları
+CSV_ALANLARI = ['kaynak', 'kare', 'plaka_sayisi', 'plakalar', 'izinler', 'okuma_ms', 'tespit_ms', 'isci']
+
+# Her işçi süreçte bir kez oluşturulan tespit nesnesi ve ayarlar
+_uygulama = None
+_ayarlar = {}
+_yukleme_hatasi = None  # İşçide modeller yüklenemediyse hata mesajı
+
+
+def girdileri_coz(girdiler, ozyinelemeli=False):
+    """
+    Klasör, joker karakterli yol ve dosya girdilerini görüntü ve video listelerine ayırır.
+
+    Parametreler:
+        girdiler (list): Klasör, glob veya dosya yolları
+        ozyinelemeli (bool): Klasörlerin alt klasörleri de taransın mı
+
+    Dönüş:
+        tuple: (görüntü yolları, video yolları)
+    """
+    dosyalar = []
+    for girdi in girdiler:
+        if os.path.isdir(girdi):
+            desen = '**/*' if ozyinelemeli else '*'
+            dosyalar.extend(str(p) for p in Path(girdi).glob(desen) if p.is_file())
+        elif os.path.isfile(girdi):
+            dosyalar.append(girdi)
+        else:
+            eslesenler = glob.glob(girdi, recursive=True)
+            if not eslesenler:
+                print(f"Uyarı: {girdi} için dosya bulunamadı!", file=sys.stderr)
+            dosyalar.extend(eslesenler)
+
+    # Aynı dosyayı iki kez işlememek için sıralı ve tekil hale getir
+    dosyalar = sorted(set(dosyalar))
+    goruntuler = [d for d in dosyalar if Path(d).suffix.lower() in GORUNTU_UZANTILARI]
+    videolar = [d for d in dosyalar if Path(d).suffix.lower() in VIDEO_UZANTILARI]
+    return goruntuler, videolar
+
+
+def gorevleri_olustur(goruntuler, videolar, parca_boyutu, video_parcasi):
+    """
+    Dosyaları işçilere dağıtılacak görevlere böler.
+
+    Parametreler:
+        goruntuler (list): Görüntü yolları
+        videolar (list): Video yolları
+        parca_boyutu (int): Bir görevdeki görüntü sayısı
+        video_parcasi (int): Bir görevdeki video karesi sayısı
+
+    Dönüş:
+        list: ('goruntu', [yollar]) veya ('video', yol, baslangic, bitis) görevleri
+    """
+    gorevler = []
+    for i in range(0, len(goruntuler), parca_boyutu):
+        gorevler.append(('goruntu', goruntuler[i:i + parca_boyutu]))
+    for video in videolar:
+        cap = cv2.VideoCapture(video)
+        kare_sayisi = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        cap.release()
+        if kare_sayisi <= 0:
+            # Kare sayısı bilinmiyorsa videonun tamamı tek görev olur
+            gorevler.append(('video', video, 0, None))
+            continue
+        for baslangic in range(0, kare_sayisi, video_parcasi):
+            gorevler.append(('video', video, baslangic, min(baslangic + video_parcasi, kare_sayisi)))
+    return gorevler
+
+
+def _isci_baslat(ayarlar):
+    """
+    İşçi süreç başlarken modelleri bir kez yükler.
+
+    Parametreler:
+        ayarlar (dict): Komut satırı ayarları
+    """
+    global _uygulama, _ayarlar, _yukleme_hatasi
+    _ayarlar = ayarlar
+
+    # Süreçler aynı çekirdekleri paylaşmasın diye iş parçacığı sayısını sınırla
+    cv2.setNumThreads(ayarlar['is_parcacigi'])
+    try:
+        import torch  # PyTorch, YOLO modeli tarafından kullanılır
+        torch.set_num_threads(ayarlar['is_parcacigi'])
+    except ImportError:
+        pass
+
+    # Başlatıcıda hata fırlatılırsa havuz işçiyi sonsuza kadar yeniden başlatır; bu yüzden hata saklanır
+    # ve ilk görevde sonuç olarak ana sürece iletilir
+    try:
+        from plaka_tespit_test import PlakaTespitTest  # Tespit sınıfı
+        from db_operations import PlakaTespitDB, BosVeritabani  # Veritabanı sınıfları
+
+        from ayarlar import ayarlari_yukle  # İzin ve tekrar ayarları için
+
+        db = PlakaTespitDB.ayarlardan(ayarlari_yukle()) if ayarlar['veritabani'] else BosVeritabani()
+        # İşçi süreç düzgün kapanırken kuyruktaki kayıtlar yazılsın
+        multiprocessing.util.Finalize(None, db.kapat, exitpriority=10)
+        _uygulama = PlakaTespitTest(arayuz=False, db=db)
+        if not _uygulama.modeller_hazir.is_set():
+            _yukleme_hatasi = f"Modeller yüklenemedi: {_uygulama.yukleme_hatasi}"
+            return
+        _uygulama.kaynak_ayarla(ayarlar['kamera'])  # Kayıtlar sabit bir kameradansa onun ilgi bölgesi kullanılır
+    except Exception as e:
+        _yukleme_hatasi = f"İşçi başlatılamadı: {e}"
+
+
+def cikti_adi(kaynak, kare_no=None):
+    """
+    İşlenmiş görüntünün dosya adını oluşturur. Farklı klasörlerdeki aynı adlı dosyalar birbirinin üzerine
+    yazılmasın diye ada kaynak klasörün kısa bir özeti eklenir.
+
+    Parametreler:
+        kaynak (str): Görüntü veya video yolu
+        kare_no (int): Video karesi numarası, görüntülerde None
+
+    Dönüş:
+        str: Dosya adı (örn. 'sonuc_arac_3f2a1c9b.jpg')
+    """
+    klasor = os.path.dirname(os.path.abspath(kaynak))
+    ozet = hashlib.sha1(klasor.encode('utf-8')).hexdigest()[:8]
+    yol = Path(kaynak)
+    if kare_no is None:
+        return f"sonuc_{yol.stem}_{ozet}{yol.suffix}"
+    return f"sonuc_{yol.stem}_{ozet}_{kare_no:06d}.jpg"
+
+
+def _kareyi_isle(goruntu, kaynak, kare_no, okuma_suresi, takip):
+    """
+    Tek bir kare üzerinde tespit yapar ve sonuç kaydını oluşturur.
+
+    Dönüş:
+        dict: Sonuç kaydı
+    """
+    baslangic = time.perf_counter()
+    islenmis, plaka_sayisi = _uygulama.tespit_et(goruntu, takip=takip)
+    tespit_suresi = time.perf_counter() - baslangic
+
+    # İstenirse işlenmiş görüntüyü kaydet
+    if _ayarlar['kaydet']:
+        os.makedirs(_ayarlar['cikti_klasoru'], exist_ok=True)  # Dizin yoksa oluşturur
+        cv2.imwrite(os.path.join(_ayarlar['cikti_klasoru'], cikti_adi(kaynak, kare_no)), islenmis)
+
+    tespitler = [t for t in _uygulama.son_tespitler if t['plaka']]
+    return {
+        'kaynak': kaynak,
+        'kare': kare_no,
+        'plaka_sayisi': plaka_sayisi,
+        'plakalar': [t['plaka'] for t in tespitler],
+        'izinler': [t['izinli'] for t in tespitler],
+        'okuma_ms': round(okuma_suresi * 1000, 2),
+        'tespit_ms': round(tespit_suresi * 1000, 2),
+        'isci': os.getpid(),
+    }
+
+
+def _gorevi_isle(gorev):
+    """
+    Bir görevi (görüntü grubu veya video parçası) işler.
+
+    Parametreler:
+        gorev (tuple): gorevleri_olustur tarafından üretilen görev
+
+    Dönüş:
+        list: Görevdeki her kare için sonuç kaydı
+    """
+    if _yukleme_hatasi is not None:
+        # Hata ana sürece iletilir; ana süreç havuzu sonlandırıp çıkar
+        raise RuntimeError(_yukleme_hatasi)
+
+    sonuclar = []
+    if gorev[0] == 'goruntu':
+        for yol in gorev[1]:
+            baslangic = time.perf_counter()
+            goruntu = cv2.imread(yol)  # Fotoğrafı okur
+            okuma_suresi = time.perf_counter() - baslangic
+            if goruntu is None:
+                sonuclar.append({'kaynak': yol, 'kare': None, 'hata': 'okunamadi'})
+                continue
+            sonuclar.append(_kareyi_isle(goruntu, yol, None, okuma_suresi, takip=False))
+        return sonuclar
+
+    _, yol, baslangic_kare, bitis_kare = gorev
+    cap = cv2.VideoCapture(yol)  # Video dosyasını açar
+    if not cap.isOpened():
+        return [{'kaynak': yol, 'kare': baslangic_kare, 'hata': 'acilamadi'}]
+    if baslangic_kare:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, baslangic_kare)  # Parçanın başına git
+
+    _uygulama.takipci.sifirla()  # Her video parçası kendi izleriyle başlar
+    kare_no = baslangic_kare
+    adim = _ayarlar['adim']
+    while bitis_kare is None or kare_no < bitis_kare:
+        baslangic = time.perf_counter()
+        if (kare_no - baslangic_kare) % adim:
+            # Atlanan karelerin yalnızca yakalanması, çözülmemesi yeterlidir
+            if not cap.grab():
+                break
+            kare_no += 1
+            continue
+        ret, frame = cap.read()  # Videodan görüntü alır
+        okuma_suresi = time.perf_counter() - baslangic
+        if not ret:
+            break
+        sonuclar.append(_kareyi_isle(frame, yol, kare_no, okuma_suresi, takip=True))
+        kare_no += 1
+    cap.release()
+    return sonuclar
+
+
+class SonucYazici:
+    """Sonuçları geldikçe JSONL veya CSV biçiminde bir dosyaya (veya standart çıktıya) yazar."""
+
+    def __init__(self, yol, bicim):
+        """
+        Parametreler:
+            yol (str): Çıktı dosyası, '-' ise standart çıktı
+            bicim (str): 'jsonl' veya 'csv'
+        """
+        self.dosya = sys.stdout if yol == '-' else open(yol, 'w', newline='', encoding='utf-8')
+        self.bicim = bicim
+        if bicim == 'csv':
+            self.csv = csv.DictWriter(self.dosya, fieldnames=CSV_ALANLARI + ['hata'], extrasaction='ignore')
+            self.csv.writeheader()
+
+    def yaz(self, kayit):
+        """Tek bir sonuç kaydını yazar."""
+        if self.bicim == 'jsonl':
+            self.dosya.write(json.dumps(kayit, ensure_ascii=False) + '\n')
+        else:
+            satir = dict(kayit)
+            for alan in ('plakalar', 'izinler'):
+                if alan in satir:
+                    satir[alan] = ';'.join(str(d) for d in satir[alan])
+            self.csv.writerow(satir)
+        self.dosya.flush()
+
+    def kapat(self):
+        """Dosyayı kapatır."""
+        if self.dosya is not sys.stdout:
+            self.dosya.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Arayüzsüz toplu plaka tespiti")
+    parser.add_argument('girdiler', nargs='+', help="Klasör, glob deseni veya görüntü/video dosyası")
+    parser.add_argument('-o', '--cikti', default='toplu_sonuclar.jsonl', help="Sonuç dosyası (.jsonl veya .csv), '-' ise standart çıktı")
+    parser.add_argument('--bicim', choices=['jsonl', 'csv'], help="Çıktı biçimi (verilmezse uzantıdan anlaşılır)")
+    parser.add_argument('-j', '--isci', type=int, default=max(os.cpu_count() // 2, 1), help="İşçi süreç sayısı")
+    parser.add_argument('--is-parcacigi', type=int, default=1, help="İşçi başına iş parçacığı sayısı")
+    parser.add_argument('--parca', type=int, default=16, help="Bir görevdeki görüntü sayısı")
+    parser.add_argument('--video-parcasi', type=int, default=500, help="Bir görevdeki video karesi sayısı")
+    parser.add_argument('--adim', type=int, default=1, help="Videolarda her N karede bir tespit yap")
+    parser.add_argument('--ozyinelemeli', action='store_true', help="Klasörleri alt klasörleriyle birlikte tara")
+    parser.add_argument('--kaydet', action='store_true', help="İşlenmiş görüntüleri kaydet")
+    parser.add_argument('--cikti-klasoru', default='test_sonuclari', help="İşlenmiş görüntülerin kaydedileceği dizin")
+    parser.add_argument('--veritabani', action='store_true', help="İzin kontrolü ve kayıt için veritabanını kullan")
+    parser.add_argument('--kamera', help="Ayarlardaki 'kameralar' bölümünden ilgi bölgesi ve imgsz alınacak kaynak")
+    args = parser.parse_args()
+
+    bicim = args.bicim or ('csv' if args.cikti.endswith('.csv') else 'jsonl')
+    goruntuler, videolar = girdileri_coz(args.girdiler, args.ozyinelemeli)
+    gorevler = gorevleri_olustur(goruntuler, videolar, args.parca, args.video_parcasi)
+    print(f"{len(goruntuler)} görüntü, {len(videolar)} video, {len(gorevler)} görev, {args.isci} işçi.",
+          file=sys.stderr)
+    if not gorevler:
+        return
+
+    ayarlar = {
+        'is_parcacigi': args.is_parcacigi,
+        'kaydet': args.kaydet,
+        'cikti_klasoru': args.cikti_klasoru,
+        'veritabani': args.veritabani,
+        'adim': max(args.adim, 1),
+        'kamera': args.kamera,
+    }
+
+    yazici = SonucYazici(args.cikti, bicim)
+    baslangic = time.perf_counter()
+    kare_sayisi = 0
+    try:
+        with multiprocessing.Pool(args.isci, initializer=_isci_baslat, initargs=(ayarlar,)) as havuz:
+            # Sonuçlar görevler bittikçe yazılır
+            for sonuclar in havuz.imap_unordered(_gorevi_isle, gorevler):
+                for kayit in sonuclar:
+                    yazici.yaz(kayit)
+                kare_sayisi += len(sonuclar)
+            # İşçilerin kayıt kuyruklarını boşaltarak kapanmasını bekle
+            havuz.close()
+            havuz.join()
+    except RuntimeError as e:
+        # Bir işçide modeller yüklenemedi; with bloğu havuzu sonlandırır
+        print(f"Hata: {e}", file=sys.stderr)
+        sys.exit(2)
+    finally:
+        yazici.kapat()
+
+    sure = time.perf_counter() - baslangic
+    print(f"{kare_sayisi} kare {sure:.1f} sn'de işlendi ({kare_sayisi / max(sure, 1e-9):.2f} kare/sn).",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
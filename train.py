@@ -1,3 +1,7 @@
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import json  # Önbellek manifestini okumak ve yazmak için kullanılır
+import multiprocessing  # Görüntüleri paralel okumak için kullanılır
+import time  # Süre ölçümleri için kullanılır
 import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
 import numpy as np  # Numpy kütüphanesini matematiksel işlemler için kullanır
 from sklearn.ensemble import RandomForestClassifier  # Random Forest sınıflandırıcı modelini kullanmak için gerekli kütüphane
@@ -6,42 +10,202 @@ from sklearn.metrics import accuracy_score  # Modelin doğruluğunu hesaplamak i
 import os  # Dosya ve dizin işlemleri için kullanılır
 import joblib  # Modeli kaydetmek ve yüklemek için kullanılır
 
-# Bu dosya, plaka tespit modelinin eğitimini gerçekleştirir. Eğitim verilerini kullanarak modelin öğrenmesini sağlar.
+# Bu dosya, plaka karakterlerini tanıyan Random Forest modelinin eğitimini gerçekleştirir.
+# Karakter görüntülerinden çıkarılan özellikler önbelleğe alınır; sonraki çalıştırmalarda
+# yalnızca yeni eklenen veya değişen görüntüler yeniden okunur.
 
-# Karakter görüntülerinin bulunduğu dizin
-# Artırılmış görüntülerin dizini
+KARAKTER_BOYUTU = (20, 20)  # Karakter görüntülerinin ölçekleneceği boyut
+OZELLIK_SAYISI = KARAKTER_BOYUTU[0] * KARAKTER_BOYUTU[1]  # Bir görüntüdeki özellik (piksel) sayısı
+ONBELLEK_KLASORU = '.ozellik_onbellegi'  # Özellik matrisinin ve manifestin tutulduğu klasör
+UZANTILAR = ('.jpg', '.jpeg', '.png')  # Görüntü sayılan dosya uzantıları
 
-data_dir = 'karakter-veriseti-artirilm'  # Artırılmış görüntülerin dizini
-labels = []  # Etiketleri saklamak için liste
-images = []  # Görüntüleri saklamak için liste
 
-# Veri setini yükleme
-for label in os.listdir(data_dir):  # Her etiket dizinini döngü ile gezer
-    label_dir = os.path.join(data_dir, label)  # Etiket dizinini oluşturur
-    for image_file in os.listdir(label_dir):  # Her etiket altındaki görüntü dosyalarını döngü ile gezer
-        image_path = os.path.join(label_dir, image_file)  # Görüntü dosyasının tam yolunu oluşturur
-        image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)  # Görüntüyü gri tonlamada okur
-        image = cv2.resize(image, (20, 20))  # Görüntü boyutunu ayarlama
-        images.append(image.flatten())  # Görüntüyü düzleştirip listeye ekler
-        labels.append(label)  # Etiket ekleme
+def dosyalari_listele(data_dir):
+    """
+    Veri setindeki görüntü dosyalarını etiketleri ve değişiklik bilgileriyle listeler.
+    Gizli dosyalar (nokta ile başlayan) ve görüntü uzantısı taşımayan dosyalar (örn. Thumbs.db) atlanır.
 
-# Verileri numpy dizisine dönüştürme
-X = np.array(images)  # Görüntüleri numpy dizisine çevirir
-y = np.array(labels)  # Etiketleri numpy dizisine çevirir
+    Parametreler:
+        data_dir (str): Her etiket için bir alt klasör içeren veri seti dizini
 
-# Eğitim ve test setlerine ayırma
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)  # Veriyi eğitim ve test setlerine ayırır
+    Dönüş:
+        list: (göreli yol, etiket, [değişiklik zamanı, boyut]) demetleri
+    """
+    dosyalar = []
+    for etiket_girdisi in sorted(os.scandir(data_dir), key=lambda g: g.name):  # Her etiket dizinini gezer
+        if not etiket_girdisi.is_dir() or etiket_girdisi.name.startswith('.'):
+            continue
+        for girdi in sorted(os.scandir(etiket_girdisi.path), key=lambda g: g.name):
+            if (girdi.name.startswith('.') or os.path.splitext(girdi.name)[1].lower() not in UZANTILAR
+                    or not girdi.is_file()):
+                continue
+            bilgi = girdi.stat()
+            dosyalar.append((f"{etiket_girdisi.name}/{girdi.name}", etiket_girdisi.name,
+                             [bilgi.st_mtime_ns, bilgi.st_size]))
+    return dosyalar
 
-# Random Forest modelini oluşturma ve eğitme
-model = RandomForestClassifier(n_estimators=100, random_state=42)  # Random Forest modelini oluşturur
-model.fit(X_train, y_train)  # Modeli eğitim verileri ile eğitir
 
-# Test seti ile tahmin yapma
-y_pred = model.predict(X_test)  # Test verileri ile tahmin yapar
+def _ozellik_cikar(yol):
+    """
+    Görüntüyü gri tonlamada okuyup 20x20 boyutuna getirir ve düzleştirir.
 
-# Doğruluğu hesaplama
-accuracy = accuracy_score(y_test, y_pred)  # Modelin doğruluğunu hesaplar
-print(f'Model doğruluğu: {accuracy * 100:.2f}%')  # Doğruluğu ekrana yazdırır
+    Parametreler:
+        yol (str): Görüntü dosyasının yolu
 
-# Modeli .pkl dosyası olarak kaydetme
-joblib.dump(model, '2random_forest_model.pkl')  # Eğitilmiş modeli dosyaya kaydeder 
\ No newline at end of file
+    Dönüş:
+        numpy.ndarray: 400 elemanlı uint8 özellik vektörü, okunamazsa None
+    """
+    image = cv2.imread(yol, cv2.IMREAD_GRAYSCALE)  # Görüntüyü gri tonlamada okur
+    if image is None:
+        return None
+    return cv2.resize(image, KARAKTER_BOYUTU).flatten()  # Görüntü boyutunu ayarlayıp düzleştirir
+
+
+def _isci_baslat():
+    """Her işçi süreçte OpenCV'nin kendi iş parçacıklarını kapatır."""
+    cv2.setNumThreads(1)
+
+
+def veri_setini_yukle(data_dir, onbellek_klasoru=ONBELLEK_KLASORU, isci=None):
+    """
+    Özellik matrisini ve etiketleri döndürür. Önbellekte aynı değişiklik zamanı ve boyutla
+    kayıtlı görüntüler yeniden okunmaz, yeni veya değişen görüntüler paralel olarak okunur.
+
+    Parametreler:
+        data_dir (str): Veri seti dizini
+        onbellek_klasoru (str): Önbellek klasörü, None ise önbellek kullanılmaz
+        isci (int): Görüntüleri okuyacak süreç sayısı (varsayılan: işlemci sayısı)
+
+    Dönüş:
+        tuple: (X, y, istatistikler)
+    """
+    dosyalar = dosyalari_listele(data_dir)
+
+    # Önceki çalıştırmanın manifestini ve özellik matrisini yükle
+    eski_manifest, eski_ozellikler = {}, None
+    if onbellek_klasoru:
+        manifest_yolu = os.path.join(onbellek_klasoru, 'manifest.json')
+        ozellik_yolu = os.path.join(onbellek_klasoru, 'ozellikler.npy')
+        try:
+            with open(manifest_yolu, encoding='utf-8') as dosya:
+                manifest = json.load(dosya)
+            eski_ozellikler = np.load(ozellik_yolu, mmap_mode='r')  # Bellek eşlemeli okuma
+            # Matris manifestle uyuşmuyorsa (örn. yarım kalan yazma) önbellek yok sayılır
+            if eski_ozellikler.shape == (manifest['satir_sayisi'], OZELLIK_SAYISI):
+                eski_manifest = manifest['dosyalar']
+            else:
+                eski_ozellikler = None
+        except (OSError, ValueError, KeyError):
+            eski_manifest, eski_ozellikler = {}, None
+
+    # Önbellekte olan ve yeniden okunması gereken dosyaları ayır
+    eski_satirlar, yeni_sira, okunacaklar = [], [], []
+    for sira, (goreli_yol, _, imza) in enumerate(dosyalar):
+        kayit = eski_manifest.get(goreli_yol)
+        if kayit is not None and kayit['imza'] == imza:
+            eski_satirlar.append((sira, kayit['satir']))
+        else:
+            yeni_sira.append(sira)
+            okunacaklar.append(os.path.join(data_dir, goreli_yol))
+
+    X = np.empty((len(dosyalar), OZELLIK_SAYISI), dtype=np.uint8)
+    gecerli = np.ones(len(dosyalar), dtype=bool)
+    if eski_satirlar:
+        hedef, kaynak = (np.array(s) for s in zip(*eski_satirlar))
+        X[hedef] = eski_ozellikler[kaynak]  # Önbellekteki satırları kopyala
+
+    if okunacaklar:
+        isci = isci or os.cpu_count()
+        if isci > 1 and len(okunacaklar) > 200:
+            with multiprocessing.Pool(isci, initializer=_isci_baslat) as havuz:
+                ozellikler = havuz.map(_ozellik_cikar, okunacaklar, chunksize=64)
+        else:
+            ozellikler = [_ozellik_cikar(yol) for yol in okunacaklar]
+        for sira, ozellik, yol in zip(yeni_sira, ozellikler, okunacaklar):
+            if ozellik is None:
+                print(f"Görüntü okunamadı, atlanıyor: {yol}")
+                gecerli[sira] = False
+            else:
+                X[sira] = ozellik
+
+    y = np.array([etiket for _, etiket, _ in dosyalar])  # Etiketleri numpy dizisine çevirir
+    X, y = X[gecerli], y[gecerli]
+
+    # Önbelleği yeni dosya listesiyle güncelle (silinen dosyalar manifestten düşer)
+    if onbellek_klasoru and (okunacaklar or len(eski_manifest) != len(X)):
+        os.makedirs(onbellek_klasoru, exist_ok=True)
+        gecerli_dosyalar = [d for d, g in zip(dosyalar, gecerli) if g]
+        manifest = {
+            'satir_sayisi': len(X),
+            'dosyalar': {goreli_yol: {'imza': imza, 'satir': satir}
+                         for satir, (goreli_yol, _, imza) in enumerate(gecerli_dosyalar)},
+        }
+        del eski_ozellikler  # Üzerine yazmadan önce bellek eşlemesini bırak
+        # Yarım kalan yazmalar önbelleği bozmasın diye önce geçici dosyalara yazılır
+        np.save(os.path.join(onbellek_klasoru, 'ozellikler.tmp.npy'), X)
+        with open(os.path.join(onbellek_klasoru, 'manifest.tmp.json'), 'w', encoding='utf-8') as dosya:
+            json.dump(manifest, dosya)
+        os.replace(os.path.join(onbellek_klasoru, 'ozellikler.tmp.npy'), ozellik_yolu)
+        os.replace(os.path.join(onbellek_klasoru, 'manifest.tmp.json'), manifest_yolu)
+
+    istatistikler = {
+        'toplam': len(dosyalar),
+        'onbellekten': len(eski_satirlar),
+        'yeni_okunan': len(okunacaklar),
+        'okunamayan': int((~gecerli).sum()),
+    }
+    return X, y, istatistikler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Karakter tanıma modelinin eğitimi")
+    parser.add_argument('--veri', default='karakter-veriseti-artirilm', help="Artırılmış görüntülerin dizini")
+    parser.add_argument('--model', default='2random_forest_model.pkl', help="Kaydedilecek model dosyası")
+    parser.add_argument('--onbellek', default=ONBELLEK_KLASORU, help="Özellik önbelleği klasörü")
+    parser.add_argument('--onbelleksiz', action='store_true', help="Önbelleği kullanmadan bütün görüntüleri oku")
+    parser.add_argument('--isci', type=int, default=None, help="Görüntü okuma süreç sayısı")
+    parser.add_argument('--artir-kaynak', help="Ham karakter veri seti; verilirse artırma bellekte yapılır ve --veri kullanılmaz")
+    parser.add_argument('--n-jobs', type=int, default=-1, help="Eğitimde kullanılacak çekirdek sayısı (-1: hepsi)")
+    args = parser.parse_args()
+
+    sureler = {}
+
+    # Veri setini yükleme
+    baslangic = time.perf_counter()
+    if args.artir_kaynak:
+        # Artırılmış görüntüler diske yazılmadan doğrudan özellik matrisine dönüştürülür
+        from veri_artirma import artirilmis_ozellikler
+        X, y = artirilmis_ozellikler(args.artir_kaynak, isci=args.isci, boyut=KARAKTER_BOYUTU)
+        print(f"{len(X)} artırılmış görüntü bellekte üretildi.")
+    else:
+        X, y, istatistikler = veri_setini_yukle(args.veri, None if args.onbelleksiz else args.onbellek, args.isci)
+        print(f"{istatistikler['toplam']} görüntü: {istatistikler['onbellekten']} önbellekten, "
+              f"{istatistikler['yeni_okunan']} yeniden okundu, {istatistikler['okunamayan']} okunamadı.")
+    sureler['yukleme'] = time.perf_counter() - baslangic
+
+    # Eğitim ve test setlerine ayırma
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)  # Veriyi eğitim ve test setlerine ayırır
+
+    # Random Forest modelini oluşturma ve eğitme (ağaçlar bütün çekirdeklerde paralel eğitilir)
+    baslangic = time.perf_counter()
+    model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=args.n_jobs)  # Random Forest modelini oluşturur
+    model.fit(X_train, y_train)  # Modeli eğitim verileri ile eğitir
+    sureler['egitim'] = time.perf_counter() - baslangic
+
+    # Test seti ile tahmin yapma
+    baslangic = time.perf_counter()
+    y_pred = model.predict(X_test)  # Test verileri ile tahmin yapar
+    accuracy = accuracy_score(y_test, y_pred)  # Modelin doğruluğunu hesaplar
+    sureler['degerlendirme'] = time.perf_counter() - baslangic
+    print(f'Model doğruluğu: {accuracy * 100:.2f}%')  # Doğruluğu ekrana yazdırır
+
+    # Modeli .pkl dosyası olarak kaydetme
+    joblib.dump(model, args.model)  # Eğitilmiş modeli dosyaya kaydeder
+
+    print("Süreler:")
+    for asama, sure in sureler.items():
+        print(f"  {asama:<14}: {sure:.2f} sn")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,9 @@
 # Bu dosya, veri artırma tekniklerini uygular. Eğitim verilerini zenginleştirerek modelin daha iyi öğrenmesini sağlar.
 
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import hashlib  # Dönüşüm tariflerinin özetini çıkarmak için kullanılır
+import json  # Manifest ve tarif dosyalarını okumak ve yazmak için kullanılır
+import multiprocessing  # Görüntüleri paralel artırmak için kullanılır
 import cv2  # OpenCV kütüphanesini görüntü işleme için kullanır
 import numpy as np  # Numpy kütüphanesini matematiksel işlemler için kullanır
 from pathlib import Path  # Dosya yollarını yönetmek için kullanılır
@@ -34,78 +38,269 @@ def resize_image(image, scale):
     height = int(image.shape[0] * scale)  # Yeni yüksekliği hesaplar
     return cv2.resize(image, (width, height))  # Görüntüyü yeniden boyutlandırır
 
+def to_gray(image):
+    """Görüntüyü gri tonlamaya çevirir"""
+    if image.ndim == 2:
+        return image  # Zaten gri tonlamalı
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)  # Görüntüyü gri tonlamaya çevirir
+
+def binarize(image, threshold=128):
+    """Görüntüyü eşik değerine göre siyah-beyaz yapar"""
+    _, binary = cv2.threshold(to_gray(image), threshold, 255, cv2.THRESH_BINARY)  # Eşikleme ile binarize eder
+    return binary  # Binarize edilmiş görüntüyü döner
+
+# Tariflerde adıyla kullanılabilen dönüşümler
+DONUSUMLER = {
+    'olcekle': resize_image,  # parametre: scale
+    'gri': to_gray,
+    'ikili': binarize,  # parametre: threshold
+    'dondur': rotate_image,  # parametre: angle
+    'parlaklik': adjust_brightness,  # parametre: factor (yalnızca renkli görüntüler)
+    'gurultu': add_noise,  # parametre: noise_factor
+}
+
+# Her tarif sırayla uygulanacak [dönüşüm adı, parametreler] adımlarından oluşur; boş tarif orijinal görüntüdür.
+# Varsayılan tarifler eski 0-5 sıralı artırmalarla aynı çıktıyı üretir.
+VARSAYILAN_TARIFLER = [
+    [['olcekle', {'scale': 1.5}]],  # Boyut arttırma
+    [['gri', {}]],  # Gri tonlama
+    [['ikili', {'threshold': 128}]],  # Binarizasyon
+    [['dondur', {'angle': 15}]],  # Açı değiştirme +15
+    [['dondur', {'angle': -15}]],  # Açı değiştirme -15
+    [],  # Orijinal görüntü
+]
+
+def tarifleri_yukle(yol):
+    """
+    Dönüşüm tariflerini JSON dosyasından okur ve doğrular.
+
+    Parametreler:
+        yol (str): [[["dondur", {"angle": 5}], ["gurultu", {"noise_factor": 0.05}]], ...] biçiminde dosya
+
+    Dönüş:
+        list: Tarifler
+    """
+    with open(yol, encoding='utf-8') as dosya:
+        tarifler = json.load(dosya)
+    for tarif in tarifler:
+        for ad, _ in tarif:
+            if ad not in DONUSUMLER:
+                raise ValueError(f"Bilinmeyen dönüşüm: {ad} (geçerli: {', '.join(DONUSUMLER)})")
+    return tarifler
+
+def tarifi_uygula(image, tarif):
+    """
+    Tarifteki dönüşümleri sırayla uygular.
+
+    Parametreler:
+        image: Kaynak görüntü
+        tarif (list): [dönüşüm adı, parametreler] adımları
+
+    Dönüş:
+        numpy.ndarray: Artırılmış görüntü
+    """
+    for ad, parametreler in tarif:
+        image = DONUSUMLER[ad](image, **parametreler)
+    return image
+
 def create_augmented_image(image, index):
     """Görüntünün artırılmış versiyonunu oluşturur"""
-    if index == 0:  # Boyut arttırma
-        return resize_image(image, 1.5)  # Görüntüyü %50 büyütür
-    elif index == 1:  # Gri tonlama
-        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)  # Görüntüyü gri tonlamaya çevirir
-    elif index == 2:  # Binarizasyon
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)  # Görüntüyü gri tonlamaya çevirir
-        _, binary = cv2.threshold(gray, 128, 255, cv2.THRESH_BINARY)  # Eşikleme ile binarize eder
-        return binary  # Binarize edilmiş görüntüyü döner
-    elif index == 3:  # Açı değiştirme +15
-        return rotate_image(image, 15)  # Görüntüyü 15 derece döndürür
-    elif index == 4:  # Açı değiştirme -15
-        return rotate_image(image, -15)  # Görüntüyü -15 derece döndürür
-    else:
-        return image  # Diğer durumlar için orijinal görüntüyü döndür
-
-def augment_dataset(input_dir, output_dir, num_augmentations_per_image=6):
-    """Veri setindeki her görüntü için veri artırma işlemi yapar"""
+    if 0 <= index < len(VARSAYILAN_TARIFLER):
+        return tarifi_uygula(image, VARSAYILAN_TARIFLER[index])
+    return image  # Diğer durumlar için orijinal görüntüyü döndür
+
+def _tarif_ozeti(tarifler):
+    """Tariflerin değişip değişmediğini anlamak için kısa bir özet döndürür."""
+    return hashlib.sha1(json.dumps(tarifler, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+def _dosya_imzasi(yol):
+    """Dosyanın değişiklik zamanı ve boyutunu döndürür."""
+    bilgi = os.stat(yol)
+    return [bilgi.st_mtime_ns, bilgi.st_size]
+
+# İşçi süreçlerde kullanılan tarifler (havuz başlatılırken atanır)
+_tarifler = VARSAYILAN_TARIFLER
+
+def _isci_baslat(tarifler):
+    """İşçi süreçte tarifleri ayarlar ve OpenCV iş parçacıklarını kapatır."""
+    global _tarifler
+    _tarifler = tarifler
+    cv2.setNumThreads(1)
+
+def _goruntuyu_artir(gorev):
+    """
+    Bir görüntüyü bir kez okuyup her tarifle artırılmış halini diske yazar.
+
+    Parametreler:
+        gorev (tuple): (kaynak yol, çıktı dizini)
+
+    Dönüş:
+        tuple: (kaynak dosya adı, yazılan dosya sayısı, hata mesajı veya None)
+    """
+    img_path, output_path = gorev
+    image = cv2.imread(str(img_path))  # Görüntüyü okur
+    if image is None:
+        return img_path.name, 0, f"Hata: {img_path} okunamadı."
+    yazilan = 0
+    for i, tarif in enumerate(_tarifler):
+        try:
+            augmented = tarifi_uygula(image, tarif)  # Görüntüyü artırır
+            output_file = output_path / f"{img_path.stem}_aug_{i}{img_path.suffix}"  # Çıktı dosya yolunu oluşturur
+            cv2.imwrite(str(output_file), augmented)  # Artırılmış görüntüyü kaydeder
+            yazilan += 1
+        except Exception as e:
+            return img_path.name, yazilan, f"Görüntü artırma hatası ({img_path.name}, {i}): {str(e)}"
+    # Tarif sayısı azaldıysa önceki çalıştırmadan kalan fazla çıktıları sil
+    i = len(_tarifler)
+    while (output_path / f"{img_path.stem}_aug_{i}{img_path.suffix}").exists():
+        (output_path / f"{img_path.stem}_aug_{i}{img_path.suffix}").unlink()
+        i += 1
+    return img_path.name, yazilan, None
+
+def _kaynak_dosyalar(input_dir):
+    """Giriş dizinindeki JPG ve PNG dosyalarını sıralı olarak döndürür."""
+    input_path = Path(input_dir)
+    return sorted(list(input_path.glob('*.jpg')) + list(input_path.glob('*.png')))
+
+def _manifest_yolu(output_path):
+    """
+    Çıktı dizininin manifest dosyasını döndürür. Manifest sınıf klasörünün içine değil yanına yazılır
+    (örn. karakter-veriseti-artirilm/.arkaplan.artirma_manifest.json); böylece klasördeki her dosyayı
+    görüntü sayan train.py onu okumaya çalışmaz.
+    """
+    return output_path.parent / f".{output_path.name}.artirma_manifest.json"
+
+def augment_dataset(input_dir, output_dir, num_augmentations_per_image=6, tarifler=None, isci=None):
+    """
+    Veri setindeki her görüntü için veri artırma işlemi yapar.
+
+    Görüntüler süreç havuzunda paralel işlenir. Çıktı dizininin yanındaki manifest sayesinde
+    (bkz. _manifest_yolu) yalnızca yeni veya değişen kaynak görüntüler (ya da tarifler değiştiyse hepsi) yeniden artırılır.
+
+    Parametreler:
+        input_dir: Kaynak görüntülerin dizini
+        output_dir: Artırılmış görüntülerin yazılacağı dizin
+        num_augmentations_per_image (int): Tarif verilmezse varsayılan tariflerden kaç tanesinin kullanılacağı
+        tarifler (list): Dönüşüm tarifleri (varsayılan: VARSAYILAN_TARIFLER)
+        isci (int): Süreç sayısı (varsayılan: işlemci sayısı)
+    """
+    tarifler = tarifler if tarifler is not None else VARSAYILAN_TARIFLER[:num_augmentations_per_image]
     try:
         # Çıktı dizinini oluştur
         output_path = Path(output_dir)  # Çıktı dizinini Path nesnesi olarak oluşturur
         output_path.mkdir(parents=True, exist_ok=True)  # Dizin yoksa oluşturur
-        
-        # Giriş dizinindeki tüm görüntüleri işle
-        input_path = Path(input_dir)  # Giriş dizinini Path nesnesi olarak oluşturur
-        input_files = list(input_path.glob('*.jpg')) + list(input_path.glob('*.png'))  # Tüm JPG ve PNG dosyalarını alır
-        
+
+        input_files = _kaynak_dosyalar(input_dir)  # Tüm JPG ve PNG dosyalarını alır
         if not input_files:
             print(f"HATA: {input_dir} klasöründe hiç görüntü bulunamadı!")  # Eğer görüntü yoksa hata mesajı gösterir
             return
-        
-        print(f"Toplam {len(input_files)} görüntü bulundu.")  # Toplam görüntü sayısını yazdırır
-        print(f"Her görüntü için {num_augmentations_per_image} artırılmış versiyon oluşturulacak.")  # Her görüntü için kaç artırma yapılacağını belirtir
-        print(f"Toplam {len(input_files) * num_augmentations_per_image} yeni görüntü oluşturulacak.")  # Toplam yeni görüntü sayısını hesaplar
-        
-        for img_path in tqdm(input_files, desc="Görüntüler işleniyor"):  # Her görüntü için döngü
+
+        # Önceki çalıştırmanın manifestini oku; tarifler değiştiyse her şey yeniden üretilir
+        manifest_yolu = _manifest_yolu(output_path)
+        eski_yol = output_path / '.artirma_manifest.json'  # Eski sürümlerin sınıf klasörüne yazdığı manifest
+        okunacak_yol = manifest_yolu if manifest_yolu.exists() else eski_yol
+        ozet = _tarif_ozeti(tarifler)
+        manifest = {'tarif_ozeti': ozet, 'dosyalar': {}}
+        if okunacak_yol.exists():
             try:
-                # Görüntüyü oku
-                image = cv2.imread(str(img_path))  # Görüntüyü okur
-                if image is None:
-                    print(f"Hata: {img_path} okunamadı.")  # Eğer görüntü okunamazsa hata mesajı gösterir
-                    continue
-                
-                # Her görüntü için belirtilen sayıda artırılmış versiyon oluştur
-                for i in range(num_augmentations_per_image):  # Her görüntü için artırma döngüsü
-                    try:
-                        # Dönüşümü uygula
-                        augmented = create_augmented_image(image, i)  # Görüntüyü artırır
-                        
-                        # Yeni dosya adı oluştur
-                        new_filename = f"{img_path.stem}_aug_{i}{img_path.suffix}"  # Yeni dosya adını oluşturur
-                        output_file = output_path / new_filename  # Çıktı dosya yolunu oluşturur
-                        
-                        # Görüntüyü kaydet
-                        cv2.imwrite(str(output_file), augmented)  # Artırılmış görüntüyü kaydeder
-                    except Exception as e:
-                        print(f"Görüntü artırma hatası ({img_path.name}, {i}): {str(e)}")  # Hata mesajı gösterir
-            except Exception as e:
-                print(f"Görüntü işleme hatası ({img_path}): {str(e)}")  # Hata mesajı gösterir
+                eski = json.loads(okunacak_yol.read_text(encoding='utf-8'))
+                if eski.get('tarif_ozeti') == ozet:
+                    manifest = eski
+            except ValueError:
+                pass
+
+        imzalar = {p.name: _dosya_imzasi(p) for p in input_files}
+        islenecekler = [p for p in input_files if manifest['dosyalar'].get(p.name) != imzalar[p.name]]
+
+        print(f"Toplam {len(input_files)} görüntü bulundu, {len(islenecekler)} tanesi yeni veya değişmiş.")
+        print(f"Her görüntü için {len(tarifler)} artırılmış versiyon oluşturulacak.")  # Her görüntü için kaç artırma yapılacağını belirtir
+        print(f"Toplam {len(islenecekler) * len(tarifler)} yeni görüntü oluşturulacak.")  # Toplam yeni görüntü sayısını hesaplar
+        if not islenecekler and okunacak_yol == manifest_yolu:
+            return
+
+        gorevler = [(p, output_path) for p in islenecekler]
+        if gorevler:
+            with multiprocessing.Pool(isci or os.cpu_count(), initializer=_isci_baslat, initargs=(tarifler,)) as havuz:
+                for ad, yazilan, hata in tqdm(havuz.imap_unordered(_goruntuyu_artir, gorevler, chunksize=8),
+                                              total=len(gorevler), desc="Görüntüler işleniyor"):
+                    if hata:
+                        print(hata)  # Hata mesajı gösterir
+                        manifest['dosyalar'].pop(ad, None)  # Bir sonraki çalıştırmada yeniden denenir
+                    else:
+                        manifest['dosyalar'][ad] = imzalar[ad]
+
+        # Silinen kaynakları manifestten çıkar ve manifesti yaz
+        manifest['dosyalar'] = {ad: imza for ad, imza in manifest['dosyalar'].items() if ad in imzalar}
+        gecici = manifest_yolu.with_suffix('.tmp')
+        gecici.write_text(json.dumps(manifest), encoding='utf-8')
+        os.replace(gecici, manifest_yolu)
+        if eski_yol.exists():
+            eski_yol.unlink()
     except Exception as e:
         print(f"Genel hata: {str(e)}")  # Genel hata mesajı gösterir
 
+def _bellekte_artir(img_path):
+    """Bir görüntünün artırılmış hallerini diske yazmadan döndürür."""
+    image = cv2.imread(str(img_path))  # Görüntüyü okur
+    if image is None:
+        return img_path, []
+    return img_path, [tarifi_uygula(image, tarif) for tarif in _tarifler]
+
+def artirilmis_ornekler(input_dir, tarifler=None, isci=None):
+    """
+    Artırılmış görüntüleri JPEG olarak diske yazmadan, üretildikçe döndüren üreteç.
+
+    Parametreler:
+        input_dir: Kaynak görüntülerin dizini
+        tarifler (list): Dönüşüm tarifleri (varsayılan: VARSAYILAN_TARIFLER)
+        isci (int): Süreç sayısı (varsayılan: işlemci sayısı)
+
+    Dönüş:
+        generator: (kaynak yol, tarif sırası, artırılmış görüntü) üçlüleri
+    """
+    tarifler = tarifler if tarifler is not None else VARSAYILAN_TARIFLER
+    with multiprocessing.Pool(isci or os.cpu_count(), initializer=_isci_baslat, initargs=(tarifler,)) as havuz:
+        for img_path, goruntuler in havuz.imap(_bellekte_artir, _kaynak_dosyalar(input_dir), chunksize=8):
+            for i, goruntu in enumerate(goruntuler):
+                yield img_path, i, goruntu
+
+def artirilmis_ozellikler(veri_klasoru, tarifler=None, isci=None, boyut=(20, 20)):
+    """
+    Etiket alt klasörleri içeren karakter veri setini bellekte artırıp eğitim matrisine çevirir.
+    train.py bu fonksiyonla artırılmış görüntüleri diske yazmadan eğitim yapabilir.
+
+    Parametreler:
+        veri_klasoru (str): Her etiket için bir alt klasör içeren ham karakter veri seti
+        tarifler (list): Dönüşüm tarifleri (varsayılan: VARSAYILAN_TARIFLER)
+        isci (int): Süreç sayısı (varsayılan: işlemci sayısı)
+        boyut (tuple): Özellik görüntüsü boyutu
+
+    Dönüş:
+        tuple: (X, y) numpy dizileri
+    """
+    ozellikler, etiketler = [], []
+    for etiket in sorted(os.listdir(veri_klasoru)):
+        etiket_dizini = os.path.join(veri_klasoru, etiket)
+        if not os.path.isdir(etiket_dizini):
+            continue
+        for _, _, goruntu in artirilmis_ornekler(etiket_dizini, tarifler, isci):
+            ozellikler.append(cv2.resize(to_gray(goruntu), boyut).flatten())
+            etiketler.append(etiket)
+    X = np.array(ozellikler, dtype=np.uint8).reshape(-1, boyut[0] * boyut[1])
+    return X, np.array(etiketler)
+
 if __name__ == "__main__":
-    # Giriş ve çıkış dizinlerini belirle
-    current_dir = Path.cwd()  # Mevcut dizini alır
-    input_directory = current_dir / "karakter-veriseti" / "arkaplan"  # Giriş dizinini oluşturur
-    output_directory = current_dir / "karakter-veriseti-artirilm" / "arkaplan"  # Çıkış dizinini oluşturur
-    
-    print(f"Giriş dizini: {input_directory}")  # Giriş dizinini yazdırır
-    print(f"Çıkış dizini: {output_directory}")  # Çıkış dizinini yazdırır
-    
+    parser = argparse.ArgumentParser(description="Karakter veri seti artırma")
+    parser.add_argument('--giris', default=str(Path.cwd() / "karakter-veriseti" / "arkaplan"), help="Giriş dizini")
+    parser.add_argument('--cikis', default=str(Path.cwd() / "karakter-veriseti-artirilm" / "arkaplan"), help="Çıkış dizini")
+    parser.add_argument('--tarifler', help="Dönüşüm tariflerini içeren JSON dosyası")
+    parser.add_argument('--isci', type=int, default=None, help="Süreç sayısı")
+    args = parser.parse_args()
+
+    print(f"Giriş dizini: {args.giris}")  # Giriş dizinini yazdırır
+    print(f"Çıkış dizini: {args.cikis}")  # Çıkış dizinini yazdırır
+
     # Veri artırma işlemini başlat
-    augment_dataset(input_directory, output_directory)  # Veri artırma fonksiyonunu çağırır
-    print("Veri artırma işlemi tamamlandı!")  # İşlem tamamlandığında mesaj gösterir 
\ No newline at end of file
+    tarifler = tarifleri_yukle(args.tarifler) if args.tarifler else None
+    augment_dataset(args.giris, args.cikis, tarifler=tarifler, isci=args.isci)  # Veri artırma fonksiyonunu çağırır
+    print("Veri artırma işlemi tamamlandı!")  # İşlem tamamlandığında mesaj gösterir
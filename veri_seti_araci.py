@@ -0,0 +1,614 @@
+# Bu dosya, plaka tespit veri setindeki birebir ve neredeyse aynı görüntüleri algısal özetlerle bulur,
+# eğitim / doğrulama / test setleri arasındaki sızıntıyı raporlar ve eğitimle ölçümün JPEG çözmeden
+# okuyabileceği, önceden çözülmüş ve küçültülmüş, bellek eşlemeli bir görüntü önbelleği yazar.
+
+import argparse  # Komut satırı argümanlarını okumak için kullanılır
+import hashlib  # Birebir aynı dosyaları bulmak için kullanılır
+import json  # Rapor ve önbellek manifestini yazmak için kullanılır
+import math  # Küçültülmüş boyutları YOLO ile aynı yuvarlamak için kullanılır
+import multiprocessing  # Görüntüleri paralel okumak için kullanılır
+import os  # Dosya ve dizin işlemleri için kullanılır
+import time  # Süre ölçümleri için kullanılır
+from pathlib import Path  # Dosya yollarını yönetmek için kullanılır
+import cv2  # Görüntüleri okumak ve küçültmek için kullanılır
+import numpy as np  # Özetler ve önbellek dizileri için kullanılır
+from tqdm import tqdm  # İlerleme çubuğu için kullanılır
+
+SETLER = ('train', 'valid', 'test')  # Set adları
+UZANTILAR = ('.jpg', '.jpeg', '.png')  # Taranan görüntü uzantıları
+ONBELLEK_KLASORU = '.goruntu_onbellegi'  # Önceden çözülmüş görüntülerin tutulduğu klasör
+ONBELLEK_SURUMU = 2  # Önbellek dosya biçimi (2: değişken boyutlu görüntüler tek düz tamponda)
+_BIT_SAYISI = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)  # Bayt başına 1 bit sayısı
+
+
+# ----------------------------------------------------------------------------- Algısal özetler
+
+def _bitleri_sayiya(bitler):
+    """64 elemanlı mantıksal diziyi 64 bitlik tamsayıya çevirir."""
+    return int.from_bytes(np.packbits(bitler.astype(np.uint8)).tobytes(), 'big')
+
+
+def dhash(gri):
+    """
+    Fark özeti: 9x8 küçültülmüş görüntüde her pikselin sağ komşusundan parlak olup olmadığı.
+
+    Parametreler:
+        gri (numpy.ndarray): Gri tonlamalı görüntü
+
+    Dönüş:
+        int: 64 bitlik özet
+    """
+    kucuk = cv2.resize(gri, (9, 8), interpolation=cv2.INTER_AREA)
+    return _bitleri_sayiya(kucuk[:, 1:] > kucuk[:, :-1])
+
+
+def phash(gri):
+    """
+    Algısal özet: 32x32 görüntünün ayrık kosinüs dönüşümündeki en düşük 8x8 frekansın medyana göre işaretleri.
+
+    Parametreler:
+        gri (numpy.ndarray): Gri tonlamalı görüntü
+
+    Dönüş:
+        int: 64 bitlik özet
+    """
+    kucuk = cv2.resize(gri, (32, 32), interpolation=cv2.INTER_AREA).astype(np.float32)
+    dusuk = cv2.dct(kucuk)[:8, :8].flatten()
+    return _bitleri_sayiya(dusuk > np.median(dusuk[1:]))  # Ortalama parlaklık (DC) medyana katılmaz
+
+
+def _isci_baslat():
+    """Her işçi süreçte OpenCV'nin kendi iş parçacıklarını kapatır."""
+    cv2.setNumThreads(1)
+
+
+def _dosya_ozeti(yol):
+    """
+    Bir görüntünün içerik özetini, algısal özetlerini ve boyutunu çıkarır.
+    JPEG'ler 1/8 ölçekte çözülür; özetler için bu yeterlidir ve tam çözmekten çok daha hızlıdır.
+    """
+    with open(yol, 'rb') as dosya:
+        veri = dosya.read()
+    sha1 = hashlib.sha1(veri).hexdigest()
+    dizi = np.frombuffer(veri, dtype=np.uint8)
+    gri = cv2.imdecode(dizi, cv2.IMREAD_REDUCED_GRAYSCALE_8)
+    if gri is None or min(gri.shape) < 32:
+        gri = cv2.imdecode(dizi, cv2.IMREAD_GRAYSCALE)
+    if gri is None:
+        return None
+    return {'yol': yol, 'sha1': sha1, 'phash': phash(gri), 'dhash': dhash(gri), 'bayt': len(veri)}
+
+
+def goruntuleri_listele(klasorler):
+    """
+    Verilen klasörlerdeki görüntüleri listeler. Set klasörü (train/valid/test) verilirse images/ alt klasörü taranır.
+
+    Parametreler:
+        klasorler (list): Görüntü klasörleri veya set klasörleri
+
+    Dönüş:
+        list: (görüntü yolu, set adı veya None) demetleri
+    """
+    dosyalar = []
+    for klasor in klasorler:
+        klasor = Path(klasor)
+        if (klasor / 'images').is_dir():
+            klasor = klasor / 'images'
+        set_adi = klasor.parent.name if klasor.name == 'images' and klasor.parent.name in SETLER else None
+        for yol in sorted(klasor.iterdir()):
+            if yol.suffix.lower() in UZANTILAR and yol.is_file():
+                dosyalar.append((str(yol), set_adi))
+    return dosyalar
+
+
+def ozetleri_cikar(yollar, isci=None):
+    """
+    Görüntülerin özetlerini paralel olarak çıkarır.
+
+    Parametreler:
+        yollar (list): Görüntü yolları
+        isci (int): Süreç sayısı (varsayılan: işlemci sayısı)
+
+    Dönüş:
+        list: Her okunabilen görüntü için {'yol', 'sha1', 'phash', 'dhash', 'bayt'}
+    """
+    isci = isci or os.cpu_count()
+    if isci > 1 and len(yollar) > 50:
+        with multiprocessing.Pool(isci, initializer=_isci_baslat) as havuz:
+            ozetler = list(tqdm(havuz.imap(_dosya_ozeti, yollar, chunksize=16), total=len(yollar), desc="Özetler"))
+    else:
+        ozetler = [_dosya_ozeti(yol) for yol in tqdm(yollar, desc="Özetler")]
+    for yol, ozet in zip(yollar, ozetler):
+        if ozet is None:
+            print(f"Görüntü okunamadı, atlanıyor: {yol}")
+    return [ozet for ozet in ozetler if ozet is not None]
+
+
+def hamming_uzakliklari(a, b):
+    """
+    İki 64 bitlik özet dizisi arasındaki bütün Hamming uzaklıklarını döndürür.
+
+    Parametreler:
+        a, b (numpy.ndarray): uint64 özet dizileri
+
+    Dönüş:
+        numpy.ndarray: len(a) x len(b) boyutunda uzaklık matrisi
+    """
+    fark = np.bitwise_xor(a[:, None], b[None, :])
+    return _BIT_SAYISI[fark.view(np.uint8)].reshape(len(a), len(b), 8).sum(axis=2, dtype=np.uint8)
+
+
+# ----------------------------------------------------------------------------- Tekrarlar ve sızıntı
+
+class _Birlesim:
+    """Kümeleri birleştirmek için basit ayrık küme yapısı."""
+
+    def __init__(self, n):
+        self.ebeveyn = list(range(n))
+
+    def bul(self, i):
+        while self.ebeveyn[i] != i:
+            self.ebeveyn[i] = self.ebeveyn[self.ebeveyn[i]]
+            i = self.ebeveyn[i]
+        return i
+
+    def birlestir(self, i, j):
+        i, j = self.bul(i), self.bul(j)
+        if i != j:
+            self.ebeveyn[max(i, j)] = min(i, j)
+
+
+def tekrarlari_bul(ozetler, esik=6, parca=1024):
+    """
+    Birebir aynı (aynı SHA-1) ve neredeyse aynı (pHash ve dHash uzaklığı en fazla esik) görüntüleri kümeler.
+
+    Parametreler:
+        ozetler (list): ozetleri_cikar çıktısı
+        esik (int): Neredeyse aynı sayılmak için iki özette de izin verilen en fazla farklı bit sayısı
+        parca (int): Uzaklık matrisinin bellekte tutulacak satır sayısı
+
+    Dönüş:
+        tuple: (birebir kümeler, neredeyse aynı kümeler); her küme ozetler içindeki sıraların listesidir
+    """
+    n = len(ozetler)
+    birebir = _Birlesim(n)
+    ilk = {}
+    for i, ozet in enumerate(ozetler):
+        birebir.birlestir(ilk.setdefault(ozet['sha1'], i), i)
+
+    benzer = _Birlesim(n)
+    for i in range(n):
+        benzer.birlestir(birebir.bul(i), i)
+    p = np.array([o['phash'] for o in ozetler], dtype=np.uint64)
+    d = np.array([o['dhash'] for o in ozetler], dtype=np.uint64)
+    for bas in range(0, n, parca):
+        # Üst üçgen yeterli: her çift yalnızca bir kez karşılaştırılır
+        uzak_p = hamming_uzakliklari(p[bas:bas + parca], p[bas:])
+        uzak_d = hamming_uzakliklari(d[bas:bas + parca], d[bas:])
+        for i, j in zip(*np.nonzero((uzak_p <= esik) & (uzak_d <= esik))):
+            if i < j:
+                benzer.birlestir(bas + i, bas + j)
+
+    def kumeler(birlesim):
+        gruplar = {}
+        for i in range(n):
+            gruplar.setdefault(birlesim.bul(i), []).append(i)
+        return [g for g in gruplar.values() if len(g) > 1]
+
+    return kumeler(birebir), kumeler(benzer)
+
+
+def tekrar_raporu(dosyalar, esik=6, isci=None):
+    """
+    Görüntüleri özetler, tekrar kümelerini ve setler arası sızıntıyı çıkarır.
+
+    Parametreler:
+        dosyalar (list): goruntuleri_listele çıktısı
+        esik (int): Neredeyse aynı görüntüler için Hamming eşiği
+        isci (int): Süreç sayısı
+
+    Dönüş:
+        dict: Özet sayılar, kümeler ve sızıntı listesi
+    """
+    setler = dict(dosyalar)
+    ozetler = ozetleri_cikar([yol for yol, _ in dosyalar], isci)
+    birebir, benzer = tekrarlari_bul(ozetler, esik)
+
+    def kume_kaydi(kume):
+        return [{'yol': ozetler[i]['yol'], 'set': setler[ozetler[i]['yol']]} for i in kume]
+
+    # Birden fazla sete dağılan kümeler sızıntıdır: aynı görüntü hem eğitimde hem değerlendirmede kullanılır
+    sizintilar = []
+    for kume in benzer:
+        kume_setleri = sorted({setler[ozetler[i]['yol']] for i in kume} - {None})
+        if len(kume_setleri) > 1:
+            sizintilar.append({'setler': kume_setleri, 'goruntuler': kume_kaydi(kume)})
+
+    fazla_bayt = sum(ozetler[i]['bayt'] for kume in birebir for i in kume[1:])
+    return {
+        'goruntu_sayisi': len(ozetler),
+        'esik': esik,
+        'birebir_kume_sayisi': len(birebir),
+        'birebir_fazla_dosya': sum(len(k) - 1 for k in birebir),
+        'birebir_fazla_mb': fazla_bayt / 2 ** 20,
+        'benzer_kume_sayisi': len(benzer),
+        'benzer_fazla_dosya': sum(len(k) - 1 for k in benzer),
+        'sizinti_kume_sayisi': len(sizintilar),
+        'birebir': [kume_kaydi(k) for k in birebir],
+        'benzer': [kume_kaydi(k) for k in benzer],
+        'sizintilar': sizintilar,
+    }
+
+
+def birebirleri_bagla(rapor):
+    """
+    Birebir aynı dosyaları kümedeki ilk dosyaya sabit bağlantı yaparak disk kullanımını azaltır.
+    Farklı dosya sistemindeki veya zaten bağlı dosyalara dokunulmaz.
+
+    Parametreler:
+        rapor (dict): tekrar_raporu çıktısı
+
+    Dönüş:
+        int: Bağlanan dosya sayısı
+    """
+    baglanan = 0
+    for kume in rapor['birebir']:
+        kaynak = kume[0]['yol']
+        for kayit in kume[1:]:
+            hedef = kayit['yol']
+            if os.path.samefile(kaynak, hedef):
+                continue
+            gecici = f"{hedef}.bag"
+            try:
+                os.link(kaynak, gecici)
+                os.replace(gecici, hedef)  # Hedef hiçbir an eksik kalmaz
+                baglanan += 1
+            except OSError as e:
+                print(f"Uyarı: {hedef} bağlanamadı ({e})")
+    return baglanan
+
+
+def tekil_liste_yaz(rapor, dosyalar, cikti):
+    """
+    Her sette neredeyse aynı kümelerden yalnızca ilk görüntüyü bırakan YOLO liste dosyalarını ve
+    bunları gösteren plaka_tekil.yaml dosyasını yazar. Eğitim bu YAML ile her turda daha az görüntü çözer.
+
+    Parametreler:
+        rapor (dict): tekrar_raporu çıktısı
+        dosyalar (list): goruntuleri_listele çıktısı
+        cikti (str): Liste dosyalarının yazılacağı klasör
+
+    Dönüş:
+        dict: Set adı → listede kalan görüntü sayısı
+    """
+    atilacak = set()
+    for kume in rapor['benzer']:
+        gorulen = set()
+        for kayit in kume:
+            if kayit['set'] in gorulen:
+                atilacak.add(kayit['yol'])  # Aynı setteki ikinci ve sonraki kopyalar
+            gorulen.add(kayit['set'])
+
+    cikti = Path(cikti).resolve()
+    os.makedirs(cikti, exist_ok=True)
+    sayilar = {}
+    for set_adi in SETLER:
+        yollar = [Path(yol).resolve() for yol, s in dosyalar if s == set_adi and yol not in atilacak]
+        (cikti / f"{set_adi}_tekil.txt").write_text("".join(f"{yol}\n" for yol in yollar), encoding='utf-8')
+        sayilar[set_adi] = len(yollar)
+    (cikti / 'plaka_tekil.yaml').write_text(f"path: {cikti}\n"
+                                            "train: train_tekil.txt\n"
+                                            "val: valid_tekil.txt\n"
+                                            "test: test_tekil.txt\n"
+                                            "names:\n"
+                                            "  0: plaka\n", encoding='utf-8')
+    return sayilar
+
+
+# ----------------------------------------------------------------------------- Önceden çözülmüş önbellek
+
+def kucult(goruntu, imgsz):
+    """
+    Görüntünün uzun kenarını imgsz yapar; ultralytics'in eğitimde yaptığı küçültmeyle aynıdır.
+
+    Dönüş:
+        numpy.ndarray: Küçültülmüş görüntü
+    """
+    h0, w0 = goruntu.shape[:2]
+    oran = imgsz / max(h0, w0)
+    if oran == 1:
+        return goruntu
+    w, h = min(math.ceil(w0 * oran), imgsz), min(math.ceil(h0 * oran), imgsz)
+    return cv2.resize(goruntu, (w, h), interpolation=cv2.INTER_LINEAR)
+
+
+def _goruntu_hazirla(gorev):
+    """Görüntüyü okuyup küçültür; (görüntü, özgün yükseklik, özgün genişlik) veya None döndürür."""
+    yol, imgsz = gorev
+    goruntu = cv2.imread(yol)
+    if goruntu is None:
+        return None
+    return kucult(goruntu, imgsz), goruntu.shape[0], goruntu.shape[1]
+
+
+def _etiketleri_oku(yol):
+    """YOLO etiket dosyasını (sınıf, x, y, w, h) satırları olarak okur."""
+    try:
+        satirlar = [s.split() for s in Path(yol).read_text(encoding='utf-8').splitlines()]
+    except OSError:
+        return np.zeros((0, 5), dtype=np.float32)
+    return np.array([[float(v) for v in s[:5]] for s in satirlar if len(s) >= 5], dtype=np.float32).reshape(-1, 5)
+
+
+def onbellek_olustur(set_klasoru, hedef, imgsz=640, isci=None):
+    """
+    Bir setin görüntülerini uzun kenarı imgsz olacak şekilde çözüp tek bir bellek eşlemeli dosyaya yazar.
+    Görüntüler küçültülmüş boyutlarıyla, dolgu olmadan art arda tek bir düz tampona (goruntuler.bin) yazılır;
+    her görüntünün tampondaki başlangıcı konumlar.npy, özgün ve küçültülmüş boyutları boyutlar.npy dosyasında tutulur.
+    Etiketler normalize olduğu için küçültmeden etkilenmez ve [görüntü sırası, sınıf, x, y, w, h] olarak saklanır.
+    Önceki önbellekte aynı imgsz ile, değişmemiş olarak bulunan görüntüler yeniden çözülmez.
+
+    Parametreler:
+        set_klasoru (str): images/ ve labels/ içeren set klasörü
+        hedef (str): Önbellek klasörü
+        imgsz (int): Uzun kenarın ölçekleneceği boyut
+        isci (int): Süreç sayısı
+
+    Dönüş:
+        dict: Görüntü sayısı, yeniden çözülen sayısı ve önbellek boyutu
+    """
+    set_klasoru = Path(set_klasoru)
+    yollar = [yol for yol, _ in goruntuleri_listele([set_klasoru])]
+    imzalar = [[os.stat(yol).st_mtime_ns, os.stat(yol).st_size] for yol in yollar]
+
+    # Önceki önbellekten yeniden kullanılabilecek görüntüler
+    eski, eski_goruntuler = {}, None
+    try:
+        with open(os.path.join(hedef, 'manifest.json'), encoding='utf-8') as dosya:
+            manifest = json.load(dosya)
+        if manifest['imgsz'] == imgsz and manifest.get('surum') == ONBELLEK_SURUMU:
+            eski_konumlar = np.load(os.path.join(hedef, 'konumlar.npy'))
+            eski_boyutlar = np.load(os.path.join(hedef, 'boyutlar.npy'))
+            if eski_konumlar[-1]:
+                eski_goruntuler = np.memmap(os.path.join(hedef, 'goruntuler.bin'), dtype=np.uint8, mode='r')
+            eski = {ad: (satir, imza) for satir, (ad, imza) in enumerate(zip(manifest['dosyalar'], manifest['imzalar']))}
+    except (OSError, ValueError, KeyError):
+        eski, eski_goruntuler = {}, None
+
+    okunacak = [sira for sira, (yol, imza) in enumerate(zip(yollar, imzalar))
+                if eski.get(yol) is None or eski[yol][1] != imza]
+    gorevler = [(yollar[sira], imgsz) for sira in okunacak]
+    isci = isci or os.cpu_count()
+    if isci > 1 and len(gorevler) > 20:
+        havuz = multiprocessing.Pool(isci, initializer=_isci_baslat)
+        sonuclar = havuz.imap(_goruntu_hazirla, gorevler, chunksize=4)
+    else:
+        havuz, sonuclar = None, map(_goruntu_hazirla, gorevler)
+
+    # Görüntüler sırayla tampona eklenir; okunamayanlar önbelleğe hiç girmez
+    os.makedirs(hedef, exist_ok=True)
+    gecici_yol = os.path.join(hedef, 'goruntuler.tmp.bin')
+    yeni_okunacak = set(okunacak)
+    secili, konumlar, boyutlar = [], [0], []
+    try:
+        with open(gecici_yol, 'wb') as tampon, tqdm(total=len(gorevler), desc=f"{set_klasoru.name} önbelleği") as ilerleme:
+            for sira, yol in enumerate(yollar):
+                if sira in yeni_okunacak:
+                    sonuc = next(sonuclar)
+                    ilerleme.update()
+                    if sonuc is None:
+                        print(f"Görüntü okunamadı, atlanıyor: {yol}")
+                        continue
+                    goruntu, h0, w0 = sonuc
+                    veri = np.ascontiguousarray(goruntu).data
+                    boyut = (h0, w0) + goruntu.shape[:2]
+                else:
+                    satir = eski[yol][0]
+                    veri = eski_goruntuler[eski_konumlar[satir]:eski_konumlar[satir + 1]].data
+                    boyut = tuple(eski_boyutlar[satir])
+                tampon.write(veri)
+                secili.append(sira)
+                konumlar.append(konumlar[-1] + veri.nbytes)
+                boyutlar.append(boyut)
+    finally:
+        if havuz is not None:
+            havuz.close()
+            havuz.join()
+    del eski_goruntuler  # Üzerine yazmadan önce bellek eşlemesini bırak
+
+    yollar = [yollar[i] for i in secili]
+    imzalar = [imzalar[i] for i in secili]
+    etiketler = [np.hstack([np.full((len(e), 1), sira, dtype=np.float32), e])
+                 for sira, e in enumerate(_etiketleri_oku(set_klasoru / 'labels' / f"{Path(yol).stem}.txt")
+                                          for yol in yollar)]
+    etiketler = np.vstack(etiketler) if etiketler else np.zeros((0, 6), dtype=np.float32)
+
+    # Yarım kalan yazmalar önbelleği bozmasın diye manifest en son yazılır
+    np.save(os.path.join(hedef, 'konumlar.npy'), np.array(konumlar, dtype=np.int64))
+    np.save(os.path.join(hedef, 'boyutlar.npy'), np.array(boyutlar, dtype=np.int32).reshape(-1, 4))
+    np.save(os.path.join(hedef, 'etiketler.npy'), etiketler)
+    os.replace(gecici_yol, os.path.join(hedef, 'goruntuler.bin'))
+    if os.path.exists(os.path.join(hedef, 'goruntuler.npy')):
+        os.remove(os.path.join(hedef, 'goruntuler.npy'))  # Eski, sabit yuvalı önbellek biçimi
+    with open(os.path.join(hedef, 'manifest.tmp.json'), 'w', encoding='utf-8') as dosya:
+        json.dump({'surum': ONBELLEK_SURUMU, 'imgsz': imgsz, 'dosyalar': yollar, 'imzalar': imzalar}, dosya)
+    os.replace(os.path.join(hedef, 'manifest.tmp.json'), os.path.join(hedef, 'manifest.json'))
+    return {
+        'goruntu_sayisi': len(yollar),
+        'yeniden_cozulen': len(okunacak),
+        'boyut_mb': konumlar[-1] / 2 ** 20,
+    }
+
+
+class OnbellekVeriSeti:
+    """
+    onbellek_olustur ile yazılmış bir seti JPEG çözmeden okur.
+    Tampon ilk erişimde ve her süreçte ayrı açılır; böylece nesne veri yükleyici işçilerine kopyalanmadan gönderilebilir.
+    """
+
+    def __init__(self, klasor):
+        """
+        Parametreler:
+            klasor (str): Set önbelleğinin klasörü
+        """
+        self.klasor = klasor
+        with open(os.path.join(klasor, 'manifest.json'), encoding='utf-8') as dosya:
+            manifest = json.load(dosya)
+        if manifest.get('surum') != ONBELLEK_SURUMU:
+            raise ValueError(f"{klasor} eski biçimde bir önbellek; 'veri_seti_araci.py onbellek' ile yeniden yazın")
+        self.imgsz = manifest['imgsz']
+        self.dosyalar = manifest['dosyalar']
+        self.sira = {os.path.realpath(yol): i for i, yol in enumerate(self.dosyalar)}  # Görüntü yolu → satır
+        self.konumlar = np.load(os.path.join(klasor, 'konumlar.npy'))
+        self.boyutlar = np.load(os.path.join(klasor, 'boyutlar.npy'))
+        etiketler = np.load(os.path.join(klasor, 'etiketler.npy'))
+        sinirlar = np.searchsorted(etiketler[:, 0], np.arange(len(self.dosyalar) + 1))
+        self._etiketler = [etiketler[sinirlar[i]:sinirlar[i + 1], 1:] for i in range(len(self.dosyalar))]
+        self._goruntuler = None
+
+    def __getstate__(self):
+        durum = self.__dict__.copy()
+        durum['_goruntuler'] = None  # Bellek eşlemesi süreçler arasında taşınmaz, yeniden açılır
+        return durum
+
+    @property
+    def goruntuler(self):
+        if self._goruntuler is None:
+            self._goruntuler = np.memmap(os.path.join(self.klasor, 'goruntuler.bin'), dtype=np.uint8, mode='r')
+        return self._goruntuler
+
+    def __len__(self):
+        return len(self.dosyalar)
+
+    def goruntu(self, i):
+        """
+        Dönüş:
+            tuple: (küçültülmüş görüntünün kopyası, (özgün yükseklik, genişlik), (yükseklik, genişlik))
+        """
+        h0, w0, h, w = (int(v) for v in self.boyutlar[i])
+        return np.array(self.goruntuler[self.konumlar[i]:self.konumlar[i + 1]]).reshape(h, w, 3), (h0, w0), (h, w)
+
+    def etiketler(self, i):
+        """
+        Dönüş:
+            numpy.ndarray: (sınıf, x, y, w, h) normalize etiketler
+        """
+        return self._etiketler[i]
+
+    def __getitem__(self, i):
+        return self.goruntu(i)[0], self.etiketler(i), self.dosyalar[i]
+
+
+def onbellekleri_yukle(onbellek_klasoru):
+    """
+    Önbellek klasöründeki bütün set önbelleklerini yükler.
+
+    Dönüş:
+        dict: Set adı → OnbellekVeriSeti
+    """
+    return {set_adi: OnbellekVeriSeti(os.path.join(onbellek_klasoru, set_adi)) for set_adi in SETLER
+            if os.path.exists(os.path.join(onbellek_klasoru, set_adi, 'manifest.json'))}
+
+
+def onbellekli_egitici(onbellek_klasoru=ONBELLEK_KLASORU):
+    """
+    Görüntüleri önbellekten okuyan ultralytics eğitici sınıfını döndürür:
+    YOLO(...).train(data=..., imgsz=..., trainer=onbellekli_egitici()).
+    Önbellekte olmayan veya imgsz'si farklı görüntüler diskten her zamanki gibi okunur.
+    Sınıflar onbellekli_egitim.py içinde modül düzeyinde tanımlıdır; veri seti spawn ile başlatılan
+    veri yükleyici işçilerine ve DDP süreçlerine gönderilebilir.
+
+    Parametreler:
+        onbellek_klasoru (str): onbellek komutuyla yazılmış klasör
+
+    Dönüş:
+        type: onbellekli_egitim.OnbellekliEgitici (onbellek_klasoru sınıf özelliğine yazılır)
+    """
+    from onbellekli_egitim import OnbellekliEgitici  # Yalnızca eğitimde gerekir (ultralytics)
+
+    OnbellekliEgitici.onbellek_klasoru = onbellek_klasoru
+    return OnbellekliEgitici
+
+
+def okuma_olc(set_klasoru, onbellek, imgsz, tekrar=3):
+    """
+    Bir turdaki görüntü okuma süresini JPEG çözüp küçültme ile önbellekten okuma için karşılaştırır.
+
+    Dönüş:
+        dict: Görüntü başına milisaniye cinsinden süreler
+    """
+    yollar = [yol for yol, _ in goruntuleri_listele([set_klasoru])]
+    baslangic = time.perf_counter()
+    for _ in range(tekrar):
+        for yol in yollar:
+            kucult(cv2.imread(yol), imgsz)
+    jpeg = (time.perf_counter() - baslangic) / (tekrar * len(yollar))
+    baslangic = time.perf_counter()
+    for _ in range(tekrar):
+        for i in range(len(onbellek)):
+            onbellek.goruntu(i)
+    onbellekten = (time.perf_counter() - baslangic) / (tekrar * len(onbellek))
+    return {'jpeg_ms': jpeg * 1000, 'onbellek_ms': onbellekten * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plaka veri seti tekrar / sızıntı taraması ve görüntü önbelleği")
+    alt = parser.add_subparsers(dest='komut', required=True)
+
+    tara = alt.add_parser('tara', help="Birebir ve neredeyse aynı görüntüleri, setler arası sızıntıyı raporla")
+    tara.add_argument('klasorler', nargs='*', default=['yolov8_dataset/train', 'yolov8_dataset/valid',
+                                                        'yolov8_dataset/test', 'dataset/images'],
+                      help="Görüntü veya set klasörleri")
+    tara.add_argument('--esik', type=int, default=6, help="Neredeyse aynı görüntüler için Hamming eşiği (0-64)")
+    tara.add_argument('--isci', type=int, default=None, help="Süreç sayısı")
+    tara.add_argument('-o', '--cikti', default='tekrar_raporu.json', help="Rapor JSON dosyası")
+    tara.add_argument('--bagla', action='store_true', help="Birebir aynı dosyaları sabit bağlantıyla birleştir")
+    tara.add_argument('--tekil-liste', metavar='KLASOR',
+                      help="Her sette neredeyse aynı kopyaları dışarıda bırakan YOLO liste dosyalarını yaz")
+
+    onbellek = alt.add_parser('onbellek', help="Setler için önceden çözülmüş görüntü önbelleğini yaz")
+    onbellek.add_argument('--veri', default='yolov8_dataset', help="train/, valid/ ve test/ içeren klasör")
+    onbellek.add_argument('--hedef', default=ONBELLEK_KLASORU, help="Önbellek klasörü")
+    onbellek.add_argument('--imgsz', type=int, default=640, help="Uzun kenar boyutu (eğitimdeki imgsz)")
+    onbellek.add_argument('--isci', type=int, default=None, help="Süreç sayısı")
+    onbellek.add_argument('--olc', action='store_true', help="JPEG okuma ile önbellekten okuma süresini karşılaştır")
+    args = parser.parse_args()
+
+    if args.komut == 'tara':
+        dosyalar = goruntuleri_listele(args.klasorler)
+        rapor = tekrar_raporu(dosyalar, args.esik, args.isci)
+        print(f"{rapor['goruntu_sayisi']} görüntü tarandı.")
+        print(f"Birebir aynı: {rapor['birebir_kume_sayisi']} küme, {rapor['birebir_fazla_dosya']} fazla dosya "
+              f"({rapor['birebir_fazla_mb']:.1f} MB)")
+        print(f"Neredeyse aynı (eşik {args.esik}): {rapor['benzer_kume_sayisi']} küme, "
+              f"{rapor['benzer_fazla_dosya']} fazla dosya")
+        print(f"Setler arası sızıntı: {rapor['sizinti_kume_sayisi']} küme")
+        for sizinti in rapor['sizintilar'][:10]:
+            adlar = [f"{k['set']}/{os.path.basename(k['yol'])}" for k in sizinti['goruntuler'] if k['set']]
+            print(f"  {', '.join(sizinti['setler'])}: {', '.join(adlar)}")
+        with open(args.cikti, 'w', encoding='utf-8') as dosya:
+            json.dump(rapor, dosya, ensure_ascii=False, indent=2)
+        print(f"Rapor kaydedildi: {args.cikti}")
+        if args.bagla:
+            print(f"{birebirleri_bagla(rapor)} dosya sabit bağlantıyla birleştirildi.")
+        if args.tekil_liste:
+            sayilar = tekil_liste_yaz(rapor, dosyalar, args.tekil_liste)
+            print(f"Tekil listeler yazıldı ({args.tekil_liste}/plaka_tekil.yaml): "
+                  + ", ".join(f"{s} {n}" for s, n in sayilar.items()))
+    else:
+        for set_adi in SETLER:
+            set_klasoru = os.path.join(args.veri, set_adi)
+            if not os.path.isdir(os.path.join(set_klasoru, 'images')):
+                continue
+            hedef = os.path.join(args.hedef, set_adi)
+            sonuc = onbellek_olustur(set_klasoru, hedef, args.imgsz, args.isci)
+            print(f"{set_adi}: {sonuc['goruntu_sayisi']} görüntü ({sonuc['yeniden_cozulen']} yeniden çözüldü), "
+                  f"{sonuc['boyut_mb']:.1f} MB")
+            if args.olc:
+                sureler = okuma_olc(set_klasoru, OnbellekVeriSeti(hedef), args.imgsz)
+                print(f"  görüntü başına okuma: JPEG {sureler['jpeg_ms']:.2f} ms, "
+                      f"önbellek {sureler['onbellek_ms']:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()